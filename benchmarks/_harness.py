@@ -0,0 +1,111 @@
+"""In-process Home Assistant instance for the benchmarks.
+
+Needs a Home Assistant development environment with
+pytest-homeassistant-custom-component installed.
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from aiohttp.test_utils import TestClient, TestServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    CLIENT_ID,
+    MockConfigEntry,
+    MockUser,
+    async_test_home_assistant,
+    mock_storage,
+)
+from homeassistant import loader  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+
+# Import this repository's custom_components before the test instance can shadow it
+import custom_components  # noqa: E402,F401
+
+DOMAIN = "home_trivia"
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return the mean and percentiles of latencies in seconds, in milliseconds."""
+    samples = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "p50_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3),
+    }
+
+
+@asynccontextmanager
+async def async_home_assistant() -> AsyncIterator[HomeAssistant]:
+    """Yield a running test instance that loads this repository's integration.
+
+    Storage is kept in memory and the config directory is a temporary one.
+    """
+    with mock_storage(), tempfile.TemporaryDirectory() as config_dir:
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Load custom_components from this repository
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            await async_setup_component(hass, "http", {})
+            await hass.async_block_till_done()
+            yield hass
+            for entry in hass.config_entries.async_entries(DOMAIN):
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_stop(force=True)
+
+
+async def async_add_game(hass: HomeAssistant, name: str = "Home Trivia") -> MockConfigEntry:
+    """Add and set up a game."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"name": name}, title=name)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+class WebSocketClient:
+    """Minimal websocket API client that sends a command and waits for its result."""
+
+    def __init__(self, websocket) -> None:
+        self._websocket = websocket
+        self._id = 0
+
+    async def command(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Send a command and return the result message."""
+        self._id += 1
+        await self._websocket.send_json({**message, "id": self._id})
+        while True:
+            response = await self._websocket.receive_json()
+            if response.get("id") == self._id and response["type"] == "result":
+                return response
+
+
+@asynccontextmanager
+async def async_websocket_clients(hass: HomeAssistant, count: int = 1) -> AsyncIterator[list[WebSocketClient]]:
+    """Yield count authenticated websocket connections of the owner."""
+    await async_setup_component(hass, "websocket_api", {})
+    user = MockUser(is_owner=True).add_to_hass(hass)
+    refresh_token = await hass.auth.async_create_refresh_token(user, CLIENT_ID)
+    access_token = hass.auth.async_create_access_token(refresh_token)
+
+    async with TestClient(TestServer(hass.http.app)) as client:
+        websockets = []
+        for _ in range(count):
+            websocket = await client.ws_connect("/api/websocket")
+            await websocket.receive_json()  # auth_required
+            await websocket.send_json({"type": "auth", "access_token": access_token})
+            auth = await websocket.receive_json()
+            if auth["type"] != "auth_ok":
+                raise RuntimeError(f"Websocket authentication failed: {auth}")
+            websockets.append(websocket)
+        yield [WebSocketClient(websocket) for websocket in websockets]
+        for websocket in websockets:
+            await websocket.close()
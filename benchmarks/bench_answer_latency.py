@@ -0,0 +1,84 @@
+"""Compare answer submission latency of the service call and websocket paths.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_answer_latency.py [--tablets 20] [--rounds 50]
+
+A game with one team per tablet is set up in an in-process test instance of
+Home Assistant, and every tablet gets its own websocket connection. In every
+round, all tablets answer at once, either the way the card used to
+(call_service for home_trivia.update_team_answer) or with the
+home_trivia/submit_answer command. Reported is the time from sending an
+answer to receiving its result, per path.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from _harness import DOMAIN, async_add_game, async_home_assistant, async_websocket_clients, summarize
+
+
+def service_message(team_id: str, answer: str) -> dict:
+    """Return the call_service message the card sent before."""
+    return {
+        "type": "call_service",
+        "domain": DOMAIN,
+        "service": "update_team_answer",
+        "service_data": {"team_id": team_id, "answer": answer},
+    }
+
+
+def command_message(team_id: str, answer: str) -> dict:
+    """Return the home_trivia/submit_answer command."""
+    return {"type": "home_trivia/submit_answer", "team_id": team_id, "answer": answer}
+
+
+async def timed(client, message: dict) -> float:
+    """Send a message and return the seconds until its result arrived."""
+    start = time.perf_counter()
+    response = await client.command(message)
+    elapsed = time.perf_counter() - start
+    if not response["success"]:
+        raise RuntimeError(response["error"])
+    return elapsed
+
+
+async def run(tablets: int, rounds: int) -> dict:
+    """Play rounds on both paths and return the latencies."""
+    async with async_home_assistant() as hass:
+        await async_add_game(hass)
+        await hass.services.async_call(DOMAIN, "update_team_count", {"team_count": tablets}, blocking=True)
+        await hass.services.async_call(DOMAIN, "start_game", {}, blocking=True)
+
+        results = {"tablets": tablets, "rounds": rounds}
+        async with async_websocket_clients(hass, tablets) as clients:
+            for name, build_message in (("service", service_message), ("websocket", command_message)):
+                samples = []
+                for _ in range(rounds):
+                    await clients[0].command({"type": "home_trivia/next_question"})
+                    samples += await asyncio.gather(*(
+                        timed(client, build_message(f"team_{number}", random.choice("ABC")))
+                        for number, client in enumerate(clients, start=1)
+                    ))
+                results[name] = summarize(samples)
+        return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tablets", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(json.dumps(asyncio.run(run(args.tablets, args.rounds))))
+
+
+if __name__ == "__main__":
+    main()
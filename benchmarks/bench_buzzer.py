@@ -0,0 +1,98 @@
+"""Measure buzzer mode ordering and acknowledgement latency.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_buzzer.py [--teams 40] [--rounds 50]
+
+A buzzer mode game is set up in an in-process test instance of Home
+Assistant, with one websocket connection per team. In every round, all
+teams buzz in at once with home_trivia/submit_answer, then the round is
+scored. Reported are the acknowledgement latencies and the time between the
+first and the last buzz of a round as received by the server (how long the
+burst took to ingest), and every round is checked for:
+
+- ranks: the buzzes got the ranks 1..teams, without ties
+- order: a team ranked earlier never has less time remaining
+- bonus: correct teams' speed bonuses strictly decrease with their rank
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from _harness import DOMAIN, async_add_game, async_home_assistant, async_websocket_clients, summarize
+
+
+async def buzz(client, team_id: str, answer: str) -> tuple[float, dict]:
+    """Buzz in and return the acknowledgement latency and the acknowledgement."""
+    start = time.perf_counter()
+    response = await client.command({"type": "home_trivia/submit_answer", "team_id": team_id, "answer": answer})
+    elapsed = time.perf_counter() - start
+    if not response["success"]:
+        raise RuntimeError(response["error"])
+    return elapsed, response["result"]
+
+
+async def run(teams: int, rounds: int) -> dict:
+    """Play buzzer rounds and return the latencies and check results."""
+    async with async_home_assistant() as hass:
+        entry = await async_add_game(hass)
+        await hass.services.async_call(DOMAIN, "update_team_count", {"team_count": teams}, blocking=True)
+        await hass.services.async_call(DOMAIN, "update_game_mode", {"game_mode": "buzzer"}, blocking=True)
+        await hass.services.async_call(DOMAIN, "start_game", {}, blocking=True)
+        team_sensors = hass.data[DOMAIN][entry.entry_id]["context"].team_sensors
+
+        latencies, spreads = [], []
+        failures = {"ranks": 0, "order": 0, "bonus": 0}
+        async with async_websocket_clients(hass, teams) as clients:
+            for _ in range(rounds):
+                await clients[0].command({"type": "home_trivia/next_question"})
+                correct_answer = hass.states.get("sensor.home_trivia_current_question").attributes["correct_answer"]
+                results = await asyncio.gather(*(
+                    buzz(client, f"team_{number}", random.choice("ABC"))
+                    for number, client in enumerate(clients, start=1)
+                ))
+                latencies += [elapsed for elapsed, _ack in results]
+
+                acks = sorted((ack for _elapsed, ack in results), key=lambda ack: ack["answer_rank"])
+                if [ack["answer_rank"] for ack in acks] != list(range(1, teams + 1)):
+                    failures["ranks"] += 1
+                remaining = [ack["answer_time_remaining_ms"] for ack in acks]
+                if remaining != sorted(remaining, reverse=True):
+                    failures["order"] += 1
+                spreads.append((remaining[0] - remaining[-1]) / 1000)
+
+                # Score the round; the points are what the correct teams earned
+                correct = [int(ack["team_id"].removeprefix("team_")) for ack in acks if ack["answer"] == correct_answer]
+                await clients[0].command({"type": "home_trivia/next_question"})
+                bonuses = [team_sensors[number]._last_round_points - 10 for number in correct]
+                if any(later >= earlier for earlier, later in zip(bonuses, bonuses[1:])):
+                    failures["bonus"] += 1
+                await clients[0].command({"type": "home_trivia/start_game"})
+
+        return {
+            "teams": teams,
+            "rounds": rounds,
+            "ack": summarize(latencies),
+            "first_to_last_buzz": summarize(spreads),
+            "failed_rounds": failures,
+        }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(json.dumps(asyncio.run(run(args.teams, args.rounds))))
+
+
+if __name__ == "__main__":
+    main()
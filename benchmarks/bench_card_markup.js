@@ -0,0 +1,214 @@
+/*
+Measure the markup the Home Trivia card builds and parses per render, in Node.
+
+Usage (from the repository root):
+
+    node benchmarks/bench_card_markup.js [--card <path>] [--teams 8]
+        [--updates 300] [--tablet]
+
+Plays the same fake game as bench_card_render.html against the card, one
+render per game update, with a minimal DOM that parses nothing: it only
+counts the markup handed to <template> elements, which a browser would
+parse and diff against the live tree. This leaves out layout and paint, so
+it does not replace the browser benchmark, but it runs anywhere and its
+byte counts do not depend on the browser. --card loads another version of
+the card to compare, e.g. one saved with
+`git show <commit>:custom_components/home_trivia/www/home-trivia-card.js`.
+
+Reports:
+
+- render_ms: time of one render() call without any DOM work (p50, p95, max)
+- parsed_kb_per_render: markup parsed per render, on average
+- parsed_kb_first_render: markup parsed by the first render of the game screen
+
+With 8 teams and 300 updates, patching the whole screen from one markup
+string (styles included) parsed 34 KiB per render on the game screen and
+5.6 KiB on the tablet; filling the slots of the static skeleton parses
+5.4 KiB and 1.3 KiB. render_ms stays around 0.03 ms (p50) for both.
+*/
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function option(name, fallback) {
+  const index = process.argv.indexOf(`--${name}`);
+  return index === -1 ? fallback : process.argv[index + 1];
+}
+
+const CARD = option('card', path.join(__dirname, '..', 'custom_components', 'home_trivia', 'www', 'home-trivia-card.js'));
+const TEAMS = parseInt(option('teams', '8'), 10);
+const UPDATES = parseInt(option('updates', '300'), 10);
+const TABLET = process.argv.includes('--tablet');
+
+let parsedBytes = 0;
+
+// Just enough DOM for the card to render: elements keep their attributes and
+// text, and parsed markup is only counted
+class Element {
+  constructor(tagName) {
+    this.tagName = tagName.toUpperCase();
+    this.attributes = new Map();
+    this.dataset = {};
+    this.style = {};
+    this.classList = { toggle() {} };
+    this.text = '';
+    this.markup = '';
+  }
+
+  get textContent() { return this.text; }
+  set textContent(text) { this.text = String(text); }
+  get innerHTML() {
+    return this.text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+  }
+  set innerHTML(html) {
+    parsedBytes += html.length;
+    this.markup = html;
+    this.content = { markup: html, firstChild: null };
+  }
+
+  getAttribute(name) { return this.attributes.has(name) ? this.attributes.get(name) : null; }
+  setAttribute(name, value) { this.attributes.set(name, String(value)); }
+  append() {}
+  replaceChildren(content) { this.markup = content.markup; }
+  querySelector() { return null; }
+  getElementById() { return null; }
+
+  // The slots of a skeleton put in by replaceChildren()
+  querySelectorAll() {
+    return [...this.markup.matchAll(/data-(slot|region)="([^"]+)"/g)].map(([, kind, name]) => {
+      const element = new Element('div');
+      element.dataset[kind] = name;
+      return element;
+    });
+  }
+}
+
+class HTMLElement extends Element {
+  constructor() {
+    super('home-trivia-card');
+    this.isConnected = true;
+  }
+
+  attachShadow() {
+    this.shadowRoot = new Element('#shadow-root');
+    this.shadowRoot.activeElement = null;
+    return this.shadowRoot;
+  }
+}
+
+function loadCard() {
+  const storage = new Map();
+  const registry = new Map();
+  const context = {
+    HTMLElement,
+    Node: { ELEMENT_NODE: 1, TEXT_NODE: 3 },
+    document: { createElement: (tagName) => new Element(tagName) },
+    customElements: { get: (name) => registry.get(name), define: (name, cls) => registry.set(name, cls) },
+    localStorage: { getItem: (key) => storage.get(key) ?? null, setItem: (key, value) => storage.set(key, value) },
+    location: { origin: 'http://homeassistant.local:8123' },
+    fetch: async () => ({ ok: false }),
+    requestAnimationFrame: () => 0,
+    setTimeout: () => 0,
+    clearTimeout: () => {},
+    setInterval: () => 0,
+    clearInterval: () => {},
+    btoa: (text) => Buffer.from(text, 'binary').toString('base64'),
+    performance,
+    console: { ...console, info() {}, warn() {} },
+  };
+  context.window = context;
+  vm.createContext(context);
+  vm.runInContext(fs.readFileSync(CARD, 'utf8'), context, { filename: CARD });
+  return registry.get('home-trivia-card');
+}
+
+const state = (value, attributes) => ({ state: String(value), attributes, last_updated: new Date().toISOString() });
+const questions = [
+  { question: 'Which planet is known as the Red Planet?', answer_a: 'Mars', answer_b: 'Venus', answer_c: 'Jupiter', correct_answer: 'A', category: 'Science' },
+  { question: 'What is the largest ocean on Earth?', answer_a: 'Atlantic', answer_b: 'Pacific', answer_c: 'Indian', correct_answer: 'B', category: 'Geography' },
+  { question: 'How many legs does a spider have?', answer_a: 'Six', answer_b: 'Ten', answer_c: 'Eight', correct_answer: 'C', category: 'Nature' },
+];
+
+function initialStates() {
+  const states = {
+    game_status: state('playing', { team_count: TEAMS, max_team_count: 200, difficulty_level: 'Easy', game_mode: 'classic', current_round: 2 }),
+    countdown_timer: state(30, {}),
+    countdown_current: state(30, { is_running: true, initial_time: 30, deadline: new Date(Date.now() + 30000).toISOString() }),
+    current_question: state(questions[0].question, { ...questions[0], question_id: 1 }),
+    round_counter: state(1, {}),
+  };
+  for (let i = 1; i <= TEAMS; i++) {
+    states[`team_${i}`] = state(`Team ${i}`, {
+      points: 0, participating: true, answered: false, answer: null, user_id: i === 1 ? 'user' : null,
+      last_round_points: 0, correct_answer_streak: 0,
+    });
+  }
+  return states;
+}
+
+// The next game update, as in bench_card_render.html
+function gameUpdate(states, step) {
+  const changed = {};
+  const team = 1 + (step % TEAMS);
+  if (step % (TEAMS + 2) === TEAMS + 1) {
+    const question = questions[(step / (TEAMS + 2) | 0) % questions.length];
+    changed.current_question = state(question.question, { ...question, question_id: step });
+    changed.countdown_current = state(30, { is_running: true, initial_time: 30, deadline: new Date(Date.now() + 30000).toISOString() });
+    for (let i = 1; i <= TEAMS; i++) {
+      changed[`team_${i}`] = state(`Team ${i}`, { ...states[`team_${i}`].attributes, answered: false, answer: null });
+    }
+  } else if (step % 2) {
+    changed[`team_${team}`] = state(`Team ${team}`, { ...states[`team_${team}`].attributes, answered: true, answer: 'ABC'[step % 3] });
+  } else {
+    const attributes = states[`team_${team}`].attributes;
+    changed[`team_${team}`] = state(`Team ${team}`, { ...attributes, points: attributes.points + 10, last_round_points: 10 });
+  }
+  return changed;
+}
+
+function percentiles(samples) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const at = (fraction) => +sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * fraction))].toFixed(3);
+  return { p50: at(0.5), p95: at(0.95), max: at(1) };
+}
+
+function main() {
+  const HomeTriviaCard = loadCard();
+  const states = initialStates();
+  const hass = () => {
+    const all = {};
+    for (const [key, value] of Object.entries(states)) all[`sensor.home_trivia_${key}`] = value;
+    return { states: all, user: { id: 'user', is_admin: true }, language: 'en', callWS: async () => [], callService: async () => {} };
+  };
+
+  const card = new HomeTriviaCard();
+  card.setConfig({ tablet_mode: TABLET });
+  card._hass = hass();
+  parsedBytes = 0;
+  card.render();
+  const firstRender = parsedBytes;
+
+  const renderTimes = [];
+  parsedBytes = 0;
+  for (let step = 0; step < UPDATES; step++) {
+    Object.assign(states, gameUpdate(states, step));
+    card._hass = hass();
+    const start = performance.now();
+    card.render();
+    renderTimes.push(performance.now() - start);
+  }
+
+  console.log(JSON.stringify({
+    card: path.relative(process.cwd(), CARD),
+    teams: TEAMS,
+    updates: UPDATES,
+    tablet: TABLET,
+    render_ms: percentiles(renderTimes),
+    parsed_kb_per_render: +(parsedBytes / UPDATES / 1024).toFixed(2),
+    parsed_kb_first_render: +(firstRender / 1024).toFixed(1),
+  }));
+}
+
+main();
@@ -0,0 +1,253 @@
+"""Benchmark the game loop across bank sizes, team counts and game lengths.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_game_loop.py [--banks 55 10000 100000]
+        [--teams 2 20 200] [--rounds 10 50] [--output results.json]
+        [--compare baseline.json]
+
+For every bank size, a question pack is generated in the config directory
+of an in-process test instance of Home Assistant (55 is the bundled
+questions.json alone) and a game is set up. Then, for every team count and
+round count, a whole game is played through the services: start_game, then
+per round next_question, update_team_answer for every team and the
+countdown running out, then stop_game. The clock is faked, so every
+countdown expires right away instead of after the timer length.
+
+Reported per scenario:
+
+- setup: setting up the game, including loading the question bank
+- latency of every operation (mean, p50, p99 in ms); countdown_expiry is
+  the scheduled callback that ends a round
+- state_changes_per_round: state_changed events of the game's entities
+- allocations: a second, shorter game is played with tracemalloc; peak_kib
+  is the mean per round of the highest memory allocated during a round and
+  retained_kib what was still allocated when the game was over
+
+The results are printed and, with --output, saved as JSON together with
+the integration version and git commit. --compare prints the latencies that
+got more than 10% slower than in an earlier results file.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from datetime import timedelta
+
+from _harness import DOMAIN, async_add_game, async_home_assistant, summarize
+from bench_question_store import generate_questions
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.const import EVENT_STATE_CHANGED, __version__ as HA_VERSION
+from homeassistant.util import dt as dt_util
+
+from custom_components.home_trivia.const import DEFAULT_PACK_DIRECTORY
+from custom_components.home_trivia.question_bank import QUESTIONS_FILE
+
+MANIFEST_FILE = os.path.join(os.path.dirname(QUESTIONS_FILE), "manifest.json")
+
+# Rounds of the game played with tracemalloc
+ALLOCATION_ROUNDS = 10
+
+# Ratio of p50 latencies that --compare reports as a regression
+REGRESSION_RATIO = 1.1
+
+
+def write_pack(config_dir: str, bank_size: int) -> None:
+    """Write a pack that brings the bank to bank_size questions."""
+    with open(QUESTIONS_FILE, encoding="utf-8") as file:
+        builtin_count = len(json.load(file))
+    if bank_size <= builtin_count:
+        return
+    pack_directory = os.path.join(config_dir, DEFAULT_PACK_DIRECTORY)
+    os.makedirs(pack_directory, exist_ok=True)
+    with open(os.path.join(pack_directory, "benchmark.jsonl"), "w", encoding="utf-8") as file:
+        for question in generate_questions(bank_size - builtin_count):
+            # Keep the synthetic ids clear of the bundled questions
+            question["id"] += 1_000_000
+            file.write(json.dumps(question) + "\n")
+
+
+class FakeClock:
+    """Moves Home Assistant's timers forward without waiting."""
+
+    def __init__(self, hass) -> None:
+        self._hass = hass
+        self._offset = timedelta()
+
+    async def async_advance(self, seconds: float) -> None:
+        """Fire every timer due within the next seconds."""
+        self._offset += timedelta(seconds=seconds)
+        async_fire_time_changed(self._hass, dt_util.utcnow() + self._offset)
+        await self._hass.async_block_till_done()
+
+
+async def timed(latencies: dict[str, list[float]] | None, operation: str, awaitable) -> None:
+    """Await an operation and add its latency to latencies, if given."""
+    start = time.perf_counter()
+    await awaitable
+    if latencies is not None:
+        latencies[operation].append(time.perf_counter() - start)
+
+
+async def play_round(hass, clock: FakeClock, teams: int, latencies: dict[str, list[float]] | None = None) -> None:
+    """Play one round of a running game: a question, every team's answer and the countdown."""
+    await timed(latencies, "next_question", hass.services.async_call(DOMAIN, "next_question", {}, blocking=True))
+    for number in range(1, teams + 1):
+        await timed(latencies, "update_team_answer", hass.services.async_call(
+            DOMAIN, "update_team_answer", {"team_id": f"team_{number}", "answer": random.choice("ABC")}, blocking=True
+        ))
+    timer_length = hass.states.get("sensor.home_trivia_game_status").attributes["timer_length"]
+    await timed(latencies, "countdown_expiry", clock.async_advance(timer_length + 1))
+
+
+async def play_game(
+    hass, clock: FakeClock, teams: int, rounds: int, latencies: dict[str, list[float]] | None = None
+) -> None:
+    """Play a whole game through the services."""
+    await timed(latencies, "start_game", hass.services.async_call(DOMAIN, "start_game", {}, blocking=True))
+    for _ in range(rounds):
+        await play_round(hass, clock, teams, latencies)
+    await timed(latencies, "stop_game", hass.services.async_call(DOMAIN, "stop_game", {}, blocking=True))
+
+
+async def run_bank(bank_size: int, team_counts: list[int], round_counts: list[int]) -> list[dict]:
+    """Run every team and round count scenario for one bank size."""
+    results = []
+    async with async_home_assistant() as hass:
+        await hass.async_add_executor_job(write_pack, hass.config.config_dir, bank_size)
+        start = time.perf_counter()
+        entry = await async_add_game(hass)
+        setup_ms = round((time.perf_counter() - start) * 1000, 1)
+        game = hass.data[DOMAIN][entry.entry_id]
+        clock = FakeClock(hass)
+
+        state_changes = 0
+        prefix = f"sensor.{game['entity_prefix']}_"
+
+        def count_state_change(event) -> None:
+            nonlocal state_changes
+            if event.data["entity_id"].startswith(prefix):
+                state_changes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_change)
+
+        for teams in team_counts:
+            await hass.services.async_call(DOMAIN, "update_team_count", {"team_count": teams}, blocking=True)
+            await hass.async_block_till_done()
+            for rounds in round_counts:
+                latencies = {
+                    operation: []
+                    for operation in ("start_game", "next_question", "update_team_answer", "countdown_expiry", "stop_game")
+                }
+                state_changes = 0
+                await play_game(hass, clock, teams, rounds, latencies)
+                changes_per_round = state_changes / rounds
+
+                tracemalloc.start()
+                before = tracemalloc.get_traced_memory()[0]
+                peaks = []
+                await hass.services.async_call(DOMAIN, "start_game", {}, blocking=True)
+                for _ in range(ALLOCATION_ROUNDS):
+                    tracemalloc.reset_peak()
+                    round_start = tracemalloc.get_traced_memory()[0]
+                    await play_round(hass, clock, teams)
+                    peaks.append(tracemalloc.get_traced_memory()[1] - round_start)
+                await hass.services.async_call(DOMAIN, "stop_game", {}, blocking=True)
+                retained = tracemalloc.get_traced_memory()[0] - before
+                tracemalloc.stop()
+
+                results.append({
+                    "bank_size": game["game_manager"].question_bank.question_count,
+                    "teams": teams,
+                    "rounds": rounds,
+                    "setup_ms": setup_ms,
+                    "latency": {operation: summarize(samples) for operation, samples in latencies.items()},
+                    "state_changes_per_round": round(changes_per_round, 1),
+                    "allocations": {
+                        "peak_kib": round(sum(peaks) / len(peaks) / 1024, 1),
+                        "retained_kib": round(retained / 1024, 1),
+                    },
+                })
+                print(json.dumps(results[-1]))
+    return results
+
+
+def environment() -> dict:
+    """Return the versions the results were measured with."""
+    with open(MANIFEST_FILE, encoding="utf-8") as file:
+        version = json.load(file)["version"]
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(MANIFEST_FILE),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "version": version,
+        "commit": commit,
+        "home_assistant": HA_VERSION,
+        "python": platform.python_version(),
+    }
+
+
+def compare(results: list[dict], baseline_file: str) -> None:
+    """Print the latencies that regressed compared to an earlier results file."""
+    with open(baseline_file, encoding="utf-8") as file:
+        baseline = json.load(file)
+    scenario = lambda result: (result["bank_size"], result["teams"], result["rounds"])  # noqa: E731
+    before = {scenario(result): result for result in baseline["results"]}
+    regressions = 0
+    for result in results:
+        old = before.get(scenario(result))
+        if old is None:
+            continue
+        for operation, stats in result["latency"].items():
+            old_p50 = old["latency"].get(operation, {}).get("p50_ms")
+            if old_p50 and stats["p50_ms"] > old_p50 * REGRESSION_RATIO:
+                regressions += 1
+                print(
+                    f"Regression {scenario(result)} {operation}: p50 {old_p50} -> {stats['p50_ms']} ms "
+                    f"(baseline {baseline['environment'].get('commit')})"
+                )
+    print(f"{regressions} regressions compared to {baseline_file}")
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--banks", type=int, nargs="+", default=[55, 10000, 100000])
+    parser.add_argument("--teams", type=int, nargs="+", default=[2, 20, 200])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Report regressions against this earlier results file")
+    args = parser.parse_args()
+
+    # Keep the per-round info logging of the integration out of the measurements
+    logging.getLogger("custom_components.home_trivia").setLevel(logging.ERROR)
+    random.seed(0)
+
+    results = []
+    for bank_size in args.banks:
+        results += asyncio.run(run_bank(bank_size, args.teams, args.rounds))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"environment": environment(), "results": results}, file, indent=2)
+        print(f"Saved results to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
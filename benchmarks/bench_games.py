@@ -0,0 +1,76 @@
+"""Measure the startup cost and memory of every extra Home Trivia game.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_games.py [--games 5]
+
+Sets up --games config entries one after another in an in-process test
+instance of Home Assistant. For each game, the setup time and the memory it
+allocated (tracemalloc) are reported. The first game also loads the question
+bank; the following games share it, so they only pay for their own entities,
+GameManager and question decks.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from _harness import DOMAIN, MockConfigEntry, async_home_assistant
+
+
+async def play_round(hass, game_id: str) -> None:
+    """Start a game and draw a question, so the game builds its deck."""
+    await hass.services.async_call(DOMAIN, "start_game", {"game_id": game_id}, blocking=True)
+    await hass.services.async_call(DOMAIN, "next_question", {"game_id": game_id}, blocking=True)
+
+
+async def run(games: int) -> list[dict]:
+    """Set up the games and return one result per game."""
+    results = []
+    async with async_home_assistant() as hass:
+        tracemalloc.start()
+        for number in range(1, games + 1):
+            name = "Home Trivia" if number == 1 else f"Room {number}"
+            entry = MockConfigEntry(domain=DOMAIN, data={"name": name}, title=name)
+            entry.add_to_hass(hass)
+
+            memory_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            setup_seconds = time.perf_counter() - start
+            await play_round(hass, entry.entry_id)
+            memory_after = tracemalloc.get_traced_memory()[0]
+
+            results.append({
+                "game": number,
+                "setup_ms": round(setup_seconds * 1000, 2),
+                "memory_kib": round((memory_after - memory_before) / 1024, 1),
+                "question_banks": len(hass.data[DOMAIN]["question_banks"]),
+            })
+            print(json.dumps(results[-1]))
+        tracemalloc.stop()
+    return results
+
+
+def main() -> None:
+    """Run the measurement."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.games))
+    extra = results[1:]
+    if extra:
+        print(json.dumps({
+            "extra_game_setup_ms": round(sum(r["setup_ms"] for r in extra) / len(extra), 2),
+            "extra_game_memory_kib": round(sum(r["memory_kib"] for r in extra) / len(extra), 1),
+        }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Measure the cost of the game event journal.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_journal.py [--teams 20] [--rounds 200] [--what-if]
+
+Plays --rounds rounds with --teams teams in an in-process test instance of
+Home Assistant and reports:
+
+- record_us: time the event loop spends per journal event
+- flush_ms: time to write all buffered events in the executor
+- file_kib / events: size of the journal
+- replay_ms: reading the journal and replaying it into a scoreboard, and
+  whether the replayed summary matches the one set when the game stopped
+- rescore_rounds_per_s: rounds the scoring engine re-scores per second from
+  the journal's events, and whether re-scoring with the game's rules gives
+  every team the points it has; with --what-if, the winner and points per
+  team under a few other rules
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+from _harness import DOMAIN, async_add_game, async_home_assistant
+
+from custom_components.home_trivia.journal import read_events, replay, rescore
+from custom_components.home_trivia.scoring import ScoringRules
+
+# Rounds re-scored to measure the scoring engine's rate
+RESCORE_ROUNDS = 10000
+
+# Rules compared with --what-if
+WHAT_IF_RULES = {
+    "no_speed_bonus": ScoringRules(speed_bonus_per_second=0),
+    "double_speed_bonus": ScoringRules(speed_bonus_per_second=2),
+    "no_streak_bonus": ScoringRules(streak_length=0),
+    "streak_of_5": ScoringRules(streak_length=5, streak_bonus=50),
+}
+
+
+async def run(teams: int, rounds: int, what_if: bool = False) -> dict:
+    """Play a journaled game and return the measurements."""
+    async with async_home_assistant() as hass:
+        entry = await async_add_game(hass)
+        game = hass.data[DOMAIN][entry.entry_id]
+        game_manager, journal = game["game_manager"], game["journal"]
+        await hass.services.async_call(DOMAIN, "update_team_count", {"team_count": teams}, blocking=True)
+        await game_manager.start_game()
+
+        record = journal.record
+        record_seconds = 0.0
+        recorded_before = journal.events_recorded
+
+        def timed_record(event, **data):
+            nonlocal record_seconds
+            start = time.perf_counter()
+            record(event, **data)
+            record_seconds += time.perf_counter() - start
+
+        journal.record = timed_record
+        for _ in range(rounds):
+            await game_manager.next_question()
+            for number in range(1, teams + 1):
+                game_manager.submit_answer(number, random.choice("ABC"))
+        await game_manager.stop_game()
+        events = journal.events_recorded - recorded_before
+
+        start = time.perf_counter()
+        await journal.async_flush()
+        flush_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = await hass.async_add_executor_job(lambda: replay(read_events(journal.path)))
+        replay_seconds = time.perf_counter() - start
+
+        events_list = await hass.async_add_executor_job(lambda: list(read_events(journal.path)))
+        rescored = rescore(events_list, game_manager.scoring_rules)
+        # The bundled bank runs out of questions, so the game is re-scored often enough for a stable rate
+        repeats = RESCORE_ROUNDS // rescored["rounds"] if rescored["rounds"] else 0
+        start = time.perf_counter()
+        rescore(events_list * repeats, game_manager.scoring_rules)
+        rescore_seconds = time.perf_counter() - start
+        points = {team.team_key: team._points for team in game["context"].team_sensors.values()}
+
+        summary = hass.states.get("sensor.home_trivia_game_status").attributes["game_summary"]
+        result = {
+            "teams": teams,
+            "rounds": rounds,
+            "events": events,
+            "record_us": round(record_seconds / events * 1e6, 2),
+            "flush_ms": round(flush_seconds * 1000, 2),
+            "file_kib": round(os.path.getsize(journal.path) / 1024, 1),
+            "replay_ms": round(replay_seconds * 1000, 2),
+            "replay_matches_summary": result["summary"]["team_stats"] == summary["team_stats"],
+            # None when rotation dropped every scored round from the journal
+            "rescore_rounds_per_s": round(rescored["rounds"] * repeats / rescore_seconds) if repeats else None,
+            "rescore_matches_points": all(
+                rescored["teams"].get(team_key, {}).get("points", 0) == team_points
+                for team_key, team_points in points.items()
+            ),
+        }
+        if what_if:
+            result["what_if"] = {}
+            for name, rules in WHAT_IF_RULES.items():
+                teams_points = {team_key: team["points"] for team_key, team in rescore(events_list, rules)["teams"].items()}
+                result["what_if"][name] = {"winner": max(teams_points, key=teams_points.get), "points": teams_points}
+        return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--what-if", action="store_true", help="Re-score the game with other rules")
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(json.dumps(asyncio.run(run(args.teams, args.rounds, args.what_if))))
+
+
+if __name__ == "__main__":
+    main()
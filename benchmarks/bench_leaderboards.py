@@ -0,0 +1,90 @@
+"""Measure the cost of keeping the all-time leaderboards.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_leaderboards.py [--games 10000] [--teams 20]
+
+Ends --games games of --teams teams, with random points, against the shared
+leaderboards in an in-process test instance of Home Assistant, spread over
+the difficulty levels and 2 to --teams teams. Reports:
+
+- submit_us: event loop time to offer all results of one game
+- saves_per_game: share of games that changed a ranking and so scheduled a
+  write; it drops as the leaderboards fill up with better results
+- saves_last_1000: the same over the last 1000 games
+- query_us: time of one leaderboard query, as home_trivia/leaderboard runs it
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from _harness import DOMAIN, async_add_game, async_home_assistant
+
+# Games measured at the end for saves_last_1000
+TAIL_GAMES = 1000
+
+DIFFICULTY_LEVELS = ["Easy", "Medium", "Hard"]
+
+
+async def run(games: int, teams: int) -> dict:
+    """End games against the leaderboards and return the costs."""
+    async with async_home_assistant() as hass:
+        await async_add_game(hass)
+        leaderboards = hass.data[DOMAIN]["leaderboards"]
+
+        submit = []
+        tail_saves = 0
+        for game_number in range(games):
+            difficulty_level = random.choice(DIFFICULTY_LEVELS)
+            team_count = random.randint(2, teams)
+            rounds = random.randint(5, 30)
+            results = [
+                {
+                    "team_name": f"Team {team_number}",
+                    "points": random.randint(0, rounds * 40),
+                    "rounds": rounds,
+                    "game": DOMAIN,
+                    "ended_at": "2026-01-01T00:00:00+00:00",
+                }
+                for team_number in range(1, team_count + 1)
+            ]
+            saves = leaderboards.saves_scheduled
+            start = time.perf_counter()
+            leaderboards.async_submit(difficulty_level, team_count, results)
+            submit.append(time.perf_counter() - start)
+            if game_number >= games - TAIL_GAMES:
+                tail_saves += leaderboards.saves_scheduled - saves
+
+        query = []
+        for _ in range(1000):
+            start = time.perf_counter()
+            leaderboards.async_get(random.choice(DIFFICULTY_LEVELS), random.randint(2, teams))
+            query.append(time.perf_counter() - start)
+
+        return {
+            "games": games,
+            "teams": teams,
+            "submit_us": round(statistics.median(submit) * 1e6, 1),
+            "saves_per_game": round(leaderboards.saves_scheduled / games, 3),
+            "saves_last_1000": round(tail_saves / min(games, TAIL_GAMES), 3),
+            "query_us": round(statistics.median(query) * 1e6, 1),
+        }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--teams", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.games, args.teams))))
+
+
+if __name__ == "__main__":
+    main()
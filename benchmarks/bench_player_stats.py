@@ -0,0 +1,114 @@
+"""Measure the long-term player statistics database.
+
+Usage (from the repository root, in a Home Assistant development environment):
+
+    python benchmarks/bench_player_stats.py [--games 500] [--rounds 20]
+        [--players 20] [--categories 24]
+
+Plays --games games of --rounds rounds against a fresh database in a
+temporary directory, with --players players spread over the games (2 to 8
+per game) and answers in --categories categories, writing one batch per
+round as PlayerStats does. Reports:
+
+- write_ms: executor time to write the results of one round (p50 and max)
+- end_game_ms: executor time to count the MVP of a game
+- player_ms: one player's totals, best category and per-category stats,
+  as home_trivia/player_stats returns them
+- best_category_ms: the best category of one player
+- mvps_ms: the all-time MVP ranking with the best category of every player
+- database_kb: size of the database file
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.home_trivia.player_stats import PlayerStatsStore  # noqa: E402
+
+# Queries timed per query type
+QUERIES = 200
+
+
+def ms(samples: list[float]) -> float:
+    """Return the median of durations in seconds, in milliseconds."""
+    return round(statistics.median(samples) * 1e3, 3)
+
+
+def run(games: int, rounds: int, players: int, categories: int) -> dict:
+    """Play games against a fresh database and return the costs."""
+    user_ids = [f"user_{number}" for number in range(players)]
+    category_names = [f"Category {number}" for number in range(categories)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "player_stats.db")
+        store = PlayerStatsStore(path)
+
+        write = []
+        end_game = []
+        for game_number in range(games):
+            game_key = f"game_{game_number}"
+            game_players = random.sample(user_ids, random.randint(2, min(8, players)))
+            streaks = dict.fromkeys(game_players, 0)
+            correct_answers = dict.fromkeys(game_players, 0)
+            for _ in range(rounds):
+                rows = []
+                for user_id in game_players:
+                    correct = random.random() < 0.5
+                    streaks[user_id] = streaks[user_id] + 1 if correct else 0
+                    correct_answers[user_id] += correct
+                    rows.append((user_id, correct, random.randint(10, 40) if correct else 0, streaks[user_id]))
+                start = time.perf_counter()
+                store.write([("round", game_key, "bench", random.choice(category_names), rows)])
+                write.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            store.write([("end", game_key, max(game_players, key=correct_answers.get))])
+            end_game.append(time.perf_counter() - start)
+
+        def timed(query) -> list[float]:
+            samples = []
+            for _ in range(QUERIES):
+                start = time.perf_counter()
+                query()
+                samples.append(time.perf_counter() - start)
+            return samples
+
+        player = timed(lambda: store.player(random.choice(user_ids)))
+        best_category = timed(lambda: store.best_category(random.choice(user_ids)))
+        mvps = timed(lambda: store.mvps(10))
+        store.close()
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+    return {
+        "games": games,
+        "rounds": rounds,
+        "players": players,
+        "categories": categories,
+        "write_ms": {"p50": ms(write), "max": round(max(write) * 1e3, 3)},
+        "end_game_ms": ms(end_game),
+        "player_ms": ms(player),
+        "best_category_ms": ms(best_category),
+        "mvps_ms": ms(mvps),
+        "database_kb": round(size / 1024),
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--categories", type=int, default=24)
+    args = parser.parse_args()
+    print(json.dumps(run(args.games, args.rounds, args.players, args.categories)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Compare question draw latency of the in-memory (JSON) bank and the SQLite store.
+
+Usage (from the repository root, in a Home Assistant development environment):
+
+    python benchmarks/bench_question_store.py [--sizes 1000 100000 1000000] [--draws 1000]
+
+For every bank size a synthetic question pack is generated, then each
+backend draws --draws unplayed questions of one difficulty level:
+
+- json-filter: the original approach, filtering the difficulty list against
+  the played ids and calling random.choice on every draw
+- json-deck: the shuffled QuestionDeck used by the in-memory bank
+- sqlite: QuestionStore.draw, one indexed query per draw
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.home_trivia.question_bank import QuestionDeck  # noqa: E402
+from custom_components.home_trivia.question_store import QuestionStore  # noqa: E402
+
+DIFFICULTY_LEVELS = ("Kids", "Easy", "Medium", "Hard")
+CATEGORIES = ("Fun Facts", "History", "Geography", "Music", "Literature", "Science", "Politics")
+
+
+def generate_questions(count: int):
+    """Yield synthetic questions in the questions.json schema."""
+    for question_id in range(1, count + 1):
+        yield {
+            "id": question_id,
+            "category": CATEGORIES[question_id % len(CATEGORIES)],
+            "question": f"Synthetic question number {question_id}?",
+            "answer_a": "Alpha",
+            "answer_b": "Bravo",
+            "answer_c": "Charlie",
+            "correct_answer": "ABC"[question_id % 3],
+            "fun_fact": "Synthetic questions are generated for benchmarking.",
+            "difficulty_level": DIFFICULTY_LEVELS[question_id % len(DIFFICULTY_LEVELS)],
+        }
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return latency percentiles in microseconds."""
+    samples = sorted(samples)
+    return {
+        "mean_us": round(statistics.fmean(samples) * 1e6, 2),
+        "p50_us": round(samples[len(samples) // 2] * 1e6, 2),
+        "p99_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6, 2),
+    }
+
+
+def bench_json_filter(questions: list[dict], difficulty_level: str, draws: int) -> list[float]:
+    """Time the original filter + random.choice draw."""
+    played_question_ids = []
+    samples = []
+    for _ in range(draws):
+        start = time.perf_counter()
+        available = [q for q in questions if q.get("difficulty_level") == difficulty_level]
+        unplayed = [q for q in available if q.get("id") not in played_question_ids]
+        question = random.choice(unplayed)
+        played_question_ids.append(question["id"])
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_json_deck(questions: list[dict], difficulty_level: str, draws: int) -> list[float]:
+    """Time draws from a shuffled deck."""
+    deck = QuestionDeck(
+        [q["id"] for q in questions if q["difficulty_level"] == difficulty_level], generation=1
+    )
+    samples = []
+    for _ in range(draws):
+        start = time.perf_counter()
+        deck.draw()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_sqlite(store: QuestionStore, difficulty_level: str, draws: int) -> list[float]:
+    """Time indexed draws from the SQLite store."""
+    store.reset_played("benchmark")
+    samples = []
+    for _ in range(draws):
+        start = time.perf_counter()
+        store.draw(difficulty_level, "benchmark")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 1_000_000])
+    parser.add_argument("--draws", type=int, default=1000)
+    parser.add_argument("--filter-max-size", type=int, default=100_000,
+                        help="skip the (slow) json-filter path above this bank size")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in args.sizes:
+            questions = list(generate_questions(size))
+            draws = min(args.draws, size // len(DIFFICULTY_LEVELS))
+
+            store = QuestionStore(os.path.join(tmp_dir, f"questions_{size}.db"))
+            start = time.perf_counter()
+            store.import_questions(questions)
+            import_seconds = time.perf_counter() - start
+
+            paths = {
+                "json-deck": bench_json_deck(questions, "Easy", draws),
+                "sqlite": bench_sqlite(store, "Easy", draws),
+            }
+            if size <= args.filter_max_size:
+                paths["json-filter"] = bench_json_filter(questions, "Easy", draws)
+            store.close()
+
+            for path, samples in paths.items():
+                result = {"bank_size": size, "path": path, "draws": draws, **summarize(samples)}
+                if path == "sqlite":
+                    result["import_s"] = round(import_seconds, 2)
+                results.append(result)
+                print(json.dumps(result))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
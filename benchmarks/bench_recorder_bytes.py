@@ -0,0 +1,144 @@
+"""Measure how many attribute bytes a game round writes to the recorder.
+
+Usage (from the repository root, in a Home Assistant development environment):
+
+    python benchmarks/bench_recorder_bytes.py [--teams 5] [--rounds 20]
+
+Plays rounds against the real sensors and round scoring, capturing every
+state write through the sensors' write batch instead of a running Home
+Assistant. For each write, the JSON size of the attributes is counted twice:
+everything (before) and without the sensor's _unrecorded_attributes (after).
+Like the recorder, an attribute set identical to the entity's previous one
+is not counted again.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.home_trivia import _process_round_scoring  # noqa: E402
+from custom_components.home_trivia.question_bank import (  # noqa: E402
+    QUESTIONS_FILE,
+    build_question_payload,
+)
+from custom_components.home_trivia.sensor import (  # noqa: E402
+    GameContext,
+    HomeTriviaCountdownCurrentSensor,
+    HomeTriviaCountdownTimerSensor,
+    HomeTriviaCurrentQuestionSensor,
+    HomeTriviaGameStatusSensor,
+    HomeTriviaHighscoreSensor,
+    HomeTriviaPlayedQuestionsSensor,
+    HomeTriviaRoundCounterSensor,
+    HomeTriviaTeamSensor,
+    StateWriteBatch,
+    TeamSensors,
+)
+
+
+class RecorderMeter(StateWriteBatch):
+    """Write batch that measures attribute bytes instead of writing states."""
+
+    def __init__(self) -> None:
+        """Initialize the meter."""
+        super().__init__()
+        self.bytes_all = 0
+        self.bytes_recorded = 0
+        self._last_all: dict = {}
+        self._last_recorded: dict = {}
+
+    def flush(self) -> None:
+        """Measure every entity changed during the batch."""
+        pending, self._pending = self._pending, {}
+        for entity in pending:
+            attributes = entity.extra_state_attributes
+            recorded = {
+                key: value
+                for key, value in attributes.items()
+                if key not in entity._unrecorded_attributes
+            }
+            self.bytes_all += self._measure(self._last_all, entity, attributes)
+            self.bytes_recorded += self._measure(self._last_recorded, entity, recorded)
+        self.writes += len(pending)
+
+    @staticmethod
+    def _measure(last: dict, entity, attributes: dict) -> int:
+        """Return the size of an attribute set, or 0 if unchanged."""
+        payload = json.dumps(attributes, separators=(",", ":"), default=str)
+        if last.get(id(entity)) == payload:
+            return 0
+        last[id(entity)] = payload
+        return len(payload.encode())
+
+
+async def play(teams: int, rounds: int) -> dict:
+    """Play rounds and return the measured bytes."""
+    with open(QUESTIONS_FILE) as f:
+        questions = json.load(f)
+
+    meter = RecorderMeter()
+    # The sensors are never added to Home Assistant, so the teams are set up by hand
+    team_sensors = TeamSensors(None, {}, meter, None)
+    team_sensors.sensors.update({i: HomeTriviaTeamSensor(i) for i in range(1, teams + 1)})
+    main_sensor = HomeTriviaGameStatusSensor(None)
+    main_sensor._team_count = teams
+    context = GameContext(
+        main_sensor=main_sensor,
+        teams=team_sensors,
+        countdown_sensor=HomeTriviaCountdownTimerSensor(),
+        countdown_current_sensor=HomeTriviaCountdownCurrentSensor(),
+        current_question_sensor=HomeTriviaCurrentQuestionSensor(),
+        round_counter_sensor=HomeTriviaRoundCounterSensor(),
+        played_questions_sensor=HomeTriviaPlayedQuestionsSensor(),
+        highscore_sensor=HomeTriviaHighscoreSensor(),
+        write_batch=meter,
+    )
+    team_sensors = context.team_sensors
+    for sensor in context.sensors:
+        sensor._write_batch = meter
+    for number, team_sensor in enumerate(team_sensors.values(), start=1):
+        team_sensor._user_id = f"user_{number}"
+
+    for round_number in range(rounds):
+        question = questions[round_number % len(questions)]
+        with meter:
+            context.current_question_sensor.update_current_question(build_question_payload(question))
+            context.played_questions_sensor.add_played_question(question["id"])
+
+        # Every answer is its own service call
+        for team_sensor in team_sensors.values():
+            with meter:
+                team_sensor.update_team_answer_with_time(random.choice("ABC"), random.randint(0, 30))
+                team_sensor.update_team_answered(True)
+
+        with meter:
+            await _process_round_scoring(context)
+
+    return {
+        "teams": teams,
+        "rounds": rounds,
+        "writes": meter.writes,
+        "bytes_per_round_before": round(meter.bytes_all / rounds),
+        "bytes_per_round_after": round(meter.bytes_recorded / rounds),
+    }
+
+
+def main() -> None:
+    """Run the measurement."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(json.dumps(asyncio.run(play(args.teams, args.rounds))))
+
+
+if __name__ == "__main__":
+    main()
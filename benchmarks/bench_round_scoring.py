@@ -0,0 +1,78 @@
+"""Measure round-scoring latency for growing team counts.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_round_scoring.py [--teams 5 50 200] [--rounds 50]
+
+For every team count, a game is set up in an in-process test instance of
+Home Assistant and --rounds rounds are played: every team answers through
+the update_team_answer service, then the round is scored the way
+next_question does it, inside the game's write batch. Reported per round:
+
+- scoring: _process_round_scoring (points, streaks, stats)
+- flush: writing the changed team and game sensors when the batch ends
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from _harness import DOMAIN, async_add_game, async_home_assistant, summarize
+
+from custom_components.home_trivia import _process_round_scoring
+
+
+async def run(team_count: int, rounds: int) -> dict:
+    """Play rounds with team_count teams and return the latencies."""
+    async with async_home_assistant() as hass:
+        entry = await async_add_game(hass)
+        await hass.services.async_call(DOMAIN, "update_team_count", {"team_count": team_count}, blocking=True)
+        await hass.services.async_call(DOMAIN, "start_game", {}, blocking=True)
+        await hass.services.async_call(DOMAIN, "next_question", {}, blocking=True)
+        await hass.async_block_till_done()
+
+        context = hass.data[DOMAIN][entry.entry_id]["context"]
+        write_batch = context.write_batch
+        scoring, flush = [], []
+        for _ in range(rounds):
+            for team_number in range(1, team_count + 1):
+                await hass.services.async_call(
+                    DOMAIN, "update_team_answer",
+                    {"team_id": f"team_{team_number}", "answer": random.choice("ABC")},
+                    blocking=True,
+                )
+
+            start = time.perf_counter()
+            with write_batch:
+                await _process_round_scoring(context)
+                scored = time.perf_counter()
+            end = time.perf_counter()
+            scoring.append(scored - start)
+            flush.append(end - scored)
+
+        return {
+            "teams": len(context.teams),
+            "rounds": rounds,
+            "scoring": summarize(scoring),
+            "flush": summarize(flush),
+        }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, nargs="+", default=[5, 50, 200])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    for team_count in args.teams:
+        print(json.dumps(asyncio.run(run(team_count, args.rounds))))
+
+
+if __name__ == "__main__":
+    main()
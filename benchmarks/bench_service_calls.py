@@ -0,0 +1,154 @@
+"""Measure the per-call overhead of the game's lightweight services.
+
+Usage (from the repository root, in a Home Assistant development environment
+with pytest-homeassistant-custom-component installed):
+
+    python benchmarks/bench_service_calls.py [--teams 20] [--calls 2000]
+        [--repeats 5] [--output results.json] [--compare baseline.json]
+
+A game with --teams teams is set up in an in-process test instance of Home
+Assistant and every service below is called --calls times through the
+service registry (blocking), alternating between two values so every call
+changes a state, --repeats times; the best p50 of the repeats is reported,
+which keeps noise from other processes out of the comparison. submit_answer
+is the websocket answer path, called directly on the GameManager. Per
+service:
+
+- p50_us: the whole call, including the state writes.
+- overhead_us: the same with the game's write batch held open, so the state
+  writes are deferred and only coalesced, minus the p50 of a no-op service
+  registered next to them. This is the time spent in the integration
+  itself: resolving the game, finding the entities and running the handler.
+
+--compare prints every service whose overhead changed by more than 10%
+compared to an earlier results file.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import time
+
+from _harness import DOMAIN, async_add_game, async_home_assistant
+
+# Ratio of overheads that --compare reports
+CHANGE_RATIO = 1.1
+
+
+def service_calls(teams: int) -> dict[str, list[dict]]:
+    """Return the alternating service data of every measured service."""
+    last_team = f"team_{teams}"
+    return {
+        "update_team_name": [{"team_id": last_team, "name": "Quizzards"}, {"team_id": last_team, "name": "Brainiacs"}],
+        "update_team_points": [{"team_id": last_team, "points": 10}, {"team_id": last_team, "points": 20}],
+        "update_team_participating": [
+            {"team_id": last_team, "participating": False}, {"team_id": last_team, "participating": True},
+        ],
+        "update_team_answer": [{"team_id": last_team, "answer": "A"}, {"team_id": last_team, "answer": "B"}],
+        "update_team_user_id": [{"team_id": last_team, "user_id": "abc"}, {"team_id": last_team, "user_id": None}],
+        "update_difficulty_level": [{"difficulty_level": "Medium"}, {"difficulty_level": "Easy"}],
+        "update_countdown_timer_length": [{"timer_length": 20}, {"timer_length": 30}],
+        "update_game_mode": [{"game_mode": "buzzer"}, {"game_mode": "classic"}],
+    }
+
+
+def p50_us(samples: list[float]) -> float:
+    """Return the median of latencies in seconds, in microseconds."""
+    return round(statistics.median(samples) * 1e6, 1)
+
+
+async def run(teams: int, calls: int, repeats: int) -> dict:
+    """Call every service and return the p50 latency and overhead per service."""
+    async with async_home_assistant() as hass:
+        entry = await async_add_game(hass)
+        await hass.services.async_call(DOMAIN, "update_team_count", {"team_count": teams}, blocking=True)
+        await hass.services.async_call(DOMAIN, "start_game", {}, blocking=True)
+        await hass.async_block_till_done()
+
+        async def noop(call) -> None:
+            """Do nothing, to measure the service registry."""
+
+        hass.services.async_register("bench", "noop", noop)
+
+        game = hass.data[DOMAIN][entry.entry_id]
+        # Every sensor shares the game's write batch
+        write_batch = game["game_store"].entities[0]._write_batch
+        game_manager = game["game_manager"]
+
+        async def call_service(domain: str, service: str, data: dict) -> None:
+            await hass.services.async_call(domain, service, data, blocking=True)
+
+        async def submit_answer(domain: str, service: str, data: dict) -> None:
+            game_manager.submit_answer(data["team_number"], data["answer"])
+
+        async def measure(call, domain: str, service: str, data: list[dict]) -> float:
+            best = None
+            for _ in range(repeats):
+                samples = []
+                gc.disable()
+                try:
+                    for number in range(calls):
+                        start = time.perf_counter()
+                        await call(domain, service, data[number % 2])
+                        samples.append(time.perf_counter() - start)
+                finally:
+                    gc.enable()
+                await hass.async_block_till_done()
+                best = p50_us(samples) if best is None else min(best, p50_us(samples))
+            return best
+
+        noop_p50 = await measure(call_service, "bench", "noop", [{}, {}])
+        calls_by_service = {service: (call_service, data) for service, data in service_calls(teams).items()}
+        calls_by_service["submit_answer"] = (
+            submit_answer, [{"team_number": teams, "answer": "A"}, {"team_number": teams, "answer": "B"}]
+        )
+        results = {}
+        for service, (call, data) in calls_by_service.items():
+            await measure(call, DOMAIN, service, data)  # Warm up
+            latency = await measure(call, DOMAIN, service, data)
+            with write_batch:
+                deferred = await measure(call, DOMAIN, service, data)
+            # submit_answer does not go through the service registry
+            registry = noop_p50 if call is call_service else 0
+            results[service] = {"p50_us": latency, "overhead_us": round(deferred - registry, 1)}
+
+        return {"teams": teams, "calls": calls, "repeats": repeats, "noop_p50_us": noop_p50, "services": results}
+
+
+def compare(result: dict, baseline_file: str) -> None:
+    """Print the services whose overhead changed compared to an earlier results file."""
+    with open(baseline_file, encoding="utf-8") as file:
+        baseline = json.load(file)
+    for service, stats in result["services"].items():
+        old = baseline["services"].get(service, {}).get("overhead_us")
+        if not old or stats["overhead_us"] <= 0:
+            continue
+        ratio = stats["overhead_us"] / old
+        if ratio > CHANGE_RATIO or ratio < 1 / CHANGE_RATIO:
+            print(f"{service}: overhead {old} -> {stats['overhead_us']} us ({(ratio - 1) * 100:+.0f}%)")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Report changes against this earlier results file")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.teams, args.calls, args.repeats))
+    print(json.dumps(result))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=2)
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
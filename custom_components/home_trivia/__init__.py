@@ -1,28 +1,81 @@
 """The Home Trivia integration."""
-import json
+from __future__ import annotations
+
+import asyncio
+import contextlib
 import logging
-import os
-import random
+import re
+import time
+from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.util import dt as dt_util
+from homeassistant.util.ulid import ulid_now
+
+from .const import (
+    ATTR_GAME_ID,
+    CONF_GAME_NAME,
+    CONF_PACK_DIRECTORY,
+    CONF_USE_QUESTION_DATABASE,
+    DEFAULT_GAME_NAME,
+    DEFAULT_PACK_DIRECTORY,
+    DOMAIN,
+    GAME_MODE_BUZZER,
+    GAME_MODES,
+    MAX_TEAM_COUNT,
+    PLAYER_STATS_DATABASE_FILE,
+    QUESTION_DATABASE_FILE,
+)
+from .game_store import GameStateStore
+from .journal import GameJournal
+from .leaderboard import Leaderboards
+from .metrics import GameMetrics
+from .naming import game_display_name, game_entity_prefix
+from .player_stats import PlayerStats, PlayerStatsStore
+from .question_bank import PreparedQuestion, QuestionBank, QuestionDeck, build_question_payload
+from .question_store import QuestionStore
+from .scoring import DEFAULT_SCORING_RULES, RoundAnswers, ScoringRules, score_round
 
-from .const import DOMAIN
+if TYPE_CHECKING:
+    from .sensor import GameContext, HomeTriviaTeamSensor
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# The team_id of the services and websocket commands, e.g. team_3
+TEAM_ID = re.compile(r"^team_(\d+)$")
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up Home Trivia integration from YAML (if needed)."""
     _LOGGER.info("Setting up Home Trivia integration from YAML")
     hass.data.setdefault(DOMAIN, {})
 
-    # Register frontend resources (card JS)
-    await _register_frontend_resources(hass)
+    # The all-time leaderboards are shared by all games
+    leaderboards = hass.data[DOMAIN]["leaderboards"] = Leaderboards(hass)
+    await leaderboards.async_load()
+
+    # So are the long-term player statistics; the database is opened on the first write
+    player_stats = hass.data[DOMAIN]["player_stats"] = PlayerStats(
+        hass, PlayerStatsStore(hass.config.path(PLAYER_STATS_DATABASE_FILE))
+    )
+
+    async def _close_player_stats(_event) -> None:
+        """Write the buffered player statistics before Home Assistant shuts down."""
+        await player_stats.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _close_player_stats)
+
+    # Serve the card under content-hashed URLs; done here so it happens once, not per game
+    from .frontend import async_register_frontend
+    await async_register_frontend(hass)
+
+    # Websocket commands cannot be unregistered, so they are registered once for all games
+    from .websocket_api import async_register_websocket_commands
+    async_register_websocket_commands(hass)
 
     # If user placed "home_trivia:" in configuration.yaml, import it into a config entry
     if DOMAIN in config:
@@ -34,56 +87,71 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             )
     return True
 
-async def _register_frontend_resources(hass: HomeAssistant) -> None:
-    """Register the JS so that "/home_trivia_frontend_assets/home-trivia-card.js" is served."""
-    www_dir = os.path.join(os.path.dirname(__file__), "www")
-    card_file = os.path.join(www_dir, "home-trivia-card.js")
-
-    if not os.path.isfile(card_file):
-        _LOGGER.warning("Home Trivia card file not found at %s", card_file)
-        return
-
-    await hass.http.async_register_static_paths([
-        StaticPathConfig(
-            url_path="/home_trivia_frontend_assets",
-            path=www_dir,
-            cache_headers=False
-        )
-    ])
-    _LOGGER.info("Registered Home Trivia static path → %s", www_dir)
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Home Trivia from a config entry."""
     _LOGGER.info("Setting up Home Trivia config entry %s", entry.entry_id)
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {}
+    
+    # Every config entry is a separate game with its own entities and GameManager
+    game_name = entry.data.get(CONF_GAME_NAME, DEFAULT_GAME_NAME)
+    game = hass.data[DOMAIN][entry.entry_id] = {
+        "name": game_display_name(game_name),
+        "entity_prefix": game_entity_prefix(game_name),
+    }
+
+    # Load the question bank once; it is only re-read when a question pack changes
+    question_bank, question_store = await _async_setup_question_source(hass, entry)
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
 
-    # Register frontend resources (card JS)
-    await _register_frontend_resources(hass)
+    # Load the saved game once; the sensors restore from it when they are added
+    game_store = GameStateStore(hass, entry.entry_id)
+    await game_store.async_load()
+    game["game_store"] = game_store
+    game["journal"] = journal = GameJournal(hass, entry.entry_id)
+    game["metrics"] = GameMetrics()
+    game["scoring_rules"] = ScoringRules.from_options(entry.options)
+    
+    async def _flush_journal(_event) -> None:
+        """Write the buffered journal events before Home Assistant shuts down."""
+        await journal.async_flush()
+    
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _flush_journal))
 
     # Forward to sensor platform (so sensor.py is loaded)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Create and store GameManager instance
-    game_manager = GameManager(hass)
-    hass.data[DOMAIN]["game_manager"] = game_manager
+    # Create and store GameManager instance, with the entities the sensor platform set up
+    game_manager = GameManager(
+        hass,
+        entry.entry_id,
+        game["context"],
+        question_bank,
+        question_store,
+        game["entity_prefix"],
+        game["journal"],
+        game["metrics"],
+        hass.data[DOMAIN].get("leaderboards"),
+        hass.data[DOMAIN].get("player_stats"),
+    )
+    game["game_manager"] = game_manager
 
-    # Register all game services (after entities are created)
-    await _register_services(hass)
+    # Register all game services (after entities are created); shared by all games
+    if not hass.services.has_service(DOMAIN, "start_game"):
+        await _register_services(hass)
     
     # Sync persistent settings to other sensors after a short delay
     async def _sync_persistent_settings():
         """Sync persistent settings from main sensor to other sensors."""
         try:
-            entities = hass.data.get(DOMAIN, {}).get("entities", {})
-            main_sensor = entities.get("main_sensor")
-            timer_sensor = entities.get("countdown_sensor")
+            context = game_manager.context
+            main_sensor = context.main_sensor
+            
+            # Create or remove team sensors to match the restored team count
+            await context.teams.async_set_count(hass, main_sensor._team_count)
             
-            if main_sensor and timer_sensor:
-                # Sync timer length from main sensor to timer sensor
-                if hasattr(main_sensor, '_timer_length') and hasattr(timer_sensor, 'update_timer_length'):
-                    timer_sensor.update_timer_length(main_sensor._timer_length)
-                    _LOGGER.debug("Synced timer length from main sensor: %d", main_sensor._timer_length)
+            # Sync timer length from main sensor to timer sensor
+            context.countdown_sensor.update_timer_length(main_sensor._timer_length)
+            _LOGGER.debug("Synced timer length from main sensor: %d", main_sensor._timer_length)
         except Exception as e:
             _LOGGER.warning("Could not sync persistent settings: %s", e)
     
@@ -92,804 +160,972 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     return True
 
-async def _process_round_scoring(entities: dict) -> None:
-    """Process scoring for the current round before moving to next question."""
+def _get_pack_directory(hass: HomeAssistant, entry: ConfigEntry) -> str | None:
+    """Return the absolute question pack directory, or None if packs are disabled."""
+    pack_directory = entry.options.get(CONF_PACK_DIRECTORY, DEFAULT_PACK_DIRECTORY)
+    return hass.config.path(pack_directory) if pack_directory else None
+
+def _loaded_games(hass: HomeAssistant) -> dict[str, dict]:
+    """Return the data of every set up game, keyed by config entry id."""
+    domain_data = hass.data.get(DOMAIN, {})
+    return {
+        entry.entry_id: domain_data[entry.entry_id]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if "game_manager" in domain_data.get(entry.entry_id, {})
+    }
+
+def _resolve_game(hass: HomeAssistant, game_id: str | None) -> dict | None:
+    """Return the data of a game by config entry id, name or entity prefix.
     
-    # Get the current question to check if we have a round to score
-    current_question_sensor = entities.get("current_question_sensor")
-    if not current_question_sensor or not hasattr(current_question_sensor, '_current_question'):
-        _LOGGER.debug("No current question found, skipping round scoring")
-        return
+    Without a game_id, the only game is used, or else the default
+    "Home Trivia" game, so single-game setups need no game_id at all.
+    """
+    games = _loaded_games(hass)
+    if game_id:
+        if game_id in games:
+            return games[game_id]
+        for game in games.values():
+            if game["entity_prefix"] in (game_id, game_entity_prefix(game_id)):
+                return game
+        return None
+    if len(games) == 1:
+        return next(iter(games.values()))
+    default_prefix = game_entity_prefix(DEFAULT_GAME_NAME)
+    return next((game for game in games.values() if game["entity_prefix"] == default_prefix), None)
+
+def _parse_team_id(team_id: str) -> int | None:
+    """Return the team number of a team_id such as team_3, or None if it is not one."""
+    match = TEAM_ID.match(str(team_id))
+    return int(match.group(1)) if match else None
+
+def _get_question_bank(hass: HomeAssistant, pack_directory: str | None) -> QuestionBank:
+    """Return the question bank for a pack directory, shared by all games using it.
+    
+    Games only read from the bank; each GameManager keeps its own decks.
+    The bank is released once no loaded game uses it.
+    """
+    question_banks = hass.data[DOMAIN].setdefault("question_banks", {})
+    question_bank = question_banks.get(pack_directory)
+    if question_bank is None:
+        question_bank = QuestionBank(hass, pack_directory)
+        question_banks[pack_directory] = question_bank
+    return question_bank
+
+def _evict_unused_question_banks(hass: HomeAssistant) -> None:
+    """Drop the question banks no loaded game reads from, e.g. after its pack directory changed."""
+    question_banks = hass.data[DOMAIN].get("question_banks", {})
+    in_use = {id(game["game_manager"].question_bank) for game in _loaded_games(hass).values()}
+    for pack_directory, question_bank in list(question_banks.items()):
+        if id(question_bank) not in in_use:
+            del question_banks[pack_directory]
+            _LOGGER.debug("Released the question bank of %s", pack_directory or "the bundled questions")
+
+def _get_question_store(hass: HomeAssistant) -> QuestionStore:
+    """Return the shared SQLite question store, creating it on first use."""
+    question_store = hass.data[DOMAIN].get("question_store")
+    if question_store is None:
+        question_store = QuestionStore(hass.config.path(QUESTION_DATABASE_FILE))
+        hass.data[DOMAIN]["question_store"] = question_store
+    return question_store
+
+async def _async_setup_question_source(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> tuple[QuestionBank, QuestionStore | None]:
+    """Set up the question bank and, if enabled, the question database.
+    
+    When the database is enabled and populated, the in-memory bank is not
+    loaded at all, so very large banks never have to fit in memory.
+    """
+    question_bank = _get_question_bank(hass, _get_pack_directory(hass, entry))
+    
+    question_store = None
+    if entry.options.get(CONF_USE_QUESTION_DATABASE, False):
+        question_store = _get_question_store(hass)
+        if not await hass.async_add_executor_job(question_store.question_count):
+            _LOGGER.warning(
+                "Question database %s is empty, using question packs instead. "
+                "Run home_trivia.import_question_database to build it.",
+                question_store.path,
+            )
+            question_store = None
+    
+    if question_store is None:
+        await question_bank.async_load()
+    return question_bank, question_store
+
+async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Switch question source and scoring rules when the options change."""
+    question_bank, question_store = await _async_setup_question_source(hass, entry)
+    game = hass.data[DOMAIN].get(entry.entry_id, {})
+    game["scoring_rules"] = ScoringRules.from_options(entry.options)
+    game_manager = game.get("game_manager")
+    if game_manager:
+        game_manager.question_bank = question_bank
+        game_manager.question_store = question_store
+    _evict_unused_question_banks(hass)
+
+async def _process_round_scoring(
+    context: GameContext, journal: GameJournal | None = None, rules: ScoringRules | None = None
+) -> tuple[str | None, dict[str, dict]] | None:
+    """Process scoring for the current round before moving to next question.
+    
+    The answers of the participating teams are collected into arrays and
+    scored by the scoring engine; the results are then applied to the team
+    sensors. Returns the category and the per-team results of the round, or
+    None if there was no round to score.
+    """
     
-    current_question = current_question_sensor._current_question
+    # Get the current question to check if we have a round to score
+    current_question = context.current_question_sensor._current_question
     if not current_question:
         _LOGGER.debug("No current question data, skipping round scoring")
-        return
+        return None
     
     correct_answer = current_question.get("correct_answer")
     category = current_question.get("category")
     if not correct_answer:
         _LOGGER.warning("No correct answer found for current question, skipping scoring")
-        return
+        return None
     
     _LOGGER.info("Processing round scoring for question: %s", current_question.get("question", "Unknown"))
     
-    # Get team sensors and main sensor for team count
-    team_sensors = entities.get("team_sensors", {})
-    main_sensor = entities.get("main_sensor")
+    # Get team sensors (one per team of the current team count) and main sensor
+    main_sensor = context.main_sensor
+    teams = [
+        (team_sensor.team_key, team_sensor)
+        for team_sensor in context.team_sensors.values()
+        if team_sensor._participating
+    ]
     
-    # Determine participating teams
-    team_count = 5  # Default to all teams
-    if main_sensor and hasattr(main_sensor, '_team_count'):
-        team_count = main_sensor._team_count
+    # In buzzer mode the speed bonus follows the order the answers were received in
+    game_mode = main_sensor.game_mode
+    round_answers = RoundAnswers(
+        team_keys=[team_key for team_key, _ in teams],
+        correct_answer=correct_answer,
+        answers=[(team_sensor._answer or "").upper() or None for _, team_sensor in teams],
+        time_remaining=[team_sensor._answer_time_remaining for _, team_sensor in teams],
+        ranks=[team_sensor._answer_rank for _, team_sensor in teams] if game_mode == GAME_MODE_BUZZER else None,
+        category=category,
+    )
+    scores = score_round(
+        rules or DEFAULT_SCORING_RULES,
+        round_answers,
+        [team_sensor._correct_answer_streak for _, team_sensor in teams],
+    )
     
-    # Process scoring for each participating team
-    for i in range(1, team_count + 1):
-        team_key = f"home_trivia_team_{i}"
-        team_sensor = team_sensors.get(team_key)
+    results = {}  # Per team, for the journal
+    for index, (team_key, team_sensor) in enumerate(teams):
+        team_answer = team_sensor._answer
+        points_earned = scores.points[index]
+        is_correct = scores.correct[index]
         
-        if not team_sensor:
-            _LOGGER.warning("Team sensor %s not found, skipping", team_key)
-            continue
-            
-        # Check if team is participating
-        if not getattr(team_sensor, '_participating', True):
-            _LOGGER.debug("Team %d not participating, skipping", i)
-            continue
-        
-        # Get team's answer and time when they answered
-        team_answer = getattr(team_sensor, '_answer', None)
-        answer_time_remaining = getattr(team_sensor, '_answer_time_remaining', 0)
-        _LOGGER.debug("Team %d answer: %s, correct: %s, answered with %d seconds remaining", 
-                     i, team_answer, correct_answer, answer_time_remaining)
-        
-        # Calculate points
-        points_earned = 0
-        is_correct = False
-        
-        if team_answer and team_answer.upper() == correct_answer.upper():
-            is_correct = True
-            points_earned = 10 + answer_time_remaining  # 10 base points + speed bonus from when they answered
-            
-            # Streak bonus logic
-            if hasattr(team_sensor, 'increment_streak'):
-                new_streak = team_sensor.increment_streak()
-                # Check if the streak is a multiple of 3 (and not zero)
-                if new_streak > 0 and new_streak % 3 == 0:
-                    streak_bonus = 25
-                    points_earned += streak_bonus
-                    _LOGGER.info("Team %d hit a %dx streak! Awarding %d bonus points.", i, new_streak, streak_bonus)
-            
-            _LOGGER.info("Team %d answered correctly! Earned %d points (10 base + %d speed bonus)", 
-                        i, points_earned, answer_time_remaining)
+        if is_correct:
+            if scores.streak_bonuses[index]:
+                _LOGGER.info("Team %s hit a %dx streak! Awarding %d bonus points.",
+                             team_key, scores.streaks[index], scores.streak_bonuses[index])
+            _LOGGER.info("Team %s answered correctly! Earned %d points", team_key, points_earned)
             
             # Update user stats for MVP calculation
-            user_id = getattr(team_sensor, '_user_id', None)
-            if user_id and main_sensor and hasattr(main_sensor, 'update_user_correct_answer'):
-                main_sensor.update_user_correct_answer(user_id)
+            if team_sensor._user_id:
+                main_sensor.update_user_correct_answer(team_sensor._user_id)
         else:
-            _LOGGER.info("Team %d answered incorrectly or didn't answer (answer: %s)", i, team_answer)
-            # Reset streak on incorrect answer
-            if hasattr(team_sensor, 'reset_streak'):
-                team_sensor.reset_streak()
+            _LOGGER.info("Team %s answered incorrectly or didn't answer (answer: %s)", team_key, team_answer)
+        
+        team_sensor.set_streak(scores.streaks[index])
         
         # Update category stats for each team
-        if category and hasattr(team_sensor, 'update_category_stats'):
+        if category:
             team_sensor.update_category_stats(category, is_correct)
         
         # Update team with round results
-        if hasattr(team_sensor, 'add_points') and points_earned > 0:
+        if points_earned > 0:
             team_sensor.add_points(points_earned)
         
-        if hasattr(team_sensor, 'set_last_round_result'):
-            team_sensor.set_last_round_result(
-                answer=team_answer or "No Answer",
-                correct=is_correct, 
-                points=points_earned
-            )
+        team_sensor.set_last_round_result(
+            answer=team_answer or "No Answer",
+            correct=is_correct, 
+            points=points_earned
+        )
+        
+        results[team_key] = {
+            "name": team_sensor._team_name,
+            "user_id": team_sensor._user_id,
+            "answer": team_answer,
+            "correct": is_correct,
+            "points": points_earned,
+            "streak": scores.streaks[index],
+        }
         
-        # Reset team answer and answered status for next round
-        if hasattr(team_sensor, 'update_team_answer'):
-            team_sensor.update_team_answer(None)
-        if hasattr(team_sensor, 'update_team_answered'):
-            team_sensor.update_team_answered(False)
-        # Reset answer time for next round
-        if hasattr(team_sensor, '_answer_time_remaining'):
-            team_sensor._answer_time_remaining = 0
-            team_sensor.async_write_ha_state()
+        # Reset team answer, answered status and answer time for next round
+        team_sensor.clear_answer()
     
     # Increment round counter
-    round_counter_sensor = entities.get("round_counter_sensor")
-    if round_counter_sensor and hasattr(round_counter_sensor, 'increment_round'):
-        round_counter_sensor.increment_round()
-        _LOGGER.debug("Incremented round counter")
+    context.round_counter_sensor.increment_round()
+    _LOGGER.debug("Incremented round counter")
     
-    # Update high scores
-    await _update_high_scores(entities)
+    if journal is not None:
+        journal.record(
+            "round_scored",
+            question_id=current_question.get("question_id"),
+            category=category,
+            correct_answer=correct_answer,
+            game_mode=game_mode,
+            results=results,
+        )
+    return category, results
 
 
-async def _update_high_scores(entities: dict) -> None:
-    """Update high scores based on current team performance."""
-    
-    team_sensors = entities.get("team_sensors", {})
-    highscore_sensor = entities.get("highscore_sensor")
-    round_counter_sensor = entities.get("round_counter_sensor")
-    main_sensor = entities.get("main_sensor")
-    
-    if not highscore_sensor or not round_counter_sensor:
-        _LOGGER.debug("Missing highscore or round counter sensor, skipping high score update")
-        return
+async def _update_high_scores(context: GameContext) -> None:
+    """Update the high score with the results of a game that ends."""
     
     # Get current round count
-    rounds_played = getattr(round_counter_sensor, '_round_count', 0)
+    rounds_played = context.round_counter_sensor._round_count
     if rounds_played <= 0:
         return
     
-    # Determine participating teams
-    team_count = 5  # Default to all teams
-    if main_sensor and hasattr(main_sensor, '_team_count'):
-        team_count = main_sensor._team_count
-    
     # Check each team for new high scores
-    for i in range(1, team_count + 1):
-        team_key = f"home_trivia_team_{i}"
-        team_sensor = team_sensors.get(team_key)
-        
-        if not team_sensor:
-            continue
-            
-        # Check if team is participating
-        if not getattr(team_sensor, '_participating', True):
-            continue
-        
-        team_name = getattr(team_sensor, '_team_name', f"Team {i}")
-        team_points = getattr(team_sensor, '_points', 0)
-        
-        # Update high score if this is a new record
-        if hasattr(highscore_sensor, 'update_highscore'):
-            highscore_sensor.update_highscore(team_name, team_points, rounds_played)
+    highscore_sensor = context.highscore_sensor
+    for team_sensor in context.team_sensors.values():
+        # Update high score if this is a new record of a participating team
+        if team_sensor._participating:
+            highscore_sensor.update_highscore(team_sensor._team_name, team_sensor._points, rounds_played)
+
+
+def _record_team_answer(
+    context: GameContext,
+    team_sensor: HomeTriviaTeamSensor,
+    answer: str,
+    received: float,
+    journal: GameJournal | None = None,
+) -> bool:
+    """Record a team's answer with the time left on the countdown when it was received.
+    
+    received is the time.monotonic() timestamp at which the answer arrived.
+    Returns False if the answer was refused because, in buzzer mode, a
+    team's first answer is final.
+    """
+    if context.main_sensor.game_mode == GAME_MODE_BUZZER and team_sensor._answered:
+        _LOGGER.debug("Team already buzzed in %s, ignoring %s", team_sensor._answer, answer)
+        return False
+    
+    time_remaining_ms = int(context.countdown_current_sensor.remaining_seconds_at(received) * 1000)
+    
+    # Teams are ranked in the order in which their first answer was received
+    rank = 1 + sum(1 for team in context.team_sensors.values() if team._answer_rank)
+    team_sensor.record_answer(answer, time_remaining_ms, rank)
+    if journal is not None:
+        journal.record(
+            "answer_received",
+            team=team_sensor.team_key,
+            answer=answer,
+            time_remaining_ms=time_remaining_ms,
+            rank=team_sensor._answer_rank,
+        )
+    
+    _LOGGER.debug("Team answered %s with %d ms remaining", answer, time_remaining_ms)
+    return True
 
 
 async def _register_services(hass: HomeAssistant) -> None:
     """Register all `home_trivia.*` services (start_game, stop_game, etc.)."""
 
-    def _get_entities():
-        """Get entity references from hass data."""
-        return hass.data.get(DOMAIN, {}).get("entities", {})
+    def _get_game(call) -> dict:
+        """Get the data of the game a service call is for, routed by game_id."""
+        game = _resolve_game(hass, call.data.get(ATTR_GAME_ID))
+        if game is None:
+            _LOGGER.error("No Home Trivia game found for game_id %s", call.data.get(ATTR_GAME_ID))
+            return {}
+        return game
 
-    def team_service_handler(method_name: str, required_params: list[str] = None, fallback_handler=None):
+    def team_service_handler(required_params: list[str] = None):
         """Decorator to handle team-related services with common entity lookup."""
         if required_params is None:
             required_params = ["team_id"]
             
         def decorator(func):
-            async def wrapper(call):
+            async def wrapper(call, game_manager: GameManager):
                 # Validate required parameters
                 for param in required_params:
                     if not call.data.get(param):
                         _LOGGER.error(f"Missing required parameter: {param}")
                         return
                 
-                team_id = call.data.get("team_id")
-                team_number = team_id.split('_')[-1]
-                unique_id = f"home_trivia_team_{team_number}"
-                
                 # Get team sensor entity
-                entities = _get_entities()
-                team_sensors = entities.get("team_sensors", {})
-                team_sensor = team_sensors.get(unique_id)
+                context = game_manager.context
+                team_number = _parse_team_id(call.data["team_id"])
+                team_sensor = context.team(team_number) if team_number is not None else None
+                if team_sensor is None:
+                    _LOGGER.warning("Could not find team %s", call.data["team_id"])
+                    return
                 
-                if team_sensor and hasattr(team_sensor, method_name):
-                    _LOGGER.debug(f"Updating team {team_number} via {method_name}")
-                    await func(call, team_sensor)
-                else:
-                    # Use fallback handler if provided
-                    if fallback_handler:
-                        _LOGGER.warning(f"Could not find team sensor entity {unique_id}, using fallback")
-                        await fallback_handler(call, team_number, hass)
-                    else:
-                        _LOGGER.warning(f"Could not find team sensor entity {unique_id}")
+                with context.write_batch:
+                    await func(call, game_manager, team_sensor)
             return wrapper
         return decorator
-    
-    # Fallback handlers for team services
-    async def _fallback_team_name(call, team_number: str, hass: HomeAssistant):
-        """Fallback handler for team name updates."""
-        entity_id = f"sensor.home_trivia_team_{team_number}"
-        state_obj = hass.states.get(entity_id)
-        if state_obj:
-            name = call.data.get("name")
-            attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-            hass.states.async_set(entity_id, name, attrs)
-
-    async def _fallback_team_points(call, team_number: str, hass: HomeAssistant):
-        """Fallback handler for team points updates."""
-        entity_id = f"sensor.home_trivia_team_{team_number}"
-        state_obj = hass.states.get(entity_id)
-        if state_obj:
-            points = call.data.get("points")
-            attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-            attrs["points"] = int(points)
-            hass.states.async_set(entity_id, state_obj.state, attrs)
-
-    async def _fallback_team_participating(call, team_number: str, hass: HomeAssistant):
-        """Fallback handler for team participating updates."""
-        entity_id = f"sensor.home_trivia_team_{team_number}"
-        state_obj = hass.states.get(entity_id)
-        if state_obj:
-            participating = call.data.get("participating")
-            attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-            attrs["participating"] = bool(participating)
-            hass.states.async_set(entity_id, state_obj.state, attrs)
-
-    async def _fallback_team_answer(call, team_number: str, hass: HomeAssistant):
-        """Fallback handler for team answer updates."""
-        entity_id = f"sensor.home_trivia_team_{team_number}"
-        state_obj = hass.states.get(entity_id)
-        if state_obj:
-            answer = call.data.get("answer")
-            attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-            attrs["answer"] = answer
-            attrs["answered"] = True
-            hass.states.async_set(entity_id, state_obj.state, attrs)
-
-    async def _fallback_team_user_id(call, team_number: str, hass: HomeAssistant):
-        """Fallback handler for team user_id updates."""
-        entity_id = f"sensor.home_trivia_team_{team_number}"
-        state_obj = hass.states.get(entity_id)
-        if state_obj:
-            user_id = call.data.get("user_id")
-            attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-            attrs["user_id"] = user_id
-            hass.states.async_set(entity_id, state_obj.state, attrs)
-
-    def _get_game_manager():
-        """Get GameManager instance from hass data."""
-        return hass.data.get(DOMAIN, {}).get("game_manager")
-
-    async def start_game(call):
-        game_manager = _get_game_manager()
-        if game_manager:
-            await game_manager.start_game()
-        else:
-            _LOGGER.error("GameManager not found")
 
-    async def stop_game(call):
-        game_manager = _get_game_manager()
-        if game_manager:
-            await game_manager.stop_game()
-        else:
-            _LOGGER.error("GameManager not found")
+    async def start_game(call, game_manager: GameManager):
+        await game_manager.start_game()
 
-    async def reset_game(call):
-        game_manager = _get_game_manager()
-        if game_manager:
-            await game_manager.reset_game()
-        else:
-            _LOGGER.error("GameManager not found")
+    async def stop_game(call, game_manager: GameManager):
+        await game_manager.stop_game()
 
-    async def next_question(call):
-        game_manager = _get_game_manager()
-        if game_manager:
-            await game_manager.next_question()
-        else:
-            _LOGGER.error("GameManager not found")
+    async def reset_game(call, game_manager: GameManager):
+        await game_manager.reset_game()
+
+    async def next_question(call, game_manager: GameManager):
+        await game_manager.next_question()
 
-    @team_service_handler("update_team_name", ["team_id", "name"], _fallback_team_name)
-    async def update_team_name(call, team_sensor):
+    @team_service_handler(["team_id", "name"])
+    async def update_team_name(call, game_manager: GameManager, team_sensor: HomeTriviaTeamSensor):
         """Handle the update_team_name service call."""
         name = call.data.get("name")
         team_sensor.update_team_name(name)
 
-    @team_service_handler("update_team_points", ["team_id", "points"], _fallback_team_points)
-    async def update_team_points(call, team_sensor):
+    @team_service_handler(["team_id", "points"])
+    async def update_team_points(call, game_manager: GameManager, team_sensor: HomeTriviaTeamSensor):
         """Handle the update_team_points service call."""
         points = call.data.get("points")
         team_sensor.update_team_points(int(points))
+        game_manager._record_event("points_set", team=team_sensor.team_key, points=int(points))
 
-    @team_service_handler("update_team_participating", ["team_id", "participating"], _fallback_team_participating)
-    async def update_team_participating(call, team_sensor):
+    @team_service_handler(["team_id", "participating"])
+    async def update_team_participating(call, game_manager: GameManager, team_sensor: HomeTriviaTeamSensor):
         """Handle the update_team_participating service call."""
         participating = call.data.get("participating")
         team_sensor.update_team_participating(bool(participating))
 
-    @team_service_handler("update_team_answer_with_time", ["team_id", "answer"], _fallback_team_answer)
-    async def update_team_answer(call, team_sensor):
+    @team_service_handler(["team_id", "answer"])
+    async def update_team_answer(call, game_manager: GameManager, team_sensor: HomeTriviaTeamSensor):
         """Handle the update_team_answer service call."""
-        answer = call.data.get("answer")
-        
-        # Get current timer state to capture speed bonus time
-        entities = _get_entities()
-        countdown_current_sensor = entities.get("countdown_current_sensor")
-        time_remaining = 0
-        if countdown_current_sensor and hasattr(countdown_current_sensor, '_current_time'):
-            time_remaining = max(0, countdown_current_sensor._current_time)
-        
-        # Update team answer with time remaining when answered
-        if hasattr(team_sensor, 'update_team_answer_with_time'):
-            team_sensor.update_team_answer_with_time(answer, time_remaining)
-        else:
-            # Fallback to regular answer update
-            team_sensor.update_team_answer(answer)
-        
-        team_sensor.update_team_answered(True)
-        
-        _LOGGER.debug("Team answered %s with %d seconds remaining", answer, time_remaining)
+        received = time.monotonic()
+        _record_team_answer(game_manager.context, team_sensor, call.data.get("answer"), received, game_manager.journal)
 
-    @team_service_handler("update_team_user_id", ["team_id"], _fallback_team_user_id)
-    async def update_team_user_id(call, team_sensor):
+    @team_service_handler(["team_id"])
+    async def update_team_user_id(call, game_manager: GameManager, team_sensor: HomeTriviaTeamSensor):
         """Handle the update_team_user_id service call."""
         user_id = call.data.get("user_id")
         team_sensor.update_team_user_id(user_id)
 
-    async def update_countdown_timer_length(call):
+    async def update_countdown_timer_length(call, game_manager: GameManager):
         length = call.data.get("timer_length")
         if length is None:
             _LOGGER.error("Missing timer_length")
             return
         
-        entities = _get_entities()
-        timer_sensor = entities.get("countdown_sensor")
-        if timer_sensor and hasattr(timer_sensor, 'update_timer_length'):
-            timer_sensor.update_timer_length(int(length))
-        else:
-            hass.states.async_set("sensor.home_trivia_countdown_timer", int(length))
-        
+        context = game_manager.context
+        context.countdown_sensor.update_timer_length(int(length))
         # Also persist timer length in main sensor for settings persistence
-        main_sensor = entities.get("main_sensor")
-        if main_sensor and hasattr(main_sensor, 'set_timer_length'):
-            main_sensor.set_timer_length(int(length))
-        else:
-            # Update the game status entity with timer_length attribute
-            state_obj = hass.states.get("sensor.home_trivia_game_status")
-            if state_obj:
-                attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-                attrs["timer_length"] = int(length)
-                hass.states.async_set("sensor.home_trivia_game_status", state_obj.state, attrs)
-            else:
-                # Create the entity if it doesn't exist
-                hass.states.async_set("sensor.home_trivia_game_status", "ready", {"timer_length": int(length)})
-
-    async def update_team_count(call):
+        context.main_sensor.set_timer_length(int(length))
+
+    async def update_team_count(call, game_manager: GameManager):
         team_count = call.data.get("team_count")
         if team_count is None:
             _LOGGER.error("Missing team_count")
             return
         
-        # Validate team count is between 1 and 5
+        # Validate team count is between 1 and MAX_TEAM_COUNT
         team_count = int(team_count)
-        if team_count < 1 or team_count > 5:
-            _LOGGER.error("Invalid team_count: %s (must be 1-5)", team_count)
+        if team_count < 1 or team_count > MAX_TEAM_COUNT:
+            _LOGGER.error("Invalid team_count: %s (must be 1-%d)", team_count, MAX_TEAM_COUNT)
             return
-            
-        entities = _get_entities()
-        main_sensor = entities.get("main_sensor")
-        if main_sensor and hasattr(main_sensor, 'set_team_count'):
-            main_sensor.set_team_count(team_count)
-        else:
-            # Update the game status entity with team_count attribute
-            state_obj = hass.states.get("sensor.home_trivia_game_status")
-            if state_obj:
-                attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-                attrs["team_count"] = team_count
-                hass.states.async_set("sensor.home_trivia_game_status", state_obj.state, attrs)
-            else:
-                # Create the entity if it doesn't exist
-                hass.states.async_set("sensor.home_trivia_game_status", "ready", {"team_count": team_count})
-
-    async def update_difficulty_level(call):
+        
+        # Create or remove team sensors to match the new team count
+        context = game_manager.context
+        await context.teams.async_set_count(hass, team_count)
+        context.main_sensor.set_team_count(team_count)
+
+    async def import_question_database(call, game_manager: GameManager):
+        """Build the SQLite question database from the question packs of a game."""
+        question_store = _get_question_store(hass)
+        imported = await hass.async_add_executor_job(
+            question_store.import_questions, game_manager.question_bank.iter_questions()
+        )
+        _LOGGER.info("Question database built with %d questions", imported)
+        
+        # Start drawing from the database in every game that has it enabled
+        games = _loaded_games(hass)
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if entry.entry_id in games and entry.options.get(CONF_USE_QUESTION_DATABASE, False):
+                games[entry.entry_id]["game_manager"].question_store = question_store
+
+    async def update_difficulty_level(call, game_manager: GameManager):
         difficulty = call.data.get("difficulty_level")
         if not difficulty:
             _LOGGER.error("Missing difficulty_level")
             return
         
-        entities = _get_entities()
-        main_sensor = entities.get("main_sensor")
-        if main_sensor and hasattr(main_sensor, 'set_difficulty_level'):
-            main_sensor.set_difficulty_level(difficulty)
-        else:
-            # Update the game status entity with difficulty_level attribute
-            state_obj = hass.states.get("sensor.home_trivia_game_status")
-            if state_obj:
-                attrs = dict(state_obj.attributes) if state_obj.attributes else {}
-                attrs["difficulty_level"] = difficulty
-                hass.states.async_set("sensor.home_trivia_game_status", state_obj.state, attrs)
-            else:
-                # Create the entity if it doesn't exist
-                hass.states.async_set("sensor.home_trivia_game_status", "ready", {"difficulty_level": difficulty})
+        game_manager.context.main_sensor.set_difficulty_level(difficulty)
+
+    async def update_game_mode(call, game_manager: GameManager):
+        game_mode = call.data.get("game_mode")
+        if game_mode not in GAME_MODES:
+            _LOGGER.error("Invalid game_mode: %s (must be one of %s)", game_mode, ", ".join(GAME_MODES))
+            return
+        
+        game_manager.context.main_sensor.set_game_mode(game_mode)
+
+    def _instrumented(service: str, handler):
+        """Wrap a service handler to run it for the called game and record its latency.
+        
+        The game is resolved once per call; the handler gets its GameManager.
+        """
+        async def wrapper(call):
+            game_manager = _get_game(call).get("game_manager")
+            if game_manager is None:
+                _LOGGER.error("GameManager not found")
+                return
+            start = time.perf_counter()
+            failed = True
+            try:
+                await handler(call, game_manager)
+                failed = False
+            finally:
+                if game_manager.metrics is not None:
+                    game_manager.metrics.record_service(service, time.perf_counter() - start, failed)
+        return wrapper
 
     # Register all services under the "home_trivia" domain
-    hass.services.async_register(DOMAIN, "start_game", start_game)
-    hass.services.async_register(DOMAIN, "stop_game", stop_game)
-    hass.services.async_register(DOMAIN, "reset_game", reset_game)
-    hass.services.async_register(DOMAIN, "next_question", next_question)
-    hass.services.async_register(DOMAIN, "update_team_name", update_team_name)
-    hass.services.async_register(DOMAIN, "update_team_points", update_team_points)
-    hass.services.async_register(DOMAIN, "update_team_participating", update_team_participating)
-    hass.services.async_register(DOMAIN, "update_team_answer", update_team_answer)
-    hass.services.async_register(DOMAIN, "update_difficulty_level", update_difficulty_level)
-    hass.services.async_register(DOMAIN, "update_team_user_id", update_team_user_id)
-    hass.services.async_register(DOMAIN, "update_countdown_timer_length", update_countdown_timer_length)
-    hass.services.async_register(DOMAIN, "update_team_count", update_team_count)
+    for service, handler in {
+        "start_game": start_game,
+        "stop_game": stop_game,
+        "reset_game": reset_game,
+        "next_question": next_question,
+        "update_team_name": update_team_name,
+        "update_team_points": update_team_points,
+        "update_team_participating": update_team_participating,
+        "update_team_answer": update_team_answer,
+        "update_difficulty_level": update_difficulty_level,
+        "update_team_user_id": update_team_user_id,
+        "update_countdown_timer_length": update_countdown_timer_length,
+        "update_team_count": update_team_count,
+        "update_game_mode": update_game_mode,
+        "import_question_database": import_question_database,
+    }.items():
+        hass.services.async_register(DOMAIN, service, _instrumented(service, handler))
 
 
 class GameManager:
     """Central manager for Home Trivia game logic and state."""
     
-    def __init__(self, hass: HomeAssistant):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        game_id: str,
+        context: GameContext,
+        question_bank: QuestionBank,
+        question_store: QuestionStore | None = None,
+        entity_prefix: str = DOMAIN,
+        journal: GameJournal | None = None,
+        metrics: GameMetrics | None = None,
+        leaderboards: Leaderboards | None = None,
+        player_stats: PlayerStats | None = None,
+    ):
         """Initialize the game manager."""
         self.hass = hass
+        self.game_id = game_id  # Config entry id
+        self.context = context  # The game's entities, set up by the sensor platform
+        self.entity_prefix = entity_prefix  # e.g. home_trivia_kitchen
+        self.question_bank = question_bank
+        self.question_store = question_store  # Optional SQLite backend, used instead of the bank
+        self.journal = journal  # Event journal of the game, if any
+        self.metrics = metrics  # Latency metrics of the game, if any
+        self.leaderboards = leaderboards  # All-time leaderboards, shared by all games
+        self.player_stats = player_stats  # Long-term player statistics, shared by all games
+        self._game_key: str | None = None  # Identifies the current game in the player statistics
+        self._user_names: dict[str, str] = {}  # Names of the users who led the MVP race this game, by user id
+        self._decks: dict[str, QuestionDeck] = {}  # One deck per difficulty level for the current game
+        self._prefetch: asyncio.Task[PreparedQuestion] | None = None  # Draws the next question ahead
+        
+    @property
+    def scoring_rules(self) -> ScoringRules:
+        """Return the scoring rules of this game's options."""
+        return self.hass.data.get(DOMAIN, {}).get(self.game_id, {}).get("scoring_rules", DEFAULT_SCORING_RULES)
+    
+    def _measure(self, phase: str):
+        """Return a context that records the latency of a game phase in the metrics."""
+        return self.metrics.measure_phase(phase) if self.metrics is not None else contextlib.nullcontext()
+    
+    @callback
+    def submit_answer(self, team_number: int, answer: str, received: float | None = None) -> dict | None:
+        """Record a team's answer and return the acknowledgement.
+        
+        Used by the home_trivia/submit_answer websocket command, which calls
+        this straight from the event loop with the time.monotonic() timestamp
+        at which the answer was received. Returns None if the team does not
+        exist in this game.
+        """
+        if received is None:
+            received = time.monotonic()
+        context = self.context
+        team_sensor = context.team(team_number)
+        if team_sensor is None:
+            return None
         
-    def _get_entities(self):
-        """Get entity references from hass data."""
-        return self.hass.data.get(DOMAIN, {}).get("entities", {})
+        with context.write_batch:
+            accepted = _record_team_answer(context, team_sensor, answer, received, self.journal)
+        # When refused, the acknowledgement carries the answer that was recorded before
+        return {
+            "team_id": f"team_{team_sensor._team_number}",
+            "accepted": accepted,
+            "answer": team_sensor._answer,
+            "answer_time_remaining": team_sensor._answer_time_remaining,
+            "answer_time_remaining_ms": team_sensor._answer_time_remaining_ms,
+            "answer_rank": team_sensor._answer_rank,
+            "answered_at": dt_util.utcnow().isoformat(),
+        }
+    
+    def _record_event(self, event: str, **data) -> None:
+        """Append an event to the game's journal."""
+        if self.journal is not None:
+            self.journal.record(event, **data)
+    
+    def _journal_teams(self) -> dict[str, dict]:
+        """Return the team setup to record when a game starts."""
+        return {
+            team_sensor.team_key: {
+                "name": team_sensor._team_name,
+                "participating": team_sensor._participating,
+                "user_id": team_sensor._user_id,
+            }
+            for team_sensor in self.context.team_sensors.values()
+        }
     
     async def start_game(self):
         """Start a new trivia game."""
         _LOGGER.info("Starting Home Trivia game")
-        entities = self._get_entities()
+        context = self.context
         
-        # Reset game stats at the start of each game
-        main_sensor = entities.get("main_sensor")
-        if main_sensor and hasattr(main_sensor, 'reset_game_stats'):
-            main_sensor.reset_game_stats()
+        with context.write_batch:
+            # A game that was not stopped still ends here
+            await self._record_game_results()
+            
+            # Reset game stats at the start of each game
+            context.main_sensor.reset_game_stats()
+            self._game_key = ulid_now()
+            self._user_names.clear()  # Look names up again, in case a user was renamed
         
-        # Set game status to playing
-        if main_sensor and hasattr(main_sensor, 'set_state'):
-            main_sensor.set_state("playing")
-        else:
-            self.hass.states.async_set("sensor.home_trivia_game_status", "playing")
+            # Set game status to playing
+            context.main_sensor.set_state("playing")
         
-        # Stop any countdown timer
-        countdown_current_sensor = entities.get("countdown_current_sensor")
-        if countdown_current_sensor and hasattr(countdown_current_sensor, 'stop_countdown'):
-            countdown_current_sensor.stop_countdown()
-        else:
-            self.hass.states.async_set("sensor.home_trivia_countdown_current", 0)
+            # Stop any countdown timer
+            context.countdown_current_sensor.stop_countdown()
         
-        # Reset game state
-        await self._reset_game_state(entities, reset_teams=True)
+            # Reset game state
+            await self._reset_game_state(reset_teams=True)
+        
+        self._record_event("game_started", teams=self._journal_teams())
+        
+        # Have the first question ready
+        self._schedule_prefetch()
     
     async def stop_game(self):
         """Stop the current trivia game."""
         _LOGGER.info("Stopping Home Trivia game")
-        entities = self._get_entities()
+        context = self.context
+        await self._async_discard_prefetch()
         
-        # Stop any countdown timer
-        countdown_current_sensor = entities.get("countdown_current_sensor")
-        if countdown_current_sensor and hasattr(countdown_current_sensor, 'stop_countdown'):
-            countdown_current_sensor.stop_countdown()
+        with context.write_batch:
+            # Stop any countdown timer
+            context.countdown_current_sensor.stop_countdown()
         
-        # Calculate and set summary before stopping
-        await self._calculate_and_set_summary(entities)
+            # Calculate and set summary before stopping
+            await self._calculate_and_set_summary()
+            await self._record_game_results()
         
-        main_sensor = entities.get("main_sensor")
-        if main_sensor and hasattr(main_sensor, 'set_state'):
-            main_sensor.set_state("stopped")
-        else:
-            self.hass.states.async_set("sensor.home_trivia_game_status", "stopped")
+            context.main_sensor.set_state("stopped")
+        
+        self._record_event(
+            "game_stopped",
+            participating=[team.team_key for team in context.team_sensors.values() if team._participating],
+        )
     
     async def reset_game(self):
         """Reset game progress while preserving setup."""
         _LOGGER.info("Resetting Home Trivia game - preserving user setup")
-        entities = self._get_entities()
+        context = self.context
         
-        # Stop any countdown timer
-        countdown_current_sensor = entities.get("countdown_current_sensor")
-        if countdown_current_sensor and hasattr(countdown_current_sensor, 'stop_countdown'):
-            countdown_current_sensor.stop_countdown()
+        with context.write_batch:
+            # A game that was not stopped still ends here
+            await self._record_game_results()
+            
+            # Stop any countdown timer
+            context.countdown_current_sensor.stop_countdown()
         
-        # Reset game status to ready
-        main_sensor = entities.get("main_sensor")
-        if main_sensor and hasattr(main_sensor, 'set_state'):
-            main_sensor.set_state("ready")
-        else:
-            self.hass.states.async_set("sensor.home_trivia_game_status", "ready")
+            # Reset game status to ready
+            context.main_sensor.set_state("ready")
+            self._game_key = None
+        
+            # Reset game state but preserve team setup
+            await self._reset_game_state(reset_teams=False)
         
-        # Reset game state but preserve team setup
-        await self._reset_game_state(entities, reset_teams=False)
+        self._record_event("game_reset", teams=self._journal_teams())
     
     async def next_question(self):
         """Move to the next trivia question."""
         _LOGGER.info("Moving to next trivia question")
         
-        entities = self._get_entities()
+        context = self.context
         
-        # Process scoring from the previous round (if there was one)
-        await _process_round_scoring(entities)
+        with context.write_batch:
+            # Process scoring from the previous round (if there was one)
+            with self._measure("process_round_scoring"):
+                scored = await _process_round_scoring(context, self.journal, self.scoring_rules)
+            if scored is not None and self.player_stats is not None:
+                # Written in the executor after the round, together with any other pending rounds
+                if self._game_key is None:
+                    self._game_key = ulid_now()
+                category, results = scored
+                self.player_stats.record_round(self._game_key, self.game_id, category, results)
+            if scored is not None:
+                await self._async_resolve_mvp_name()
         
-        # Reset team answers
-        await self._reset_team_answers(entities)
+            # Reset team answers
+            with self._measure("reset_team_answers"):
+                await self._reset_team_answers()
         
-        # Load and select next question
-        await self._load_next_question(entities)
+            # Load and select next question
+            with self._measure("load_next_question"):
+                await self._load_next_question()
+            current_question = context.current_question_sensor._current_question
+            if current_question:
+                self._record_event(
+                    "question_drawn",
+                    question_id=current_question.get("question_id"),
+                    category=current_question.get("category"),
+                    difficulty_level=current_question.get("difficulty_level"),
+                    correct_answer=current_question.get("correct_answer"),
+                )
         
-        # Start countdown timer
-        await self._start_countdown(entities)
+            # Start countdown timer
+            with self._measure("start_countdown"):
+                await self._start_countdown()
         
-        # Trigger state update
-        state_obj = self.hass.states.get("sensor.home_trivia_game_status")
-        if state_obj:
-            self.hass.states.async_set("sensor.home_trivia_game_status", state_obj.state, state_obj.attributes)
+        # Draw the question after this one while the round runs
+        self._schedule_prefetch()
     
-    async def _reset_game_state(self, entities: dict, reset_teams: bool = True):
+    async def _record_game_results(self):
+        """Enter the results of the game in the high score, leaderboards and player statistics.
+        
+        Called when a game ends: when it is stopped, or when a game that is
+        still being played is reset or replaced by a new one.
+        """
+        context = self.context
+        if context.main_sensor.state != "playing":
+            return  # Not started, or already recorded when it was stopped
+        rounds_played = context.round_counter_sensor._round_count
+        if rounds_played <= 0:
+            return
+        
+        await _update_high_scores(context)
+        if self.player_stats is not None and self._game_key is not None:
+            mvp = context.main_sensor.mvp
+            if mvp is not None:
+                self.player_stats.end_game(self._game_key, mvp["user_id"])
+            self._game_key = None
+        if self.leaderboards is None:
+            return
+        teams = [team_sensor for team_sensor in context.team_sensors.values() if team_sensor._participating]
+        ended_at = dt_util.utcnow().isoformat()
+        self.leaderboards.async_submit(
+            context.main_sensor._difficulty_level,
+            len(teams),
+            [
+                {
+                    "team_name": team_sensor._team_name,
+                    "points": team_sensor._points,
+                    "rounds": rounds_played,
+                    "game": self.entity_prefix,
+                    "ended_at": ended_at,
+                }
+                for team_sensor in teams
+            ],
+        )
+    
+    async def _reset_game_state(self, reset_teams: bool = True):
         """Reset core game state (rounds, questions, etc.)."""
+        # Reshuffle question decks for the new game
+        await self._async_discard_prefetch()
+        self._decks.clear()
+        if self.question_store:
+            await self.hass.async_add_executor_job(self.question_store.reset_played, self.game_id)
+        
         # Reset round counter to 0
-        round_counter_sensor = entities.get("round_counter_sensor")
-        if round_counter_sensor and hasattr(round_counter_sensor, 'reset_round_counter'):
-            round_counter_sensor.reset_round_counter()
-        else:
-            self.hass.states.async_set("sensor.home_trivia_round_counter", 0)
+        self.context.round_counter_sensor.reset_round_counter()
         
         # Reset played questions list
-        played_questions_sensor = entities.get("played_questions_sensor")
-        if played_questions_sensor and hasattr(played_questions_sensor, 'reset_played_questions'):
-            played_questions_sensor.reset_played_questions()
-        else:
-            self.hass.states.async_set("sensor.home_trivia_played_questions", 0, {"played_question_ids": []})
+        self.context.played_questions_sensor.reset_played_questions()
         
         if reset_teams:
-            await self._reset_teams_for_new_game(entities)
+            await self._reset_teams_for_new_game()
         else:
-            await self._reset_teams_preserve_setup(entities)
+            await self._reset_teams_preserve_setup()
     
-    async def _reset_teams_for_new_game(self, entities: dict):
+    async def _reset_teams_for_new_game(self):
         """Reset teams to default state for new game."""
-        team_sensors = entities.get("team_sensors", {})
-        main_sensor = entities.get("main_sensor")
-        team_count = 5  # Default to all teams if we can't get the setting
-        
-        # Try to get current team count from main sensor
-        if main_sensor and hasattr(main_sensor, '_team_count'):
-            team_count = main_sensor._team_count
-        else:
-            # Fallback: check state attributes
-            state_obj = self.hass.states.get("sensor.home_trivia_game_status")
-            if state_obj and state_obj.attributes and 'team_count' in state_obj.attributes:
-                team_count = int(state_obj.attributes['team_count'])
-        
         # Reset active teams to default names and 0 points
-        for i in range(1, team_count + 1):
-            team_key = f"home_trivia_team_{i}"
-            team_sensor = team_sensors.get(team_key)
-            if team_sensor:
-                team_sensor.update_team_name(f"Team {i}")
-                team_sensor.update_team_points(0)
-                team_sensor.update_team_participating(True)
-                # Reset trivia-specific attributes
-                if hasattr(team_sensor, 'update_team_answer'):
-                    team_sensor.update_team_answer(None)
-                if hasattr(team_sensor, 'update_team_answered'):
-                    team_sensor.update_team_answered(False)
-                if hasattr(team_sensor, '_answer_time_remaining'):
-                    team_sensor._answer_time_remaining = 0
-                    team_sensor.async_write_ha_state()
-                if hasattr(team_sensor, '_last_round_answer'):
-                    team_sensor._last_round_answer = None
-                    team_sensor.async_write_ha_state()
-                if hasattr(team_sensor, 'update_team_user_id'):
-                    team_sensor.update_team_user_id(None)
-                if hasattr(team_sensor, 'reset_streak'):
-                    team_sensor.reset_streak()
-        
-        # Disable any teams beyond the current team count
-        for i in range(team_count + 1, 6):
-            team_key = f"home_trivia_team_{i}"
-            team_sensor = team_sensors.get(team_key)
-            if team_sensor:
-                team_sensor.update_team_participating(False)
-    
-    async def _reset_teams_preserve_setup(self, entities: dict):
+        for team_sensor in self.context.team_sensors.values():
+            team_sensor.update_team_name(f"Team {team_sensor._team_number}")
+            team_sensor.update_team_points(0)
+            team_sensor.update_team_participating(True)
+            # Reset trivia-specific attributes
+            team_sensor._last_round_answer = None
+            team_sensor.clear_answer()
+            team_sensor.update_team_user_id(None)
+            team_sensor.reset_streak()
+            # The game summary only covers the categories of this game
+            team_sensor.reset_category_stats()
+    
+    async def _reset_teams_preserve_setup(self):
         """Reset team game progress while preserving setup."""
-        team_sensors = entities.get("team_sensors", {})
-        for i in range(1, 6):
-            team_key = f"home_trivia_team_{i}"
-            team_sensor = team_sensors.get(team_key)
-            if team_sensor:
-                # Only reset gameplay-related attributes, preserve team setup
-                team_sensor.update_team_points(0)
-                if hasattr(team_sensor, 'update_team_answer'):
-                    team_sensor.update_team_answer(None)
-                if hasattr(team_sensor, 'update_team_answered'):
-                    team_sensor.update_team_answered(False)
-                if hasattr(team_sensor, '_answer_time_remaining'):
-                    team_sensor._answer_time_remaining = 0
-                    team_sensor.async_write_ha_state()
-                if hasattr(team_sensor, '_last_round_answer'):
-                    team_sensor._last_round_answer = None
-                    team_sensor.async_write_ha_state()
-                if hasattr(team_sensor, 'reset_streak'):
-                    team_sensor.reset_streak()
-    
-    async def _reset_team_answers(self, entities: dict):
+        for team_sensor in self.context.team_sensors.values():
+            # Only reset gameplay-related attributes, preserve team setup
+            team_sensor.update_team_points(0)
+            team_sensor._last_round_answer = None
+            team_sensor.clear_answer()
+            team_sensor.reset_streak()
+            # The game summary only covers the categories of this game
+            team_sensor.reset_category_stats()
+    
+    async def _reset_team_answers(self):
         """Reset team answers for the next question."""
-        team_sensors = entities.get("team_sensors", {})
-        
-        # Reset answer and answered status for all teams
-        for team_key, team_sensor in team_sensors.items():
-            if team_sensor and hasattr(team_sensor, 'update_team_answer') and hasattr(team_sensor, 'update_team_answered'):
-                team_sensor.update_team_answer(None)
-                team_sensor.update_team_answered(False)
-                # Reset answer time for next question
-                if hasattr(team_sensor, '_answer_time_remaining'):
-                    team_sensor._answer_time_remaining = 0
-                    team_sensor.async_write_ha_state()
-                _LOGGER.debug("Reset answer for %s", team_key)
-    
-    async def _load_next_question(self, entities: dict):
-        """Load and set the next trivia question."""
-        current_question_sensor = entities.get("current_question_sensor")
+        # Reset answer, answered status and answer time for all teams
+        for team_sensor in self.context.team_sensors.values():
+            team_sensor.clear_answer()
+            _LOGGER.debug("Reset answer for %s", team_sensor.team_key)
+    
+    async def _load_next_question(self):
+        """Publish the next trivia question, drawing it now if it was not prefetched."""
+        difficulty_level = self.context.main_sensor._difficulty_level
+        prepared = await self._async_take_prefetched_question(difficulty_level)
+        if prepared is None:
+            prepared = await self._async_prepare_question(difficulty_level)
+        
+        current_question_sensor = self.context.current_question_sensor
+        if prepared.payload is None:
+            # Clear the current question sensor to trigger warning display
+            _LOGGER.warning("No unplayed %s questions left", difficulty_level)
+            current_question_sensor.clear_current_question()
+            return
+        
+        _LOGGER.info("Selected unplayed question with ID %s", prepared.question_id)
+        
+        # Add question to played list
+        self.context.played_questions_sensor.add_played_question(prepared.question_id)
+        
+        # Update the current question sensor with the prebuilt question payload
+        current_question_sensor.update_current_question(prepared.payload)
+    
+    async def _async_prepare_question(self, difficulty_level: str) -> PreparedQuestion:
+        """Draw a question and look up its payload without publishing it."""
+        if self.question_store:
+            return await self._async_prepare_question_from_store(difficulty_level)
         
         try:
-            questions_file = os.path.join(os.path.dirname(__file__), "questions.json")
+            # Picks up edits to questions.json without re-reading it every round
+            await self.question_bank.async_load()
+            question_bank = self.question_bank  # The bank may have been swapped during the load
             
-            def _load_questions_file():
-                with open(questions_file, 'r') as f:
-                    return json.load(f)
+            if not question_bank.question_count:
+                _LOGGER.warning("No questions found in any question pack")
+                return PreparedQuestion(difficulty_level)
             
-            questions = await self.hass.async_add_executor_job(_load_questions_file)
+            deck = self._get_deck(difficulty_level)
+            question_id = deck.draw()
+            if question_id is None:
+                # All questions have been asked
+                _LOGGER.warning("All questions have been asked! Total questions: %d",
+                                len(question_bank.questions_for_difficulty(difficulty_level)))
+                return PreparedQuestion(difficulty_level, question_bank.generation, bank=question_bank)
             
-            if questions:
-                # Get played questions sensor to check which questions have been asked
-                played_questions_sensor = entities.get("played_questions_sensor")
-                played_question_ids = []
-                
-                if played_questions_sensor and hasattr(played_questions_sensor, 'extra_state_attributes'):
-                    played_question_ids = played_questions_sensor.extra_state_attributes.get("played_question_ids", [])
-                
-                # Get difficulty level from main sensor or use default
-                difficulty_level = "Easy"  # Default
-                main_sensor = entities.get("main_sensor")
-                if main_sensor and hasattr(main_sensor, '_difficulty_level'):
-                    difficulty_level = main_sensor._difficulty_level
-                
-                # Filter questions by difficulty level
-                available_questions = [q for q in questions if q.get("difficulty_level") == difficulty_level]
-                
-                # Filter out already played questions
-                unplayed_questions = [q for q in available_questions if q.get("id") not in played_question_ids]
-                
-                if unplayed_questions:
-                    # Select random question from unplayed questions
-                    selected_question = random.choice(unplayed_questions)
-                    question_id = selected_question.get("id")
-                    
-                    _LOGGER.info("Selected unplayed question with ID %s (%d unplayed questions remaining)", 
-                                question_id, len(unplayed_questions) - 1)
-                    
-                    # Add question to played list
-                    if played_questions_sensor and hasattr(played_questions_sensor, 'add_played_question'):
-                        played_questions_sensor.add_played_question(question_id)
-                    
-                    # Update the current question sensor with the question details
-                    if current_question_sensor and hasattr(current_question_sensor, 'update_current_question'):
-                        current_question_sensor.update_current_question({
-                            "question_id": selected_question.get("id"),
-                            "category": selected_question.get("category"),
-                            "question": selected_question.get("question"),
-                            "answer_a": selected_question.get("answer_a"),
-                            "answer_b": selected_question.get("answer_b"),
-                            "answer_c": selected_question.get("answer_c"),
-                            "correct_answer": selected_question.get("correct_answer"),
-                            "fun_fact": selected_question.get("fun_fact"),
-                            "difficulty_level": selected_question.get("difficulty_level")
-                        })
-                else:
-                    # All questions have been asked
-                    _LOGGER.warning("All questions have been asked! Total questions: %d", len(available_questions))
-                    
-                    # Clear the current question sensor to trigger warning display
-                    if current_question_sensor and hasattr(current_question_sensor, 'clear_current_question'):
-                        current_question_sensor.clear_current_question()
-                    
-                    return
-            else:
-                _LOGGER.warning("No questions found in questions.json")
-                if current_question_sensor and hasattr(current_question_sensor, 'clear_current_question'):
-                    current_question_sensor.clear_current_question()
+            _LOGGER.debug("Drew question with ID %s (%d unplayed questions remaining)",
+                          question_id, deck.remaining)
+            return PreparedQuestion(
+                difficulty_level,
+                question_bank.generation,
+                question_id,
+                question_bank.get_payload(question_id),
+                bank=question_bank,
+            )
         except Exception as e:
             _LOGGER.error("Failed to select random question: %s", e)
-            if current_question_sensor and hasattr(current_question_sensor, 'clear_current_question'):
-                current_question_sensor.clear_current_question()
+            return PreparedQuestion(difficulty_level)
+    
+    async def _async_prepare_question_from_store(self, difficulty_level: str) -> PreparedQuestion:
+        """Draw the next question from the SQLite question database."""
+        question_store = self.question_store
+        try:
+            question = await self.hass.async_add_executor_job(
+                question_store.draw, difficulty_level, self.game_id
+            )
+        except Exception as e:
+            _LOGGER.error("Failed to draw question from question database: %s", e)
+            question = None
+        
+        if question is None:
+            return PreparedQuestion(difficulty_level)
+        
+        _LOGGER.debug("Drew question with ID %s from question database", question["id"])
+        return PreparedQuestion(
+            difficulty_level, None, question["id"], build_question_payload(question), question_store
+        )
+    
+    def _schedule_prefetch(self) -> None:
+        """Start drawing the next question in the background.
+        
+        The question is drawn, its payload looked up and the question packs
+        checked for changes while the current round runs, so next_question
+        only has to publish it. A pack edited after the prefetch is picked up
+        one question later.
+        """
+        if self._prefetch is None:
+            self._prefetch = self.hass.async_create_background_task(
+                self._async_prefetch_question(self.context.main_sensor._difficulty_level),
+                f"{DOMAIN} prefetch question {self.game_id}",
+            )
+    
+    async def _async_prefetch_question(self, difficulty_level: str) -> PreparedQuestion:
+        """Prepare the next question; run as a background task."""
+        with self._measure("prefetch_question"):
+            return await self._async_prepare_question(difficulty_level)
+    
+    async def _async_take_prefetched_question(self, difficulty_level: str) -> PreparedQuestion | None:
+        """Return the prefetched question, or None if there is none or it no longer applies."""
+        task, self._prefetch = self._prefetch, None
+        prepared = await task if task is not None else None
+        usable = (
+            prepared is not None
+            and prepared.difficulty_level == difficulty_level
+            and self._is_current_source(prepared.store, prepared.bank, prepared.generation)
+        )
+        if self.metrics is not None:
+            self.metrics.record_prefetch(usable)
+        if usable:
+            return prepared
+        # Drawn for another difficulty level, from another or older bank, or from
+        # the bank before the question database was enabled: put it back
+        await self._async_release_question(prepared)
+        return None
+    
+    async def _async_discard_prefetch(self) -> None:
+        """Wait for a running prefetch and put its question back."""
+        task, self._prefetch = self._prefetch, None
+        if task is not None:
+            await self._async_release_question(await task)
+    
+    @callback
+    def async_cancel_prefetch(self) -> None:
+        """Cancel a running prefetch when the game is unloaded."""
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+    
+    async def _async_release_question(self, prepared: PreparedQuestion | None) -> None:
+        """Make a drawn but unpublished question available again."""
+        if prepared is None or prepared.question_id is None:
+            return
+        if prepared.store is not None:
+            # Through the database it was drawn from, which may have been switched off since
+            await self.hass.async_add_executor_job(
+                prepared.store.release, self.game_id, prepared.question_id
+            )
+            return
+        deck = self._decks.get(prepared.difficulty_level)
+        if deck is not None and deck.bank is prepared.bank and deck.generation == prepared.generation:
+            deck.undraw(prepared.question_id)
     
-    async def _start_countdown(self, entities: dict):
+    def _is_current_source(
+        self, store: QuestionStore | None, bank: QuestionBank | None, generation: int | None
+    ) -> bool:
+        """Return whether questions drawn from a store or bank generation can still be asked."""
+        if self.question_store is not None:
+            return store is self.question_store
+        return store is None and bank is self.question_bank and generation == self.question_bank.generation
+    
+    def _get_deck(self, difficulty_level: str) -> QuestionDeck:
+        """Return the deck for a difficulty level, building it on first use.
+        
+        Decks are kept per difficulty level for the whole game, so switching
+        difficulty mid-game resumes the other deck where it left off. A deck is
+        rebuilt (without already played questions) when the question bank reloads
+        or is replaced by the bank of another pack directory.
+        """
+        deck = self._decks.get(difficulty_level)
+        if deck is None or not self._is_current_source(None, deck.bank, deck.generation):
+            played_question_ids = self.context.played_questions_sensor.played_question_ids
+            deck = self.question_bank.build_deck(difficulty_level, played_question_ids)
+            self._decks[difficulty_level] = deck
+            _LOGGER.debug("Built %s question deck with %d unplayed questions", difficulty_level, deck.remaining)
+        return deck
+    
+    async def _start_countdown(self):
         """Start the countdown timer for the current question."""
-        countdown_sensor = entities.get("countdown_sensor")
-        countdown_current_sensor = entities.get("countdown_current_sensor")
+        # Start the countdown with the configured timer length
+        self.context.countdown_current_sensor.start_countdown(self.context.countdown_sensor.state)
+
+    async def _async_resolve_mvp_name(self):
+        """Look up the name of the current MVP when another user takes the lead.
         
-        if countdown_sensor and countdown_current_sensor:
-            # Get the configured timer length
-            timer_length = int(countdown_sensor.state) if (hasattr(countdown_sensor, 'state') and countdown_sensor.state is not None) else 30
-            
-            # Start the countdown
-            if hasattr(countdown_current_sensor, 'start_countdown'):
-                countdown_current_sensor.start_countdown(timer_length)
-            else:
-                # Fallback to direct state setting
-                self.hass.states.async_set("sensor.home_trivia_countdown_current", timer_length)
-        else:
-            # Fallback: get timer length from sensor state and start countdown
-            timer_entity = self.hass.states.get("sensor.home_trivia_countdown_timer")
-            timer_length = int(timer_entity.state) if (timer_entity and timer_entity.state is not None) else 30
-            
-            # Try to find the countdown current sensor entity and start countdown
-            countdown_current_sensor = None
-            
-            # Check all config entries for the entity
-            for config_entry_data in self.hass.data.get(DOMAIN, {}).values():
-                if isinstance(config_entry_data, dict) and "entities" in config_entry_data:
-                    countdown_current_sensor = config_entry_data["entities"].get("countdown_current_sensor")
-                    if countdown_current_sensor:
-                        break
-            
-            # If not found in config entries, check the global entities dict
-            if not countdown_current_sensor:
-                entities = self.hass.data.get(DOMAIN, {}).get("entities", {})
-                countdown_current_sensor = entities.get("countdown_current_sensor")
-            
-            if countdown_current_sensor and hasattr(countdown_current_sensor, 'start_countdown'):
-                countdown_current_sensor.start_countdown(timer_length)
-            else:
-                # Final fallback: just set the state (countdown won't auto-decrement)
-                self.hass.states.async_set("sensor.home_trivia_countdown_current", timer_length)
-
-    async def _calculate_and_set_summary(self, entities: dict):
-        """Calculate final game stats and store them."""
-        main_sensor = entities.get("main_sensor")
-        team_sensors = entities.get("team_sensors", {})
-        
-        # Calculate Best Category for each team
-        team_stats = {}
-        for team_id, team_sensor in team_sensors.items():
-            if not getattr(team_sensor, '_participating', False):
-                continue
-            
-            best_category = "N/A"
-            best_rate = -1
-            category_stats = getattr(team_sensor, '_category_stats', {})
-            for cat, stats in category_stats.items():
-                if stats['total'] > 0:
-                    rate = stats['correct'] / stats['total']
-                    if rate > best_rate:
-                        best_rate = rate
-                        best_category = cat
-            team_stats[team_id] = {"best_category": best_category}
-
-        # Calculate MVP
-        mvp_data = {"name": "N/A", "score": 0}
-        user_stats = getattr(main_sensor, '_user_stats', {})
-        if user_stats:
-            # Find user_id with the most correct answers
-            mvp_user_id = max(user_stats, key=lambda u: user_stats[u]['correct_answers'])
-            mvp_score = user_stats[mvp_user_id]['correct_answers']
-            
-            # Find the HA user's name from their ID (requires hass object)
+        A name is looked up once per user, so the summary never has to wait
+        for it when the game is stopped.
+        """
+        main_sensor = self.context.main_sensor
+        mvp = main_sensor.mvp
+        if mvp is None or main_sensor._mvp_name is not None:
+            return
+        user_id = mvp["user_id"]
+        name = self._user_names.get(user_id)
+        if name is None:
             try:
-                user_info = await self.hass.auth.async_get_user(mvp_user_id)
-                mvp_name = user_info.name if user_info else mvp_user_id
-                mvp_data = {"name": mvp_name, "score": mvp_score}
+                user_info = await self.hass.auth.async_get_user(user_id)
+                name = user_info.name if user_info and user_info.name else user_id
             except Exception as e:
                 _LOGGER.warning("Could not get user info for MVP: %s", e)
-                mvp_data = {"name": mvp_user_id, "score": mvp_score}
+                name = user_id
+            self._user_names[user_id] = name
+        main_sensor.set_mvp_name(user_id, name)
+    
+    async def _calculate_and_set_summary(self):
+        """Publish the final game stats.
+        
+        The best categories and the MVP are kept up to date as rounds are
+        scored, so this only collects them.
+        """
+        main_sensor = self.context.main_sensor
+        
+        # Only needed if the game was restored after a restart
+        await self._async_resolve_mvp_name()
+        
+        team_stats = {
+            team_sensor.team_key: {"best_category": team_sensor._best_category or "N/A"}
+            for team_sensor in self.context.team_sensors.values()
+            if team_sensor._participating
+        }
+        mvp = main_sensor.mvp
+        mvp_data = {"name": "N/A", "score": 0}
+        if mvp is not None:
+            mvp_data = {"name": mvp["name"], "score": mvp["score"], "tied_user_ids": mvp["tied_user_ids"]}
             
         # Assemble and set summary
         summary = {
             "team_stats": team_stats,
             "mvp": mvp_data,
         }
-        if main_sensor and hasattr(main_sensor, 'set_game_summary'):
-            main_sensor.set_game_summary(summary)
-            _LOGGER.info("Game summary calculated and set")
-
+        main_sensor.set_game_summary(summary)
+        _LOGGER.info("Game summary set")
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry and remove services if no entries remain."""
     _LOGGER.info("Unloading Home Trivia entry %s", entry.entry_id)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-        if not hass.data[DOMAIN]:
-            # No more config entries—remove all services
+        game = hass.data[DOMAIN].pop(entry.entry_id)
+        game["game_manager"].async_cancel_prefetch()
+        # Write the game and its journal now instead of leaving delayed writes behind
+        await game["game_store"].async_save()
+        await game["journal"].async_flush()
+        _evict_unused_question_banks(hass)
+        if not _loaded_games(hass):
+            # No more games—remove all services
             for svc in [
                 "start_game",
                 "stop_game",
@@ -903,6 +1139,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "update_team_user_id",
                 "update_countdown_timer_length",
                 "update_team_count",
+                "update_game_mode",
+                "import_question_database",
             ]:
                 hass.services.async_remove(DOMAIN, svc)
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the saved game and its journal when a config entry is removed."""
+    await GameStateStore(hass, entry.entry_id).async_remove()
+    await GameJournal(hass, entry.entry_id).async_remove()
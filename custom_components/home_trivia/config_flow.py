@@ -2,13 +2,41 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.util import slugify
+
+from .const import (
+    CONF_BASE_POINTS,
+    CONF_GAME_NAME,
+    CONF_PACK_DIRECTORY,
+    CONF_SPEED_BONUS_PER_SECOND,
+    CONF_STREAK_BONUS,
+    CONF_STREAK_LENGTH,
+    CONF_USE_QUESTION_DATABASE,
+    DEFAULT_BASE_POINTS,
+    DEFAULT_GAME_NAME,
+    DEFAULT_PACK_DIRECTORY,
+    DEFAULT_SPEED_BONUS_PER_SECOND,
+    DEFAULT_STREAK_BONUS,
+    DEFAULT_STREAK_LENGTH,
+    DOMAIN,
+)
+from .naming import game_entity_prefix
 
-from .const import DOMAIN
+# Scoring rule options with their defaults; all are whole numbers from 0
+SCORING_OPTIONS = {
+    CONF_BASE_POINTS: DEFAULT_BASE_POINTS,
+    CONF_SPEED_BONUS_PER_SECOND: DEFAULT_SPEED_BONUS_PER_SECOND,
+    CONF_STREAK_LENGTH: DEFAULT_STREAK_LENGTH,
+    CONF_STREAK_BONUS: DEFAULT_STREAK_BONUS,
+}
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,23 +46,100 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
+        """Handle the initial step.
+        
+        Every entry is a separate game (e.g. one per room); only its name is
+        asked here, all other setup is done in the splash screen.
+        """
+        errors: dict[str, str] = {}
+        existing_prefixes = {
+            game_entity_prefix(entry.data.get(CONF_GAME_NAME, DEFAULT_GAME_NAME))
+            for entry in self._async_current_entries()
+        }
 
         if user_input is not None:
-            # Create entry with minimal data - all setup is done in splash screen
-            return self.async_create_entry(title="Home Trivia", data={})
+            name = user_input[CONF_GAME_NAME].strip()
+            if not slugify(name):
+                errors[CONF_GAME_NAME] = "invalid_name"
+            elif game_entity_prefix(name) in existing_prefixes:
+                errors[CONF_GAME_NAME] = "name_exists"
+            else:
+                return self.async_create_entry(title=name, data={CONF_GAME_NAME: name})
 
-        # Simple confirmation form - no configuration asked here
-        return self.async_show_form(step_id="user")
+        # The first game keeps the plain "Home Trivia" name and entity ids
+        default_name = "" if game_entity_prefix(DEFAULT_GAME_NAME) in existing_prefixes else DEFAULT_GAME_NAME
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema({vol.Required(CONF_GAME_NAME, default=default_name): str}),
+            errors=errors,
+        )
 
     async def async_step_import(self, import_config: dict[str, Any]) -> FlowResult:
         """Handle import from YAML configuration."""
         if self._async_current_entries():
             return self.async_abort(reason="single_instance_allowed")
 
-        return self.async_create_entry(title="Home Trivia", data={})
\ No newline at end of file
+        return self.async_create_entry(title="Home Trivia", data={})
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Home Trivia options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the question pack directory, question database and scoring rules."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            pack_directory = user_input[CONF_PACK_DIRECTORY].strip()
+            path = self.hass.config.path(pack_directory)
+            # A folder that does not exist yet (like the default one) just has no packs
+            if not pack_directory or not await self.hass.async_add_executor_job(os.path.isfile, path):
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        CONF_PACK_DIRECTORY: pack_directory,
+                        CONF_USE_QUESTION_DATABASE: user_input[CONF_USE_QUESTION_DATABASE],
+                        **{key: user_input[key] for key in SCORING_OPTIONS},
+                    },
+                )
+            errors[CONF_PACK_DIRECTORY] = "pack_directory_is_file"
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PACK_DIRECTORY,
+                        default=options.get(CONF_PACK_DIRECTORY, DEFAULT_PACK_DIRECTORY),
+                    ): str,
+                    vol.Optional(
+                        CONF_USE_QUESTION_DATABASE,
+                        default=options.get(CONF_USE_QUESTION_DATABASE, False),
+                    ): bool,
+                    **{
+                        vol.Optional(key, default=options.get(key, default)): vol.All(
+                            vol.Coerce(int), vol.Range(min=0, max=1000)
+                        )
+                        for key, default in SCORING_OPTIONS.items()
+                    },
+                }
+            ),
+            errors=errors,
+        )
@@ -1,3 +1,50 @@
 """Constants for the Home Trivia integration."""
 
-DOMAIN = "home_trivia"
\ No newline at end of file
+DOMAIN = "home_trivia"
+
+# Directory (relative to the config directory, or absolute) with extra question packs
+CONF_PACK_DIRECTORY = "pack_directory"
+DEFAULT_PACK_DIRECTORY = "home_trivia_packs"
+
+# Optional SQLite backend for very large question banks (in the config directory)
+CONF_USE_QUESTION_DATABASE = "use_question_database"
+QUESTION_DATABASE_FILE = "home_trivia_questions.db"
+PLAYER_STATS_DATABASE_FILE = "home_trivia_player_stats.db"
+
+# Every config entry is a separate game; its name prefixes the entity ids
+CONF_GAME_NAME = "name"
+DEFAULT_GAME_NAME = "Home Trivia"
+
+# Service field that selects the game a service call is for
+ATTR_GAME_ID = "game_id"
+
+# Team entities are created and removed as the team count changes
+MAX_TEAM_COUNT = 200
+LEGACY_TEAM_COUNT = 5  # Team entities that existed before the team count was dynamic
+
+# Game modes: in buzzer mode a team's first answer is final, and the speed
+# bonus follows the millisecond order in which the answers were received
+GAME_MODE_CLASSIC = "classic"
+GAME_MODE_BUZZER = "buzzer"
+GAME_MODES = [GAME_MODE_CLASSIC, GAME_MODE_BUZZER]
+
+# Folder (in the config directory) with the event journal of every game
+JOURNAL_DIRECTORY = "home_trivia_journal"
+
+# Scoring rules, set in the options of a game: base points for a correct
+# answer, speed bonus points per second left, and a bonus for every
+# streak_length correct answers in a row
+CONF_BASE_POINTS = "base_points"
+CONF_SPEED_BONUS_PER_SECOND = "speed_bonus_per_second"
+CONF_STREAK_LENGTH = "streak_length"
+CONF_STREAK_BONUS = "streak_bonus"
+DEFAULT_BASE_POINTS = 10
+DEFAULT_SPEED_BONUS_PER_SECOND = 1
+DEFAULT_STREAK_LENGTH = 3
+DEFAULT_STREAK_BONUS = 25
+
+# Results kept on every all-time leaderboard (one per difficulty level and team count)
+LEADERBOARD_SIZE = 10
+
+# Most players the all-time MVP ranking of home_trivia/player_stats returns
+PLAYER_STATS_LIMIT = 25
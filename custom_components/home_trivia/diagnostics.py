@@ -0,0 +1,62 @@
+"""Diagnostics support for Home Trivia.
+
+The diagnostics download of a game holds its runtime metrics: latency
+histograms and call counts of the GameManager phases and services, how late
+the countdown expired, and the state writes per entity.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return the diagnostics of a game."""
+    game = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    context = game.get("context")
+    metrics = game.get("metrics")
+    journal = game.get("journal")
+    player_stats = hass.data.get(DOMAIN, {}).get("player_stats")
+    game_manager = game.get("game_manager")
+    write_batch = context.write_batch if context else None
+    main_sensor = context.main_sensor if context else None
+
+    sensors = context.sensors if context else []
+    state_writes = {
+        sensor.entity_id or sensor.unique_id: sensor.state_writes
+        for sensor in sorted(sensors, key=lambda sensor: sensor.state_writes, reverse=True)
+    }
+
+    return {
+        "entry": {"title": entry.title, "data": dict(entry.data), "options": dict(entry.options)},
+        "game": {
+            "name": game.get("name"),
+            "state": main_sensor.state if main_sensor else None,
+            "game_mode": main_sensor.game_mode if main_sensor else None,
+            "team_count": len(context.teams) if context else 0,
+            "question_count": game_manager.question_bank.question_count if game_manager else None,
+            "question_database": bool(game_manager and game_manager.question_store),
+        },
+        "metrics": metrics.as_dict() if metrics else None,
+        "state_writes": {
+            "per_entity": state_writes,
+            "batched": write_batch.writes if write_batch else None,
+            "coalesced": write_batch.writes_avoided if write_batch else None,
+            "store_saves_scheduled": game["game_store"].saves_scheduled if "game_store" in game else None,
+            "leaderboard_saves_scheduled": (
+                hass.data[DOMAIN]["leaderboards"].saves_scheduled if "leaderboards" in hass.data.get(DOMAIN, {}) else None
+            ),
+        },
+        "journal": {
+            "events_recorded": journal.events_recorded,
+            "events_written": journal.events_written,
+        } if journal else None,
+        "player_stats": {
+            "database": player_stats.store.path,
+            "batches_written": player_stats.batches_written,
+        } if player_stats else None,
+    }
@@ -0,0 +1,176 @@
+"""Serve the Home Trivia card and its translations.
+
+The files in www are read once at startup, in the executor, and kept in
+memory with precompressed gzip (and, if the brotli module is installed,
+brotli) variants. They are served under a URL that contains a hash of their
+content, /home_trivia_frontend_assets/<hash>/home-trivia-card.js, which the
+browser may cache forever: a new version of a file gets a new URL. The card
+is added to the frontend under that URL, so tablets only download it again
+after an update.
+
+The unversioned URLs (/home_trivia_frontend_assets/<file>) keep working for
+dashboards that load the card as a resource; those responses are
+revalidated with an ETag instead.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+from dataclasses import dataclass
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip is always available
+    brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+FRONTEND_URL_PATH = "/home_trivia_frontend_assets"
+CARD_FILE = "home-trivia-card.js"
+TRANSLATIONS_FILE = "translations.json"
+
+WWW_DIRECTORY = os.path.join(os.path.dirname(__file__), "www")
+
+# Hex digits of the content hash in versioned URLs
+HASH_LENGTH = 12
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+@dataclass(frozen=True, slots=True)
+class FrontendAsset:
+    """A file of the card, with its precompressed variants."""
+
+    content_type: str
+    version: str
+    body: bytes
+    gzip: bytes
+    brotli: bytes | None
+
+    @property
+    def etag(self) -> str:
+        """Return the ETag of the file."""
+        return f'"{self.version}"'
+
+
+def _build_asset(filename: str, body: bytes) -> FrontendAsset:
+    """Hash and compress a file."""
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+        content_type += "; charset=utf-8"
+    return FrontendAsset(
+        content_type=content_type,
+        version=hashlib.sha256(body).hexdigest()[:HASH_LENGTH],
+        body=body,
+        gzip=gzip.compress(body, compresslevel=9, mtime=0),
+        brotli=brotli.compress(body) if brotli is not None else None,
+    )
+
+
+def build_frontend_assets(www_directory: str = WWW_DIRECTORY) -> dict[str, FrontendAsset]:
+    """Read, hash and compress the files of the card. Blocks, run it in the executor.
+
+    The card fetches its translations from a versioned URL too, so that URL
+    is written into the card before the card itself is hashed; a change to
+    the translations therefore also gives the card a new URL.
+    """
+    assets: dict[str, FrontendAsset] = {}
+    for filename in sorted(os.listdir(www_directory)):
+        if filename == CARD_FILE:
+            continue
+        path = os.path.join(www_directory, filename)
+        if os.path.isfile(path):
+            with open(path, "rb") as file:
+                assets[filename] = _build_asset(filename, file.read())
+
+    with open(os.path.join(www_directory, CARD_FILE), "rb") as file:
+        card = file.read()
+    if TRANSLATIONS_FILE in assets:
+        card = card.replace(
+            f"{FRONTEND_URL_PATH}/{TRANSLATIONS_FILE}".encode(),
+            asset_url(TRANSLATIONS_FILE, assets[TRANSLATIONS_FILE]).encode(),
+        )
+    assets[CARD_FILE] = _build_asset(CARD_FILE, card)
+    return assets
+
+
+def asset_url(filename: str, asset: FrontendAsset) -> str:
+    """Return the versioned URL of a file."""
+    return f"{FRONTEND_URL_PATH}/{asset.version}/{filename}"
+
+
+class FrontendAssetsView(HomeAssistantView):
+    """Serve the card's files from memory, compressed when the browser accepts it."""
+
+    url = FRONTEND_URL_PATH + "/{filename}"
+    extra_urls = [FRONTEND_URL_PATH + "/{version}/{filename}"]
+    name = "home_trivia:frontend_assets"
+    requires_auth = False
+
+    def __init__(self, assets: dict[str, FrontendAsset]) -> None:
+        """Initialize the view."""
+        self._assets = assets
+
+    async def get(self, request: web.Request, filename: str, version: str | None = None) -> web.Response:
+        """Return a file."""
+        asset = self._assets.get(filename)
+        if asset is None:
+            raise web.HTTPNotFound
+
+        # Only the current version may be cached for good; an old hash gets the current file, revalidated
+        cache_control = IMMUTABLE_CACHE_CONTROL if version == asset.version else REVALIDATE_CACHE_CONTROL
+        headers = {
+            hdrs.CACHE_CONTROL: cache_control,
+            hdrs.ETAG: asset.etag,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        if request.headers.get(hdrs.IF_NONE_MATCH) == asset.etag:
+            return web.Response(status=304, headers=headers)
+
+        accept_encoding = request.headers.get(hdrs.ACCEPT_ENCODING, "")
+        body = asset.body
+        if asset.brotli is not None and "br" in accept_encoding:
+            body = asset.brotli
+            headers[hdrs.CONTENT_ENCODING] = "br"
+        elif "gzip" in accept_encoding:
+            body = asset.gzip
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        headers[hdrs.CONTENT_TYPE] = asset.content_type
+        return web.Response(body=body, headers=headers)
+
+
+async def async_register_frontend(hass: HomeAssistant) -> None:
+    """Serve the card and add it to the frontend, once per Home Assistant instance."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "frontend_assets" in domain_data:
+        return
+    if not os.path.isfile(os.path.join(WWW_DIRECTORY, CARD_FILE)):
+        _LOGGER.warning("Home Trivia card file not found in %s", WWW_DIRECTORY)
+        return
+
+    assets = await hass.async_add_executor_job(build_frontend_assets)
+    domain_data["frontend_assets"] = assets
+    hass.http.register_view(FrontendAssetsView(assets))
+
+    card_url = asset_url(CARD_FILE, assets[CARD_FILE])
+    if "frontend" in hass.config.components:
+        from homeassistant.components.frontend import add_extra_js_url
+
+        add_extra_js_url(hass, card_url)
+    _LOGGER.info(
+        "Serving Home Trivia card at %s (%d bytes, %d gzipped)",
+        card_url,
+        len(assets[CARD_FILE].body),
+        len(assets[CARD_FILE].gzip),
+    )
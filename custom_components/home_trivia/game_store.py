@@ -0,0 +1,70 @@
+"""Persistent game state for the Home Trivia integration.
+
+The whole game (settings, teams, stats, current question, played questions
+and the countdown deadline) is kept in one versioned Home Assistant storage
+file per game. Saves are debounced, so a burst of state changes such as
+several teams answering at once is written to disk once.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .sensor import HomeTriviaSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Seconds without a state change before the game is written to disk
+SAVE_DELAY = 2
+
+
+class GameStateStore:
+    """Debounced storage of one game's snapshot."""
+
+    def __init__(self, hass: HomeAssistant, game_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.game.{game_id}"
+        )
+        self.entities: list[HomeTriviaSensor] = []  # Set by the sensor platform
+        self.restored: dict[str, dict[str, Any]] = {}  # Snapshot per entity unique id
+        self.saves_scheduled = 0
+
+    async def async_load(self) -> None:
+        """Load the saved game, if there is one."""
+        data = await self._store.async_load()
+        if data:
+            self.restored = data.get("entities", {})
+            _LOGGER.debug("Loaded saved game with %d entities", len(self.restored))
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the game once no state has changed for SAVE_DELAY seconds."""
+        self.saves_scheduled += 1
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the game now, replacing any pending delayed save."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the saved game."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Build the snapshot of every entity in the game."""
+        entities = {}
+        for entity in self.entities:
+            snapshot = entity.snapshot()
+            if snapshot is not None:
+                entities[entity.unique_id] = snapshot
+        return {"entities": entities}
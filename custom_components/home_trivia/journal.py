@@ -0,0 +1,312 @@
+"""Append-only event journal of Home Trivia games.
+
+Every game appends its events (game started, question drawn, answer
+received, round scored, game stopped) to a JSON Lines file in the
+home_trivia_journal folder of the config directory. Events are buffered in
+memory and written in batches in the executor, so recording an event never
+waits on disk. Files are rotated at JOURNAL_MAX_BYTES and only
+JOURNAL_BACKUP_COUNT rotated files are kept, which caps the disk space a
+game can use.
+
+replay() rebuilds the scoreboard and the game summary of the last game
+from the events alone, and rescore() scores every journaled round again
+with other scoring rules, to see how they would have played out.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import GAME_MODE_BUZZER, JOURNAL_DIRECTORY
+from .scoring import RoundAnswers, ScoringRules, score_rounds
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds events are buffered before they are written
+JOURNAL_FLUSH_DELAY = 1
+
+# Buffered events that trigger a write right away
+JOURNAL_MAX_BATCH = 500
+
+# Size at which the journal file is rotated, and rotated files kept
+JOURNAL_MAX_BYTES = 1024 * 1024
+JOURNAL_BACKUP_COUNT = 4
+
+# Events that start a game; replay() starts from the last of them
+GAME_START_EVENTS = ("game_started", "game_reset")
+
+
+class GameJournal:
+    """Buffered, rotating JSON Lines journal of one game."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        game_id: str,
+        max_bytes: int = JOURNAL_MAX_BYTES,
+        backup_count: int = JOURNAL_BACKUP_COUNT,
+    ) -> None:
+        """Initialize the journal."""
+        self._hass = hass
+        self.path = hass.config.path(JOURNAL_DIRECTORY, f"{game_id}.jsonl")
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._buffer: list[dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self.events_recorded = 0
+        self.events_written = 0
+
+    @callback
+    def record(self, event: str, **data: Any) -> None:
+        """Append an event; it is written to disk with the next batch."""
+        self._buffer.append({"time": time.time(), "event": event, **data})
+        self.events_recorded += 1
+        if len(self._buffer) >= JOURNAL_MAX_BATCH:
+            self._schedule_flush(0)
+        elif self._unsub_flush is None:
+            self._schedule_flush(JOURNAL_FLUSH_DELAY)
+
+    @callback
+    def _schedule_flush(self, delay: float) -> None:
+        """Write the buffered events after delay seconds."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+        self._unsub_flush = async_call_later(self._hass, delay, self._async_flush_later)
+
+    async def _async_flush_later(self, _now) -> None:
+        """Write the buffered events when the flush delay has passed."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write all buffered events now."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        # The lock keeps batches in order when a flush is still writing
+        async with self._flush_lock:
+            events, self._buffer = self._buffer, []
+            if not events:
+                return
+            try:
+                await self._hass.async_add_executor_job(self._write, events)
+            except OSError as e:
+                _LOGGER.warning("Could not write %d journal events to %s: %s", len(events), self.path, e)
+                return
+            self.events_written += len(events)
+
+    async def async_remove(self) -> None:
+        """Delete the journal and its rotated files."""
+        self._buffer.clear()
+        await self._hass.async_add_executor_job(self._remove)
+
+    def _write(self, events: list[dict[str, Any]]) -> None:
+        """Append events to the journal file, rotating it whenever it is full."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            size = 0
+        chunk: list[bytes] = []
+        chunk_size = 0
+        for event in events:
+            line = (json.dumps(event, separators=(",", ":")) + "\n").encode()
+            if size + chunk_size + len(line) > self._max_bytes and size + chunk_size:
+                self._append(chunk)
+                self._rotate()
+                size, chunk, chunk_size = 0, [], 0
+            chunk.append(line)
+            chunk_size += len(line)
+        self._append(chunk)
+
+    def _append(self, lines: list[bytes]) -> None:
+        """Append lines to the journal file."""
+        if lines:
+            with open(self.path, "ab") as file:
+                file.write(b"".join(lines))
+
+    def _rotate(self) -> None:
+        """Shift journal.jsonl to journal.jsonl.1 and so on, dropping the oldest."""
+        for number in range(self._backup_count, 0, -1):
+            source = f"{self.path}.{number - 1}" if number > 1 else self.path
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{number}")
+        if not self._backup_count:
+            os.remove(self.path)
+
+    def _remove(self) -> None:
+        """Delete the journal files."""
+        for path in journal_files(self.path):
+            os.remove(path)
+
+
+def journal_files(path: str) -> list[str]:
+    """Return the existing files of a journal, oldest first."""
+    files = []
+    number = 1
+    while os.path.exists(f"{path}.{number}"):
+        files.insert(0, f"{path}.{number}")
+        number += 1
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_events(path: str) -> Iterator[dict[str, Any]]:
+    """Yield the events of a journal, oldest first. Blocks, run it in the executor.
+
+    A line that is not valid JSON, e.g. the last line after a crash
+    mid-write, is skipped.
+    """
+    for file_path in journal_files(path):
+        with open(file_path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    _LOGGER.debug("Skipping malformed journal line in %s", file_path)
+
+
+def replay(events: Iterable[dict[str, Any]], user_names: dict[str, str] | None = None) -> dict[str, Any]:
+    """Rebuild the scoreboard and game summary of the last game in the events.
+
+    The summary has the same shape as the one set when a game is stopped.
+    MVP names are looked up in user_names and default to the user id.
+    """
+    teams: dict[str, dict[str, Any]] = {}
+    user_stats: dict[str, int] = {}
+    mvp_user_ids: list[str] = []
+    mvp_score = 0
+    participating: list[str] | None = None
+    rounds = 0
+
+    for event in events:
+        event_type = event.get("event")
+        if event_type in GAME_START_EVENTS:
+            teams = {
+                team_key: {"name": team["name"], "points": 0, "correct": 0, "category_stats": {}}
+                for team_key, team in event.get("teams", {}).items()
+            }
+            # A reset keeps the user stats of the game; a new game starts them over
+            if event_type == "game_started":
+                user_stats = {}
+                mvp_user_ids = []
+                mvp_score = 0
+            participating = None
+            rounds = 0
+        elif event_type == "round_scored":
+            rounds += 1
+            category = event.get("category")
+            for team_key, result in event.get("results", {}).items():
+                team = teams.setdefault(team_key, {"name": team_key, "points": 0, "correct": 0, "category_stats": {}})
+                team["name"] = result.get("name", team["name"])
+                team["points"] += result["points"]
+                if result["correct"]:
+                    team["correct"] += 1
+                    if result.get("user_id"):
+                        user_id = result["user_id"]
+                        user_stats[user_id] = user_stats.get(user_id, 0) + 1
+                        # The first user to reach the most correct answers is MVP, the others tie
+                        if user_stats[user_id] > mvp_score:
+                            mvp_user_ids, mvp_score = [user_id], user_stats[user_id]
+                        elif user_stats[user_id] == mvp_score:
+                            mvp_user_ids.append(user_id)
+                if category:
+                    stats = team["category_stats"].setdefault(category, {"correct": 0, "total": 0})
+                    stats["correct"] += int(result["correct"])
+                    stats["total"] += 1
+        elif event_type == "points_set":
+            if event["team"] in teams:
+                teams[event["team"]]["points"] = event["points"]
+        elif event_type == "game_stopped":
+            participating = event.get("participating")
+
+    # Best category per team, by rate; the first category wins a tie
+    team_stats = {}
+    for team_key, team in teams.items():
+        if participating is not None and team_key not in participating:
+            continue
+        best_category = "N/A"
+        best_rate = -1
+        for category, stats in team["category_stats"].items():
+            if stats["total"] > 0:
+                rate = stats["correct"] / stats["total"]
+                if rate > best_rate:
+                    best_rate = rate
+                    best_category = category
+        team_stats[team_key] = {"best_category": best_category}
+
+    mvp = {"name": "N/A", "score": 0}
+    if mvp_user_ids:
+        mvp_user_id = mvp_user_ids[0]
+        mvp = {
+            "name": (user_names or {}).get(mvp_user_id, mvp_user_id),
+            "score": mvp_score,
+            "tied_user_ids": mvp_user_ids[1:],
+        }
+
+    scoreboard = sorted(
+        (
+            {"team": team_key, "name": team["name"], "points": team["points"], "correct": team["correct"]}
+            for team_key, team in teams.items()
+        ),
+        key=lambda team: team["points"],
+        reverse=True,
+    )
+    return {
+        "rounds": rounds,
+        "scoreboard": scoreboard,
+        "summary": {"team_stats": team_stats, "mvp": mvp},
+    }
+
+
+def journal_rounds(events: Iterable[dict[str, Any]]) -> Iterator[RoundAnswers | None]:
+    """Yield the scored rounds of the events as input for the scoring engine.
+
+    The answers come from the round_scored events, the time left and the
+    order of the answers from the answer_received events before them. None
+    is yielded where a game starts, as score_rounds() expects. Rounds
+    journaled before the game mode was recorded are scored as classic.
+    """
+    received: dict[str, tuple[int, int]] = {}  # Team key: (time remaining in ms, rank)
+    for event in events:
+        event_type = event.get("event")
+        if event_type in GAME_START_EVENTS:
+            received.clear()
+            yield None
+        elif event_type == "answer_received":
+            received[event["team"]] = (event.get("time_remaining_ms", 0), event.get("rank", 0))
+        elif event_type == "round_scored":
+            results = event.get("results", {})
+            team_keys = list(results)
+            timing = [received.get(team_key, (0, 0)) for team_key in team_keys]
+            yield RoundAnswers(
+                team_keys=team_keys,
+                correct_answer=event.get("correct_answer") or "",
+                answers=[(results[team_key].get("answer") or "").upper() or None for team_key in team_keys],
+                time_remaining=[math.ceil(time_remaining_ms / 1000) for time_remaining_ms, _rank in timing],
+                ranks=[rank for _time_remaining_ms, rank in timing]
+                if event.get("game_mode") == GAME_MODE_BUZZER else None,
+                category=event.get("category"),
+            )
+            received.clear()
+
+
+def rescore(events: Iterable[dict[str, Any]], rules: ScoringRules) -> dict[str, Any]:
+    """Score every journaled round again with other rules.
+
+    Returns the number of rounds and, per team, the total points, correct
+    answers and longest streak over all games in the events. Points set by
+    hand are not included.
+    """
+    return score_rounds(rules, journal_rounds(events))
@@ -0,0 +1,151 @@
+"""All-time leaderboards of Home Trivia.
+
+When a game ends, the result of every participating team is offered to the
+leaderboard of the game's difficulty level and team count. Each leaderboard
+keeps the LEADERBOARD_SIZE best results, ranked by average points per round
+and then by total points, in a min-heap, so a result that does not make it
+is turned away after one comparison with the weakest entry. The
+leaderboards of all games share one Home Assistant storage file, which is
+only written when a ranking actually changed. They are read back through
+the home_trivia/leaderboard websocket command; the journal is not needed.
+"""
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LEADERBOARD_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Seconds to wait before writing a changed ranking, so the results of all
+# teams of a game, or of several games ending at once, are written together
+SAVE_DELAY = 5
+
+
+class Leaderboard:
+    """The best results for one difficulty level and team count."""
+
+    __slots__ = ("size", "_heap")
+
+    def __init__(self, size: int = LEADERBOARD_SIZE, entries: Iterable[dict[str, Any]] = ()) -> None:
+        """Initialize the leaderboard from saved entries, in any order."""
+        self.size = size
+        # Min-heap of (rank key, entry): the root is the weakest result on the board
+        self._heap: list[tuple[tuple[float, int, int], dict[str, Any]]] = [
+            (self._key(entry), entry) for entry in entries
+        ]
+        heapq.heapify(self._heap)
+        while len(self._heap) > size:
+            heapq.heappop(self._heap)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._heap)
+
+    @staticmethod
+    def _key(entry: dict[str, Any]) -> tuple[float, int, int]:
+        """Return the rank key of an entry; on a tie, the earlier result ranks higher."""
+        return (entry["average_points"], entry["points"], -entry["seq"])
+
+    def submit(self, entry: dict[str, Any]) -> bool:
+        """Offer a result to the leaderboard and return True if it made it."""
+        item = (self._key(entry), entry)
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, item)
+            return True
+        if item[0] > self._heap[0][0]:
+            heapq.heapreplace(self._heap, item)
+            return True
+        return False
+
+    def entries(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return the entries, best first."""
+        return [entry for _key, entry in heapq.nlargest(limit or self.size, self._heap)]
+
+
+class Leaderboards:
+    """The leaderboards of every difficulty level and team count, with debounced storage."""
+
+    def __init__(self, hass: HomeAssistant, size: int = LEADERBOARD_SIZE) -> None:
+        """Initialize the leaderboards."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.leaderboards")
+        self.size = size
+        self._boards: dict[tuple[str, int], Leaderboard] = {}
+        self._seq = 0  # Order in which results were submitted, for ties
+        self.saves_scheduled = 0
+
+    async def async_load(self) -> None:
+        """Load the saved leaderboards, if there are any."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self._seq = data.get("seq", 0)
+        for board in data.get("leaderboards", []):
+            key = (board["difficulty_level"], int(board["team_count"]))
+            self._boards[key] = Leaderboard(self.size, board["entries"])
+        _LOGGER.debug("Loaded %d leaderboards", len(self._boards))
+
+    @callback
+    def async_submit(self, difficulty_level: str, team_count: int, results: Iterable[dict[str, Any]]) -> int:
+        """Offer the results of a game and return how many made it onto the leaderboard.
+
+        Every result holds team_name, points, rounds and game; results
+        without any rounds played are ignored.
+        """
+        key = (difficulty_level, team_count)
+        board = self._boards.get(key)
+        placed = 0
+        for result in results:
+            if result["rounds"] <= 0:
+                continue
+            self._seq += 1
+            entry = {
+                **result,
+                "average_points": round(result["points"] / result["rounds"], 2),
+                "seq": self._seq,
+            }
+            if board is None:
+                board = self._boards[key] = Leaderboard(self.size)
+            if board.submit(entry):
+                placed += 1
+        if placed:
+            _LOGGER.info("%d results made the %s leaderboard for %d teams", placed, difficulty_level, team_count)
+            self.saves_scheduled += 1
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return placed
+
+    @callback
+    def async_get(
+        self, difficulty_level: str | None = None, team_count: int | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the leaderboards matching the filters, best results first."""
+        if difficulty_level is not None and team_count is not None:
+            board = self._boards.get((difficulty_level, team_count))
+            if board is None:
+                return []
+            return [{"difficulty_level": difficulty_level, "team_count": team_count, "entries": board.entries(limit)}]
+        return [
+            {
+                "difficulty_level": board_difficulty,
+                "team_count": board_team_count,
+                "entries": board.entries(limit),
+            }
+            for (board_difficulty, board_team_count), board in sorted(self._boards.items())
+            if difficulty_level in (None, board_difficulty) and team_count in (None, board_team_count)
+        ]
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Build the data to save: only the entries of every leaderboard."""
+        return {
+            "seq": self._seq,
+            "leaderboards": self.async_get(),
+        }
@@ -0,0 +1,145 @@
+"""Runtime metrics of a Home Trivia game.
+
+Every game keeps latency histograms of its GameManager phases and service
+calls and of how late the countdown expires, so a slow game night can be
+looked into from the diagnostics download instead of a debugger. A
+histogram is a fixed list of bucket counters allocated once, so recording a
+sample is a bisect and a few additions, without allocating memory.
+"""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds in ms of the latency buckets; the last bucket counts everything slower
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Upper bounds in ms of the countdown drift buckets
+DRIFT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class LatencyHistogram:
+    """Call count, errors and latency distribution of one operation."""
+
+    __slots__ = ("bounds", "counts", "count", "errors", "total_ms", "max_ms")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        """Initialize the histogram with empty buckets."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        """Add a sample."""
+        ms = seconds * 1000
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        if failed:
+            self.errors += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the upper bound in ms of the bucket holding the given fraction of samples.
+
+        No bucket bound is higher than the slowest sample, which also bounds
+        the last bucket.
+        """
+        if not self.count:
+            return None
+        max_ms = round(self.max_ms, 3)
+        rank = max(1, round(self.count * fraction))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and index < len(self.bounds):
+                return min(self.bounds[index], max_ms)
+        return max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for the diagnostics."""
+        buckets = {f"<={bound}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets[f">{self.bounds[-1]}"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets_ms": buckets,
+        }
+
+
+class _Measurement:
+    """Context manager that records the time spent in its block."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: LatencyHistogram) -> None:
+        """Initialize the measurement for a histogram."""
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        """Start the clock."""
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        """Record the time spent in the block, and whether it raised."""
+        self._histogram.record(time.perf_counter() - self._start, exc_type is not None)
+
+
+class GameMetrics:
+    """Metrics of one game, kept from setup until the game is unloaded."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.started = time.monotonic()
+        self.phases: dict[str, LatencyHistogram] = {}
+        self.services: dict[str, LatencyHistogram] = {}
+        # How late the countdown expiry ran after the deadline
+        self.countdown_drift = LatencyHistogram(DRIFT_BUCKETS_MS)
+        # Questions published from the prefetch, and those that had to be drawn on demand
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+
+    def measure_phase(self, phase: str) -> _Measurement:
+        """Return a context manager that times a GameManager phase."""
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = LatencyHistogram()
+        return _Measurement(histogram)
+
+    def record_service(self, service: str, seconds: float, failed: bool = False) -> None:
+        """Record the latency of a service call."""
+        histogram = self.services.get(service)
+        if histogram is None:
+            histogram = self.services[service] = LatencyHistogram()
+        histogram.record(seconds, failed)
+
+    def record_countdown_drift(self, seconds: float) -> None:
+        """Record how late the countdown expired; expiring early counts as on time."""
+        self.countdown_drift.record(max(0.0, seconds))
+
+    def record_prefetch(self, hit: bool) -> None:
+        """Count whether the next question had been prepared in advance."""
+        if hit:
+            self.prefetch_hits += 1
+        else:
+            self.prefetch_misses += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for the diagnostics."""
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started),
+            "phases": {phase: histogram.as_dict() for phase, histogram in self.phases.items()},
+            "services": {service: histogram.as_dict() for service, histogram in self.services.items()},
+            "countdown_drift": self.countdown_drift.as_dict(),
+            "question_prefetch": {"hits": self.prefetch_hits, "misses": self.prefetch_misses},
+        }
@@ -0,0 +1,28 @@
+"""Names and entity id prefixes of Home Trivia games.
+
+Kept apart from the integration's __init__ so the config flow can check
+new game names without importing the whole game engine.
+"""
+from __future__ import annotations
+
+from homeassistant.util import slugify
+
+from .const import DEFAULT_GAME_NAME
+
+
+def game_entity_prefix(name: str) -> str:
+    """Return the entity id prefix of a game, e.g. home_trivia_kitchen.
+
+    The default game keeps the original home_trivia prefix, so existing
+    entities and dashboards are not affected by adding more games.
+    """
+    slug = slugify(name)
+    default_slug = slugify(DEFAULT_GAME_NAME)
+    return default_slug if slug == default_slug else f"{default_slug}_{slug}"
+
+
+def game_display_name(name: str) -> str:
+    """Return the name that prefixes a game's entity names."""
+    if game_entity_prefix(name) == game_entity_prefix(DEFAULT_GAME_NAME):
+        return DEFAULT_GAME_NAME
+    return f"{DEFAULT_GAME_NAME} {name}"
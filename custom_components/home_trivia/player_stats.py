@@ -0,0 +1,313 @@
+"""Long-term player statistics of Home Trivia.
+
+Every scored round adds the result of each team with an assigned user to a
+local SQLite database, shared by all games. The database holds running
+totals only: one row per player (games, rounds, correct answers, points,
+longest streak, games as MVP), one per player and category, and one per
+player and game, so the accuracy, best category and MVP ranking of players
+with hundreds of games behind them are a few indexed lookups.
+
+PlayerStatsStore blocks and must be run in the executor. PlayerStats
+buffers the results of a round on the event loop and writes them in one
+transaction in the executor right after the round, in order.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rounds a player must have played in a category before it can be their best
+BEST_CATEGORY_MIN_ROUNDS = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    user_id TEXT PRIMARY KEY,
+    games INTEGER NOT NULL DEFAULT 0,
+    rounds INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+    best_streak INTEGER NOT NULL DEFAULT 0,
+    mvp_games INTEGER NOT NULL DEFAULT 0,
+    last_played REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_players_mvp
+    ON players (mvp_games DESC, correct DESC);
+CREATE TABLE IF NOT EXISTS player_categories (
+    user_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    rounds INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, category)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS player_games (
+    game_key TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    game_id TEXT,
+    rounds INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (game_key, user_id)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_PLAYER = """
+INSERT INTO players (user_id, rounds, correct, points, best_streak, last_played)
+VALUES (:user_id, 1, :correct, :points, :streak, :now)
+ON CONFLICT (user_id) DO UPDATE SET
+    rounds = rounds + 1,
+    correct = correct + :correct,
+    points = points + :points,
+    best_streak = MAX(best_streak, :streak),
+    last_played = :now
+"""
+
+_UPSERT_CATEGORY = """
+INSERT INTO player_categories (user_id, category, rounds, correct)
+VALUES (:user_id, :category, 1, :correct)
+ON CONFLICT (user_id, category) DO UPDATE SET
+    rounds = rounds + 1,
+    correct = correct + :correct
+"""
+
+_UPDATE_PLAYER_GAME = """
+UPDATE player_games SET rounds = rounds + 1, correct = correct + :correct, points = points + :points
+WHERE game_key = :game_key AND user_id = :user_id
+"""
+
+# The MVP of a game is the one the game status sensor chose: of the players
+# tied on the most correct answers, the one who got there first
+_COUNT_MVP = """
+UPDATE players SET mvp_games = mvp_games + 1
+WHERE user_id = :user_id
+  AND EXISTS (SELECT 1 FROM player_games WHERE game_key = :game_key AND user_id = :user_id)
+"""
+
+_BEST_CATEGORY = """
+SELECT category, rounds, correct FROM player_categories
+WHERE user_id = ? AND rounds >= ?
+ORDER BY CAST(correct AS REAL) / rounds DESC, rounds DESC
+LIMIT 1
+"""
+
+PLAYER_COLUMNS = ("user_id", "games", "rounds", "correct", "points", "best_streak", "mvp_games", "last_played")
+
+
+def _accuracy(correct: int, rounds: int) -> float:
+    """Return the share of correct answers, rounded for display."""
+    return round(correct / rounds, 3) if rounds else 0.0
+
+
+class PlayerStatsStore:
+    """Player statistics backed by a SQLite database."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the store."""
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()  # Executor jobs may run on any worker thread
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def write(self, batch: list[tuple]) -> None:
+        """Apply buffered rounds and game ends in one transaction.
+
+        A round is ("round", game_key, game_id, category, rows), with a
+        (user_id, correct, points, streak) row per player; a game end is
+        ("end", game_key, mvp_user_id).
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for operation in batch:
+                    if operation[0] == "round":
+                        self._write_round(connection, now, *operation[1:])
+                    else:
+                        connection.execute(_COUNT_MVP, {"game_key": operation[1], "user_id": operation[2]})
+
+    @staticmethod
+    def _write_round(
+        connection: sqlite3.Connection,
+        now: float,
+        game_key: str,
+        game_id: str | None,
+        category: str | None,
+        rows: list[tuple[str, bool, int, int]],
+    ) -> None:
+        """Add the results of one round to the totals."""
+        params = [
+            {
+                "user_id": user_id,
+                "correct": int(correct),
+                "points": points,
+                "streak": streak,
+                "now": now,
+                "category": category,
+                "game_key": game_key,
+            }
+            for user_id, correct, points, streak in rows
+        ]
+        connection.executemany(_UPSERT_PLAYER, params)
+        if category:
+            connection.executemany(_UPSERT_CATEGORY, params)
+        for row in params:
+            # The first round of a player in a game counts the game
+            if connection.execute(
+                "INSERT OR IGNORE INTO player_games (game_key, user_id, game_id) VALUES (?, ?, ?)",
+                (game_key, row["user_id"], game_id),
+            ).rowcount:
+                connection.execute("UPDATE players SET games = games + 1 WHERE user_id = ?", (row["user_id"],))
+            connection.execute(_UPDATE_PLAYER_GAME, row)
+
+    def best_category(self, user_id: str) -> dict[str, Any] | None:
+        """Return the category a player answers best, or None before any category round.
+
+        Only categories with BEST_CATEGORY_MIN_ROUNDS rounds count, unless
+        the player has not played that many rounds in any category yet.
+        """
+        with self._lock:
+            return self._best_category(self._connect(), user_id)
+
+    @staticmethod
+    def _best_category(connection: sqlite3.Connection, user_id: str) -> dict[str, Any] | None:
+        """Return the best category of a player, on an open connection."""
+        row = connection.execute(_BEST_CATEGORY, (user_id, BEST_CATEGORY_MIN_ROUNDS)).fetchone()
+        if row is None:
+            row = connection.execute(_BEST_CATEGORY, (user_id, 1)).fetchone()
+        if row is None:
+            return None
+        category, rounds, correct = row
+        return {"category": category, "rounds": rounds, "correct": correct, "accuracy": _accuracy(correct, rounds)}
+
+    def player(self, user_id: str) -> dict[str, Any] | None:
+        """Return the totals, best category and per-category stats of a player."""
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                f"SELECT {', '.join(PLAYER_COLUMNS)} FROM players WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            player = self._player_dict(row)
+            player["best_category"] = self._best_category(connection, user_id)
+            player["categories"] = [
+                {"category": category, "rounds": rounds, "correct": correct, "accuracy": _accuracy(correct, rounds)}
+                for category, rounds, correct in connection.execute(
+                    "SELECT category, rounds, correct FROM player_categories WHERE user_id = ? ORDER BY category",
+                    (user_id,),
+                )
+            ]
+        return player
+
+    def mvps(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the players with the most games as MVP, then the most correct answers."""
+        with self._lock:
+            connection = self._connect()
+            players = [
+                self._player_dict(row)
+                for row in connection.execute(
+                    f"SELECT {', '.join(PLAYER_COLUMNS)} FROM players "
+                    "ORDER BY mvp_games DESC, correct DESC LIMIT ?",
+                    (limit,),
+                )
+            ]
+            for player in players:
+                player["best_category"] = self._best_category(connection, player["user_id"])
+        return players
+
+    @staticmethod
+    def _player_dict(row: tuple) -> dict[str, Any]:
+        """Return a players row as a dict, with the accuracy."""
+        player = dict(zip(PLAYER_COLUMNS, row))
+        player["accuracy"] = _accuracy(player["correct"], player["rounds"])
+        return player
+
+
+class PlayerStats:
+    """Buffers round results on the event loop and writes them to the store in order."""
+
+    def __init__(self, hass: HomeAssistant, store: PlayerStatsStore) -> None:
+        """Initialize the statistics."""
+        self._hass = hass
+        self.store = store
+        self._pending: list[tuple] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self.batches_written = 0
+
+    @callback
+    def record_round(self, game_key: str, game_id: str | None, category: str | None, results: dict[str, dict]) -> None:
+        """Add the results of a scored round (as journaled in round_scored) for the players in it."""
+        rows = [
+            (result["user_id"], result["correct"], result["points"], result["streak"])
+            for result in results.values()
+            if result.get("user_id")
+        ]
+        if rows:
+            self._pending.append(("round", game_key, game_id, category, rows))
+            self._schedule_flush()
+
+    @callback
+    def end_game(self, game_key: str, mvp_user_id: str) -> None:
+        """Count the MVP of a game that ended."""
+        self._pending.append(("end", game_key, mvp_user_id))
+        self._schedule_flush()
+
+    @callback
+    def _schedule_flush(self) -> None:
+        """Write the pending results in the executor, unless a write is already on its way."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._hass.async_create_background_task(
+                self.async_flush(), "home_trivia player stats write"
+            )
+
+    async def async_flush(self) -> None:
+        """Write all pending results now."""
+        # The lock keeps batches in order; results added while one is written go in the next
+        async with self._flush_lock:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    await self._hass.async_add_executor_job(self.store.write, batch)
+                except sqlite3.Error as e:
+                    _LOGGER.warning("Could not write %d player stats updates to %s: %s", len(batch), self.store.path, e)
+                    return
+                self.batches_written += 1
+
+    async def async_close(self) -> None:
+        """Write the pending results and close the database."""
+        await self.async_flush()
+        await self._hass.async_add_executor_job(self.store.close)
+
+    async def async_get_player(self, user_id: str) -> dict[str, Any] | None:
+        """Return the stats of a player, including results not written yet."""
+        await self.async_flush()
+        return await self._hass.async_add_executor_job(self.store.player, user_id)
+
+    async def async_get_mvps(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the all-time MVP ranking, including results not written yet."""
+        await self.async_flush()
+        return await self._hass.async_add_executor_job(self.store.mvps, limit)
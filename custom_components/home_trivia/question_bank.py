@@ -0,0 +1,488 @@
+"""Question bank for the Home Trivia integration."""
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+import logging
+import os
+import random
+import time
+import zlib
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, TextIO
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from .question_store import QuestionStore
+
+_LOGGER = logging.getLogger(__name__)
+
+QUESTIONS_FILE = os.path.join(os.path.dirname(__file__), "questions.json")
+
+# Question pack formats, optionally gzip compressed
+PACK_EXTENSIONS = (".json", ".jsonl", ".json.gz", ".jsonl.gz")
+
+# Size of the chunks read while streaming a JSON array pack
+PACK_CHUNK_SIZE = 1 << 16
+
+# Errors of a pack that cannot be read: missing, truncated, corrupt gzip stream or invalid JSON
+PACK_ERRORS = (OSError, EOFError, ValueError, zlib.error)
+
+# Name of the bundled questions file in the pack stats, apart from a pack with the same file name
+BUILTIN_PACK_NAME = "builtin:questions.json"
+
+# Keys published by the current question sensor, mapped from the question schema
+PAYLOAD_FIELDS = (
+    ("question_id", "id"),
+    ("category", "category"),
+    ("question", "question"),
+    ("answer_a", "answer_a"),
+    ("answer_b", "answer_b"),
+    ("answer_c", "answer_c"),
+    ("correct_answer", "correct_answer"),
+    ("fun_fact", "fun_fact"),
+    ("difficulty_level", "difficulty_level"),
+)
+
+
+def valid_question_id(question: Any) -> int | None:
+    """Return the id of a question, or None if it has no non-negative integer id.
+
+    Played questions are kept in a bitmap indexed by id and the question
+    database uses the id as its integer primary key, so a question with any
+    other id could never be played.
+    """
+    question_id = question.get("id") if isinstance(question, dict) else None
+    if isinstance(question_id, int) and not isinstance(question_id, bool) and question_id >= 0:
+        return question_id
+    return None
+
+
+def build_question_payload(question: dict) -> dict[str, Any]:
+    """Build the current question sensor payload for a question."""
+    return {key: question.get(field) for key, field in PAYLOAD_FIELDS}
+
+
+def _iter_json_array(f: TextIO) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, reading the file in chunks."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace and the separators between items
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Question pack must contain a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Item spans the chunk boundary; read more unless the file is done
+                if eof:
+                    raise
+            else:
+                yield item
+                continue
+        elif eof:
+            if started:
+                raise ValueError("Unexpected end of question pack")
+            return
+
+        chunk = f.read(PACK_CHUNK_SIZE)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def iter_pack_questions(path: str) -> Iterator[Any]:
+    """Stream the questions of a .json, .jsonl or gzip compressed pack."""
+    compressed = path.endswith(".gz")
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        if (path[:-3] if compressed else path).endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(f)
+
+
+class QuestionBank:
+    """In-memory question bank, merged from question packs and partitioned by difficulty level.
+
+    The bundled questions.json is always loaded first, followed by every pack
+    in the configured pack directory. Packs are parsed as streams, and the
+    bank is only re-read when a pack is added, removed, or its modification
+    time or size changes, so drawing a question never touches the disk.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pack_directory: str | None = None,
+        builtin_file: str = QUESTIONS_FILE,
+    ) -> None:
+        """Initialize the question bank."""
+        self.hass = hass
+        self.pack_directory = pack_directory
+        self._builtin_file = builtin_file
+        self._lock = asyncio.Lock()
+        self._signature: tuple | None = None
+        self._questions: dict[Any, dict] = {}
+        self._payloads: dict[Any, dict] = {}
+        self._by_difficulty: dict[str, list[dict]] = {}
+        self.generation = 0  # Bumped on every (re)load
+        self.last_load_duration = 0.0  # Seconds spent in the last load
+        self.pack_stats: dict[str, dict[str, Any]] = {}  # Per-pack counts and load times
+
+    @property
+    def question_count(self) -> int:
+        """Return the total number of questions in the bank."""
+        return len(self._questions)
+
+    def _pack_files(self) -> list[str]:
+        """Return the bundled questions file followed by the packs in the pack directory."""
+        files = [self._builtin_file]
+        if self.pack_directory and os.path.isdir(self.pack_directory):
+            files.extend(
+                os.path.join(self.pack_directory, name)
+                for name in sorted(os.listdir(self.pack_directory))
+                if name.endswith(PACK_EXTENSIONS)
+            )
+        return files
+
+    def _stat(self) -> tuple:
+        """Return the (path, mtime, size) signature of every pack."""
+        signature = []
+        for path in self._pack_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def iter_questions(self) -> Iterator[Any]:
+        """Stream the questions of every pack without indexing them (runs in the executor)."""
+        for path in self._pack_files():
+            try:
+                yield from iter_pack_questions(path)
+            except PACK_ERRORS as e:
+                _LOGGER.error("Failed to read question pack %s: %s", path, e)
+
+    def _pack_name(self, path: str) -> str:
+        """Return the name of a pack in the pack stats."""
+        if path == self._builtin_file:
+            return BUILTIN_PACK_NAME
+        return os.path.relpath(path, self.pack_directory)
+
+    def _read(self) -> tuple:
+        """Stream every pack into a new index (runs in the executor)."""
+        signature = self._stat()
+        by_id: dict[Any, dict] = {}
+        payloads: dict[Any, dict] = {}
+        by_difficulty: dict[str, list[dict]] = {}
+        pack_stats: dict[str, dict[str, Any]] = {}
+
+        for path, _mtime, _size in signature:
+            start = time.perf_counter()
+            stats = {"questions": 0, "skipped": 0, "load_time_ms": 0.0}
+            pack_stats[self._pack_name(path)] = stats
+            invalid = 0
+            try:
+                for question in iter_pack_questions(path):
+                    question_id = valid_question_id(question)
+                    if question_id is None:
+                        # Malformed question, or an id that is not a non-negative integer
+                        invalid += 1
+                        stats["skipped"] += 1
+                        continue
+                    if question_id in by_id:
+                        # Id already used by an earlier pack
+                        stats["skipped"] += 1
+                        continue
+                    by_id[question_id] = question
+                    payloads[question_id] = build_question_payload(question)
+                    by_difficulty.setdefault(question.get("difficulty_level"), []).append(question)
+                    stats["questions"] += 1
+            except PACK_ERRORS as e:
+                stats["error"] = str(e)
+                _LOGGER.error("Failed to load question pack %s: %s", path, e)
+            if invalid:
+                _LOGGER.warning(
+                    "Skipped %d questions in pack %s without a non-negative integer id", invalid, path
+                )
+            stats["load_time_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+        return signature, by_id, payloads, by_difficulty, pack_stats
+
+    async def async_load(self, force: bool = False) -> bool:
+        """Load the bank if it has not been loaded or any pack has changed.
+
+        Returns True if the bank was (re)loaded.
+        """
+        async with self._lock:
+            if not force and self._signature is not None:
+                signature = await self.hass.async_add_executor_job(self._stat)
+                if signature == self._signature:
+                    return False
+
+            start = time.perf_counter()
+            (
+                self._signature,
+                self._questions,
+                self._payloads,
+                self._by_difficulty,
+                self.pack_stats,
+            ) = await self.hass.async_add_executor_job(self._read)
+            self.generation += 1
+            self.last_load_duration = time.perf_counter() - start
+
+            for name, stats in self.pack_stats.items():
+                _LOGGER.info(
+                    "Question pack %s: %d questions (%d skipped) in %.1f ms",
+                    name, stats["questions"], stats["skipped"], stats["load_time_ms"],
+                )
+            _LOGGER.info(
+                "Loaded %d questions (%s) in %.1f ms",
+                self.question_count,
+                ", ".join(f"{level}: {len(items)}" for level, items in self._by_difficulty.items()),
+                self.last_load_duration * 1000,
+            )
+            return True
+
+    def questions_for_difficulty(self, difficulty_level: str) -> list[dict]:
+        """Return all questions for a difficulty level."""
+        return self._by_difficulty.get(difficulty_level, [])
+
+    def build_deck(self, difficulty_level: str, exclude_ids=()) -> QuestionDeck:
+        """Build a shuffled deck for a difficulty level, leaving out excluded ids.
+
+        exclude_ids should support fast membership checks (a set or PlayedQuestions).
+        """
+        return QuestionDeck(
+            [
+                question["id"]
+                for question in self.questions_for_difficulty(difficulty_level)
+                if question.get("id") not in exclude_ids
+            ],
+            self.generation,
+            self,
+        )
+
+    def get_question(self, question_id: Any) -> dict | None:
+        """Return a question by id."""
+        return self._questions.get(question_id)
+
+    def get_payload(self, question_id: Any) -> dict | None:
+        """Return the prebuilt sensor payload for a question."""
+        return self._payloads.get(question_id)
+
+
+class PreparedQuestion:
+    """A question drawn ahead of time, ready to be published.
+
+    question_id and payload are None when no unplayed question was left.
+    """
+
+    __slots__ = ("difficulty_level", "generation", "question_id", "payload", "store", "bank")
+
+    def __init__(
+        self,
+        difficulty_level: str,
+        generation: int | None = None,
+        question_id: Any = None,
+        payload: dict | None = None,
+        store: QuestionStore | None = None,
+        bank: QuestionBank | None = None,
+    ) -> None:
+        """Initialize the prepared question."""
+        self.difficulty_level = difficulty_level
+        self.generation = generation  # Question bank generation it was drawn from, None for the database
+        self.question_id = question_id
+        self.payload = payload
+        # Every pack directory has its own bank, whose generations also start at 1
+        self.bank = bank
+        # Question database it was drawn from, so it can be put back even after the
+        # database was switched off
+        self.store = store
+
+
+class QuestionDeck:
+    """Shuffled draw order for the questions of one difficulty level.
+
+    The deck is shuffled once and drawn from with a cursor, so each draw is
+    constant time no matter how many questions have already been played.
+    """
+
+    __slots__ = ("generation", "bank", "_order", "_cursor")
+
+    def __init__(self, question_ids: list, generation: int, bank: QuestionBank | None = None) -> None:
+        """Initialize and shuffle the deck."""
+        self.generation = generation  # Question bank generation the deck was built from
+        self.bank = bank  # Question bank the deck was built from
+        self._order = list(question_ids)
+        random.shuffle(self._order)
+        self._cursor = 0
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of questions left in the deck."""
+        return len(self._order) - self._cursor
+
+    def draw(self) -> Any | None:
+        """Draw the next question id, or None when the deck is exhausted."""
+        if self._cursor >= len(self._order):
+            return None
+        question_id = self._order[self._cursor]
+        self._cursor += 1
+        return question_id
+
+    def undraw(self, question_id: Any) -> bool:
+        """Put the last drawn question back on top of the deck.
+
+        Returns False if question_id was not the last question drawn.
+        """
+        if not self._cursor or self._order[self._cursor - 1] != question_id:
+            return False
+        self._cursor -= 1
+        return True
+
+
+# Played questions are kept in a bitmap while it takes no more than BITMAP_MIN_BYTES
+# plus BITMAP_BYTES_PER_ID bytes per played question. Sparser ids (one question with
+# id 100000000 would need a 12.5 MB bitmap) are kept as a set instead, and encoded
+# as a sorted, delta encoded id list behind SPARSE_PREFIX
+BITMAP_MIN_BYTES = 1024
+BITMAP_BYTES_PER_ID = 4
+SPARSE_PREFIX = "ids:"  # Not in the base64 alphabet, so never the start of an encoded bitmap
+
+
+class PlayedQuestions:
+    """Set of played question ids, backed by a bitmap indexed by question id.
+
+    Membership checks are constant time. While the ids are dense, the set
+    serializes to a compressed bitmap, so its size does not grow with the
+    number of questions played. When the ids are too sparse for that, the
+    set switches to a plain set of ids, serialized as a compressed list of
+    the differences between the sorted ids.
+    """
+
+    __slots__ = ("_bitmap", "_ids", "_count", "_encoded")
+
+    def __init__(self) -> None:
+        """Initialize an empty set."""
+        self._bitmap = bytearray()
+        self._ids: set[int] | None = None  # Used instead of the bitmap for sparse ids
+        self._count = 0
+        self._encoded: str | None = ""
+
+    def __len__(self) -> int:
+        """Return the number of played questions."""
+        return self._count
+
+    def __contains__(self, question_id: Any) -> bool:
+        """Return True if the question has been played."""
+        try:
+            index = int(question_id)
+        except (TypeError, ValueError):
+            return False
+        if self._ids is not None:
+            return index in self._ids
+        byte = index >> 3
+        return 0 <= byte < len(self._bitmap) and bool(self._bitmap[byte] & (1 << (index & 7)))
+
+    def __iter__(self):
+        """Iterate over the played question ids in ascending order."""
+        if self._ids is not None:
+            yield from sorted(self._ids)
+            return
+        for byte_index, value in enumerate(self._bitmap):
+            if value:
+                for bit in range(8):
+                    if value & (1 << bit):
+                        yield (byte_index << 3) | bit
+
+    @property
+    def sparse(self) -> bool:
+        """Return True if the ids are kept as a set rather than a bitmap."""
+        return self._ids is not None
+
+    def add(self, question_id: Any) -> bool:
+        """Mark a question as played. Returns False if it already was."""
+        index = int(question_id)
+        if index < 0:
+            raise ValueError(f"Invalid question id: {question_id}")
+        if index in self:
+            return False
+        if self._ids is None:
+            byte = index >> 3
+            if byte >= len(self._bitmap):
+                if byte + 1 > BITMAP_MIN_BYTES + BITMAP_BYTES_PER_ID * (self._count + 1):
+                    # Growing the bitmap this far would cost more than keeping the ids
+                    self._ids = set(self)
+                    self._bitmap = bytearray()
+                else:
+                    self._bitmap.extend(bytes(byte + 1 - len(self._bitmap)))
+        if self._ids is not None:
+            self._ids.add(index)
+        else:
+            self._bitmap[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+        self._encoded = None
+        return True
+
+    def clear(self) -> None:
+        """Forget all played questions."""
+        self._bitmap = bytearray()
+        self._ids = None
+        self._count = 0
+        self._encoded = ""
+
+    def encode(self) -> str:
+        """Return the set as a base64 encoded, zlib compressed bitmap or sparse id list."""
+        if self._encoded is None:
+            if self._ids is not None:
+                previous = 0
+                deltas = []
+                for index in sorted(self._ids):
+                    deltas.append(str(index - previous))
+                    previous = index
+                data = ",".join(deltas).encode("ascii")
+                self._encoded = SPARSE_PREFIX + base64.b64encode(zlib.compress(data)).decode("ascii")
+            else:
+                self._encoded = base64.b64encode(zlib.compress(bytes(self._bitmap))).decode("ascii")
+        return self._encoded
+
+    @classmethod
+    def decode(cls, data: str) -> PlayedQuestions:
+        """Rebuild the set from the output of encode()."""
+        played = cls()
+        if data.startswith(SPARSE_PREFIX):
+            ids = set()
+            index = 0
+            for delta in zlib.decompress(base64.b64decode(data[len(SPARSE_PREFIX):])).split(b","):
+                index += int(delta)
+                ids.add(index)
+            played._ids = ids
+            played._count = len(ids)
+            played._encoded = data
+        elif data:
+            played._bitmap = bytearray(zlib.decompress(base64.b64decode(data)))
+            played._count = sum(bin(value).count("1") for value in played._bitmap)
+            played._encoded = data
+        return played
@@ -0,0 +1,193 @@
+"""SQLite question store for the Home Trivia integration.
+
+An optional backend for very large question banks. Questions live on disk
+and a random unplayed question of a difficulty level is picked with one
+indexed query instead of holding the whole bank in memory.
+
+All methods block and must be run in the executor.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from .question_bank import valid_question_id
+
+_LOGGER = logging.getLogger(__name__)
+
+# Columns of the questions.json schema, in table order
+QUESTION_COLUMNS = (
+    "id",
+    "category",
+    "question",
+    "answer_a",
+    "answer_b",
+    "answer_c",
+    "correct_answer",
+    "fun_fact",
+    "difficulty_level",
+)
+
+# Every question gets a random sort key; drawing seeks to a random key
+RANDOM_KEY_BITS = 31
+
+IMPORT_BATCH_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    category TEXT,
+    question TEXT NOT NULL,
+    answer_a TEXT,
+    answer_b TEXT,
+    answer_c TEXT,
+    correct_answer TEXT,
+    fun_fact TEXT,
+    difficulty_level TEXT NOT NULL,
+    random_key INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_questions_difficulty_category
+    ON questions (difficulty_level, category);
+CREATE INDEX IF NOT EXISTS idx_questions_difficulty_random
+    ON questions (difficulty_level, random_key);
+CREATE TABLE IF NOT EXISTS played_questions (
+    game_id TEXT NOT NULL,
+    question_id INTEGER NOT NULL,
+    PRIMARY KEY (game_id, question_id)
+) WITHOUT ROWID;
+"""
+
+# Nearest unplayed question at or after (>=) / before (<) a random key
+_DRAW_QUERY = """
+SELECT {columns} FROM questions AS q
+WHERE q.difficulty_level = ? AND q.random_key {op} ?
+  AND NOT EXISTS (
+    SELECT 1 FROM played_questions AS p
+    WHERE p.game_id = ? AND p.question_id = q.id
+  )
+ORDER BY q.random_key {order}
+LIMIT 1
+"""
+_DRAW_AFTER = _DRAW_QUERY.format(columns=", ".join(QUESTION_COLUMNS), op=">=", order="ASC")
+_DRAW_BEFORE = _DRAW_QUERY.format(columns=", ".join(QUESTION_COLUMNS), op="<", order="DESC")
+
+
+class QuestionStore:
+    """Question bank backed by a SQLite database."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the store."""
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()  # Executor jobs may run on any worker thread
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def question_count(self) -> int:
+        """Return the number of questions in the store."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def import_questions(self, questions: Iterable[dict], replace: bool = True) -> int:
+        """Import questions in the questions.json schema. Returns the number imported.
+
+        With replace, the existing questions (but not the played history) are
+        dropped first. Questions are written in batches inside one transaction.
+        """
+        start = time.perf_counter()
+        imported = 0
+        invalid = 0
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                if replace:
+                    connection.execute("DELETE FROM questions")
+                insert = (
+                    f"INSERT OR REPLACE INTO questions ({', '.join(QUESTION_COLUMNS)}, random_key) "
+                    f"VALUES ({', '.join('?' * (len(QUESTION_COLUMNS) + 1))})"
+                )
+                batch = []
+                for question in questions:
+                    if valid_question_id(question) is None:
+                        # Would be rejected by the integer primary key and roll back the import
+                        invalid += 1
+                        continue
+                    batch.append(
+                        tuple(question.get(column) for column in QUESTION_COLUMNS)
+                        + (random.getrandbits(RANDOM_KEY_BITS),)
+                    )
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        connection.executemany(insert, batch)
+                        imported += len(batch)
+                        batch.clear()
+                if batch:
+                    connection.executemany(insert, batch)
+                    imported += len(batch)
+            connection.execute("ANALYZE")
+
+        if invalid:
+            _LOGGER.warning("Skipped %d questions without a non-negative integer id", invalid)
+
+        _LOGGER.info(
+            "Imported %d questions into %s in %.1f ms",
+            imported, self.path, (time.perf_counter() - start) * 1000,
+        )
+        return imported
+
+    def draw(self, difficulty_level: str, game_id: str) -> dict[str, Any] | None:
+        """Pick a random unplayed question of a difficulty level and mark it played.
+
+        Seeks to a random key on the (difficulty_level, random_key) index and
+        takes the nearest unplayed question, wrapping around once.
+        """
+        pivot = random.getrandbits(RANDOM_KEY_BITS)
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(_DRAW_AFTER, (difficulty_level, pivot, game_id)).fetchone()
+            if row is None:
+                row = connection.execute(_DRAW_BEFORE, (difficulty_level, pivot, game_id)).fetchone()
+            if row is None:
+                return None
+            with connection:
+                connection.execute(
+                    "INSERT OR IGNORE INTO played_questions (game_id, question_id) VALUES (?, ?)",
+                    (game_id, row[0]),
+                )
+        return dict(zip(QUESTION_COLUMNS, row))
+
+    def release(self, game_id: str, question_id: Any) -> None:
+        """Mark a drawn question unplayed again, e.g. when it was drawn ahead but never asked."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "DELETE FROM played_questions WHERE game_id = ? AND question_id = ?",
+                    (game_id, question_id),
+                )
+
+    def reset_played(self, game_id: str) -> None:
+        """Forget the played questions of a game."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM played_questions WHERE game_id = ?", (game_id,))
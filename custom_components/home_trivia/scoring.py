@@ -0,0 +1,175 @@
+"""Scoring engine of Home Trivia.
+
+Scores one round for all teams at once, from compact per-team arrays, with
+the rules of the game's options. The engine does not touch entities or Home
+Assistant: the GameManager collects the answers of the participating teams,
+calls score_round() and applies the results to the team sensors. The same
+engine re-scores rounds read back from the event journal, so different
+rules can be compared on games that were actually played (see
+journal.rescore()).
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .const import (
+    CONF_BASE_POINTS,
+    CONF_SPEED_BONUS_PER_SECOND,
+    CONF_STREAK_BONUS,
+    CONF_STREAK_LENGTH,
+    DEFAULT_BASE_POINTS,
+    DEFAULT_SPEED_BONUS_PER_SECOND,
+    DEFAULT_STREAK_BONUS,
+    DEFAULT_STREAK_LENGTH,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringRules:
+    """Points awarded for a correct answer."""
+
+    base_points: int = DEFAULT_BASE_POINTS
+    # Points per whole second left on the countdown; 0 turns the speed bonus off
+    speed_bonus_per_second: int = DEFAULT_SPEED_BONUS_PER_SECOND
+    # Bonus for every streak_length correct answers in a row; 0 turns streak bonuses off
+    streak_length: int = DEFAULT_STREAK_LENGTH
+    streak_bonus: int = DEFAULT_STREAK_BONUS
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> ScoringRules:
+        """Return the rules set in the options of a game."""
+        return cls(
+            base_points=int(options.get(CONF_BASE_POINTS, DEFAULT_BASE_POINTS)),
+            speed_bonus_per_second=int(options.get(CONF_SPEED_BONUS_PER_SECOND, DEFAULT_SPEED_BONUS_PER_SECOND)),
+            streak_length=int(options.get(CONF_STREAK_LENGTH, DEFAULT_STREAK_LENGTH)),
+            streak_bonus=int(options.get(CONF_STREAK_BONUS, DEFAULT_STREAK_BONUS)),
+        )
+
+
+DEFAULT_SCORING_RULES = ScoringRules()
+
+
+class RoundAnswers:
+    """The answers of one round, one entry per participating team in every array."""
+
+    __slots__ = ("team_keys", "correct_answer", "category", "answers", "time_remaining", "ranks")
+
+    def __init__(
+        self,
+        team_keys: Sequence[str],
+        correct_answer: str,
+        answers: Sequence[str | None],
+        time_remaining: Sequence[int],
+        ranks: Sequence[int] | None = None,
+        category: str | None = None,
+    ) -> None:
+        """Initialize the round.
+
+        answers are upper case, None for a team that did not answer.
+        time_remaining holds the whole seconds left when each team answered.
+        ranks, the order in which the teams first answered (0 for no answer),
+        is only given in buzzer mode.
+        """
+        self.team_keys = team_keys
+        self.correct_answer = correct_answer
+        self.category = category
+        self.answers = answers
+        self.time_remaining = time_remaining
+        self.ranks = ranks
+
+
+class RoundScores:
+    """Result of a round: per team, in the order of the round's arrays."""
+
+    __slots__ = ("points", "correct", "streaks", "streak_bonuses")
+
+    def __init__(self, points: list[int], correct: list[bool], streaks: list[int], streak_bonuses: list[int]) -> None:
+        """Initialize the result."""
+        self.points = points  # Points earned this round
+        self.correct = correct  # Also the category delta: one more answer, correct or not
+        self.streaks = streaks  # Correct answers in a row after this round
+        self.streak_bonuses = streak_bonuses  # Part of points that is streak bonus
+
+
+def buzzer_speed_bonuses(
+    speed_bonus: int, correct: Sequence[bool], time_remaining: Sequence[int], ranks: Sequence[int]
+) -> list[int]:
+    """Return the speed bonus of every team in buzzer mode.
+
+    Every correct team gets the speed bonus for its whole seconds left, as in
+    classic mode, plus one point for every correct team that answered after
+    it. So each correct team earns more than every team that buzzed in after
+    it, however many teams answered within the same second.
+    """
+    bonuses = [speed_bonus * seconds for seconds in time_remaining]
+    if not speed_bonus:
+        return bonuses
+    ranked = sorted((ranks[index], index) for index in range(len(correct)) if correct[index] and ranks[index])
+    for position, (_rank, index) in enumerate(ranked):
+        bonuses[index] += len(ranked) - 1 - position
+    return bonuses
+
+
+def score_round(rules: ScoringRules, round_answers: RoundAnswers, streaks: Sequence[int]) -> RoundScores:
+    """Score a round for all teams in one pass.
+
+    streaks holds each team's correct answers in a row before this round.
+    """
+    correct_answer = round_answers.correct_answer.upper()
+    correct = [answer == correct_answer for answer in round_answers.answers]
+    speed_bonus = rules.speed_bonus_per_second
+    if round_answers.ranks is not None:
+        bonuses = buzzer_speed_bonuses(speed_bonus, correct, round_answers.time_remaining, round_answers.ranks)
+    else:
+        bonuses = [speed_bonus * seconds for seconds in round_answers.time_remaining]
+
+    base_points = rules.base_points
+    streak_length = rules.streak_length
+    streak_bonus = rules.streak_bonus
+    points = [0] * len(correct)
+    new_streaks = [0] * len(correct)
+    streak_bonuses = [0] * len(correct)
+    for index, is_correct in enumerate(correct):
+        if not is_correct:
+            continue
+        streak = new_streaks[index] = streaks[index] + 1
+        earned = base_points + bonuses[index]
+        if streak_length and streak % streak_length == 0:
+            streak_bonuses[index] = streak_bonus
+            earned += streak_bonus
+        points[index] = earned
+    return RoundScores(points, correct, new_streaks, streak_bonuses)
+
+
+def score_rounds(rules: ScoringRules, rounds: Iterable[RoundAnswers | None]) -> dict[str, Any]:
+    """Score a sequence of rounds, carrying the streaks from round to round.
+
+    A None in rounds marks the start of a new game, which resets the
+    streaks. Returns the number of rounds and the total points, correct
+    answers and longest streak per team.
+    """
+    totals: dict[str, list[int]] = {}  # Team key: [points, correct, streak, longest streak]
+    round_count = 0
+    for round_answers in rounds:
+        if round_answers is None:
+            for total in totals.values():
+                total[2] = 0
+            continue
+        round_count += 1
+        team_totals = [totals.setdefault(team_key, [0, 0, 0, 0]) for team_key in round_answers.team_keys]
+        scores = score_round(rules, round_answers, [total[2] for total in team_totals])
+        for total, points, is_correct, streak in zip(team_totals, scores.points, scores.correct, scores.streaks):
+            total[0] += points
+            total[1] += is_correct
+            total[2] = streak
+            if streak > total[3]:
+                total[3] = streak
+    return {
+        "rounds": round_count,
+        "teams": {
+            team_key: {"points": total[0], "correct": total[1], "longest_streak": total[3]}
+            for team_key, total in totals.items()
+        },
+    }
@@ -3,24 +3,162 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, RestoreEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DEFAULT_GAME_NAME, DOMAIN, GAME_MODE_CLASSIC, GAME_MODES, LEGACY_TEAM_COUNT, MAX_TEAM_COUNT
+from .game_store import GameStateStore
+from .metrics import GameMetrics
+from .question_bank import PlayedQuestions
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class HomeTriviaBaseSensor(SensorEntity, RestoreEntity):
-    """Base class for Home Trivia sensors that handles state restoration."""
+class _PendingWrites:
+    """The state writes deferred by the game operation of one task."""
+
+    __slots__ = ("depth", "entities")
+
+    def __init__(self) -> None:
+        """Initialize the pending writes."""
+        self.depth = 0
+        self.entities: dict[HomeTriviaSensor, None] = {}  # Insertion-ordered set
+
+
+class StateWriteBatch:
+    """Coalesce the state writes of Home Trivia sensors during a game operation.
+
+    Used as a context manager around a GameManager operation. While active,
+    the operation's sensor writes are deferred and each changed entity is
+    written exactly once when its outermost context exits. Writes are
+    deferred per task, so an operation that awaits (scoring, drawing a
+    question) never holds back the writes of other work meanwhile, like an
+    answer arriving over the websocket or the countdown expiring.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the batch."""
+        self._pending: dict[asyncio.Task | None, _PendingWrites] = {}  # By task, None for loop callbacks
+        self.writes = 0  # State writes performed on flush
+        self.writes_avoided = 0  # Deferred writes that were coalesced away
+
+    @property
+    def active(self) -> bool:
+        """Return True while the writes of the current task are being deferred."""
+        return asyncio.current_task() in self._pending
+
+    def __enter__(self) -> StateWriteBatch:
+        """Start deferring the writes of the current task."""
+        task = asyncio.current_task()
+        pending = self._pending.get(task)
+        if pending is None:
+            pending = self._pending[task] = _PendingWrites()
+        pending.depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Flush the deferred writes of the current task when its outermost batch ends."""
+        task = asyncio.current_task()
+        pending = self._pending[task]
+        pending.depth -= 1
+        if pending.depth == 0:
+            del self._pending[task]
+            self._flush(pending.entities)
+
+    def discard(self, entity: HomeTriviaSensor) -> None:
+        """Drop a pending write, e.g. of an entity that is being removed."""
+        for pending in self._pending.values():
+            pending.entities.pop(entity, None)
+
+    def defer(self, entity: HomeTriviaSensor) -> None:
+        """Queue an entity for writing at the end of the current task's batch."""
+        entities = self._pending[asyncio.current_task()].entities
+        if entity in entities:
+            self.writes_avoided += 1
+        else:
+            entities[entity] = None
+
+    def _flush(self, entities: dict[HomeTriviaSensor, None]) -> None:
+        """Write every entity changed during a batch."""
+        for entity in entities:
+            entity.async_write_ha_state_now()
+        self.writes += len(entities)
+        if entities:
+            _LOGGER.debug("Flushed %d state writes (%d avoided so far)", len(entities), self.writes_avoided)
+
+
+class HomeTriviaSensor(SensorEntity):
+    """Base class for all Home Trivia sensors, with batched state writes.
+
+    Every state write also schedules a (debounced) save of the game store,
+    and the sensor's snapshot from the game store is applied when it is added.
+    """
+
+    _write_batch: StateWriteBatch | None = None
+    _game_store: GameStateStore | None = None
+    _snapshot: dict[str, Any] | None = None  # Saved game data, applied when added
+    state_writes = 0  # State writes since setup, shown in the diagnostics
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the sensor from the saved game."""
+        await super().async_added_to_hass()
+        if self._snapshot is not None:
+            try:
+                self.restore_snapshot(self._snapshot)
+            except (KeyError, ValueError, TypeError, zlib.error) as e:
+                _LOGGER.warning("Could not restore %s from saved game: %s", self.name, e)
+            self._snapshot = None
+
+    def snapshot(self) -> dict[str, Any] | None:
+        """Return the data to save in the game store, or None if not saved."""
+        return None
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from data returned by snapshot()."""
+
+    def async_write_ha_state(self) -> None:
+        """Write the state, or defer it while a write batch is active."""
+        if self._write_batch is not None and self._write_batch.active:
+            self._write_batch.defer(self)
+        else:
+            self.async_write_ha_state_now()
+
+    def async_write_ha_state_now(self) -> None:
+        """Write the state immediately, bypassing any write batch."""
+        if self.hass is None:
+            # Not added yet (e.g. a team just created); its state is written when added
+            return
+        super().async_write_ha_state()
+        self.state_writes += 1
+        if self._game_store is not None:
+            self._game_store.async_schedule_save()
+
+
+class HomeTriviaBaseSensor(HomeTriviaSensor, RestoreEntity):
+    """Base class for Home Trivia sensors that handles state restoration.
+
+    Sensors are restored from the game store. The last known state is only
+    used when there is no saved game yet, e.g. right after upgrading.
+    """
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which provides state restoration."""
+        from_game_store = self._snapshot is not None
         await super().async_added_to_hass()
+        if from_game_store:
+            return
         if (last_state := await self.async_get_last_state()) is not None:
             await self._restore_state(last_state)
             _LOGGER.debug(f"Restored state for {self.name}: {getattr(self, '_state', 'N/A')}")
@@ -36,30 +174,26 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Home Trivia sensor based on a config entry."""
-    _LOGGER.info("Setting up Home Trivia sensors")
+    """Set up the sensors of one Home Trivia game based on a config entry."""
+    game = hass.data[DOMAIN][config_entry.entry_id]
+    # Entity ids of every game but the default one are prefixed with its name
+    game_ids = {"game_prefix": game["entity_prefix"], "game_name": game["name"]}
+    _LOGGER.info("Setting up Home Trivia sensors for %s", game["name"])
     
     # Create all sensor entities
     entities = []
     
     # Main game status sensor
-    main_sensor = HomeTriviaGameStatusSensor(config_entry)
+    main_sensor = HomeTriviaGameStatusSensor(config_entry, **game_ids)
     entities.append(main_sensor)
     
-    # Individual team sensors
-    team_sensors = {}
-    for i in range(1, 6):
-        team_sensor = HomeTriviaTeamSensor(i)
-        team_sensors[f"home_trivia_team_{i}"] = team_sensor
-        entities.append(team_sensor)
-    
     # Individual game settings sensors
-    countdown_sensor = HomeTriviaCountdownTimerSensor()
-    countdown_current_sensor = HomeTriviaCountdownCurrentSensor()
-    current_question_sensor = HomeTriviaCurrentQuestionSensor()
-    round_counter_sensor = HomeTriviaRoundCounterSensor()
-    played_questions_sensor = HomeTriviaPlayedQuestionsSensor()
-    highscore_sensor = HomeTriviaHighscoreSensor()
+    countdown_sensor = HomeTriviaCountdownTimerSensor(**game_ids)
+    countdown_current_sensor = HomeTriviaCountdownCurrentSensor(**game_ids)
+    current_question_sensor = HomeTriviaCurrentQuestionSensor(**game_ids)
+    round_counter_sensor = HomeTriviaRoundCounterSensor(**game_ids)
+    played_questions_sensor = HomeTriviaPlayedQuestionsSensor(**game_ids)
+    highscore_sensor = HomeTriviaHighscoreSensor(**game_ids)
     
     entities.extend([
         countdown_sensor, 
@@ -70,29 +204,160 @@ async def async_setup_entry(
         highscore_sensor
     ])
     
-    # Store entity references in hass data for service access
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]["entities"] = {
-        "main_sensor": main_sensor,
-        "team_sensors": team_sensors,
-        "countdown_sensor": countdown_sensor,
-        "countdown_current_sensor": countdown_current_sensor,
-        "current_question_sensor": current_question_sensor,
-        "round_counter_sensor": round_counter_sensor,
-        "played_questions_sensor": played_questions_sensor,
-        "highscore_sensor": highscore_sensor,
-    }
+    # Share one write batch so GameManager operations write each entity once,
+    # and restore every entity from the game loaded in async_setup_entry
+    write_batch = StateWriteBatch()
+    game_store = game["game_store"]
+    for entity in entities:
+        entity._write_batch = write_batch
+        entity._game_store = game_store
+        entity._snapshot = game_store.restored.get(entity.unique_id)
+    game_store.entities = list(entities)
+    countdown_current_sensor._metrics = game.get("metrics")
+    
+    # Team sensors for the saved team count; the count is synced again once
+    # the game status sensor is restored (see _sync_persistent_settings)
+    teams = TeamSensors(async_add_entities, game_ids, write_batch, game_store)
+    saved_game_status = game_store.restored.get(main_sensor.unique_id, {})
+    for team_number in range(1, int(saved_game_status.get("team_count", LEGACY_TEAM_COUNT)) + 1):
+        entities.append(teams.create(team_number, restore=True))
+    
+    # Direct references to the entities, for the GameManager, services and scoring
+    game["context"] = GameContext(
+        main_sensor=main_sensor,
+        teams=teams,
+        countdown_sensor=countdown_sensor,
+        countdown_current_sensor=countdown_current_sensor,
+        current_question_sensor=current_question_sensor,
+        round_counter_sensor=round_counter_sensor,
+        played_questions_sensor=played_questions_sensor,
+        highscore_sensor=highscore_sensor,
+        write_batch=write_batch,
+    )
     
     async_add_entities(entities, True)
 
 
+class TeamSensors:
+    """The team sensors of one game, created and removed as the team count changes.
+
+    Teams are numbered 1..team_count and keyed by their number in every
+    game, so scoring and resets iterate over exactly the active teams.
+    """
+
+    def __init__(
+        self,
+        async_add_entities: AddEntitiesCallback,
+        game_ids: dict[str, str],
+        write_batch: StateWriteBatch,
+        game_store: GameStateStore,
+    ) -> None:
+        """Initialize the team collection."""
+        self._async_add_entities = async_add_entities
+        self._game_ids = game_ids
+        self._write_batch = write_batch
+        self._game_store = game_store
+        self.sensors: dict[int, HomeTriviaTeamSensor] = {}
+
+    def __len__(self) -> int:
+        """Return the number of teams."""
+        return len(self.sensors)
+
+    def create(self, team_number: int, restore: bool = False) -> HomeTriviaTeamSensor:
+        """Create the sensor of a team; the caller adds it to Home Assistant.
+
+        Only teams created at setup are restored; a team added later always
+        starts fresh, even if a team with its number existed before.
+        """
+        sensor = HomeTriviaTeamSensor(team_number, **self._game_ids)
+        sensor._write_batch = self._write_batch
+        sensor._game_store = self._game_store
+        sensor._snapshot = self._game_store.restored.get(sensor.unique_id) if restore else {}
+        self._game_store.entities.append(sensor)
+        self.sensors[team_number] = sensor
+        return sensor
+
+    async def async_set_count(self, hass: HomeAssistant, team_count: int) -> None:
+        """Create or remove team sensors so that there are team_count teams."""
+        current_count = len(self.sensors)
+        if team_count > current_count:
+            self._async_add_entities(
+                [self.create(team_number) for team_number in range(current_count + 1, team_count + 1)],
+                True,
+            )
+        
+        registry = er.async_get(hass)
+        for team_number in range(current_count, team_count, -1):
+            sensor = self.sensors.pop(team_number)
+            self._game_store.entities.remove(sensor)
+            self._write_batch.discard(sensor)
+            if sensor.hass is not None:
+                await sensor.async_remove(force_remove=True)
+            # Remove it from the entity registry too, so no unavailable team is left behind
+            if sensor.registry_entry is not None:
+                registry.async_remove(sensor.entity_id)
+        
+        if team_count != current_count:
+            _LOGGER.info("Team count changed from %d to %d", current_count, team_count)
+            self._game_store.async_schedule_save()
+
+
+@dataclass(slots=True, eq=False)
+class GameContext:
+    """The entities of one game, built once when its sensors are set up.
+
+    The GameManager, the services and the scoring reach every entity through
+    these attributes instead of looking them up by key on every call. The
+    entities exist for as long as the game is loaded; only the team sensors
+    change, with the team count.
+    """
+
+    main_sensor: HomeTriviaGameStatusSensor
+    teams: TeamSensors
+    countdown_sensor: HomeTriviaCountdownTimerSensor
+    countdown_current_sensor: HomeTriviaCountdownCurrentSensor
+    current_question_sensor: HomeTriviaCurrentQuestionSensor
+    round_counter_sensor: HomeTriviaRoundCounterSensor
+    played_questions_sensor: HomeTriviaPlayedQuestionsSensor
+    highscore_sensor: HomeTriviaHighscoreSensor
+    write_batch: StateWriteBatch
+
+    @property
+    def team_sensors(self) -> dict[int, HomeTriviaTeamSensor]:
+        """Return the sensors of the active teams, keyed by team number."""
+        return self.teams.sensors
+
+    def team(self, team_number: int) -> HomeTriviaTeamSensor | None:
+        """Return the sensor of a team by its number, or None if there is no such team."""
+        return self.teams.sensors.get(team_number)
+
+    @property
+    def sensors(self) -> list[HomeTriviaSensor]:
+        """Return every sensor of the game."""
+        return [
+            self.main_sensor,
+            self.countdown_sensor,
+            self.countdown_current_sensor,
+            self.current_question_sensor,
+            self.round_counter_sensor,
+            self.played_questions_sensor,
+            self.highscore_sensor,
+            *self.teams.sensors.values(),
+        ]
+
+
 class HomeTriviaGameStatusSensor(HomeTriviaBaseSensor):
     """Representation of a Home Trivia main game status sensor."""
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
+    # Summary and per-user stats are only needed live by the card, not in history
+    _unrecorded_attributes = frozenset({"description", "game_summary", "user_stats", "mvp"})
+
+    def __init__(
+        self, config_entry: ConfigEntry, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME
+    ) -> None:
         """Initialize the sensor."""
-        self._attr_name = "Home Trivia Game Status"
-        self._attr_unique_id = "home_trivia_game_status"
+        self._attr_name = f"{game_name} Game Status"
+        self._attr_unique_id = f"{game_prefix}_game_status"
         self._attr_icon = "mdi:help-circle"
         self._state = "ready"
         
@@ -100,8 +365,13 @@ class HomeTriviaGameStatusSensor(HomeTriviaBaseSensor):
         self._team_count = 2
         self._difficulty_level = "Easy"
         self._timer_length = 30
+        self._game_mode = GAME_MODE_CLASSIC
         self._game_summary = {}  # Hold final game results
         self._user_stats = {}  # Track stats per user_id for MVP
+        # Kept up to date as answers are scored, so the MVP is known at any time during play
+        self._mvp_user_ids: list[str] = []  # Users with the most correct answers, first to get there first
+        self._mvp_score = 0
+        self._mvp_name: str | None = None  # Name of the leading user, looked up by the GameManager
 
     async def _restore_state(self, last_state) -> None:
         """Restore state from last known state."""
@@ -115,8 +385,11 @@ class HomeTriviaGameStatusSensor(HomeTriviaBaseSensor):
                 self._team_count = int(last_state.attributes.get("team_count", 2))
                 self._difficulty_level = last_state.attributes.get("difficulty_level", "Easy")
                 self._timer_length = int(last_state.attributes.get("timer_length", 30))
+                self._game_mode = last_state.attributes.get("game_mode", GAME_MODE_CLASSIC)
                 self._game_summary = last_state.attributes.get("game_summary", {})
                 self._user_stats = last_state.attributes.get("user_stats", {})
+                mvp = last_state.attributes.get("mvp") or {}
+                self._rebuild_mvp([mvp["user_id"], *mvp.get("tied_user_ids", [])] if mvp.get("user_id") else None)
                 
                 _LOGGER.info("Restored game settings - Team Count: %d, Difficulty: %s, Timer: %d", 
                            self._team_count, self._difficulty_level, self._timer_length)
@@ -124,11 +397,53 @@ class HomeTriviaGameStatusSensor(HomeTriviaBaseSensor):
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Could not restore game status state: %s", e)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {
+            "state": self._state,
+            "team_count": self._team_count,
+            "difficulty_level": self._difficulty_level,
+            "timer_length": self._timer_length,
+            "game_mode": self._game_mode,
+            "game_summary": self._game_summary,
+            "user_stats": self._user_stats,
+            "mvp_user_ids": self._mvp_user_ids,
+        }
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        self._state = data.get("state", "ready")
+        self._team_count = int(data.get("team_count", 2))
+        self._difficulty_level = data.get("difficulty_level", "Easy")
+        self._timer_length = int(data.get("timer_length", 30))
+        self._game_mode = data.get("game_mode", GAME_MODE_CLASSIC)
+        self._game_summary = data.get("game_summary", {})
+        self._user_stats = data.get("user_stats", {})
+        self._rebuild_mvp(data.get("mvp_user_ids"))
+
     @property
     def state(self) -> str:
         """Return the state of the sensor."""
         return self._state
 
+    @property
+    def game_mode(self) -> str:
+        """Return the game mode (classic or buzzer)."""
+        return self._game_mode
+
+    @property
+    def mvp(self) -> dict[str, Any] | None:
+        """Return the current MVP and the users tied with them, or None before any correct answer."""
+        if not self._mvp_user_ids:
+            return None
+        user_id = self._mvp_user_ids[0]
+        return {
+            "user_id": user_id,
+            "name": self._mvp_name or user_id,
+            "score": self._mvp_score,
+            "tied_user_ids": self._mvp_user_ids[1:],
+        }
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
@@ -138,8 +453,12 @@ class HomeTriviaGameStatusSensor(HomeTriviaBaseSensor):
             "team_count": self._team_count,
             "difficulty_level": self._difficulty_level,
             "timer_length": self._timer_length,
+            "game_mode": self._game_mode,
+            "game_modes": GAME_MODES,
+            "max_team_count": MAX_TEAM_COUNT,
             "game_summary": self._game_summary,
             "user_stats": self._user_stats,
+            "mvp": self.mvp,
         }
 
     def set_state(self, new_state: str) -> None:
@@ -162,22 +481,66 @@ class HomeTriviaGameStatusSensor(HomeTriviaBaseSensor):
         self._timer_length = timer_length
         self.async_write_ha_state()
 
+    def set_game_mode(self, game_mode: str) -> None:
+        """Set the game mode (classic or buzzer)."""
+        self._game_mode = game_mode
+        self.async_write_ha_state()
+
     def set_game_summary(self, summary: dict) -> None:
         """Set the game summary."""
         self._game_summary = summary
         self.async_write_ha_state()
 
     def update_user_correct_answer(self, user_id: str) -> None:
-        """Update user stats for MVP calculation."""
+        """Update user stats and the MVP with a correct answer of a user."""
         if user_id not in self._user_stats:
             self._user_stats[user_id] = {"correct_answers": 0}
         self._user_stats[user_id]["correct_answers"] += 1
+        self._update_mvp(user_id, self._user_stats[user_id]["correct_answers"])
         self.async_write_ha_state()
 
+    def _update_mvp(self, user_id: str, score: int) -> None:
+        """Take a user's new number of correct answers into account for the MVP.
+
+        Scores only go up during a game, so a user either takes the lead,
+        ties with the leaders or stays behind them. On a tie, the user who
+        got there first stays MVP, as in journal.replay.
+        """
+        if score > self._mvp_score:
+            if not self._mvp_user_ids or self._mvp_user_ids[0] != user_id:
+                self._mvp_name = None
+            self._mvp_user_ids = [user_id]
+            self._mvp_score = score
+        elif score == self._mvp_score:
+            self._mvp_user_ids.append(user_id)
+
+    def _rebuild_mvp(self, mvp_user_ids: list[str] | None = None) -> None:
+        """Work out the MVP from the user stats, e.g. after a restart.
+
+        The user stats do not tell who got to a tied score first, so the
+        saved order of the tied users is kept when it still matches them.
+        """
+        self._mvp_user_ids = []
+        self._mvp_score = 0
+        self._mvp_name = None
+        for user_id, stats in self._user_stats.items():
+            self._update_mvp(user_id, stats.get("correct_answers", 0))
+        if mvp_user_ids and sorted(mvp_user_ids) == sorted(self._mvp_user_ids):
+            self._mvp_user_ids = list(mvp_user_ids)
+
+    def set_mvp_name(self, user_id: str, name: str) -> None:
+        """Set the name of the MVP, if that user still leads."""
+        if self._mvp_user_ids and self._mvp_user_ids[0] == user_id:
+            self._mvp_name = name
+            self.async_write_ha_state()
+
     def reset_game_stats(self) -> None:
-        """Reset game summary and user stats."""
+        """Reset game summary, user stats and MVP."""
         self._game_summary = {}
         self._user_stats = {}
+        self._mvp_user_ids = []
+        self._mvp_score = 0
+        self._mvp_name = None
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
@@ -185,14 +548,27 @@ class HomeTriviaGameStatusSensor(HomeTriviaBaseSensor):
         _LOGGER.debug("Updating Home Trivia main sensor")
 
 
+def _better_rate(stats: dict[str, int], other: dict[str, int]) -> bool:
+    """Return whether category stats have a better answer rate than other stats."""
+    # Cross-multiplied, so no division and no rounding
+    return stats["correct"] * other["total"] > other["correct"] * stats["total"]
+
+
 class HomeTriviaTeamSensor(HomeTriviaBaseSensor):
     """Representation of a Home Trivia team sensor."""
 
-    def __init__(self, team_number: int) -> None:
+    # Category stats grow every round; keep them out of the recorder database
+    _unrecorded_attributes = frozenset({"category_stats"})
+
+    def __init__(
+        self, team_number: int, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME
+    ) -> None:
         """Initialize the team sensor."""
         self._team_number = team_number
-        self._attr_name = f"Home Trivia Team {team_number}"
-        self._attr_unique_id = f"home_trivia_team_{team_number}"
+        # The key of the team in the journal and the game summary
+        self.team_key = f"home_trivia_team_{team_number}"
+        self._attr_name = f"{game_name} Team {team_number}"
+        self._attr_unique_id = f"{game_prefix}_team_{team_number}"
         self._attr_icon = "mdi:account-group"
         self._team_name = f"Team {team_number}"
         self._points = 0
@@ -200,12 +576,15 @@ class HomeTriviaTeamSensor(HomeTriviaBaseSensor):
         self._answer = None  # A, B, or C
         self._answered = False
         self._answer_time_remaining = 0  # Time remaining when answer was submitted
+        self._answer_time_remaining_ms = 0  # The same, in milliseconds
+        self._answer_rank = 0  # Order in which the team answered this round; 0 if it did not
         self._last_round_answer = None
         self._last_round_correct = False
         self._last_round_points = 0
         self._user_id = None
         self._correct_answer_streak = 0
         self._category_stats = {}  # Track performance per category
+        self._best_category = None  # Category with the best answer rate, kept up to date per round
 
     async def _restore_state(self, last_state) -> None:
         """Restore state from last known state."""
@@ -227,12 +606,50 @@ class HomeTriviaTeamSensor(HomeTriviaBaseSensor):
                 self._user_id = last_state.attributes.get("user_id")
                 self._correct_answer_streak = int(last_state.attributes.get("correct_answer_streak", 0))
                 self._category_stats = last_state.attributes.get("category_stats", {})
+                self._best_category = self._find_best_category()
                 
                 _LOGGER.debug("Restored team %d attributes", self._team_number)
                 
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Could not restore team %d state: %s", self._team_number, e)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {
+            "team_name": self._team_name,
+            "points": self._points,
+            "participating": self._participating,
+            "answer": self._answer,
+            "answered": self._answered,
+            "answer_time_remaining": self._answer_time_remaining,
+            "answer_time_remaining_ms": self._answer_time_remaining_ms,
+            "answer_rank": self._answer_rank,
+            "last_round_answer": self._last_round_answer,
+            "last_round_correct": self._last_round_correct,
+            "last_round_points": self._last_round_points,
+            "user_id": self._user_id,
+            "correct_answer_streak": self._correct_answer_streak,
+            "category_stats": self._category_stats,
+        }
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        self._team_name = data.get("team_name", f"Team {self._team_number}")
+        self._points = int(data.get("points", 0))
+        self._participating = bool(data.get("participating", True))
+        self._answer = data.get("answer")
+        self._answered = bool(data.get("answered", False))
+        self._answer_time_remaining = int(data.get("answer_time_remaining", 0))
+        self._answer_time_remaining_ms = int(data.get("answer_time_remaining_ms", 0))
+        self._answer_rank = int(data.get("answer_rank", 0))
+        self._last_round_answer = data.get("last_round_answer")
+        self._last_round_correct = bool(data.get("last_round_correct", False))
+        self._last_round_points = int(data.get("last_round_points", 0))
+        self._user_id = data.get("user_id")
+        self._correct_answer_streak = int(data.get("correct_answer_streak", 0))
+        self._category_stats = data.get("category_stats", {})
+        self._best_category = self._find_best_category()
+
     @property
     def state(self) -> str:
         """Return the state of the sensor."""
@@ -249,12 +666,15 @@ class HomeTriviaTeamSensor(HomeTriviaBaseSensor):
             "answer": self._answer,
             "answered": self._answered,
             "answer_time_remaining": self._answer_time_remaining,
+            "answer_time_remaining_ms": self._answer_time_remaining_ms,
+            "answer_rank": self._answer_rank,
             "last_round_answer": self._last_round_answer,
             "last_round_correct": self._last_round_correct,
             "last_round_points": self._last_round_points,
             "user_id": self._user_id,
             "correct_answer_streak": self._correct_answer_streak,
             "category_stats": self._category_stats,
+            "best_category": self._best_category,
         }
 
     def update_team_name(self, name: str) -> None:
@@ -283,11 +703,34 @@ class HomeTriviaTeamSensor(HomeTriviaBaseSensor):
         self._answer_time_remaining = time_remaining
         self.async_write_ha_state()
 
+    def record_answer(self, answer: str, time_remaining_ms: int, rank: int) -> None:
+        """Record an answer with the exact time remaining and the order it was received in.
+
+        The rank is kept when a team changes its answer, so it reflects
+        when the team first answered.
+        """
+        self._answer = answer
+        self._answered = True
+        self._answer_time_remaining = math.ceil(time_remaining_ms / 1000)
+        self._answer_time_remaining_ms = time_remaining_ms
+        if not self._answer_rank:
+            self._answer_rank = rank
+        self.async_write_ha_state()
+
     def update_team_answered(self, answered: bool) -> None:
         """Update whether the team has answered."""
         self._answered = answered
         self.async_write_ha_state()
 
+    def clear_answer(self) -> None:
+        """Forget the team's answer, its time and rank, for the next round."""
+        self._answer = None
+        self._answered = False
+        self._answer_time_remaining = 0
+        self._answer_time_remaining_ms = 0
+        self._answer_rank = 0
+        self.async_write_ha_state()
+
     def update_team_user_id(self, user_id: str | None) -> None:
         """Update the team's assigned user ID."""
         self._user_id = user_id
@@ -307,13 +750,39 @@ class HomeTriviaTeamSensor(HomeTriviaBaseSensor):
         self.async_write_ha_state()
 
     def update_category_stats(self, category: str, is_correct: bool) -> None:
-        """Update the stats for a given category."""
+        """Update the stats for a given category, and the best category with them."""
         if category not in self._category_stats:
             self._category_stats[category] = {"correct": 0, "total": 0}
 
+        stats = self._category_stats[category]
         if is_correct:
-            self._category_stats[category]["correct"] += 1
-        self._category_stats[category]["total"] += 1
+            stats["correct"] += 1
+        stats["total"] += 1
+
+        best = self._best_category
+        if best == category:
+            if not is_correct:
+                # The best rate dropped, so another category may be ahead now
+                self._best_category = self._find_best_category()
+        elif best is None or _better_rate(stats, self._category_stats[best]):
+            self._best_category = category
+        elif not _better_rate(self._category_stats[best], stats):
+            # A tie goes to the category played first
+            self._best_category = self._find_best_category()
+        self.async_write_ha_state()
+
+    def _find_best_category(self) -> str | None:
+        """Return the category with the best answer rate; on a tie, the first one played."""
+        best = None
+        for category, stats in self._category_stats.items():
+            if stats["total"] > 0 and (best is None or _better_rate(stats, self._category_stats[best])):
+                best = category
+        return best
+
+    def reset_category_stats(self) -> None:
+        """Forget the category stats, e.g. when a new game starts."""
+        self._category_stats = {}
+        self._best_category = None
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
@@ -331,14 +800,19 @@ class HomeTriviaTeamSensor(HomeTriviaBaseSensor):
         self._correct_answer_streak = 0
         self.async_write_ha_state()
 
+    def set_streak(self, streak: int) -> None:
+        """Set the team's correct answer streak, as counted by the scoring engine."""
+        self._correct_answer_streak = streak
+        self.async_write_ha_state()
+
 
 class HomeTriviaCountdownTimerSensor(HomeTriviaBaseSensor):
     """Sensor for the countdown timer length setting."""
 
-    def __init__(self) -> None:
+    def __init__(self, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME) -> None:
         """Initialize the countdown timer sensor."""
-        self._attr_name = "Home Trivia Countdown Timer"
-        self._attr_unique_id = "home_trivia_countdown_timer"
+        self._attr_name = f"{game_name} Countdown Timer"
+        self._attr_unique_id = f"{game_prefix}_countdown_timer"
         self._attr_icon = "mdi:timer"
         self._timer_length = 30  # Default timer length in seconds
 
@@ -350,6 +824,14 @@ class HomeTriviaCountdownTimerSensor(HomeTriviaBaseSensor):
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Could not restore timer length: %s", e)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {"timer_length": self._timer_length}
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        self._timer_length = int(data.get("timer_length", 30))
+
     @property
     def state(self) -> int:
         """Return the state of the sensor."""
@@ -369,23 +851,77 @@ class HomeTriviaCountdownTimerSensor(HomeTriviaBaseSensor):
         self.async_write_ha_state()
 
 
-class HomeTriviaCountdownCurrentSensor(SensorEntity):
-    """Sensor for the current countdown timer value."""
+class HomeTriviaCountdownCurrentSensor(HomeTriviaBaseSensor):
+    """Sensor for the current countdown timer value.
 
-    def __init__(self) -> None:
+    Instead of writing the remaining time every second, the sensor publishes
+    the countdown deadline once and the card interpolates the remaining time
+    locally. Expiry is handled by a single scheduled callback.
+    """
+
+    def __init__(self, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME) -> None:
         """Initialize the countdown current sensor."""
-        self._attr_name = "Home Trivia Countdown Current"
-        self._attr_unique_id = "home_trivia_countdown_current"
+        self._attr_name = f"{game_name} Countdown Current"
+        self._attr_unique_id = f"{game_prefix}_countdown_current"
         self._attr_icon = "mdi:timer-sand"
-        self._current_time = 0
         self._is_running = False
-        self._countdown_task = None
         self._initial_time = 0  # Store initial time for progress calculation
+        self._deadline = None  # Wall-clock end time (UTC), published for the card
+        self._deadline_monotonic = None  # Monotonic end time, used server-side
+        self._expire_unsub = None
+        self._metrics: GameMetrics | None = None  # Set by the sensor platform
+
+    async def _restore_state(self, last_state) -> None:
+        """Resume a countdown that was running before a restart."""
+        try:
+            if last_state.attributes and last_state.attributes.get("is_running"):
+                self._resume(last_state.attributes.get("deadline"), last_state.attributes.get("initial_time", 0))
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning("Could not restore countdown timer: %s", e)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {
+            "deadline": self._deadline.isoformat() if self._is_running and self._deadline else None,
+            "initial_time": self._initial_time,
+        }
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        if data.get("deadline"):
+            self._resume(data["deadline"], data.get("initial_time", 0))
+
+    def _resume(self, deadline: str | None, initial_time: int) -> None:
+        """Resume the countdown if its deadline has not passed yet."""
+        deadline = dt_util.parse_datetime(deadline or "")
+        if deadline is None:
+            return
+        remaining = (deadline - dt_util.utcnow()).total_seconds()
+        if remaining > 0:
+            self._initial_time = int(initial_time)
+            self._schedule_deadline(remaining)
+            _LOGGER.info("Resumed countdown timer with %.1f seconds remaining", remaining)
+
+    @property
+    def remaining_seconds(self) -> float:
+        """Return the exact time remaining in seconds."""
+        return self.remaining_seconds_at(time.monotonic())
+
+    def remaining_seconds_at(self, monotonic: float) -> float:
+        """Return the time that was remaining at a time.monotonic() timestamp."""
+        if not self._is_running or self._deadline_monotonic is None:
+            return 0.0
+        return max(0.0, self._deadline_monotonic - monotonic)
+
+    @property
+    def remaining_time(self) -> int:
+        """Return the whole seconds remaining, as shown on the countdown."""
+        return math.ceil(self.remaining_seconds)
 
     @property
     def state(self) -> int:
         """Return the state of the sensor."""
-        return self._current_time
+        return self.remaining_time
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -395,98 +931,83 @@ class HomeTriviaCountdownCurrentSensor(SensorEntity):
             "unit_of_measurement": "seconds",
             "is_running": self._is_running,
             "initial_time": self._initial_time,
+            "deadline": self._deadline.isoformat() if self._deadline else None,
         }
 
-    async def _countdown_worker(self) -> None:
-        """Worker coroutine that decrements the timer every second."""
-        try:
-            while self._is_running and self._current_time > 0:
-                await asyncio.sleep(1)
-                if self._is_running and self._current_time > 0:
-                    self._current_time -= 1
-                    self.async_write_ha_state()
-                    _LOGGER.debug("Countdown timer: %d seconds remaining", self._current_time)
-            
-            # Timer reached zero
-            if self._is_running and self._current_time <= 0:
-                self._is_running = False
-                self.async_write_ha_state()
-                _LOGGER.info("Countdown timer reached zero")
-                
-                # Trigger round scoring when timer expires
-                # await self._trigger_round_scoring_on_timeout()  # Commented out to fix speed bonus calculation
-        except asyncio.CancelledError:
-            _LOGGER.debug("Countdown timer task was cancelled")
-        except Exception as e:
-            _LOGGER.error("Error in countdown timer: %s", e)
-            self._is_running = False
-            self.async_write_ha_state()
-
-    async def _trigger_round_scoring_on_timeout(self) -> None:
-        """Trigger round scoring when timer expires."""
-        try:
-            # Get entities from hass data to trigger scoring
-            entities = self.hass.data.get(DOMAIN, {}).get("entities", {})
-            if entities:
-                # Import the scoring function from __init__.py
-                from . import _process_round_scoring
-                await _process_round_scoring(entities)
-                _LOGGER.info("Round scoring processed due to timer expiration")
-            else:
-                _LOGGER.warning("Could not find entities for round scoring on timeout")
-        except Exception as e:
-            _LOGGER.error("Error processing round scoring on timeout: %s", e)
+    def _schedule_deadline(self, seconds: float) -> None:
+        """Set the deadline and schedule the expiry callback."""
+        self._cancel_expiry()
+        # Derive both clocks from one instant so the published deadline matches the monotonic one
+        self._deadline_monotonic = time.monotonic() + seconds
+        self._deadline = dt_util.utcnow() + timedelta(seconds=seconds)
+        self._is_running = True
+        self._expire_unsub = async_call_later(self.hass, seconds, self._async_expire)
+
+    def _cancel_expiry(self) -> None:
+        """Cancel the scheduled expiry callback."""
+        if self._expire_unsub:
+            self._expire_unsub()
+            self._expire_unsub = None
+
+    @callback
+    def _async_expire(self, _now) -> None:
+        """Handle the countdown reaching zero."""
+        self._expire_unsub = None
+        if self._metrics is not None and self._deadline_monotonic is not None:
+            self._metrics.record_countdown_drift(time.monotonic() - self._deadline_monotonic)
+        self._is_running = False
+        self._deadline = None
+        self._deadline_monotonic = None
+        self.async_write_ha_state()
+        _LOGGER.info("Countdown timer reached zero")
 
     def start_countdown(self, initial_time: int) -> None:
         """Start the countdown timer."""
-        # Stop any existing countdown
-        self.stop_countdown()
-        
-        self._current_time = initial_time
         self._initial_time = initial_time  # Store initial time for progress calculation
-        self._is_running = True
-        self.async_write_ha_state()
-        
-        # Start the countdown task using Home Assistant's async framework
         if self.hass:
-            self._countdown_task = self.hass.async_create_task(self._countdown_worker())
+            self._schedule_deadline(initial_time)
             _LOGGER.info("Started countdown timer for %d seconds", initial_time)
+        self.async_write_ha_state()
 
     def stop_countdown(self) -> None:
         """Stop the countdown timer."""
+        self._cancel_expiry()
         self._is_running = False
-        
-        # Cancel the countdown task if it's running
-        if self._countdown_task and not self._countdown_task.done():
-            self._countdown_task.cancel()
-            self._countdown_task = None
-        
-        self._current_time = 0
+        self._deadline = None
+        self._deadline_monotonic = None
         self._initial_time = 0  # Reset initial time as well
         self.async_write_ha_state()
         _LOGGER.debug("Countdown timer stopped")
 
-    def update_current_time(self, time: int) -> None:
-        """Update the current countdown time."""
-        self._current_time = time
-        self.async_write_ha_state()
-
     async def async_will_remove_from_hass(self) -> None:
         """Called when entity will be removed from hass."""
-        # Ensure we clean up the countdown task when the entity is removed
-        self.stop_countdown()
+        # Cancel the scheduled expiry without touching the persisted deadline
+        self._cancel_expiry()
 
 
-class HomeTriviaCurrentQuestionSensor(SensorEntity):
+class HomeTriviaCurrentQuestionSensor(HomeTriviaSensor):
     """Sensor for the currently active question."""
 
-    def __init__(self) -> None:
+    # Question text is only needed live by the card, not in history
+    _unrecorded_attributes = frozenset(
+        {"question", "answer_a", "answer_b", "answer_c", "fun_fact"}
+    )
+
+    def __init__(self, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME) -> None:
         """Initialize the current question sensor."""
-        self._attr_name = "Home Trivia Current Question"
-        self._attr_unique_id = "home_trivia_current_question"
+        self._attr_name = f"{game_name} Current Question"
+        self._attr_unique_id = f"{game_prefix}_current_question"
         self._attr_icon = "mdi:help-circle-outline"
         self._current_question = None
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {"question": self._current_question}
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        self._current_question = data.get("question")
+
     @property
     def state(self) -> str:
         """Return the state of the sensor."""
@@ -529,10 +1050,10 @@ class HomeTriviaCurrentQuestionSensor(SensorEntity):
 class HomeTriviaRoundCounterSensor(HomeTriviaBaseSensor):
     """Sensor for tracking the current round number."""
 
-    def __init__(self) -> None:
+    def __init__(self, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME) -> None:
         """Initialize the round counter sensor."""
-        self._attr_name = "Home Trivia Round Counter"
-        self._attr_unique_id = "home_trivia_round_counter"
+        self._attr_name = f"{game_name} Round Counter"
+        self._attr_unique_id = f"{game_prefix}_round_counter"
         self._attr_icon = "mdi:counter"
         self._round_count = 0
 
@@ -544,6 +1065,14 @@ class HomeTriviaRoundCounterSensor(HomeTriviaBaseSensor):
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Could not restore round count: %s", e)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {"round_count": self._round_count}
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        self._round_count = int(data.get("round_count", 0))
+
     @property
     def state(self) -> int:
         """Return the state of the sensor."""
@@ -570,58 +1099,77 @@ class HomeTriviaRoundCounterSensor(HomeTriviaBaseSensor):
 class HomeTriviaPlayedQuestionsSensor(HomeTriviaBaseSensor):
     """Sensor for tracking played questions."""
 
-    def __init__(self) -> None:
+    # Kept in the state machine for restoring, but not written to the recorder
+    _unrecorded_attributes = frozenset({"played_bitmap"})
+
+    def __init__(self, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME) -> None:
         """Initialize the played questions sensor."""
-        self._attr_name = "Home Trivia Played Questions"
-        self._attr_unique_id = "home_trivia_played_questions"
+        self._attr_name = f"{game_name} Played Questions"
+        self._attr_unique_id = f"{game_prefix}_played_questions"
         self._attr_icon = "mdi:playlist-check"
-        self._played_questions = 0
-        self._played_question_ids = []
+        self._played_question_ids = PlayedQuestions()
 
     async def _restore_state(self, last_state) -> None:
         """Restore state from last known state."""
         try:
-            self._played_questions = int(last_state.state)
-            if last_state.attributes and "played_question_ids" in last_state.attributes:
-                self._played_question_ids = last_state.attributes["played_question_ids"]
-            _LOGGER.debug("Restored played questions: %d", self._played_questions)
-        except (ValueError, TypeError) as e:
+            if last_state.attributes and "played_bitmap" in last_state.attributes:
+                self._played_question_ids = PlayedQuestions.decode(last_state.attributes["played_bitmap"])
+            elif last_state.attributes and "played_question_ids" in last_state.attributes:
+                # Migrate the old list-based attribute
+                for question_id in last_state.attributes["played_question_ids"]:
+                    self._played_question_ids.add(question_id)
+            _LOGGER.debug("Restored played questions: %d", len(self._played_question_ids))
+        except (ValueError, TypeError, zlib.error) as e:
             _LOGGER.warning("Could not restore played questions: %s", e)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {"played_bitmap": self._played_question_ids.encode()}
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        self._played_question_ids = PlayedQuestions.decode(data.get("played_bitmap", ""))
+
     @property
     def state(self) -> int:
         """Return the state of the sensor."""
-        return self._played_questions
+        return len(self._played_question_ids)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
         return {
             "friendly_name": "Played Questions",
-            "played_question_ids": self._played_question_ids,
+            "played_bitmap": self._played_question_ids.encode(),
         }
 
+    @property
+    def played_question_ids(self) -> PlayedQuestions:
+        """Return the set of played question ids."""
+        return self._played_question_ids
+
+    def is_played(self, question_id: int) -> bool:
+        """Return True if the question has already been played."""
+        return question_id in self._played_question_ids
+
     def add_played_question(self, question_id: int) -> None:
         """Add a question to the played list."""
-        if question_id not in self._played_question_ids:
-            self._played_question_ids.append(question_id)
-            self._played_questions = len(self._played_question_ids)
+        if self._played_question_ids.add(question_id):
             self.async_write_ha_state()
 
     def reset_played_questions(self) -> None:
         """Reset the played questions list."""
-        self._played_questions = 0
-        self._played_question_ids = []
+        self._played_question_ids.clear()
         self.async_write_ha_state()
 
 
 class HomeTriviaHighscoreSensor(HomeTriviaBaseSensor):
     """Sensor for tracking high scores."""
 
-    def __init__(self) -> None:
+    def __init__(self, game_prefix: str = DOMAIN, game_name: str = DEFAULT_GAME_NAME) -> None:
         """Initialize the highscore sensor."""
-        self._attr_name = "Home Trivia Highscore"
-        self._attr_unique_id = "home_trivia_highscore"
+        self._attr_name = f"{game_name} Highscore"
+        self._attr_unique_id = f"{game_prefix}_highscore"
         self._attr_icon = "mdi:trophy"
         self._highscore_total = 0
         self._highscore_average = 0.0
@@ -640,6 +1188,22 @@ class HomeTriviaHighscoreSensor(HomeTriviaBaseSensor):
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Could not restore highscore: %s", e)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the game store."""
+        return {
+            "total_points": self._highscore_total,
+            "average_points": self._highscore_average,
+            "team_name": self._highscore_team,
+            "total_rounds": self._total_rounds,
+        }
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Restore the sensor from the game store."""
+        self._highscore_total = int(data.get("total_points", 0))
+        self._highscore_average = float(data.get("average_points", 0.0))
+        self._highscore_team = data.get("team_name", "No Team")
+        self._total_rounds = int(data.get("total_rounds", 0))
+
     @property
     def state(self) -> int:
         """Return the state of the sensor."""
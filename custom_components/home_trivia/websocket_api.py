@@ -0,0 +1,348 @@
+"""Websocket commands for answering and controlling Home Trivia games.
+
+The card sends answers and game controls as `home_trivia/*` websocket
+commands instead of service calls. They act on the game's GameManager
+directly, skipping service registry dispatch, and answer with an
+acknowledgement, so a tablet knows its answer was recorded and with how
+much time left.
+
+home_trivia/subscribe streams the state of a game's entities to the card:
+a snapshot first, with the game's entity prefix, then deltas with only the
+changed states and attributes, so the card no longer has to diff every
+state change in the house.
+
+home_trivia/leaderboard returns the all-time leaderboards, which are shared
+by all games. home_trivia/player_stats returns the long-term statistics of a
+player, or the all-time MVP ranking.
+
+Every game command takes an optional game_id, routed like the services' game_id.
+"""
+from __future__ import annotations
+
+import re
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import json_dumps
+
+from . import TEAM_ID, _parse_team_id, _resolve_game
+from .const import ATTR_GAME_ID, DOMAIN, LEADERBOARD_SIZE, PLAYER_STATS_LIMIT
+
+# Entity id suffixes of a game's sensors, e.g. team_3 in sensor.home_trivia_team_3
+GAME_ENTITY_KEY = re.compile(
+    r"^(game_status|countdown_timer|countdown_current|current_question|round_counter|played_questions|highscore|team_\d+)$"
+)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the home_trivia/* websocket commands."""
+    websocket_api.async_register_command(hass, websocket_submit_answer)
+    websocket_api.async_register_command(hass, websocket_start_game)
+    websocket_api.async_register_command(hass, websocket_stop_game)
+    websocket_api.async_register_command(hass, websocket_reset_game)
+    websocket_api.async_register_command(hass, websocket_next_question)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_leaderboard)
+    websocket_api.async_register_command(hass, websocket_player_stats)
+
+
+@callback
+def _get_game_manager(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]):
+    """Return the GameManager a command is for, or send an error and return None."""
+    game = _resolve_game(hass, msg.get(ATTR_GAME_ID))
+    game_manager = game.get("game_manager") if game else None
+    if game_manager is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No Home Trivia game found for game_id {msg.get(ATTR_GAME_ID)}"
+        )
+    return game_manager
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "home_trivia/submit_answer",
+        vol.Optional(ATTR_GAME_ID): str,
+        vol.Required("team_id"): vol.Match(TEAM_ID),
+        vol.Required("answer"): str,
+    }
+)
+@callback
+def websocket_submit_answer(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Record a team's answer and acknowledge it with the recorded answer time."""
+    # Stamp the answer first, so the lookups below do not count towards its time
+    received = time.monotonic()
+    game_manager = _get_game_manager(hass, connection, msg)
+    if game_manager is None:
+        return
+
+    ack = game_manager.submit_answer(_parse_team_id(msg["team_id"]), msg["answer"], received)
+    if ack is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"Team {msg['team_id']} not found")
+        return
+    connection.send_result(msg["id"], ack)
+
+
+async def _async_handle_game_command(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any], method_name: str
+) -> None:
+    """Run a GameManager method for a command and send the game status back."""
+    game_manager = _get_game_manager(hass, connection, msg)
+    if game_manager is None:
+        return
+
+    await getattr(game_manager, method_name)()
+    connection.send_result(msg["id"], {"state": game_manager.context.main_sensor.state})
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "home_trivia/start_game", vol.Optional(ATTR_GAME_ID): str}
+)
+@websocket_api.async_response
+async def websocket_start_game(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Start a new game."""
+    await _async_handle_game_command(hass, connection, msg, "start_game")
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "home_trivia/stop_game", vol.Optional(ATTR_GAME_ID): str}
+)
+@websocket_api.async_response
+async def websocket_stop_game(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stop the current game."""
+    await _async_handle_game_command(hass, connection, msg, "stop_game")
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "home_trivia/reset_game", vol.Optional(ATTR_GAME_ID): str}
+)
+@websocket_api.async_response
+async def websocket_reset_game(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Reset game progress while preserving setup."""
+    await _async_handle_game_command(hass, connection, msg, "reset_game")
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "home_trivia/next_question", vol.Optional(ATTR_GAME_ID): str}
+)
+@websocket_api.async_response
+async def websocket_next_question(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Score the round and move to the next question."""
+    await _async_handle_game_command(hass, connection, msg, "next_question")
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "home_trivia/leaderboard",
+        vol.Optional("difficulty_level"): str,
+        vol.Optional("team_count"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1, max=LEADERBOARD_SIZE)),
+    }
+)
+@callback
+def websocket_leaderboard(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send the leaderboards of a difficulty level and/or team count, or all of them."""
+    leaderboards = hass.data[DOMAIN]["leaderboards"]
+    connection.send_result(
+        msg["id"],
+        {
+            "leaderboards": leaderboards.async_get(
+                msg.get("difficulty_level"), msg.get("team_count"), msg.get("limit")
+            )
+        },
+    )
+
+
+async def _async_user_name(hass: HomeAssistant, user_id: str) -> str:
+    """Return the name of a Home Assistant user, or the user id if it is unknown."""
+    user = await hass.auth.async_get_user(user_id)
+    return user.name if user and user.name else user_id
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "home_trivia/player_stats",
+        vol.Optional("user_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1, max=PLAYER_STATS_LIMIT)),
+    }
+)
+@websocket_api.async_response
+async def websocket_player_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send the statistics of a player, or the all-time MVP ranking without a user_id."""
+    player_stats = hass.data[DOMAIN]["player_stats"]
+    if "user_id" in msg:
+        player = await player_stats.async_get_player(msg["user_id"])
+        if player is None:
+            connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"No statistics for user {msg['user_id']}")
+            return
+        player["name"] = await _async_user_name(hass, player["user_id"])
+        connection.send_result(msg["id"], {"player": player})
+        return
+
+    players = await player_stats.async_get_mvps(msg.get("limit", PLAYER_STATS_LIMIT))
+    for player in players:
+        player["name"] = await _async_user_name(hass, player["user_id"])
+    connection.send_result(msg["id"], {"players": players})
+
+
+def _state_dict(state: State) -> dict[str, Any]:
+    """Return the parts of a state the card uses."""
+    return {
+        "state": state.state,
+        "attributes": dict(state.attributes),
+        "last_updated": state.last_updated.isoformat(),
+    }
+
+
+class GameStateSubscriptions:
+    """Pushes the state changes of one game's entities to subscribed cards.
+
+    One state_changed listener serves every card of the game, and only while
+    at least one is subscribed. Changes are collected and sent once per event
+    loop iteration, so a GameManager operation that writes many entities
+    reaches every card as one message, encoded once.
+
+    Subscriptions are kept per entity prefix rather than per config entry, so
+    they carry on when the game is reloaded, e.g. after changing its options.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_prefix: str) -> None:
+        """Initialize the subscriptions of a game."""
+        self._hass = hass
+        self._entity_prefix = entity_prefix
+        self._prefix = f"sensor.{entity_prefix}_"
+        self._subscribers: dict[tuple[websocket_api.ActiveConnection, int], None] = {}
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self._changed: dict[str, dict[str, Any]] = {}
+        self._removed: set[str] = set()
+        self._flush_scheduled = False
+
+    def _entity_key(self, entity_id: str) -> str | None:
+        """Return the key of one of the game's entities, e.g. team_3, or None."""
+        if not entity_id.startswith(self._prefix):
+            return None
+        key = entity_id[len(self._prefix):]
+        # The default game's prefix is also the start of the other games' prefixes
+        return key if GAME_ENTITY_KEY.match(key) else None
+
+    @callback
+    def async_add(self, connection: websocket_api.ActiveConnection, msg_id: int) -> CALLBACK_TYPE:
+        """Add a subscriber and send it a snapshot; returns the callback that removes it."""
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        self._subscribers[(connection, msg_id)] = None
+
+        snapshot = {
+            key: _state_dict(state)
+            for state in self._hass.states.async_all("sensor")
+            if (key := self._entity_key(state.entity_id)) is not None
+        }
+        # The card maps the keys to entity ids with the prefix, rather than slugifying the game name itself
+        connection.send_message(
+            websocket_api.event_message(
+                msg_id, {"type": "snapshot", "entity_prefix": self._entity_prefix, "changed": snapshot}
+            )
+        )
+
+        @callback
+        def async_remove() -> None:
+            self._subscribers.pop((connection, msg_id), None)
+            if not self._subscribers and self._unsub_state_changed is not None:
+                self._unsub_state_changed()
+                self._unsub_state_changed = None
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Collect a change of one of the game's entities."""
+        key = self._entity_key(event.data["entity_id"])
+        if key is None:
+            return
+        new_state: State | None = event.data["new_state"]
+        old_state: State | None = event.data["old_state"]
+
+        if new_state is None:
+            self._changed.pop(key, None)
+            self._removed.add(key)
+        elif old_state is None or key in self._removed:
+            self._removed.discard(key)
+            self._changed[key] = _state_dict(new_state)
+        else:
+            change = self._changed.setdefault(key, {"attributes": {}})
+            if new_state.state != old_state.state:
+                change["state"] = new_state.state
+            new_attributes = new_state.attributes
+            old_attributes = old_state.attributes
+            attributes = change["attributes"]
+            for name, value in new_attributes.items():
+                if name not in old_attributes or old_attributes[name] != value:
+                    attributes[name] = value
+            for name in old_attributes:
+                if name not in new_attributes:
+                    attributes[name] = None
+            change["last_updated"] = new_state.last_updated.isoformat()
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._hass.loop.call_soon(self._flush)
+
+    @callback
+    def _flush(self) -> None:
+        """Send the collected changes to every subscriber."""
+        self._flush_scheduled = False
+        delta: dict[str, Any] = {"type": "delta", "changed": self._changed}
+        if self._removed:
+            delta["removed"] = sorted(self._removed)
+        self._changed = {}
+        self._removed = set()
+        if not self._subscribers:
+            return
+
+        # Encode the delta once and only put each subscription's id around it
+        event = json_dumps(delta)
+        for connection, msg_id in self._subscribers:
+            connection.send_message(f'{{"id":{msg_id},"type":"event","event":{event}}}')
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "home_trivia/subscribe", vol.Optional(ATTR_GAME_ID): str}
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the state of a game's entities."""
+    game = _resolve_game(hass, msg.get(ATTR_GAME_ID))
+    if game is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No Home Trivia game found for game_id {msg.get(ATTR_GAME_ID)}"
+        )
+        return
+
+    all_subscriptions = hass.data[DOMAIN].setdefault("state_subscriptions", {})
+    subscriptions = all_subscriptions.get(game["entity_prefix"])
+    if subscriptions is None:
+        subscriptions = all_subscriptions[game["entity_prefix"]] = GameStateSubscriptions(hass, game["entity_prefix"])
+
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = subscriptions.async_add(connection, msg["id"])
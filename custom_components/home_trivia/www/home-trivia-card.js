@@ -3,6 +3,9 @@
  * A custom card for the Home Trivia Home Assistant integration
  */
 
+// Renders kept for getRenderStats()
+const RENDER_STATS_SIZE = 120;
+
 class HomeTriviaCard extends HTMLElement {
   constructor() {
     super();
@@ -23,12 +26,36 @@ class HomeTriviaCard extends HTMLElement {
     // Initialize optimistic local state for form values
     this._pendingFormValues = {
       difficulty: null,
+      gameMode: null,
       timerLength: null,
       teamCount: null,
       teamNames: {},
       teamUserIds: {}
     };
     
+    // Game entity states from the home_trivia/subscribe stream, as { states: { entity_id: state } }.
+    // Until the stream is live (or if the backend does not offer it), states are read from hass.
+    this._gameStates = null;
+    this._gameStateConnection = null;
+    this._gameStateUnsub = null;
+    
+    // Local countdown ticker; the server only publishes the countdown deadline
+    this._countdownTicker = null;
+    this._clockSkew = 0; // Local clock minus server clock, in ms
+    
+    // Nodes changed by the current render, see patchChildren(), and markup parsed by all renders
+    this._patchedNodes = 0;
+    this._parsedBytes = 0;
+    
+    // Static skeleton, built once: the styles of the shown screen, then the
+    // screen itself. Each screen builds its own markup when first shown, see mountScreen().
+    this._screenStyles = document.createElement('style');
+    this._screenRoot = document.createElement('div');
+    this._screenRoot.className = 'card-region';
+    this.shadowRoot.append(this._screenStyles, this._screenRoot);
+    this._screen = null;
+    this._slots = {};
+    
     // Dropdown interaction lock to prevent re-renders during dropdown usage
     this._dropdownInteractionLock = false;
     this._dropdownLockTimer = null;
@@ -134,24 +161,158 @@ class HomeTriviaCard extends HTMLElement {
     if (!config) {
       throw new Error('Invalid configuration');
     }
+    const previousConfig = this.config;
     this.config = config;
     // Check if tablet mode is enabled in config
     this.tabletMode = config.tablet_mode || false;
+    // Optional game (room) to show when several Home Trivia games are set up. Its
+    // entity prefix comes with the first snapshot of its states, see handleGameStateMessage()
+    if (!previousConfig || previousConfig.game !== config.game) {
+      this.entityPrefix = config.game ? null : 'home_trivia';
+      // Another game needs its own subscription
+      if (previousConfig) {
+        this.unsubscribeGameState();
+        this.subscribeGameState();
+      }
+    }
     this.render();
   }
 
+  entityId(key) {
+    return `sensor.${this.entityPrefix}_${key}`;
+  }
+
+  // State of one of this game's entities, e.g. getState('team_1')
+  getState(key) {
+    return (this._gameStates || this._hass)?.states[this.entityId(key)];
+  }
+
+  getTeamCount(hass = this._gameStates || this._hass) {
+    // The game has one team entity per team, team_1 up to team_<team_count>
+    const teamCount = parseInt(hass?.states[this.entityId('game_status')]?.attributes?.team_count, 10);
+    return teamCount > 0 ? teamCount : 5;
+  }
+
+  renderTeamCountOptions(currentTeamCount) {
+    const maxTeamCount = this.getState('game_status')?.attributes?.max_team_count || 5;
+    let options = '';
+    for (let i = 1; i <= maxTeamCount; i++) {
+      options += `<option value="${i}" ${currentTeamCount === i ? 'selected' : ''}>${i} ${this.t('team')}${i === 1 ? '' : 's'}</option>`;
+    }
+    return options;
+  }
+
+  answerStatusLabel(answered, answerRank) {
+    // In buzzer mode, show the order in which the teams buzzed in
+    if (!answered) {
+      return this.t('notAnswered');
+    }
+    const buzzerMode = this.getState('game_status')?.attributes?.game_mode === 'buzzer';
+    return buzzerMode && answerRank ? `${this.t('answered')} #${answerRank}` : this.t('answered');
+  }
+
+  callGameService(service, data = {}) {
+    // Route the call to this card's game
+    const serviceData = this.config?.game ? { ...data, game_id: this.config.game } : data;
+    return this._hass.callService('home_trivia', service, serviceData);
+  }
+
+  callGameCommand(command, data = {}) {
+    // Send a home_trivia/* websocket command to this card's game; resolves with its acknowledgement
+    const message = { type: `home_trivia/${command}`, ...data };
+    if (this.config?.game) {
+      message.game_id = this.config.game;
+    }
+    return this._hass.callWS(message);
+  }
+
 
 
   set hass(hass) {
     const previousHass = this._hass;
     this._hass = hass;
+    this.subscribeGameState();
+    
+    // While subscribed, game changes arrive through handleGameStateMessage,
+    // so the many other state changes in the house need no work here
+    if (this._gameStates) {
+      return;
+    }
+    this.handleGameStateChange(previousHass, hass);
+  }
+
+  // Subscribe to this game's states; the server sends a snapshot, then only what changed
+  subscribeGameState() {
+    const connection = this._hass?.connection;
+    if (!connection || !this.config || !this.isConnected || connection === this._gameStateConnection) return;
+    this._gameStateConnection = connection;
+    
+    const message = { type: 'home_trivia/subscribe' };
+    if (this.config.game) {
+      message.game_id = this.config.game;
+    }
+    // Resubscribes by itself after a reconnect, starting with a fresh snapshot
+    const subscription = connection.subscribeMessage((event) => {
+      // Ignore messages still arriving for a subscription that was replaced
+      if (this._gameStateUnsub === subscription) {
+        this.handleGameStateMessage(event);
+      }
+    }, message).catch((err) => {
+      // Older backend or unknown game: keep following hass instead
+      console.warn('Home Trivia: state subscription failed, following all state changes instead', err);
+      return null;
+    });
+    this._gameStateUnsub = subscription;
+  }
+
+  unsubscribeGameState() {
+    if (this._gameStateUnsub) {
+      this._gameStateUnsub.then((unsub) => unsub && unsub()).catch(() => {});
+    }
+    this._gameStateUnsub = null;
+    this._gameStateConnection = null;
+    this._gameStates = null;
+  }
+
+  // Apply a snapshot or delta from home_trivia/subscribe and update the card
+  handleGameStateMessage(event) {
+    // The backend slugifies the game name into the prefix of its entity ids
+    if (event.entity_prefix) {
+      this.entityPrefix = event.entity_prefix;
+    }
+    const previous = this._gameStates;
+    const states = event.type === 'snapshot' || !previous ? {} : { ...previous.states };
+    
+    for (const [key, change] of Object.entries(event.changed || {})) {
+      const entityId = this.entityId(key);
+      const old = event.type === 'snapshot' ? undefined : states[entityId];
+      states[entityId] = {
+        entity_id: entityId,
+        state: change.state !== undefined ? change.state : old?.state,
+        attributes: { ...old?.attributes, ...change.attributes },
+        last_updated: change.last_updated || old?.last_updated
+      };
+    }
+    for (const key of event.removed || []) {
+      delete states[this.entityId(key)];
+    }
+    
+    this._gameStates = { states };
+    this.handleGameStateChange(previous, this._gameStates);
+  }
+
+  // React to changed game states; previous and current are hass objects or stream snapshots
+  handleGameStateChange(previousHass, hass) {
+    this.updateClockSkew(previousHass, hass);
+    this.recordNextQuestionLatency(hass);
     
     // --- Start of new/modified code for points animation ---
     if (previousHass) {
       // Loop through teams to check for score updates
-      for (let i = 1; i <= 5; i++) {
-        const teamState = hass.states[`sensor.home_trivia_team_${i}`];
-        const prevTeamState = previousHass.states[`sensor.home_trivia_team_${i}`];
+      const teamCount = this.getTeamCount(hass);
+      for (let i = 1; i <= teamCount; i++) {
+        const teamState = hass.states[this.entityId(`team_${i}`)];
+        const prevTeamState = previousHass.states[this.entityId(`team_${i}`)];
 
         if (teamState && prevTeamState) {
           const points = teamState.attributes.last_round_points;
@@ -185,9 +346,9 @@ class HomeTriviaCard extends HTMLElement {
         this.shouldShowSplashScreen() !== this.shouldShowSplashScreen(previousHass)) {
       this.requestUpdate();
     } else if (this.shouldShowSplashScreen()) {
-      // If we're on splash screen, only update if forms aren't actively being edited
-      // and there are no pending form changes
-      if (!this.isFormActivelyBeingEdited() && !this.hasPendingFormChanges()) {
+      // Patching keeps focus and typed values, so the splash screen can update while
+      // it is being edited; only an open dropdown picker is left alone
+      if (!this._dropdownInteractionLock) {
         this.requestUpdate();
       }
     } else {
@@ -202,84 +363,145 @@ class HomeTriviaCard extends HTMLElement {
         this.requestUpdate();
       }
     }
+    
+    this.syncCountdownTicker();
+  }
+
+  connectedCallback() {
+    this.subscribeGameState();
+    this.syncCountdownTicker();
+  }
+
+  disconnectedCallback() {
+    this.unsubscribeGameState();
+    this.stopCountdownTicker();
   }
 
   // Helper to determine if splash should be shown for a specific hass state
   shouldShowSplashScreen(hass = null) {
-    const hassToCheck = hass || this._hass;
+    const hassToCheck = hass || this._gameStates || this._hass;
     if (!hassToCheck) return true;
 
     // Check if we have minimum required data
-    const gameStatus = hassToCheck.states['sensor.home_trivia_game_status'];
-    const team1 = hassToCheck.states['sensor.home_trivia_team_1'];
+    const gameStatus = hassToCheck.states[this.entityId('game_status')];
+    const team1 = hassToCheck.states[this.entityId('team_1')];
     
     if (!gameStatus || !team1) return true;
 
     return false;
   }
 
-  // Check if any form elements are currently focused
-  isFormActivelyBeingEdited() {
-    // Check for dropdown interaction lock first
-    if (this._dropdownInteractionLock) {
-      return true;
+  // Estimate the offset between this device's clock and the server clock.
+  // A state written just now has last_updated ~ server "now", so the difference
+  // to the local clock is the skew (plus network latency).
+  updateClockSkew(previousHass, currentHass) {
+    if (!previousHass || !currentHass) return;
+    
+    const prevCountdown = previousHass.states[this.entityId('countdown_current')];
+    const currentCountdown = currentHass.states[this.entityId('countdown_current')];
+    if (!currentCountdown || !currentCountdown.last_updated) return;
+    if (prevCountdown && prevCountdown.last_updated === currentCountdown.last_updated) return;
+    
+    const serverTime = Date.parse(currentCountdown.last_updated);
+    if (!isNaN(serverTime)) {
+      this._clockSkew = Date.now() - serverTime;
+    }
+  }
+
+  // Seconds left on the countdown, interpolated locally from the server deadline
+  getCountdownTimeLeft(countdown) {
+    if (!countdown) return 0;
+    
+    const deadline = countdown.attributes?.deadline;
+    if (!countdown.attributes?.is_running || !deadline) {
+      return parseInt(countdown.state, 10) || 0;
     }
     
-    const activeElement = this.shadowRoot.activeElement;
-    return activeElement && (
-      activeElement.tagName === 'INPUT' || 
-      activeElement.tagName === 'SELECT' || 
-      activeElement.tagName === 'TEXTAREA'
-    );
+    const remainingMs = Date.parse(deadline) - (Date.now() - this._clockSkew);
+    return Math.max(0, Math.ceil(remainingMs / 1000));
+  }
+
+  // Run a local ticker only while a countdown is running
+  syncCountdownTicker() {
+    const countdown = this.getState('countdown_current');
+    const isRunning = countdown?.attributes?.is_running && countdown.attributes.deadline;
+    
+    if (isRunning && this.isConnected) {
+      if (!this._countdownTicker) {
+        this._countdownTicker = setInterval(() => this.refreshCountdownDisplay(), 250);
+      }
+      this.refreshCountdownDisplay();
+    } else {
+      this.stopCountdownTicker();
+    }
+  }
+
+  stopCountdownTicker() {
+    if (this._countdownTicker) {
+      clearInterval(this._countdownTicker);
+      this._countdownTicker = null;
+    }
   }
 
   // Update countdown display without triggering full re-render
   updateCountdownDisplay(previousHass, currentHass) {
     if (!previousHass || !currentHass) return;
     
-    const prevCountdown = previousHass.states['sensor.home_trivia_countdown_current'];
-    const currentCountdown = currentHass.states['sensor.home_trivia_countdown_current'];
+    const prevCountdown = previousHass.states[this.entityId('countdown_current')];
+    const currentCountdown = currentHass.states[this.entityId('countdown_current')];
     
     // Only update if countdown state exists and has changed
     if (!prevCountdown || !currentCountdown) return;
-    if (prevCountdown.state === currentCountdown.state) return;
-    
-    // Find the countdown timer display element
-    const timerDisplay = this.shadowRoot?.querySelector('#countdown-timer-display');
-    const progressFill = this.shadowRoot?.querySelector('.countdown-progress-fill');
+    if (prevCountdown.state === currentCountdown.state &&
+        prevCountdown.attributes.deadline === currentCountdown.attributes.deadline) return;
     
-    if (!timerDisplay) return; // Element not rendered yet
+    this.refreshCountdownDisplay();
+  }
+
+  // Patch the rendered timer elements with the current (interpolated) time left
+  refreshCountdownDisplay() {
+    const currentCountdown = this.getState('countdown_current');
+    if (!currentCountdown || !this.shadowRoot) return;
     
-    // Update timer display
-    const timeLeft = parseInt(currentCountdown.state);
+    const timeLeft = this.getCountdownTimeLeft(currentCountdown);
     const isRunning = currentCountdown.attributes.is_running;
     const isTimeUp = timeLeft <= 0;
     
     // Get timer length for progress bar calculation
     const initialTime = currentCountdown.attributes.initial_time;
-    const timerSensor = currentHass.states['sensor.home_trivia_countdown_timer'];
+    const timerSensor = this.getState('countdown_timer');
     const timerLength = initialTime || parseInt(timerSensor?.state || '30');
+    const progressPercentage = isRunning && timerLength > 0 ? 
+      Math.max(0, Math.min(100, (timeLeft / timerLength) * 100)) : 0;
+    const isWarning = !isTimeUp && timeLeft <= 5 && isRunning;
     
-    // Update timer text and classes
-    let timerClasses = 'countdown-timer';
-    let timerText = `${timeLeft}s`;
-    
-    if (isTimeUp) {
-      timerClasses += ' time-up';
-      timerText = this.t('timeUp');
-    } else if (timeLeft <= 5 && isRunning) {
-      timerClasses += ' warning';
+    // Main game timer
+    const timerDisplay = this.shadowRoot.querySelector('#countdown-timer-display');
+    if (timerDisplay) {
+      timerDisplay.className = 'countdown-timer' + (isTimeUp ? ' time-up' : isWarning ? ' warning' : '');
+      timerDisplay.textContent = isTimeUp ? this.t('timeUp') : `${timeLeft}s`;
     }
-    
-    timerDisplay.className = timerClasses;
-    timerDisplay.textContent = timerText;
-    
-    // Update progress bar
+    const progressFill = this.shadowRoot.querySelector('.countdown-progress-fill');
     if (progressFill) {
-      const progressPercentage = isRunning && timerLength > 0 ? 
-        Math.max(0, Math.min(100, (timeLeft / timerLength) * 100)) : 0;
       progressFill.style.width = `${progressPercentage}%`;
     }
+    const gameContainer = this.shadowRoot.querySelector('.game-container');
+    if (gameContainer) {
+      gameContainer.classList.toggle('warning-pulse', isWarning && timeLeft > 0);
+      gameContainer.classList.toggle('time-up-pulse', isTimeUp);
+    }
+    
+    // Tablet timer
+    const tabletTimer = this.shadowRoot.querySelector('.tablet-timer');
+    if (tabletTimer) {
+      tabletTimer.className = 'tablet-timer' + (isTimeUp ? ' time-up' : isWarning ? ' warning' : '');
+      tabletTimer.textContent = isTimeUp ? 'TIME UP!' : `${timeLeft}`;
+    }
+    const tabletProgress = this.shadowRoot.querySelector('.tablet-progress-fill');
+    if (tabletProgress) {
+      tabletProgress.className = 'tablet-progress-fill' + (isTimeUp ? ' danger' : isWarning ? ' warning' : '');
+      tabletProgress.style.width = `${progressPercentage}%`;
+    }
   }
 
   // Set a temporary lock to prevent re-renders during dropdown interactions
@@ -304,15 +526,16 @@ class HomeTriviaCard extends HTMLElement {
     
     // Check critical sensors that affect the display
     const criticalSensors = [
-      'sensor.home_trivia_current_question',
-      'sensor.home_trivia_countdown_current',
-      'sensor.home_trivia_game_status'
+      this.entityId('current_question'),
+      this.entityId('countdown_current'),
+      this.entityId('game_status')
     ];
     
     // Check team states (for points, names, etc.)
     const teamSensors = [];
-    for (let i = 1; i <= 5; i++) {
-      teamSensors.push(`sensor.home_trivia_team_${i}`);
+    const teamCount = Math.max(this.getTeamCount(previousHass), this.getTeamCount(currentHass));
+    for (let i = 1; i <= teamCount; i++) {
+      teamSensors.push(this.entityId(`team_${i}`));
     }
     
     const allSensors = [...criticalSensors, ...teamSensors];
@@ -361,15 +584,6 @@ class HomeTriviaCard extends HTMLElement {
     return false; // No significant changes detected
   }
 
-  // Check if there are any pending form changes that haven't been sent to backend yet
-  hasPendingFormChanges() {
-    return this._pendingFormValues.difficulty !== null ||
-           this._pendingFormValues.timerLength !== null ||
-           this._pendingFormValues.teamCount !== null ||
-           Object.keys(this._pendingFormValues.teamNames).length > 0 ||
-           Object.keys(this._pendingFormValues.teamUserIds).length > 0;
-  }
-
   // Check if current user is admin (Team 1 owner)
   isCurrentUserAdmin() {
     if (!this._hass || !this._hass.user) {
@@ -377,7 +591,7 @@ class HomeTriviaCard extends HTMLElement {
     }
     
     // Admin rights are determined by Team 1 ownership
-    const team1State = this._hass.states['sensor.home_trivia_team_1'];
+    const team1State = this.getState('team_1');
     if (!team1State) {
       return false;
     }
@@ -418,9 +632,211 @@ class HomeTriviaCard extends HTMLElement {
     });
   }
 
+  // Incremental rendering: the styles and static markup of a screen are
+  // built once, when the screen is first shown. A render only fills in the
+  // screen's slots: data-slot elements get their text or attributes set, and
+  // data-region elements are patched with the markup of their section (the
+  // question, the teams, the controls...) when it changed. Elements keep
+  // their identity, so focus, typed text, scroll position and running
+  // animations survive a render, and the browser only lays out what changed.
+  mountScreen(screen, styles, skeleton) {
+    if (this._screen === screen) return;
+    this._screen = screen;
+    this._screenStyles.textContent = BASE_STYLES + styles;
+    const template = document.createElement('template');
+    template.innerHTML = skeleton;
+    this._parsedBytes += skeleton.length;
+    this._screenRoot.replaceChildren(template.content);
+    this._slots = {};
+    for (const element of this._screenRoot.querySelectorAll('[data-slot], [data-region]')) {
+      this._slots[element.dataset.slot || element.dataset.region] = { element, html: null };
+    }
+    this._patchedNodes++;
+  }
+
+  // Set the text of a slot; returns whether it changed
+  setSlotText(name, text) {
+    const element = this._slots[name].element;
+    if (element.textContent === text) return false;
+    element.textContent = text;
+    this._patchedNodes++;
+    return true;
+  }
+
+  setSlotAttribute(name, attribute, value) {
+    const element = this._slots[name].element;
+    if (element.getAttribute(attribute) !== value) {
+      element.setAttribute(attribute, value);
+      this._patchedNodes++;
+    }
+  }
+
+  patchRegion(name, html) {
+    const slot = this._slots[name];
+    // The same markup as last time means nothing in the region changed
+    if (slot.html === html) return;
+    slot.html = html;
+    this.patchElement(slot.element, html);
+  }
+
+  patchElement(parent, html) {
+    const template = document.createElement('template');
+    template.innerHTML = html;
+    this._parsedBytes += html.length;
+    this.patchChildren(parent, template.content);
+  }
+
+  // Nodes are matched by data-key or id first, otherwise by position and tag
+  nodeKey(node) {
+    return node.nodeType === Node.ELEMENT_NODE ? (node.getAttribute('data-key') || node.id || null) : null;
+  }
+
+  patchChildren(parent, source) {
+    const keyed = new Map();
+    for (let child = parent.firstChild; child; child = child.nextSibling) {
+      const key = this.nodeKey(child);
+      if (key) keyed.set(key, child);
+    }
+    
+    let current = parent.firstChild;
+    for (let next = source.firstChild; next; next = next.nextSibling) {
+      const key = this.nodeKey(next);
+      let match = key ? keyed.get(key) : (current && !this.nodeKey(current) ? current : null);
+      if (match && match.nodeName !== next.nodeName) {
+        match = null;
+      }
+      
+      if (!match) {
+        parent.insertBefore(document.importNode(next, true), current);
+        this._patchedNodes++;
+        continue;
+      }
+      if (key) {
+        keyed.delete(key);
+      }
+      if (match === current) {
+        current = current.nextSibling;
+      } else {
+        parent.insertBefore(match, current);
+      }
+      this.patchNode(match, next);
+    }
+    
+    // Whatever was not matched is gone from the new markup
+    while (current) {
+      const following = current.nextSibling;
+      parent.removeChild(current);
+      this._patchedNodes++;
+      current = following;
+    }
+  }
+
+  patchNode(node, source) {
+    if (node.nodeType !== Node.ELEMENT_NODE) {
+      if (node.nodeValue !== source.nodeValue) {
+        node.nodeValue = source.nodeValue;
+        this._patchedNodes++;
+      }
+      return;
+    }
+    
+    let changed = false;
+    for (const { name, value } of source.attributes) {
+      if (node.getAttribute(name) !== value) {
+        node.setAttribute(name, value);
+        changed = true;
+      }
+    }
+    for (const name of node.getAttributeNames()) {
+      if (!source.hasAttribute(name)) {
+        node.removeAttribute(name);
+        changed = true;
+      }
+    }
+    if (changed) {
+      this._patchedNodes++;
+    }
+    
+    // The live value of a form control is a property; leave it alone while it has focus
+    const focused = this.shadowRoot.activeElement === node;
+    if (node.nodeName === 'TEXTAREA') {
+      if (!focused && node.value !== source.value) node.value = source.value;
+      return;
+    }
+    this.patchChildren(node, source);
+    if (!focused && node.nodeName === 'INPUT') {
+      if (node.value !== source.value) node.value = source.value;
+      if (node.checked !== source.checked) node.checked = source.checked;
+    } else if (!focused && node.nodeName === 'SELECT' && node.value !== source.value) {
+      node.value = source.value;
+    }
+  }
+
+  // Set the change handler of an element. Assigning it, rather than adding a
+  // listener, keeps a patched element that survives renders at one handler.
+  setChangeHandler(id, handler) {
+    const element = this.shadowRoot.getElementById(id);
+    if (element) {
+      element.onchange = handler;
+    }
+  }
+
+  // Render time of the last RENDER_STATS_SIZE renders, and the nodes they patched
+  recordRenderStats(duration) {
+    if (!this._renderTimes) {
+      this._renderTimes = new Float64Array(RENDER_STATS_SIZE);
+      this._renderCount = 0;
+      this._patchedNodesTotal = 0;
+    }
+    this._renderTimes[this._renderCount % RENDER_STATS_SIZE] = duration;
+    this._renderCount++;
+    this._patchedNodesTotal += this._patchedNodes;
+  }
+
+  // Time from pressing Next Question to the new question arriving in the card's state
+  recordNextQuestionLatency(hass) {
+    if (this._nextQuestionPressedAt === undefined) return;
+    const questionId = hass.states[this.entityId('current_question')]?.attributes?.question_id;
+    if (questionId === this._nextQuestionFrom) return;
+    if (!this._nextQuestionTimes) {
+      this._nextQuestionTimes = new Float64Array(RENDER_STATS_SIZE);
+      this._nextQuestionCount = 0;
+    }
+    this._nextQuestionTimes[this._nextQuestionCount % RENDER_STATS_SIZE] = performance.now() - this._nextQuestionPressedAt;
+    this._nextQuestionCount++;
+    this._nextQuestionPressedAt = undefined;
+  }
+
+  // Render timing for profiling, e.g. document.querySelector('home-trivia-card').getRenderStats()
+  getRenderStats() {
+    const stats = (samples, total) => {
+      const count = Math.min(total || 0, RENDER_STATS_SIZE);
+      const times = Array.from((samples || []).slice(0, count)).sort((a, b) => a - b);
+      const percentile = (fraction) => count ? times[Math.min(count - 1, Math.floor(count * fraction))] : null;
+      return { p50Ms: percentile(0.5), p95Ms: percentile(0.95), maxMs: count ? times[count - 1] : null };
+    };
+    return {
+      renders: this._renderCount || 0,
+      patchedNodes: this._patchedNodesTotal || 0,
+      parsedKb: Math.round(this._parsedBytes / 1024),
+      ...stats(this._renderTimes, this._renderCount),
+      nextQuestions: this._nextQuestionCount || 0,
+      nextQuestion: stats(this._nextQuestionTimes, this._nextQuestionCount)
+    };
+  }
+
   render() {
-    if (!this._hass) {
-      this.shadowRoot.innerHTML = `<div style="padding: 20px;">${this.t('loading')}</div>`;
+    const start = performance.now();
+    this._patchedNodes = 0;
+    this.renderScreen();
+    this.recordRenderStats(performance.now() - start);
+  }
+
+  renderScreen() {
+    // A named game is only known once its first snapshot arrived
+    if (!this._hass || !this.entityPrefix) {
+      this.mountScreen('loading', '', '<div style="padding: 20px;" data-slot="loading"></div>');
+      this.setSlotText('loading', this.t('loading'));
       return;
     }
 
@@ -430,7 +846,7 @@ class HomeTriviaCard extends HTMLElement {
     }
 
     // Check for game stopped state first to show summary screen
-    const gameStatus = this._hass.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     if (gameStatus && gameStatus.state === 'stopped') {
       this.renderSummaryScreen();
     } else if (this.shouldShowSplashScreen()) {
@@ -443,358 +859,10 @@ class HomeTriviaCard extends HTMLElement {
   }
 
   renderSplashScreen() {
-    this.shadowRoot.innerHTML = `
-      <style>
-        .splash-screen {
-          text-align: center;
-          padding: 32px;
-          background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
-          border-radius: var(--ha-card-border-radius, 12px);
-          color: white;
-          position: relative;
-          overflow: hidden;
-          min-height: 500px;
-          box-shadow: 0 10px 25px rgba(37, 99, 235, 0.15);
-        }
-        
-        .splash-header {
-          position: relative;
-          z-index: 2;
-          margin-bottom: 32px;
-        }
-        
-
-        
-        .splash-title {
-          font-size: 3em;
-          font-weight: 900;
-          margin-bottom: 16px;
-          text-shadow: 
-            0 2px 8px rgba(0,0,0,0.3),
-            0 4px 16px rgba(0,0,0,0.2),
-            0 0 40px rgba(255,255,255,0.1);
-          letter-spacing: 1px;
-          background: linear-gradient(45deg, #ffffff 20%, #f8fafc 40%, #ffffff 60%, #e2e8f0 80%);
-          background-size: 300% 300%;
-          -webkit-background-clip: text;
-          -webkit-text-fill-color: transparent;
-          background-clip: text;
-          animation: splashTitleGlow 5s ease-in-out infinite;
-        }
-        @keyframes splashTitleGlow {
-          0%, 100% { background-position: 0% 50%; }
-          50% { background-position: 100% 50%; }
-        }
-        
-        .splash-subtitle {
-          font-size: 1.2em;
-          margin-bottom: 20px;
-          opacity: 0.95;
-          font-weight: 600;
-          color: white;
-          text-shadow: 0 1px 4px rgba(0,0,0,0.2);
-          animation: subtitlePulse 3s ease-in-out infinite;
-        }
-        @keyframes subtitlePulse {
-          0%, 100% { opacity: 0.95; }
-          50% { opacity: 1; }
-        }
-        
-        .splash-sound-waves {
-          display: flex;
-          justify-content: center;
-          align-items: flex-end;
-          height: 40px;
-          margin: 20px 0;
-          gap: 4px;
-        }
-        
-        .wave {
-          width: 4px;
-          background: rgba(255, 255, 255, 0.6);
-          border-radius: 2px;
-          animation: wave 2s ease-in-out infinite;
-        }
-        
-        .wave-1 { height: 20px; animation-delay: 0s; }
-        .wave-2 { height: 35px; animation-delay: 0.2s; }
-        .wave-3 { height: 30px; animation-delay: 0.4s; }
-        .wave-4 { height: 25px; animation-delay: 0.6s; }
-        .wave-5 { height: 40px; animation-delay: 0.8s; }
-        
-        @keyframes wave {
-          0%, 100% { transform: scaleY(1); }
-          50% { transform: scaleY(1.5); }
-        }
-        
-        .splash-setup {
-          background: rgba(255, 255, 255, 0.95);
-          border-radius: 16px;
-          padding: 24px;
-          margin: 20px 0;
-          box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-          color: #1e293b;
-        }
-        
-        .setup-message h2 {
-          margin: 0 0 8px 0;
-          font-size: 1.5em;
-          font-weight: 600;
-        }
-        
-        .setup-message p {
-          margin: 0 0 20px 0;
-          opacity: 0.9;
-        }
-        
-        .splash-input-section {
-          background: rgba(255, 255, 255, 0.95);
-          border-radius: 16px;
-          padding: 24px;
-          margin-bottom: 20px;
-          text-align: left;
-          transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
-          border: 1px solid rgba(255, 255, 255, 0.2);
-          box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-          color: #1e293b;
-        }
-        
-        .splash-input-section:hover {
-          background: rgba(255, 255, 255, 1.0);
-          border-color: rgba(37, 99, 235, 0.3);
-          transform: translateY(-2px);
-          box-shadow: 0 8px 24px rgba(0, 0, 0, 0.12);
-        }
-        
-        .splash-input-section.error {
-          border: 2px solid #ff6b6b;
-          background: rgba(255, 107, 107, 0.2);
-        }
-        
-        .splash-input-header {
-          display: flex;
-          align-items: center;
-          margin-bottom: 8px;
-        }
-        
-        .splash-input-header h3 {
-          margin: 0 0 0 12px;
-          font-size: 1.3em;
-          font-weight: 700;
-          color: #1e293b;
-        }
-        
-        .input-icon {
-          --mdc-icon-size: 24px;
-          color: #2563eb;
-        }
-        
-        .input-description {
-          margin: 0 0 16px 0;
-          color: #64748b;
-          font-size: 0.95em;
-          line-height: 1.4;
-        }
-        
-        .form-select, .splash-team-input, .splash-team-select {
-          width: 100%;
-          padding: 16px 20px;
-          border: 2px solid rgba(255, 255, 255, 0.2);
-          border-radius: 12px;
-          background: rgba(255, 255, 255, 0.95);
-          color: #2d3748;
-          font-size: 16px;
-          font-weight: 500;
-          box-sizing: border-box;
-          transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
-          box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
-        }
-        
-        .form-select:focus, .splash-team-input:focus, .splash-team-select:focus {
-          outline: none;
-          border-color: #2563eb;
-          box-shadow: 0 0 0 3px rgba(37, 99, 235, 0.1), 0 4px 16px rgba(0, 0, 0, 0.08);
-          background: rgba(255, 255, 255, 1.0);
-          transform: translateY(-1px);
-        }
-        
-        .splash-teams-container {
-          display: grid;
-          gap: 12px;
-        }
-        
-        .splash-team-item {
-          display: grid;
-          grid-template-columns: auto 1fr 1fr;
-          gap: 12px;
-          align-items: center;
-          background: rgba(248, 250, 252, 0.8);
-          padding: 12px;
-          border-radius: 8px;
-          border: 1px solid #e2e8f0;
-        }
-        
-        .splash-team-item:hover {
-          background: rgba(248, 250, 252, 1.0);
-          border-color: #cbd5e1;
-        }
-        
-        .team-label {
-          font-weight: 600;
-          white-space: nowrap;
-          color: #1e293b;
-        }
-        
-        .splash-start-button {
-          background: rgba(255, 255, 255, 0.2);
-          border: 2px solid rgba(255, 255, 255, 0.5);
-          color: white;
-          padding: 16px 32px;
-          border-radius: 25px;
-          font-size: 18px;
-          font-weight: bold;
-          cursor: pointer;
-          transition: all 0.3s ease;
-          margin-top: 20px;
-          display: inline-flex;
-          align-items: center;
-          gap: 8px;
-          box-shadow: 0 4px 15px rgba(0, 0, 0, 0.2);
-        }
-        
-        .splash-start-button:hover {
-          background: rgba(255, 255, 255, 0.3);
-          border-color: rgba(255, 255, 255, 0.8);
-          transform: translateY(-2px);
-          box-shadow: 0 6px 20px rgba(0, 0, 0, 0.3);
-        }
-        
-        .splash-start-button.ready {
-          background: #059669;
-          border-color: #059669;
-          color: white;
-        }
-        
-        .splash-start-button.ready:hover {
-          background: #047857;
-          box-shadow: 0 6px 20px rgba(5, 150, 105, 0.3);
-        }
-        
-        .start-help {
-          margin: 8px 0 0 0;
-          font-size: 0.9em;
-          opacity: 0.7;
-        }
-        
-        .splash-qr-section {
-          background: rgba(255, 255, 255, 0.95);
-          border-radius: 16px;
-          padding: 20px;
-          margin: 20px 0;
-          text-align: center;
-          color: #1e293b;
-          box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-        }
-        
-        .qr-header {
-          margin-bottom: 15px;
-        }
-        
-        .qr-header h3 {
-          margin: 0 0 8px 0;
-          font-size: 1.3em;
-          font-weight: 600;
-        }
-        
-        .qr-header p {
-          margin: 0;
-          font-size: 0.9em;
-          opacity: 0.9;
-        }
-        
-        .qr-code-container {
-          background: rgba(255, 255, 255, 0.95);
-          border-radius: 8px;
-          padding: 15px;
-          display: inline-block;
-          margin: 10px 0;
-        }
-        
-        .qr-code-container img {
-          display: block;
-          border-radius: 4px;
-        }
-        
-        .qr-url {
-          font-family: monospace;
-          font-size: 0.8em;
-          color: rgba(255, 255, 255, 0.8);
-          margin-top: 10px;
-          word-break: break-all;
-        }
-        
-        @media (max-width: 768px) {
-          .splash-screen {
-            padding: 24px 16px;
-            min-height: 400px;
-          }
-          .splash-title {
-            font-size: 2.2em;
-          }
-          .splash-subtitle {
-            font-size: 1em;
-          }
-          .splash-input-section {
-            padding: 20px 16px;
-            margin-bottom: 16px;
-          }
-          .splash-input-header h3 {
-            font-size: 1.1em;
-          }
-          .splash-team-item {
-            grid-template-columns: 1fr;
-            text-align: center;
-            gap: 8px;
-          }
-          .team-label {
-            text-align: center;
-          }
-          .splash-qr-section {
-            margin: 15px 0;
-            padding: 15px;
-          }
-          .qr-header h3 {
-            font-size: 1.1em;
-          }
-          .qr-header p {
-            font-size: 0.8em;
-          }
-        }
-        
-        @media (max-width: 480px) {
-          .splash-screen {
-            padding: 20px 12px;
-          }
-          .splash-title {
-            font-size: 1.8em;
-          }
-          .splash-input-section {
-            padding: 16px 12px;
-          }
-          .form-select, .splash-team-input, .splash-team-select {
-            padding: 14px 16px;
-            font-size: 15px;
-          }
-        }
-      </style>
-
+    this.mountScreen('splash', SPLASH_STYLES, `
       <div class="splash-screen">
-
-        
         <div class="splash-header">
-          <h1 class="splash-title">
-            ${this.t('welcome')}
-          </h1>
+          <h1 class="splash-title" data-slot="welcome"></h1>
           <p class="splash-subtitle">🧠 The ultimate Home Assistant trivia game experience! 🏆</p>
           <div class="splash-sound-waves">
             <div class="wave wave-1"></div>
@@ -811,9 +879,7 @@ class HomeTriviaCard extends HTMLElement {
             <p>Configure your trivia game settings below:</p>
           </div>
           
-          <div class="splash-settings">
-            ${this.renderSplashInputs()}
-          </div>
+          <div class="splash-settings" data-region="settings"></div>
         </div>
         
         <div class="splash-qr-section">
@@ -822,12 +888,9 @@ class HomeTriviaCard extends HTMLElement {
             <p>Scan this QR code to access the game on your phone or tablet</p>
           </div>
           <div class="qr-code-container">
-            <img src="${this.generateQRCode(this.getCurrentHomeAssistantUrl())}" 
-                 alt="QR Code for ${this.getCurrentHomeAssistantUrl()}" 
-                 width="150" 
-                 height="150" />
+            <img data-slot="qr-code" width="150" height="150" />
           </div>
-          <div class="qr-url">${this.getCurrentHomeAssistantUrl()}</div>
+          <div class="qr-url" data-slot="qr-url"></div>
         </div>
         
         <div class="splash-start-section">
@@ -836,17 +899,25 @@ class HomeTriviaCard extends HTMLElement {
           </button>
         </div>
       </div>
-    `;
+    `);
+    const url = this.getCurrentHomeAssistantUrl();
+    this.setSlotText('welcome', this.t('welcome'));
+    this.patchRegion('settings', this.renderSplashInputs());
+    // The QR code is only generated again when the URL changes
+    if (this.setSlotText('qr-url', url)) {
+      this.setSlotAttribute('qr-code', 'src', this.generateQRCode(url));
+      this.setSlotAttribute('qr-code', 'alt', `QR Code for ${url}`);
+    }
 
     // Add event listeners
-    this.shadowRoot.getElementById('difficulty-select')?.addEventListener('change', (e) => {
+    this.setChangeHandler('difficulty-select', (e) => {
       // Store pending value optimistically
       this._pendingFormValues.difficulty = e.target.value;
       this.updateDifficultyDescription(e.target.value);
       
       // Persist difficulty level immediately
       this.debouncedServiceCall('difficulty_level', () => {
-        this._hass.callService('home_trivia', 'update_difficulty_level', {
+        this.callGameService('update_difficulty_level', {
           difficulty_level: e.target.value
         }).then(() => {
           // Clear pending value when backend confirms
@@ -857,7 +928,22 @@ class HomeTriviaCard extends HTMLElement {
       }, 500); // Increased delay to prevent resets
     });
 
-    this.shadowRoot.getElementById('team-count-select')?.addEventListener('change', (e) => {
+    this.setChangeHandler('game-mode-select', (e) => {
+      // Store pending value optimistically
+      this._pendingFormValues.gameMode = e.target.value;
+      
+      this.debouncedServiceCall('game_mode', () => {
+        this.callGameService('update_game_mode', {
+          game_mode: e.target.value
+        }).then(() => {
+          this.clearPendingFormValue('gameMode');
+        }).catch(() => {
+          // Keep pending value on error - user can retry
+        });
+      }, 500);
+    });
+
+    this.setChangeHandler('team-count-select', (e) => {
       const teamCount = parseInt(e.target.value);
       
       // Store pending value optimistically
@@ -865,7 +951,7 @@ class HomeTriviaCard extends HTMLElement {
       
       // Persist team count immediately
       this.debouncedServiceCall('team_count', () => {
-        this._hass.callService('home_trivia', 'update_team_count', {
+        this.callGameService('update_team_count', {
           team_count: teamCount
         }).then(() => {
           // Clear pending value when backend confirms
@@ -884,7 +970,7 @@ class HomeTriviaCard extends HTMLElement {
     let inputsHtml = '';
 
     // Get current values from Home Assistant entities
-    const gameStatus = this._hass?.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     
     // Use effective values (pending local changes take precedence over HA entity values)
     const baseDifficulty = gameStatus?.attributes?.difficulty_level || 'Easy';
@@ -892,6 +978,7 @@ class HomeTriviaCard extends HTMLElement {
     
     const currentDifficulty = this.getEffectiveFormValue('difficulty', null, baseDifficulty);
     const currentTeamCount = this.getEffectiveFormValue('teamCount', null, baseTeamCount);
+    const currentGameMode = this.getEffectiveFormValue('gameMode', null, gameStatus?.attributes?.game_mode || 'classic');
 
     // Difficulty Level Input
     inputsHtml += `
@@ -913,6 +1000,21 @@ class HomeTriviaCard extends HTMLElement {
       </div>
     `;
 
+    // Game Mode Input
+    inputsHtml += `
+      <div class="splash-input-section">
+        <div class="splash-input-header">
+          <ha-icon icon="mdi:gesture-tap-button" class="input-icon"></ha-icon>
+          <h3>${this.t('gameMode')}</h3>
+        </div>
+        <p class="input-description">${this.t('gameModeHint')}</p>
+        <select class="form-select" id="game-mode-select">
+          <option value="classic" ${currentGameMode === 'classic' ? 'selected' : ''}>${this.t('gameModeClassic')}</option>
+          <option value="buzzer" ${currentGameMode === 'buzzer' ? 'selected' : ''}>${this.t('gameModeBuzzer')}</option>
+        </select>
+      </div>
+    `;
+
     // Team Count Input
     inputsHtml += `
       <div class="splash-input-section">
@@ -922,11 +1024,7 @@ class HomeTriviaCard extends HTMLElement {
         </div>
         <p class="input-description">${this.t('teamCountHint')}</p>
         <select class="form-select" id="team-count-select">
-          <option value="1" ${currentTeamCount === 1 ? 'selected' : ''}>1 ${this.t('team')}</option>
-          <option value="2" ${currentTeamCount === 2 ? 'selected' : ''}>2 ${this.t('team')}s</option>
-          <option value="3" ${currentTeamCount === 3 ? 'selected' : ''}>3 ${this.t('team')}s</option>
-          <option value="4" ${currentTeamCount === 4 ? 'selected' : ''}>4 ${this.t('team')}s</option>
-          <option value="5" ${currentTeamCount === 5 ? 'selected' : ''}>5 ${this.t('team')}s</option>
+          ${this.renderTeamCountOptions(currentTeamCount)}
         </select>
       </div>
     `;
@@ -981,7 +1079,7 @@ class HomeTriviaCard extends HTMLElement {
   renderTeamSetup() {
     const teamCount = 2; // Default
     let html = '';
-    for (let i = 1; i <= 5; i++) {
+    for (let i = 1; i <= Math.max(teamCount, this.getTeamCount()); i++) {
       const checked = i <= teamCount ? 'checked' : '';
       const disabled = i > teamCount ? 'disabled' : '';
       html += `
@@ -1158,9 +1256,10 @@ class HomeTriviaCard extends HTMLElement {
   getTeams() {
     // Get team data from Home Assistant states
     const teams = {};
-    if (this._hass && this._hass.states) {
-      for (let i = 1; i <= 5; i++) {
-        const teamState = this._hass.states[`sensor.home_trivia_team_${i}`];
+    if (this._hass) {
+      const teamCount = this.getTeamCount();
+      for (let i = 1; i <= teamCount; i++) {
+        const teamState = this.getState(`team_${i}`);
         if (teamState) {
           teams[`team_${i}`] = {
             name: teamState.state || `Team ${i}`,
@@ -1181,7 +1280,7 @@ class HomeTriviaCard extends HTMLElement {
     // Debounce team name updates
     this.debouncedServiceCall(`teamName_${teamId}`, () => {
       if (this._hass && name.trim()) {
-        this._hass.callService('home_trivia', 'update_team_name', {
+        this.callGameService('update_team_name', {
           team_id: teamId,
           name: name.trim()
         }).then(() => {
@@ -1204,7 +1303,7 @@ class HomeTriviaCard extends HTMLElement {
     // Debounce team user ID updates
     this.debouncedServiceCall(`teamUserId_${teamId}`, () => {
       if (this._hass) {
-        this._hass.callService('home_trivia', 'update_team_user_id', {
+        this.callGameService('update_team_user_id', {
           team_id: teamId,
           user_id: userId || null
         }).then(() => {
@@ -1269,12 +1368,12 @@ class HomeTriviaCard extends HTMLElement {
 
   // Centralized function to update team participation status
   updateTeamParticipation(teamCount, keyPrefix = 'teamParticipation') {
-    for (let i = 1; i <= 5; i++) {
-      const participating = i <= teamCount;
+    // Teams beyond the team count are removed by the backend
+    for (let i = 1; i <= teamCount; i++) {
       this.debouncedServiceCall(`${keyPrefix}_${i}`, () => {
-        this._hass.callService('home_trivia', 'update_team_participating', {
+        this.callGameService('update_team_participating', {
           team_id: `team_${i}`,
-          participating: participating
+          participating: true
         });
       }, 100 + (i * 50));
     }
@@ -1288,7 +1387,7 @@ class HomeTriviaCard extends HTMLElement {
       const users = this.homeAssistantUsers || [];
       const isLoadingUsers = this._isLoadingUsers || (!this.usersLoaded && users.length === 0);
       
-      splashTeamsContainer.innerHTML = this.renderTeamSetupItems(teams, users, isLoadingUsers, teamCount, 'splash');
+      this.patchElement(splashTeamsContainer, this.renderTeamSetupItems(teams, users, isLoadingUsers, teamCount, 'splash'));
     }
     
     // Update team participation status for all teams
@@ -1303,7 +1402,7 @@ class HomeTriviaCard extends HTMLElement {
       const users = this.homeAssistantUsers || [];
       const isLoadingUsers = this._isLoadingUsers || (!this.usersLoaded && users.length === 0);
       
-      mainTeamsContainer.innerHTML = this.renderTeamSetupItems(teams, users, isLoadingUsers, teamCount, 'main');
+      this.patchElement(mainTeamsContainer, this.renderTeamSetupItems(teams, users, isLoadingUsers, teamCount, 'main'));
     }
     
     // Update team participation status for all teams
@@ -1314,22 +1413,22 @@ class HomeTriviaCard extends HTMLElement {
     const difficulty = this.shadowRoot.getElementById('difficulty-select')?.value || 'Easy';
     
     // Get current timer length from Home Assistant entity (no longer reading from splash screen)
-    const timerSensor = this._hass?.states['sensor.home_trivia_countdown_timer'];
+    const timerSensor = this.getState('countdown_timer');
     const timerLength = parseInt(timerSensor?.state || '30');
     
     // Get team count from Home Assistant entity instead of DOM
-    const gameStatus = this._hass?.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     const teamCount = gameStatus?.attributes?.team_count || 2;
 
     // Update game settings using debounced calls
     this.debouncedServiceCall('startGame_difficulty', () => {
-      this._hass.callService('home_trivia', 'update_difficulty_level', {
+      this.callGameService('update_difficulty_level', {
         difficulty_level: difficulty
       });
     }, 100);
 
     this.debouncedServiceCall('startGame_timer', () => {
-      this._hass.callService('home_trivia', 'update_countdown_timer_length', {
+      this.callGameService('update_countdown_timer_length', {
         timer_length: timerLength
       });
     }, 150);
@@ -1344,7 +1443,7 @@ class HomeTriviaCard extends HTMLElement {
       
       if (teamName && teamName !== `Team ${teamId.split('_')[1]}`) {
         this.debouncedServiceCall(`startGame_teamName_${teamId}`, () => {
-          this._hass.callService('home_trivia', 'update_team_name', {
+          this.callGameService('update_team_name', {
             team_id: teamId,
             name: teamName
           });
@@ -1354,18 +1453,18 @@ class HomeTriviaCard extends HTMLElement {
 
     // Start the game after a delay to ensure all settings are applied
     setTimeout(() => {
-      this._hass.callService('home_trivia', 'start_game', {});
+      this.callGameCommand('start_game');
     }, 800);
   }
 
   renderMainGame() {
-    const gameStatus = this._hass.states['sensor.home_trivia_game_status'];
-    const currentQuestion = this._hass.states['sensor.home_trivia_current_question'];
-    const countdown = this._hass.states['sensor.home_trivia_countdown_current'];
+    const gameStatus = this.getState('game_status');
+    const currentQuestion = this.getState('current_question');
+    const countdown = this.getState('countdown_current');
 
     // Determine container classes based on countdown state
     let containerClasses = 'game-container';
-    const timeLeft = countdown ? parseInt(countdown.state, 10) : 0;
+    const timeLeft = this.getCountdownTimeLeft(countdown);
     const isRunning = countdown?.attributes.is_running;
 
     if (isRunning && timeLeft <= 5 && timeLeft > 0) {
@@ -1374,880 +1473,8 @@ class HomeTriviaCard extends HTMLElement {
       containerClasses += ' time-up-pulse';
     }
     
-    this.shadowRoot.innerHTML = `
-      <style>
-        .game-container {
-          font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Open Sans', 'Helvetica Neue', sans-serif;
-          background: var(--ha-card-background, var(--card-background-color, white));
-          border-radius: var(--ha-card-border-radius, 16px);
-          border: none;
-          box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04);
-          overflow: hidden;
-        }
-        .game-header {
-          background: linear-gradient(135deg, #1e40af 0%, #3b82f6 25%, #2563eb 75%, #1d4ed8 100%);
-          color: white;
-          padding: 40px 24px;
-          text-align: center;
-          position: relative;
-          overflow: hidden;
-          box-shadow: 0 4px 20px rgba(37, 99, 235, 0.3);
-        }
-        .game-header::before {
-          content: '';
-          position: absolute;
-          top: -50%;
-          left: -50%;
-          width: 200%;
-          height: 200%;
-          background: 
-            radial-gradient(circle at 30% 20%, rgba(255, 255, 255, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 70% 80%, rgba(255, 255, 255, 0.08) 0%, transparent 50%);
-          animation: headerShimmer 6s ease-in-out infinite;
-        }
-        @keyframes headerShimmer {
-          0%, 100% { transform: translate(-50%, -50%) rotate(0deg); }
-          50% { transform: translate(-50%, -50%) rotate(180deg); }
-        }
-        .game-title {
-          font-size: 2.8em;
-          font-weight: 900;
-          margin-bottom: 16px;
-          position: relative;
-          z-index: 2;
-          text-shadow: 
-            0 2px 4px rgba(0,0,0,0.3),
-            0 4px 8px rgba(0,0,0,0.2),
-            0 0 40px rgba(255,255,255,0.1);
-          letter-spacing: 1px;
-          background: linear-gradient(45deg, #ffffff 30%, #f1f5f9 50%, #ffffff 70%);
-          background-size: 200% 200%;
-          -webkit-background-clip: text;
-          -webkit-text-fill-color: transparent;
-          background-clip: text;
-          animation: titleGlow 4s ease-in-out infinite;
-        }
-        @keyframes titleGlow {
-          0%, 100% { background-position: 0% 50%; }
-          50% { background-position: 100% 50%; }
-        }
-        .header-decorations {
-          position: absolute;
-          top: 0;
-          left: 0;
-          width: 100%;
-          height: 100%;
-          pointer-events: none;
-          z-index: 1;
-        }
-        .header-particle {
-          position: absolute;
-          width: 4px;
-          height: 4px;
-          background: rgba(255, 255, 255, 0.6);
-          border-radius: 50%;
-          animation: particleFloat 8s linear infinite;
-        }
-        .header-particle:nth-child(1) {
-          left: 10%;
-          animation-delay: 0s;
-          animation-duration: 8s;
-        }
-        .header-particle:nth-child(2) {
-          left: 25%;
-          animation-delay: 2s;
-          animation-duration: 12s;
-        }
-        .header-particle:nth-child(3) {
-          left: 50%;
-          animation-delay: 4s;
-          animation-duration: 10s;
-        }
-        .header-particle:nth-child(4) {
-          left: 75%;
-          animation-delay: 6s;
-          animation-duration: 14s;
-        }
-        .header-particle:nth-child(5) {
-          left: 90%;
-          animation-delay: 1s;
-          animation-duration: 9s;
-        }
-        @keyframes particleFloat {
-          0% {
-            transform: translateY(100px) scale(0);
-            opacity: 0;
-          }
-          10% {
-            opacity: 1;
-          }
-          90% {
-            opacity: 1;
-          }
-          100% {
-            transform: translateY(-100px) scale(1);
-            opacity: 0;
-          }
-        }
-        .game-status {
-          font-size: 1.4em;
-          opacity: 0.95;
-          position: relative;
-          z-index: 2;
-          font-weight: 600;
-          text-shadow: 0 1px 3px rgba(0,0,0,0.3);
-          background: rgba(255, 255, 255, 0.1);
-          padding: 8px 20px;
-          border-radius: 25px;
-          display: inline-block;
-          border: 1px solid rgba(255, 255, 255, 0.2);
-          backdrop-filter: blur(10px);
-        }
-        .game-content {
-          padding: 32px 24px;
-        }
-        .question-section {
-          margin-bottom: 40px;
-          text-align: center;
-        }
-        .question-category {
-          display: flex;
-          align-items: center;
-          justify-content: center;
-          gap: 8px;
-          font-size: 1.0em;
-          font-weight: 600;
-          margin-bottom: 16px;
-          color: var(--secondary-text-color, #64748b);
-          text-transform: uppercase;
-          letter-spacing: 0.5px;
-        }
-        .question-category ha-icon {
-          --mdc-icon-size: 20px;
-          color: var(--primary-color, #2563eb);
-        }
-        .question-text {
-          font-size: 1.4em;
-          margin-bottom: 32px;
-          color: var(--primary-text-color);
-          line-height: 1.5;
-          font-weight: 700;
-          background: var(--card-background-color, #ffffff);
-          padding: 24px;
-          border-radius: 16px;
-          border: 3px solid var(--primary-color, #2563eb);
-          box-shadow: 0 4px 16px rgba(37, 99, 235, 0.1);
-        }
-        .question-ready-title {
-          font-size: 1.3em;
-          font-weight: 600;
-          margin-bottom: 16px;
-          color: var(--secondary-text-color, #64748b);
-        }
-        .question-ready-text {
-          font-size: 1.1em;
-          color: var(--secondary-text-color, #64748b);
-          font-weight: 400;
-          line-height: 1.4;
-        }
-        .answers-grid {
-          display: grid;
-          grid-template-columns: 1fr;
-          gap: 16px;
-          margin-bottom: 24px;
-        }
-        .answer-button {
-          padding: 20px 24px;
-          border: 2px solid #e2e8f0;
-          border-radius: 12px;
-          background: white;
-          cursor: pointer;
-          font-size: 1.1em;
-          font-weight: 600;
-          transition: all 0.15s ease-out;
-          text-align: left;
-          box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
-          color: #1e293b;
-        }
-        .answer-button:hover {
-          background: #2563eb;
-          color: white;
-          border-color: #2563eb;
-          transform: translateY(-2px);
-          box-shadow: 0 8px 24px rgba(37, 99, 235, 0.2);
-        }
-        .answer-button.selected {
-          background: #10b981;
-          color: white;
-          border-color: #10b981;
-          box-shadow: 0 4px 16px rgba(16, 185, 129, 0.3);
-        }
-        .answer-button.selected:hover {
-          background: #059669;
-          border-color: #059669;
-          box-shadow: 0 8px 24px rgba(5, 150, 105, 0.3);
-        }
-        }
-        .countdown-timer {
-          text-align: center;
-          font-size: 2em;
-          font-weight: bold;
-          color: #2563eb;
-          margin-bottom: 20px;
-          padding: 10px;
-          border-radius: 8px;
-          transition: all 0.3s ease;
-        }
-        .countdown-timer.time-up {
-          color: #dc2626;
-          background-color: rgba(220, 38, 38, 0.1);
-          animation: pulse-red 1s infinite;
-        }
-        .countdown-timer.warning {
-          color: #f59e0b;
-          background-color: rgba(245, 158, 11, 0.1);
-        }
-        @keyframes pulse-red {
-          0% { transform: scale(1); opacity: 1; }
-          50% { transform: scale(1.05); opacity: 0.8; }
-          100% { transform: scale(1); opacity: 1; }
-        }
-        @keyframes pulse-orange-shadow {
-          0% { box-shadow: 0 8px 32px rgba(245, 158, 11, 0.4), 0 2px 16px rgba(245, 158, 11, 0.2); }
-          50% { box-shadow: 0 12px 40px rgba(245, 158, 11, 0.6), 0 4px 20px rgba(245, 158, 11, 0.4); }
-          100% { box-shadow: 0 8px 32px rgba(245, 158, 11, 0.4), 0 2px 16px rgba(245, 158, 11, 0.2); }
-        }
-        @keyframes pulse-red-shadow {
-          0% { box-shadow: 0 8px 32px rgba(220, 38, 38, 0.4), 0 2px 16px rgba(220, 38, 38, 0.2); }
-          50% { box-shadow: 0 12px 40px rgba(220, 38, 38, 0.6), 0 4px 20px rgba(220, 38, 38, 0.4); }
-          100% { box-shadow: 0 8px 32px rgba(220, 38, 38, 0.4), 0 2px 16px rgba(220, 38, 38, 0.2); }
-        }
-        .warning-pulse {
-          /* animation: pulse-orange-shadow 1.2s infinite; */
-        }
-        .time-up-pulse {
-          /* animation: pulse-red-shadow 1.2s infinite; */
-        }
-        .countdown-progress-container {
-          margin: 10px auto 20px auto;
-          max-width: 300px;
-        }
-        .countdown-progress-bar {
-          width: 100%;
-          height: 8px;
-          background-color: #e2e8f0;
-          border-radius: 4px;
-          overflow: hidden;
-          box-shadow: inset 0 1px 3px rgba(0, 0, 0, 0.2);
-        }
-        .countdown-progress-fill {
-          height: 100%;
-          background: linear-gradient(90deg, #059669, #2563eb);
-          border-radius: 4px;
-          transition: width 0.8s ease-out;
-          box-shadow: 0 1px 3px rgba(0, 0, 0, 0.3);
-        }
-        .countdown-timer.warning + .countdown-progress-container .countdown-progress-fill {
-          background: linear-gradient(90deg, #f59e0b, #dc2626);
-        }
-        .countdown-timer.time-up + .countdown-progress-container .countdown-progress-fill {
-          background: #dc2626;
-          animation: progress-pulse 1s infinite;
-        }
-        @keyframes progress-pulse {
-          0% { opacity: 1; }
-          50% { opacity: 0.5; }
-          100% { opacity: 1; }
-        }
-        @keyframes pulse-orange-shadow {
-          0% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(245, 158, 11, 0.8); }
-          50% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 20px rgba(245, 158, 11, 0.8); }
-          100% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(245, 158, 11, 0.8); }
-        }
-        @keyframes pulse-red-shadow {
-          0% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(220, 38, 38, 0.8); }
-          50% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 25px rgba(220, 38, 38, 0.8); }
-          100% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(220, 38, 38, 0.8); }
-        }
-        .warning-pulse {
-          /* animation: pulse-orange-shadow 1.2s ease-in-out infinite; */
-        }
-        .time-up-pulse {
-          /* animation: pulse-red-shadow 1.2s ease-in-out infinite; */
-        }
-        @keyframes score-update-flash {
-          0% { background-color: #dbeafe; }
-          100% { background-color: transparent; }
-        }
-        .score-updated {
-          animation: score-update-flash 1s ease-out;
-        }
-        @keyframes count-up {
-          from { transform: translateY(5px); opacity: 0.5; }
-          to { transform: translateY(0); opacity: 1; }
-        }
-        .team-points {
-          animation: count-up 0.3s ease-in-out;
-        }
-        .teams-grid {
-          display: grid;
-          grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-          gap: 12px;
-          margin-bottom: 32px;
-          overflow-x: auto;
-          padding-bottom: 8px;
-        }
-        .leaderboard-container {
-          padding: 16px 0;
-        }
-        .leader-card {
-          border: 2px solid #ffd700 !important; /* Gold border */
-          background: linear-gradient(145deg, #fffbeb, #fdf2d1) !important;
-          transform: scale(1.05);
-          margin-bottom: 24px;
-          box-shadow: 0 8px 30px rgba(255, 215, 0, 0.3) !important;
-          position: relative;
-        }
-        .leader-crown {
-          position: absolute;
-          top: -15px;
-          left: 50%;
-          transform: translateX(-50%);
-          font-size: 2em;
-          color: #ffd700;
-          filter: drop-shadow(0 2px 3px rgba(0,0,0,0.3));
-        }
-        .other-teams-grid {
-          display: grid;
-          gap: 12px;
-        }
-        .team-info {
-          display: flex;
-          align-items: center;
-          gap: 12px;
-        }
-        .team-score-section {
-          flex: 1;
-          padding-top: 8px;
-        }
-        .score-progress-bar {
-          width: 100%;
-          height: 8px;
-          background-color: #e2e8f0;
-          border-radius: 4px;
-          overflow: hidden;
-          margin-top: 4px;
-        }
-        .score-progress-fill {
-          height: 100%;
-          background: linear-gradient(90deg, #60a5fa, #2563eb);
-          border-radius: 4px;
-          transition: width 0.5s ease-in-out;
-        }
-        .rank-1 .score-progress-fill { 
-          background: linear-gradient(90deg, #fde047, #f59e0b); 
-        }
-        .rank-2 .score-progress-fill { 
-          background: linear-gradient(90deg, #d1d5db, #9ca3af); 
-        }
-        .rank-3 .score-progress-fill { 
-          background: linear-gradient(90deg, #fcd34d, #d97706); 
-        }
-        .team-card {
-          display: grid;
-          grid-template-columns: auto auto 1fr auto auto;
-          gap: 12px;
-          align-items: center;
-          background: white;
-          padding: 12px 16px;
-          border-radius: 8px;
-          border: 1px solid #f1f5f9;
-          box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
-          transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
-          position: relative;
-          overflow: hidden;
-        }
-        .other-teams-grid .team-card {
-          display: grid;
-          grid-template-columns: auto 1fr auto;
-          gap: 12px;
-          align-items: start;
-        }
-        .team-card::before {
-          content: '';
-          position: absolute;
-          top: 0;
-          left: 0;
-          bottom: 0;
-          width: 4px;
-          background: #2563eb;
-        }
-        .team-card:hover {
-          box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-          border-color: #e2e8f0;
-          background: rgba(248, 250, 252, 1.0);
-        }
-        .team-name {
-          font-weight: 700;
-          color: var(--primary-text-color, #1e293b);
-          font-size: 1.1em;
-        }
-        .team-points {
-          font-size: 1.1em;
-          color: #2563eb;
-          font-weight: 800;
-        }
-        /* Rank display */
-        .team-rank {
-          font-size: 1.1em;
-          font-weight: 700;
-          color: #64748b;
-          text-transform: uppercase;
-          letter-spacing: 0.5px;
-          min-width: 40px;
-          text-align: center;
-        }
-        /* Medal icon */
-        .team-medal {
-          font-size: 1.3em;
-        }
-        /* Rank-specific styling */
-        .rank-1::before {
-          background: #ffd700 !important; /* Gold */
-        }
-        .rank-1 .team-medal {
-          color: #ffd700;
-        }
-        .rank-2::before {
-          background: #c0c0c0 !important; /* Silver */
-        }
-        .rank-2 .team-medal {
-          color: #c0c0c0;
-        }
-        .rank-3::before {
-          background: #cd7f32 !important; /* Bronze */
-        }
-        .rank-3 .team-medal {
-          color: #cd7f32;
-        }
-        .team-answer {
-          padding: 8px 16px;
-          border-radius: 20px;
-          font-size: 0.9em;
-          font-weight: 600;
-          text-transform: uppercase;
-          letter-spacing: 0.5px;
-        }
-        .team-answered {
-          background: #059669;
-          color: white;
-        }
-        .team-not-answered {
-          background: #f59e0b;
-          color: white;
-        }
-        .team-last-round {
-          padding: 3px 8px;
-          border-radius: 10px;
-          font-size: 0.8em;
-          margin-top: 5px;
-          font-style: italic;
-        }
-        .team-correct {
-          background: #059669;
-          color: white;
-        }
-        .team-incorrect {
-          background: #dc2626;
-          color: white;
-        }
-        /* New team card states */
-        .team-card-neutral {
-          background: #f8fafc;
-          border-color: #e2e8f0;
-        }
-        .team-card-neutral::before {
-          background: #94a3b8;
-        }
-        .team-card-answered-during-timer {
-          background: #f0fdf4;
-          border-color: #bbf7d0;
-        }
-        .team-card-answered-during-timer::before {
-          background: #22c55e;
-        }
-        .team-card-results {
-          background: white;
-          border-color: #f1f5f9;
-        }
-        .team-card-results::before {
-          background: #2563eb;
-        }
-        
-        /* Streak indicator */
-        .streak-indicator {
-          display: flex;
-          align-items: center;
-          gap: 4px;
-          background: #fb923c;
-          color: white;
-          padding: 2px 8px;
-          border-radius: 12px;
-          font-size: 0.9em;
-          font-weight: 700;
-          margin-left: 8px;
-          animation: streak-pop-in 0.3s ease-out;
-        }
-
-        .streak-indicator ha-icon {
-          --mdc-icon-size: 16px;
-          animation: fire-flicker 1.5s infinite;
-        }
-
-        @keyframes streak-pop-in {
-          from { transform: scale(0.5); opacity: 0; }
-          to { transform: scale(1); opacity: 1; }
-        }
-
-        @keyframes fire-flicker {
-          0%, 100% { color: #f97316; }
-          50% { color: #fef3c7; }
-        }
-        
-        /* Team answer status during timer */
-        .team-answer-status {
-          padding: 4px 8px;
-          border-radius: 12px;
-          font-size: 0.8em;
-          font-weight: 600;
-          text-transform: uppercase;
-          letter-spacing: 0.5px;
-          background: #e2e8f0;
-          color: #475569;
-        }
-        /* Current answer display */
-        .team-current-answer {
-          padding: 4px 8px;
-          border-radius: 12px;
-          font-size: 0.8em;
-          font-weight: 600;
-          background: #dbeafe;
-          color: #1d4ed8;
-        }
-        /* Team status area for compact layout */
-        .team-status-area {
-          display: flex;
-          flex-direction: column;
-          gap: 4px;
-          align-items: flex-end;
-          min-width: 140px;
-        }
-        /* Badge container */
-        .team-badges {
-          display: flex;
-          gap: 6px;
-          justify-content: flex-end;
-        }
-        /* Individual badges */
-        .team-answer-badge, .team-points-badge {
-          padding: 4px 8px;
-          border-radius: 12px;
-          font-size: 0.8em;
-          font-weight: 700;
-          text-transform: uppercase;
-          letter-spacing: 0.5px;
-        }
-        .badge-correct {
-          background: #059669;
-          color: white;
-        }
-        .badge-incorrect {
-          background: #dc2626;
-          color: white;
-        }
-        .game-controls {
-          display: flex;
-          gap: 16px;
-          justify-content: center;
-          flex-wrap: wrap;
-          margin-top: 32px;
-        }
-        .control-button {
-          padding: 16px 32px;
-          border: none;
-          border-radius: 12px;
-          cursor: pointer;
-          font-weight: 700;
-          font-size: 1.1em;
-          transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
-          box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-          text-transform: uppercase;
-          letter-spacing: 0.5px;
-          position: relative;
-          overflow: hidden;
-        }
-        .control-button::before {
-          content: '';
-          position: absolute;
-          top: 0;
-          left: -100%;
-          width: 100%;
-          height: 100%;
-          background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-          transition: left 0.5s;
-        }
-        .control-button:hover::before {
-          left: 100%;
-        }
-        .primary-button {
-          background: #2563eb;
-          color: white;
-        }
-        .secondary-button {
-          background: #dc2626;
-          color: white;
-        }
-        .control-button:hover {
-          transform: translateY(-2px);
-          box-shadow: 0 8px 32px rgba(0, 0, 0, 0.2);
-        }
-        .control-button:active {
-          transform: translateY(0);
-          box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-        }
-        .fun-fact {
-          background: rgba(37, 99, 235, 0.05);
-          padding: 20px;
-          border-radius: 12px;
-          margin-top: 24px;
-          border-left: 4px solid #2563eb;
-          box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
-        }
-        .fun-fact-title {
-          font-weight: 700;
-          margin-bottom: 12px;
-          color: var(--primary-text-color);
-          font-size: 1.1em;
-        }
-        .team-management-section {
-          border: 1px solid #f1f5f9;
-          border-radius: 12px;
-          margin-bottom: 24px;
-          overflow: hidden;
-          background: white;
-          box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
-        }
-        .section-header {
-          background: #f8fafc;
-          padding: 20px 24px;
-          cursor: pointer;
-          display: flex;
-          justify-content: space-between;
-          align-items: center;
-          transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
-          border-bottom: 1px solid #e2e8f0;
-        }
-        .section-header:hover {
-          background: #f1f5f9;
-          transform: translateY(-1px);
-        }
-        .section-header h3 {
-          margin: 0;
-          color: var(--primary-text-color);
-          font-size: 1.2em;
-          font-weight: 700;
-        }
-        .expand-icon {
-          font-size: 1.3em;
-          color: #2563eb;
-          transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
-          font-weight: bold;
-        }
-        .team-management-content {
-          padding: 24px;
-          background: white;
-        }
-        .team-count-section, .team-setup-section {
-          margin-bottom: 20px;
-        }
-        .management-input-header {
-          display: flex;
-          align-items: center;
-          margin-bottom: 12px;
-        }
-        .management-input-header h4 {
-          margin: 0 0 0 12px;
-          font-size: 1.1em;
-          font-weight: 700;
-          color: var(--primary-text-color);
-        }
-        .management-input-header .input-icon {
-          --mdc-icon-size: 20px;
-          color: #2563eb;
-        }
-        .input-description {
-          margin: 0 0 12px 0;
-          opacity: 0.7;
-          font-size: 0.9em;
-          color: var(--secondary-text-color, #64748b);
-        }
-        .form-select, .main-team-input, .main-team-select {
-          width: 100%;
-          padding: 10px;
-          border: 1px solid var(--divider-color);
-          border-radius: 6px;
-          background: var(--card-background-color, white);
-          color: var(--primary-text-color, #1e293b);
-          font-size: 14px;
-          box-sizing: border-box;
-          transition: all 0.2s ease;
-        }
-        .form-select:focus, .main-team-input:focus, .main-team-select:focus {
-          outline: none;
-          border-color: #2563eb;
-          box-shadow: 0 0 0 2px rgba(37, 99, 235, 0.1);
-        }
-        .main-teams-container {
-          display: grid;
-          gap: 12px;
-        }
-        .main-team-item {
-          display: grid;
-          grid-template-columns: auto 1fr 1fr;
-          gap: 12px;
-          align-items: center;
-          background: var(--secondary-background-color, #f5f5f5);
-          padding: 12px;
-          border-radius: 6px;
-          border: 1px solid var(--divider-color);
-        }
-        .main-team-item:hover {
-          background: var(--divider-color, #e0e0e0);
-        }
-        .main-team-item .team-label {
-          font-weight: 600;
-          white-space: nowrap;
-          color: var(--primary-text-color, #1e293b);
-        }
-        
-        /* Points Animation Styles */
-        .points-animator {
-          position: absolute;
-          z-index: 9999;
-          background: linear-gradient(135deg, #059669, #047857);
-          color: white;
-          padding: 8px 12px;
-          border-radius: 20px;
-          font-weight: 800;
-          font-size: 1.1em;
-          text-align: center;
-          box-shadow: 0 4px 20px rgba(5, 150, 105, 0.4);
-          border: 2px solid rgba(255, 255, 255, 0.3);
-          pointer-events: none;
-          opacity: 0;
-          transform: scale(0);
-          transition: all 0.8s cubic-bezier(0.4, 0.0, 0.2, 1);
-          white-space: nowrap;
-          letter-spacing: 0.5px;
-          text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }
-        
-        @media (max-width: 768px) {
-          .main-team-item {
-            grid-template-columns: 1fr;
-            text-align: center;
-            gap: 8px;
-          }
-          .main-team-item .team-label {
-            text-align: center;
-          }
-        }
-        
-        /* Enhanced Mobile Responsiveness */
-        @media (max-width: 480px) {
-          .game-header {
-            padding: 32px 16px;
-          }
-          .game-title {
-            font-size: 2.2em;
-          }
-          .game-content {
-            padding: 24px 16px;
-          }
-          .question-category {
-            font-size: 0.9em;
-          }
-          .question-text {
-            font-size: 1.2em;
-            padding: 20px;
-          }
-          .answer-button {
-            padding: 16px 20px;
-            font-size: 1em;
-          }
-          .teams-grid {
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 8px;
-          }
-          .team-card {
-            padding: 10px 12px;
-            grid-template-columns: auto auto 1fr auto;
-            gap: 8px;
-          }
-          .other-teams-grid .team-card {
-            grid-template-columns: auto 1fr auto;
-            gap: 8px;
-          }
-          .leader-card {
-            transform: scale(1.02);
-            margin-bottom: 16px;
-          }
-          .leader-crown {
-            font-size: 1.5em;
-            top: -12px;
-          }
-          .team-status-area {
-            min-width: 100px;
-          }
-          .control-button {
-            padding: 14px 24px;
-            font-size: 1em;
-          }
-          .game-controls {
-            flex-direction: column;
-            gap: 12px;
-          }
-          .game-controls .control-button {
-            width: 100%;
-          }
-          .section-header {
-            padding: 16px 20px;
-          }
-          .team-management-content {
-            padding: 20px 16px;
-          }
-        }
-        
-        /* Extra small screens - horizontal scroll for teams */
-        @media (max-width: 320px) {
-          .other-teams-grid {
-            gap: 8px;
-          }
-          .team-card {
-            scroll-snap-align: start;
-            min-width: 240px;
-          }
-          .other-teams-grid .team-card {
-            min-width: 240px;
-          }
-          .leader-card {
-            transform: scale(1.0);
-            margin-bottom: 12px;
-          }
-        }
-      </style>
-      
-      <div class="${containerClasses}">
+    this.mountScreen('game', GAME_STYLES, `
+      <div class="game-container" data-slot="container">
         <div class="game-header">
           <div class="header-decorations">
             <div class="header-particle"></div>
@@ -2256,49 +1483,58 @@ class HomeTriviaCard extends HTMLElement {
             <div class="header-particle"></div>
             <div class="header-particle"></div>
           </div>
-          <div class="game-title">${this.t('gameTitle')}</div>
-          <div class="game-status">${gameStatus ? gameStatus.state : this.t('loading_')}</div>
+          <div class="game-title" data-slot="title"></div>
+          <div class="game-status" data-slot="status"></div>
         </div>
         
         <div class="game-content">
-          ${this.renderQuestionSection(currentQuestion, countdown)}
-          ${this.renderTeamsSection()}
-          ${this.renderGameSettings()}
-          ${this.renderTeamManagement()}
-          ${this.renderGameControls(gameStatus, countdown)}
+          <div class="card-region" data-region="question"></div>
+          <div class="card-region" data-region="teams"></div>
+          <div class="card-region" data-region="settings"></div>
+          <div class="card-region" data-region="team-management"></div>
+          <div class="card-region" data-region="controls"></div>
         </div>
       </div>
-    `;
+    `);
+    this.setSlotAttribute('container', 'class', containerClasses);
+    this.setSlotText('title', this.t('gameTitle'));
+    this.setSlotText('status', gameStatus ? gameStatus.state : this.t('loading_'));
+    this.patchRegion('question', this.renderQuestionSection(currentQuestion, countdown));
+    this.patchRegion('teams', this.renderTeamsSection());
+    this.patchRegion('settings', this.renderGameSettings());
+    this.patchRegion('team-management', this.renderTeamManagement());
+    this.patchRegion('controls', this.renderGameControls(gameStatus, countdown));
     
     // Add event listeners for team management and game settings
     setTimeout(() => {
       const teamCountSelect = this.shadowRoot.getElementById('main-team-count-select');
       if (teamCountSelect) {
-        teamCountSelect.addEventListener('change', (e) => {
+        // Assigned rather than added, as the patched select is kept between renders
+        teamCountSelect.onchange = (e) => {
           const teamCount = parseInt(e.target.value);
           
           // Persist team count immediately (same logic as splash screen)
           this.debouncedServiceCall('main_team_count', () => {
-            this._hass.callService('home_trivia', 'update_team_count', {
+            this.callGameService('update_team_count', {
               team_count: teamCount
             });
           }, 100);
           
           // Update team setup display immediately (same logic as splash screen)
           this.updateMainTeamSetup(teamCount);
-        });
+        };
       }
 
       // Add event listener for game settings timer
       const gameSettingsTimerSelect = this.shadowRoot.getElementById('game-settings-timer-select');
       if (gameSettingsTimerSelect) {
-        gameSettingsTimerSelect.addEventListener('change', (e) => {
+        gameSettingsTimerSelect.onchange = (e) => {
           // Store pending value optimistically
           this._pendingFormValues.timerLength = e.target.value;
           
           // Persist timer length immediately
           this.debouncedServiceCall('game_settings_timer_length', () => {
-            this._hass.callService('home_trivia', 'update_countdown_timer_length', {
+            this.callGameService('update_countdown_timer_length', {
               timer_length: parseInt(e.target.value)
             }).then(() => {
               // Clear pending value when backend confirms
@@ -2307,13 +1543,13 @@ class HomeTriviaCard extends HTMLElement {
               // Keep pending value on error - user can retry
             });
           }, 500); // Same delay as splash screen
-        });
+        };
       }
     }, 0);
   }
 
   renderSummaryScreen() {
-    const gameStatus = this._hass.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     const summary = gameStatus?.attributes?.game_summary || {};
     const teams = this.getTeams();
 
@@ -2328,220 +1564,44 @@ class HomeTriviaCard extends HTMLElement {
 
     const winner = sortedTeams.length > 0 ? sortedTeams[0] : null;
 
-    this.shadowRoot.innerHTML = `
-      <style>
-        .summary-container {
-          text-align: center;
-          padding: 32px;
-          background: linear-gradient(135deg, #059669 0%, #047857 100%);
-          border-radius: var(--ha-card-border-radius, 12px);
-          color: white;
-          min-height: 500px;
-          box-shadow: 0 10px 25px rgba(5, 150, 105, 0.15);
-        }
-
-        .summary-header {
-          margin-bottom: 24px;
-        }
-
-        .summary-header h1 {
-          font-size: 2.8rem;
-          margin: 0;
-          text-shadow: 
-            2px 2px 4px rgba(0,0,0,0.4),
-            0 4px 8px rgba(0,0,0,0.3),
-            0 0 30px rgba(255,255,255,0.1);
-          font-weight: 900;
-          background: linear-gradient(45deg, #ffffff 30%, #f0f9ff 50%, #ffffff 70%);
-          background-size: 200% 200%;
-          -webkit-background-clip: text;
-          -webkit-text-fill-color: transparent;
-          background-clip: text;
-          animation: summaryTitleGlow 3s ease-in-out infinite;
-        }
-        @keyframes summaryTitleGlow {
-          0%, 100% { background-position: 0% 50%; }
-          50% { background-position: 100% 50%; }
-        }
-
-        .summary-header p {
-          font-size: 1.3rem;
-          margin: 8px 0;
-          opacity: 0.95;
-          font-weight: 600;
-          text-shadow: 0 1px 3px rgba(0,0,0,0.2);
-        }
-
-        .winner-section {
-          background: rgba(255,255,255,0.1);
-          border-radius: 16px;
-          padding: 24px;
-          margin: 20px 0;
-          backdrop-filter: blur(10px);
-        }
-
-        .winner-trophy {
-          font-size: 4rem;
-          color: #fbbf24;
-          margin-bottom: 16px;
-          filter: drop-shadow(2px 2px 4px rgba(0,0,0,0.3));
-          animation: bounce 2s infinite;
-        }
-
-        @keyframes bounce {
-          0%, 20%, 50%, 80%, 100% { transform: translateY(0); }
-          40% { transform: translateY(-10px); }
-          60% { transform: translateY(-5px); }
-        }
-
-        .winner-section h2 {
-          font-size: 1.8rem;
-          margin: 0 0 8px 0;
-          color: #fbbf24;
-        }
-
-        .winner-name {
-          font-size: 2.2rem;
-          font-weight: bold;
-          margin: 8px 0;
-        }
-
-        .winner-points {
-          font-size: 1.5rem;
-          color: #fbbf24;
-          font-weight: bold;
-        }
-
-        .mvp-section {
-          background: rgba(255,255,255,0.08);
-          border-radius: 12px;
-          padding: 20px;
-          margin: 20px 0;
-        }
-
-        .mvp-section h3 {
-          font-size: 1.4rem;
-          margin: 0 0 12px 0;
-          color: #fbbf24;
-        }
-
-        .mvp-name {
-          font-size: 1.3rem;
-          font-weight: bold;
-          margin: 8px 0;
-        }
-
-        .mvp-stat {
-          font-size: 1rem;
-          opacity: 0.9;
-        }
-
-        .final-rankings {
-          background: rgba(255,255,255,0.05);
-          border-radius: 12px;
-          padding: 20px;
-          margin: 20px 0;
-          text-align: left;
-        }
-
-        .final-rankings h3 {
-          text-align: center;
-          font-size: 1.4rem;
-          margin: 0 0 16px 0;
-          color: #fbbf24;
-        }
-
-        .ranking-item {
-          display: flex;
-          align-items: center;
-          justify-content: space-between;
-          padding: 12px 16px;
-          margin: 8px 0;
-          background: rgba(255,255,255,0.1);
-          border-radius: 8px;
-          backdrop-filter: blur(5px);
-        }
-
-        .ranking-item .rank {
-          font-size: 1.2rem;
-          font-weight: bold;
-          width: 40px;
-          color: #fbbf24;
-        }
-
-        .ranking-item .name {
-          font-size: 1.1rem;
-          font-weight: bold;
-          flex-grow: 1;
-          margin-left: 12px;
-        }
-
-        .ranking-item .stat {
-          font-size: 0.9rem;
-          opacity: 0.8;
-          margin: 0 12px;
-        }
-
-        .ranking-item .points {
-          font-size: 1rem;
-          font-weight: bold;
-          color: #fbbf24;
-          min-width: 60px;
-          text-align: right;
-        }
-
-        .control-button {
-          background: #2563eb;
-          color: white;
-          border: none;
-          padding: 16px 32px;
-          border-radius: 12px;
-          font-size: 1.1rem;
-          font-weight: bold;
-          cursor: pointer;
-          margin-top: 24px;
-          transition: all 0.3s ease;
-          box-shadow: 0 4px 12px rgba(37, 99, 235, 0.3);
-        }
-
-        .control-button:hover {
-          background: #1d4ed8;
-          transform: translateY(-2px);
-          box-shadow: 0 6px 16px rgba(37, 99, 235, 0.4);
-        }
-
-        .control-button:active {
-          transform: translateY(0);
-        }
-      </style>
+    this.mountScreen('summary', SUMMARY_STYLES, `
       <div class="summary-container">
         <div class="summary-header">
           <h1>🎉 Game Over!</h1>
           <p>Final Results</p>
         </div>
 
-        ${winner ? `
+        <div class="card-region" data-region="winner"></div>
+        <div class="card-region" data-region="mvp"></div>
+
+        <div class="final-rankings">
+          <h3>📊 Final Rankings</h3>
+          <div class="card-region" data-region="rankings"></div>
+        </div>
+
+        <button class="control-button" onclick="this.getRootNode().host.startNewGame()">
+          🚀 Start New Game
+        </button>
+      </div>
+    `);
+    this.patchRegion('winner', winner ? `
         <div class="winner-section">
           <div class="winner-trophy">🏆</div>
           <h2>WINNER</h2>
           <div class="winner-name">${this.escapeHtml(winner.name)}</div>
           <div class="winner-points">${winner.points} PTS</div>
         </div>
-        ` : ''}
-
-        ${summary.mvp && summary.mvp.name !== 'N/A' ? `
+        ` : '');
+    this.patchRegion('mvp', summary.mvp && summary.mvp.name !== 'N/A' ? `
         <div class="mvp-section">
           <h3>⭐ Most Valuable Player</h3>
           <div class="mvp-name">${this.escapeHtml(summary.mvp.name)}</div>
           <div class="mvp-stat">${summary.mvp.score} Correct Answers</div>
         </div>
-        ` : ''}
-
-        <div class="final-rankings">
-          <h3>📊 Final Rankings</h3>
-          ${sortedTeams.map((team, index) => {
-            const teamSummary = summary.team_stats?.[`home_trivia_team_${team.team_number}`] || {};
-            return `
+        ` : '');
+    this.patchRegion('rankings', sortedTeams.map((team, index) => {
+      const teamSummary = summary.team_stats?.[`home_trivia_team_${team.team_number}`] || {};
+      return `
             <div class="ranking-item">
               <span class="rank">#${index + 1}</span>
               <span class="name">${this.escapeHtml(team.name)}</span>
@@ -2549,20 +1609,13 @@ class HomeTriviaCard extends HTMLElement {
               <span class="points">${team.points} pts</span>
             </div>
             `;
-          }).join('')}
-        </div>
-
-        <button class="control-button" onclick="this.getRootNode().host.startNewGame()">
-          🚀 Start New Game
-        </button>
-      </div>
-    `;
+    }).join(''));
   }
 
   startNewGame() {
     // Reset to splash screen by calling reset game service
     if (this._hass) {
-      this._hass.callService('home_trivia', 'reset_game', {});
+      this.callGameCommand('reset_game');
     }
   }
 
@@ -2576,7 +1629,7 @@ class HomeTriviaCard extends HTMLElement {
       `;
     }
 
-    const timeLeft = countdown ? countdown.state : 0;
+    const timeLeft = this.getCountdownTimeLeft(countdown);
     const isRunning = countdown ? countdown.attributes.is_running : false;
     const isTimeUp = timeLeft <= 0;
     
@@ -2584,7 +1637,7 @@ class HomeTriviaCard extends HTMLElement {
     // First try to get initial time from countdown sensor attributes (more accurate)
     // Fall back to timer sensor state for initial setup
     const initialTime = countdown?.attributes?.initial_time;
-    const timerSensor = this._hass?.states['sensor.home_trivia_countdown_timer'];
+    const timerSensor = this.getState('countdown_timer');
     const timerLength = initialTime || parseInt(timerSensor?.state || '30');
     
     // Calculate progress percentage (0-100)
@@ -2619,7 +1672,9 @@ class HomeTriviaCard extends HTMLElement {
 
     if (!isTimeUp) {
       // Get current user's team selected answer
-      const selectedAnswer = this.getCurrentUserTeamAnswer();
+      const refused = this._refusedAnswer;
+      const answerFinal = refused && refused.questionId === currentQuestion.attributes.question_id;
+      const selectedAnswer = answerFinal ? refused.answer : this.getCurrentUserTeamAnswer();
       
       html += `
         <div class="answers-grid">
@@ -2633,6 +1688,7 @@ class HomeTriviaCard extends HTMLElement {
             C) ${currentQuestion.attributes.answer_c}
           </div>
         </div>
+        ${answerFinal ? `<div class="answer-final">${this.t('answerFinal')}: ${this.escapeHtml(refused.answer)}</div>` : ''}
       `;
     } else {
       // Show correct answer and fun fact
@@ -2658,17 +1714,17 @@ class HomeTriviaCard extends HTMLElement {
 
   renderTeamsSection() {
     // Check if timer is currently running to hide answer details
-    const countdown = this._hass.states['sensor.home_trivia_countdown_current'];
+    const countdown = this.getState('countdown_current');
     const isTimerRunning = countdown && countdown.attributes && countdown.attributes.is_running;
     
     // Get current team count setting to ensure we don't show extra teams
-    const gameStatus = this._hass?.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     const currentTeamCount = gameStatus?.attributes?.team_count || 2;
     
     // Get all participating teams and their data
     const allTeams = [];
-    for (let i = 1; i <= Math.min(5, currentTeamCount); i++) {
-      const team = this._hass.states[`sensor.home_trivia_team_${i}`];
+    for (let i = 1; i <= currentTeamCount; i++) {
+      const team = this.getState(`team_${i}`);
       if (team && team.attributes.participating) {
         allTeams.push({
           team_number: i,
@@ -2679,7 +1735,8 @@ class HomeTriviaCard extends HTMLElement {
           last_round_answer: team.attributes.last_round_answer,
           last_round_correct: team.attributes.last_round_correct,
           last_round_points: team.attributes.last_round_points || 0,
-          correct_answer_streak: team.attributes.correct_answer_streak || 0
+          correct_answer_streak: team.attributes.correct_answer_streak || 0,
+          answer_rank: team.attributes.answer_rank || 0
         });
       }
     }
@@ -2691,9 +1748,21 @@ class HomeTriviaCard extends HTMLElement {
 
     let html = '<div class="leaderboard-container">';
 
+    // The MVP is kept up to date by the integration as rounds are scored
+    const mvp = gameStatus?.attributes?.mvp;
+    if (mvp) {
+      const tied = mvp.tied_user_ids?.length || 0;
+      html += `
+        <div class="live-mvp">
+          <span>${this.t('currentMvp')}:</span>
+          <strong>${this.escapeHtml(mvp.name)}</strong>
+          <span>${mvp.score} ✓${tied ? ` (+${tied})` : ''}</span>
+        </div>`;
+    }
+
     // Render the leader card
     if (leader) {
-      const { team_number, name, points, answered, answer, last_round_answer, last_round_correct, last_round_points, correct_answer_streak } = leader;
+      const { team_number, name, points, answered, answer, last_round_answer, last_round_correct, last_round_points, correct_answer_streak, answer_rank } = leader;
       
       let cardClasses = 'team-card leader-card rank-1 team-' + team_number;
       if (isTimerRunning) {
@@ -2721,7 +1790,7 @@ class HomeTriviaCard extends HTMLElement {
       if (isTimerRunning) {
         html += `
           <div class="team-answer-status">
-            ${answered ? this.t('answered') : this.t('notAnswered')}
+            ${this.answerStatusLabel(answered, answer_rank)}
           </div>`;
       } else {
         if (answered && answer) {
@@ -2754,7 +1823,7 @@ class HomeTriviaCard extends HTMLElement {
     html += '<div class="other-teams-grid">';
     otherTeams.forEach((team, index) => {
       const rank = index + 2; // Rank starts from 2 for this list
-      const { team_number, name, points, answered, answer, last_round_answer, last_round_correct, last_round_points, correct_answer_streak } = team;
+      const { team_number, name, points, answered, answer, last_round_answer, last_round_correct, last_round_points, correct_answer_streak, answer_rank } = team;
       
       // Calculate score percentage relative to leader for progress bar
       const maxScore = leader ? leader.points : 1;
@@ -2800,7 +1869,7 @@ class HomeTriviaCard extends HTMLElement {
       if (isTimerRunning) {
         html += `
           <div class="team-answer-status">
-            ${answered ? this.t('answered') : this.t('notAnswered')}
+            ${this.answerStatusLabel(answered, answer_rank)}
           </div>`;
       } else {
         if (answered && answer) {
@@ -2848,7 +1917,7 @@ class HomeTriviaCard extends HTMLElement {
 
   renderTeamManagementContent() {
     // Get current values from Home Assistant entities (same logic as splash screen)
-    const gameStatus = this._hass?.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     const currentTeamCount = gameStatus?.attributes?.team_count || 2;
     
     const teams = this.getTeams();
@@ -2864,11 +1933,7 @@ class HomeTriviaCard extends HTMLElement {
           </div>
           <p class="input-description">${this.t('teamCountHint')}</p>
           <select class="form-select" id="main-team-count-select">
-            <option value="1" ${currentTeamCount === 1 ? 'selected' : ''}>1 ${this.t('team')}</option>
-            <option value="2" ${currentTeamCount === 2 ? 'selected' : ''}>2 ${this.t('team')}s</option>
-            <option value="3" ${currentTeamCount === 3 ? 'selected' : ''}>3 ${this.t('team')}s</option>
-            <option value="4" ${currentTeamCount === 4 ? 'selected' : ''}>4 ${this.t('team')}s</option>
-            <option value="5" ${currentTeamCount === 5 ? 'selected' : ''}>5 ${this.t('team')}s</option>
+            ${this.renderTeamCountOptions(currentTeamCount)}
           </select>
         </div>
         
@@ -2934,7 +1999,7 @@ class HomeTriviaCard extends HTMLElement {
 
   renderGameSettingsContent() {
     // Get current timer length from Home Assistant entity
-    const timerSensor = this._hass?.states['sensor.home_trivia_countdown_timer'];
+    const timerSensor = this.getState('countdown_timer');
     const currentTimerLength = this.getEffectiveFormValue('timerLength', null, timerSensor?.state || '30');
     
     // Get the flag for the opposite language
@@ -3063,8 +2128,9 @@ class HomeTriviaCard extends HTMLElement {
     const currentUserId = this._hass.user.id;
     
     // Check each team to see if current user is assigned to it
-    for (let i = 1; i <= 5; i++) {
-      const teamState = this._hass.states[`sensor.home_trivia_team_${i}`];
+    const teamCount = this.getTeamCount();
+    for (let i = 1; i <= teamCount; i++) {
+      const teamState = this.getState(`team_${i}`);
       if (teamState && teamState.attributes.user_id === currentUserId) {
         return teamState.attributes.answer;
       }
@@ -3084,8 +2150,9 @@ class HomeTriviaCard extends HTMLElement {
     let userTeamId = null;
 
     // Check each team to see if current user is assigned to it
-    for (let i = 1; i <= 5; i++) {
-      const teamState = this._hass.states[`sensor.home_trivia_team_${i}`];
+    const teamCount = this.getTeamCount();
+    for (let i = 1; i <= teamCount; i++) {
+      const teamState = this.getState(`team_${i}`);
       if (teamState && teamState.attributes.user_id === currentUserId) {
         userTeamId = `team_${i}`;
         break;
@@ -3099,38 +2166,57 @@ class HomeTriviaCard extends HTMLElement {
     }
 
     try {
-      await this._hass.callService('home_trivia', 'update_team_answer', {
+      const ack = await this.callGameCommand('submit_answer', {
         team_id: userTeamId,
         answer: answer
       });
-      console.log(`Answer ${answer} selected for ${userTeamId}`);
+      if (!ack.accepted) {
+        // Buzzer mode: the team's first answer stands, show which one was recorded
+        this._refusedAnswer = {
+          questionId: this.getState('current_question')?.attributes?.question_id,
+          answer: ack.answer
+        };
+        console.log(`Answer ${answer} refused for ${userTeamId}, ${ack.answer} was recorded first`);
+        this.requestUpdate();
+        return;
+      }
+      this._refusedAnswer = null;
+      console.log(`Answer ${answer} selected for ${userTeamId} with ${ack.answer_time_remaining}s remaining`);
     } catch (error) {
       console.error('Failed to submit answer:', error);
     }
   }
 
   async nextQuestion() {
-    await this._hass.callService('home_trivia', 'next_question', {});
+    // Timed until the new question reaches the card, see recordNextQuestionLatency()
+    this._nextQuestionPressedAt = performance.now();
+    this._nextQuestionFrom = this.getState('current_question')?.attributes?.question_id;
+    try {
+      await this.callGameCommand('next_question');
+    } catch (error) {
+      this._nextQuestionPressedAt = undefined;
+      throw error;
+    }
   }
 
   async stopGame() {
-    await this._hass.callService('home_trivia', 'stop_game', {});
+    await this.callGameCommand('stop_game');
   }
 
   async resetGame() {
-    await this._hass.callService('home_trivia', 'reset_game', {});
+    await this.callGameCommand('reset_game');
   }
 
   async startNewGame() {
     // Start a completely new game which resets everything including team setup
-    await this._hass.callService('home_trivia', 'start_game', {});
+    await this.callGameCommand('start_game');
     // This will reset all team names to defaults and show the splash screen for setup
   }
 
   renderTabletScreen() {
-    const gameStatus = this._hass.states['sensor.home_trivia_game_status'];
-    const currentQuestion = this._hass.states['sensor.home_trivia_current_question'];
-    const countdown = this._hass.states['sensor.home_trivia_countdown_current'];
+    const gameStatus = this.getState('game_status');
+    const currentQuestion = this.getState('current_question');
+    const countdown = this.getState('countdown_current');
     const currentRound = gameStatus?.attributes?.current_round || 1;
     
     // Determine if we should show summary or bar chart
@@ -3138,252 +2224,28 @@ class HomeTriviaCard extends HTMLElement {
     const isActiveRound = currentQuestion && currentQuestion.attributes.question;
     const showBarChart = isActiveRound && currentRound > 1;
     
-    this.shadowRoot.innerHTML = `
-      <style>
-        .tablet-container {
-          font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-          background: var(--ha-card-background, var(--card-background-color, white));
-          border-radius: var(--ha-card-border-radius, 16px);
-          border: none;
-          box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08);
-          overflow: hidden;
-          display: flex;
-          height: 100vh;
-          max-height: 800px;
-        }
-        
-        .tablet-left {
-          flex: 1;
-          padding: 32px;
-          background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
-          color: white;
-          display: flex;
-          flex-direction: column;
-          justify-content: center;
-          align-items: center;
-          text-align: center;
-        }
-        
-        .tablet-right {
-          flex: 1;
-          padding: 32px;
-          background: var(--ha-card-background, white);
-          display: flex;
-          flex-direction: column;
-        }
-        
-        .tablet-timer {
-          font-size: 8rem;
-          font-weight: 800;
-          margin-bottom: 24px;
-          text-shadow: 0 4px 8px rgba(0,0,0,0.3);
-          line-height: 1;
-        }
-        
-        .tablet-timer.warning {
-          color: #fbbf24;
-          animation: warning-pulse 1s infinite;
-        }
-        
-        .tablet-timer.time-up {
-          color: #dc2626;
-          animation: danger-pulse 0.5s infinite;
-        }
-        
-        @keyframes warning-pulse {
-          0%, 100% { opacity: 1; }
-          50% { opacity: 0.7; }
-        }
-        
-        @keyframes danger-pulse {
-          0%, 100% { opacity: 1; transform: scale(1); }
-          50% { opacity: 0.8; transform: scale(1.05); }
-        }
-        
-        .tablet-progress {
-          width: 100%;
-          height: 20px;
-          background: rgba(255,255,255,0.2);
-          border-radius: 10px;
-          overflow: hidden;
-          margin-bottom: 24px;
-        }
-        
-        .tablet-progress-fill {
-          height: 100%;
-          background: linear-gradient(90deg, #10b981, #059669);
-          border-radius: 10px;
-          transition: width 0.3s ease;
-        }
-        
-        .tablet-progress-fill.warning {
-          background: linear-gradient(90deg, #f59e0b, #d97706);
-        }
-        
-        .tablet-progress-fill.danger {
-          background: linear-gradient(90deg, #ef4444, #dc2626);
-        }
-        
-        .tablet-question-info {
-          opacity: 0.9;
-        }
-        
-        .tablet-question-category {
-          font-size: 1.2rem;
-          margin-bottom: 8px;
-          display: flex;
-          align-items: center;
-          justify-content: center;
-          gap: 8px;
-        }
-        
-        .tablet-round-info {
-          font-size: 1.5rem;
-          font-weight: 600;
-          margin-bottom: 16px;
-        }
-        
-        .tablet-ranking-header {
-          font-size: 2.2rem;
-          font-weight: 900;
-          margin-bottom: 24px;
-          text-align: center;
-          color: var(--primary-text-color);
-          text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-          background: linear-gradient(45deg, #1e293b 20%, #475569 50%, #1e293b 80%);
-          background-size: 200% 200%;
-          -webkit-background-clip: text;
-          -webkit-text-fill-color: transparent;
-          background-clip: text;
-          animation: tabletHeaderGlow 4s ease-in-out infinite;
-        }
-        @keyframes tabletHeaderGlow {
-          0%, 100% { background-position: 0% 50%; }
-          50% { background-position: 100% 50%; }
-        }
-        
-        .tablet-ranking-content {
-          flex: 1;
-          overflow-y: auto;
-        }
-        
-        /* Bar chart styles */
-        .bar-chart {
-          display: flex;
-          flex-direction: column;
-          gap: 16px;
-          padding: 20px 0;
-        }
-        
-        .bar-item {
-          display: flex;
-          align-items: center;
-          gap: 16px;
-        }
-        
-        .bar-label {
-          min-width: 120px;
-          font-weight: 600;
-          font-size: 1.1rem;
-        }
-        
-        .bar-container {
-          flex: 1;
-          height: 40px;
-          background: #f1f5f9;
-          border-radius: 20px;
-          overflow: hidden;
-          position: relative;
-        }
-        
-        .bar-fill {
-          height: 100%;
-          border-radius: 20px;
-          transition: width 2s ease;
-          position: relative;
-          display: flex;
-          align-items: center;
-          justify-content: flex-end;
-          padding-right: 12px;
-          color: white;
-          font-weight: bold;
-        }
-        
-        .bar-fill.team-1 { background: linear-gradient(90deg, #3b82f6, #2563eb); }
-        .bar-fill.team-2 { background: linear-gradient(90deg, #10b981, #059669); }
-        .bar-fill.team-3 { background: linear-gradient(90deg, #f59e0b, #d97706); }
-        .bar-fill.team-4 { background: linear-gradient(90deg, #ef4444, #dc2626); }
-        .bar-fill.team-5 { background: linear-gradient(90deg, #8b5cf6, #7c3aed); }
-        
-        .bar-points {
-          font-size: 0.9rem;
-          white-space: nowrap;
-        }
-        
-        /* Summary styles (reuse from main summary screen) */
-        .summary-rankings {
-          background: rgba(0,0,0,0.02);
-          border-radius: 12px;
-          padding: 20px;
-          margin: 20px 0;
-        }
-        
-        .summary-ranking-item {
-          display: flex;
-          align-items: center;
-          justify-content: space-between;
-          padding: 12px 16px;
-          margin: 8px 0;
-          background: white;
-          border-radius: 8px;
-          box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        
-        .summary-rank {
-          font-size: 1.2rem;
-          font-weight: bold;
-          width: 40px;
-          color: #2563eb;
-        }
-        
-        .summary-name {
-          font-size: 1.1rem;
-          font-weight: 600;
-          flex-grow: 1;
-          margin-left: 12px;
-        }
-        
-        .summary-points {
-          font-size: 1.1rem;
-          font-weight: bold;
-          color: #059669;
-        }
-      </style>
-      
+    this.mountScreen('tablet', TABLET_STYLES, `
       <div class="tablet-container">
-        <div class="tablet-left">
-          ${this.renderTabletTimer(countdown, currentQuestion)}
-        </div>
+        <div class="tablet-left" data-region="timer"></div>
         <div class="tablet-right">
-          <div class="tablet-ranking-header">
-            ${showBarChart ? '📊 Live Rankings' : '🏆 Current Standings'}
-          </div>
-          <div class="tablet-ranking-content">
-            ${showBarChart ? this.renderBarChart() : this.renderTabletSummary()}
-          </div>
+          <div class="tablet-ranking-header" data-slot="ranking-header"></div>
+          <div class="tablet-ranking-content" data-region="ranking"></div>
         </div>
       </div>
-    `;
+    `);
+    this.patchRegion('timer', this.renderTabletTimer(countdown, currentQuestion));
+    this.setSlotText('ranking-header', showBarChart ? '📊 Live Rankings' : '🏆 Current Standings');
+    this.patchRegion('ranking', showBarChart ? this.renderBarChart() : this.renderTabletSummary());
   }
   
   renderTabletTimer(countdown, currentQuestion) {
-    const timeLeft = countdown ? countdown.state : 0;
+    const timeLeft = this.getCountdownTimeLeft(countdown);
     const isRunning = countdown ? countdown.attributes.is_running : false;
     const isTimeUp = timeLeft <= 0;
     
     // Get timer length for progress bar calculation
     const initialTime = countdown?.attributes?.initial_time;
-    const timerSensor = this._hass?.states['sensor.home_trivia_countdown_timer'];
+    const timerSensor = this.getState('countdown_timer');
     const timerLength = initialTime || parseInt(timerSensor?.state || '30');
     
     // Calculate progress percentage
@@ -3403,7 +2265,7 @@ class HomeTriviaCard extends HTMLElement {
       progressClasses += ' warning';
     }
     
-    const gameStatus = this._hass.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     const currentRound = gameStatus?.attributes?.current_round || 1;
     
     return `
@@ -3429,13 +2291,13 @@ class HomeTriviaCard extends HTMLElement {
   
   renderTabletSummary() {
     const teams = this.getTeams();
-    const gameStatus = this._hass?.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     const currentTeamCount = gameStatus?.attributes?.team_count || 2;
     
     // Get participating teams and sort by points
     const participatingTeams = [];
     for (let i = 1; i <= currentTeamCount; i++) {
-      const teamState = this._hass.states[`sensor.home_trivia_team_${i}`];
+      const teamState = this.getState(`team_${i}`);
       if (teamState && teamState.attributes.participating) {
         participatingTeams.push({
           team_number: i,
@@ -3462,7 +2324,7 @@ class HomeTriviaCard extends HTMLElement {
   }
   
   renderBarChart() {
-    const gameStatus = this._hass?.states['sensor.home_trivia_game_status'];
+    const gameStatus = this.getState('game_status');
     const currentTeamCount = gameStatus?.attributes?.team_count || 2;
     
     // Get participating teams
@@ -3470,7 +2332,7 @@ class HomeTriviaCard extends HTMLElement {
     let maxPoints = 1; // Minimum for percentage calculation
     
     for (let i = 1; i <= currentTeamCount; i++) {
-      const teamState = this._hass.states[`sensor.home_trivia_team_${i}`];
+      const teamState = this.getState(`team_${i}`);
       if (teamState && teamState.attributes.participating) {
         const points = teamState.attributes.points || 0;
         maxPoints = Math.max(maxPoints, points);
@@ -3510,16 +2372,1666 @@ class HomeTriviaCard extends HTMLElement {
   }
 }
 
-// Register the card
-customElements.define('home-trivia-card', HomeTriviaCard);
+// Styles of every screen, applied once when the screen is first shown, see mountScreen()
+const BASE_STYLES = `
+  .card-region {
+    display: contents;
+  }
+`;
+
+const SPLASH_STYLES = `
+  .splash-screen {
+    text-align: center;
+    padding: 32px;
+    background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
+    border-radius: var(--ha-card-border-radius, 12px);
+    color: white;
+    position: relative;
+    overflow: hidden;
+    min-height: 500px;
+    box-shadow: 0 10px 25px rgba(37, 99, 235, 0.15);
+  }
+
+  .splash-header {
+    position: relative;
+    z-index: 2;
+    margin-bottom: 32px;
+  }
+
+
+
+  .splash-title {
+    font-size: 3em;
+    font-weight: 900;
+    margin-bottom: 16px;
+    text-shadow: 
+      0 2px 8px rgba(0,0,0,0.3),
+      0 4px 16px rgba(0,0,0,0.2),
+      0 0 40px rgba(255,255,255,0.1);
+    letter-spacing: 1px;
+    background: linear-gradient(45deg, #ffffff 20%, #f8fafc 40%, #ffffff 60%, #e2e8f0 80%);
+    background-size: 300% 300%;
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+    animation: splashTitleGlow 5s ease-in-out infinite;
+  }
+  @keyframes splashTitleGlow {
+    0%, 100% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+  }
+
+  .splash-subtitle {
+    font-size: 1.2em;
+    margin-bottom: 20px;
+    opacity: 0.95;
+    font-weight: 600;
+    color: white;
+    text-shadow: 0 1px 4px rgba(0,0,0,0.2);
+    animation: subtitlePulse 3s ease-in-out infinite;
+  }
+  @keyframes subtitlePulse {
+    0%, 100% { opacity: 0.95; }
+    50% { opacity: 1; }
+  }
+
+  .splash-sound-waves {
+    display: flex;
+    justify-content: center;
+    align-items: flex-end;
+    height: 40px;
+    margin: 20px 0;
+    gap: 4px;
+  }
+
+  .wave {
+    width: 4px;
+    background: rgba(255, 255, 255, 0.6);
+    border-radius: 2px;
+    animation: wave 2s ease-in-out infinite;
+  }
+
+  .wave-1 { height: 20px; animation-delay: 0s; }
+  .wave-2 { height: 35px; animation-delay: 0.2s; }
+  .wave-3 { height: 30px; animation-delay: 0.4s; }
+  .wave-4 { height: 25px; animation-delay: 0.6s; }
+  .wave-5 { height: 40px; animation-delay: 0.8s; }
+
+  @keyframes wave {
+    0%, 100% { transform: scaleY(1); }
+    50% { transform: scaleY(1.5); }
+  }
+
+  .splash-setup {
+    background: rgba(255, 255, 255, 0.95);
+    border-radius: 16px;
+    padding: 24px;
+    margin: 20px 0;
+    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
+    color: #1e293b;
+  }
+
+  .setup-message h2 {
+    margin: 0 0 8px 0;
+    font-size: 1.5em;
+    font-weight: 600;
+  }
+
+  .setup-message p {
+    margin: 0 0 20px 0;
+    opacity: 0.9;
+  }
+
+  .splash-input-section {
+    background: rgba(255, 255, 255, 0.95);
+    border-radius: 16px;
+    padding: 24px;
+    margin-bottom: 20px;
+    text-align: left;
+    transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
+    color: #1e293b;
+  }
+
+  .splash-input-section:hover {
+    background: rgba(255, 255, 255, 1.0);
+    border-color: rgba(37, 99, 235, 0.3);
+    transform: translateY(-2px);
+    box-shadow: 0 8px 24px rgba(0, 0, 0, 0.12);
+  }
+
+  .splash-input-section.error {
+    border: 2px solid #ff6b6b;
+    background: rgba(255, 107, 107, 0.2);
+  }
+
+  .splash-input-header {
+    display: flex;
+    align-items: center;
+    margin-bottom: 8px;
+  }
+
+  .splash-input-header h3 {
+    margin: 0 0 0 12px;
+    font-size: 1.3em;
+    font-weight: 700;
+    color: #1e293b;
+  }
+
+  .input-icon {
+    --mdc-icon-size: 24px;
+    color: #2563eb;
+  }
+
+  .input-description {
+    margin: 0 0 16px 0;
+    color: #64748b;
+    font-size: 0.95em;
+    line-height: 1.4;
+  }
+
+  .form-select, .splash-team-input, .splash-team-select {
+    width: 100%;
+    padding: 16px 20px;
+    border: 2px solid rgba(255, 255, 255, 0.2);
+    border-radius: 12px;
+    background: rgba(255, 255, 255, 0.95);
+    color: #2d3748;
+    font-size: 16px;
+    font-weight: 500;
+    box-sizing: border-box;
+    transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
+  }
+
+  .form-select:focus, .splash-team-input:focus, .splash-team-select:focus {
+    outline: none;
+    border-color: #2563eb;
+    box-shadow: 0 0 0 3px rgba(37, 99, 235, 0.1), 0 4px 16px rgba(0, 0, 0, 0.08);
+    background: rgba(255, 255, 255, 1.0);
+    transform: translateY(-1px);
+  }
 
-// Register with Home Assistant
-window.customCards = window.customCards || [];
-window.customCards.push({
-  type: 'home-trivia-card',
-  name: 'Home Trivia Card',
-  description: 'A card for the Home Trivia game'
-});
+  .splash-teams-container {
+    display: grid;
+    gap: 12px;
+  }
+
+  .splash-team-item {
+    display: grid;
+    grid-template-columns: auto 1fr 1fr;
+    gap: 12px;
+    align-items: center;
+    background: rgba(248, 250, 252, 0.8);
+    padding: 12px;
+    border-radius: 8px;
+    border: 1px solid #e2e8f0;
+  }
+
+  .splash-team-item:hover {
+    background: rgba(248, 250, 252, 1.0);
+    border-color: #cbd5e1;
+  }
+
+  .team-label {
+    font-weight: 600;
+    white-space: nowrap;
+    color: #1e293b;
+  }
+
+  .splash-start-button {
+    background: rgba(255, 255, 255, 0.2);
+    border: 2px solid rgba(255, 255, 255, 0.5);
+    color: white;
+    padding: 16px 32px;
+    border-radius: 25px;
+    font-size: 18px;
+    font-weight: bold;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    margin-top: 20px;
+    display: inline-flex;
+    align-items: center;
+    gap: 8px;
+    box-shadow: 0 4px 15px rgba(0, 0, 0, 0.2);
+  }
+
+  .splash-start-button:hover {
+    background: rgba(255, 255, 255, 0.3);
+    border-color: rgba(255, 255, 255, 0.8);
+    transform: translateY(-2px);
+    box-shadow: 0 6px 20px rgba(0, 0, 0, 0.3);
+  }
+
+  .splash-start-button.ready {
+    background: #059669;
+    border-color: #059669;
+    color: white;
+  }
+
+  .splash-start-button.ready:hover {
+    background: #047857;
+    box-shadow: 0 6px 20px rgba(5, 150, 105, 0.3);
+  }
+
+  .start-help {
+    margin: 8px 0 0 0;
+    font-size: 0.9em;
+    opacity: 0.7;
+  }
+
+  .splash-qr-section {
+    background: rgba(255, 255, 255, 0.95);
+    border-radius: 16px;
+    padding: 20px;
+    margin: 20px 0;
+    text-align: center;
+    color: #1e293b;
+    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
+  }
+
+  .qr-header {
+    margin-bottom: 15px;
+  }
+
+  .qr-header h3 {
+    margin: 0 0 8px 0;
+    font-size: 1.3em;
+    font-weight: 600;
+  }
+
+  .qr-header p {
+    margin: 0;
+    font-size: 0.9em;
+    opacity: 0.9;
+  }
+
+  .qr-code-container {
+    background: rgba(255, 255, 255, 0.95);
+    border-radius: 8px;
+    padding: 15px;
+    display: inline-block;
+    margin: 10px 0;
+  }
+
+  .qr-code-container img {
+    display: block;
+    border-radius: 4px;
+  }
+
+  .qr-url {
+    font-family: monospace;
+    font-size: 0.8em;
+    color: rgba(255, 255, 255, 0.8);
+    margin-top: 10px;
+    word-break: break-all;
+  }
+
+  @media (max-width: 768px) {
+    .splash-screen {
+      padding: 24px 16px;
+      min-height: 400px;
+    }
+    .splash-title {
+      font-size: 2.2em;
+    }
+    .splash-subtitle {
+      font-size: 1em;
+    }
+    .splash-input-section {
+      padding: 20px 16px;
+      margin-bottom: 16px;
+    }
+    .splash-input-header h3 {
+      font-size: 1.1em;
+    }
+    .splash-team-item {
+      grid-template-columns: 1fr;
+      text-align: center;
+      gap: 8px;
+    }
+    .team-label {
+      text-align: center;
+    }
+    .splash-qr-section {
+      margin: 15px 0;
+      padding: 15px;
+    }
+    .qr-header h3 {
+      font-size: 1.1em;
+    }
+    .qr-header p {
+      font-size: 0.8em;
+    }
+  }
+
+  @media (max-width: 480px) {
+    .splash-screen {
+      padding: 20px 12px;
+    }
+    .splash-title {
+      font-size: 1.8em;
+    }
+    .splash-input-section {
+      padding: 16px 12px;
+    }
+    .form-select, .splash-team-input, .splash-team-select {
+      padding: 14px 16px;
+      font-size: 15px;
+    }
+  }
+`;
+
+const GAME_STYLES = `
+  .game-container {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Open Sans', 'Helvetica Neue', sans-serif;
+    background: var(--ha-card-background, var(--card-background-color, white));
+    border-radius: var(--ha-card-border-radius, 16px);
+    border: none;
+    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04);
+    overflow: hidden;
+  }
+  .game-header {
+    background: linear-gradient(135deg, #1e40af 0%, #3b82f6 25%, #2563eb 75%, #1d4ed8 100%);
+    color: white;
+    padding: 40px 24px;
+    text-align: center;
+    position: relative;
+    overflow: hidden;
+    box-shadow: 0 4px 20px rgba(37, 99, 235, 0.3);
+  }
+  .game-header::before {
+    content: '';
+    position: absolute;
+    top: -50%;
+    left: -50%;
+    width: 200%;
+    height: 200%;
+    background: 
+      radial-gradient(circle at 30% 20%, rgba(255, 255, 255, 0.1) 0%, transparent 50%),
+      radial-gradient(circle at 70% 80%, rgba(255, 255, 255, 0.08) 0%, transparent 50%);
+    animation: headerShimmer 6s ease-in-out infinite;
+  }
+  @keyframes headerShimmer {
+    0%, 100% { transform: translate(-50%, -50%) rotate(0deg); }
+    50% { transform: translate(-50%, -50%) rotate(180deg); }
+  }
+  .game-title {
+    font-size: 2.8em;
+    font-weight: 900;
+    margin-bottom: 16px;
+    position: relative;
+    z-index: 2;
+    text-shadow: 
+      0 2px 4px rgba(0,0,0,0.3),
+      0 4px 8px rgba(0,0,0,0.2),
+      0 0 40px rgba(255,255,255,0.1);
+    letter-spacing: 1px;
+    background: linear-gradient(45deg, #ffffff 30%, #f1f5f9 50%, #ffffff 70%);
+    background-size: 200% 200%;
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+    animation: titleGlow 4s ease-in-out infinite;
+  }
+  @keyframes titleGlow {
+    0%, 100% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+  }
+  .header-decorations {
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    pointer-events: none;
+    z-index: 1;
+  }
+  .header-particle {
+    position: absolute;
+    width: 4px;
+    height: 4px;
+    background: rgba(255, 255, 255, 0.6);
+    border-radius: 50%;
+    animation: particleFloat 8s linear infinite;
+  }
+  .header-particle:nth-child(1) {
+    left: 10%;
+    animation-delay: 0s;
+    animation-duration: 8s;
+  }
+  .header-particle:nth-child(2) {
+    left: 25%;
+    animation-delay: 2s;
+    animation-duration: 12s;
+  }
+  .header-particle:nth-child(3) {
+    left: 50%;
+    animation-delay: 4s;
+    animation-duration: 10s;
+  }
+  .header-particle:nth-child(4) {
+    left: 75%;
+    animation-delay: 6s;
+    animation-duration: 14s;
+  }
+  .header-particle:nth-child(5) {
+    left: 90%;
+    animation-delay: 1s;
+    animation-duration: 9s;
+  }
+  @keyframes particleFloat {
+    0% {
+      transform: translateY(100px) scale(0);
+      opacity: 0;
+    }
+    10% {
+      opacity: 1;
+    }
+    90% {
+      opacity: 1;
+    }
+    100% {
+      transform: translateY(-100px) scale(1);
+      opacity: 0;
+    }
+  }
+  .game-status {
+    font-size: 1.4em;
+    opacity: 0.95;
+    position: relative;
+    z-index: 2;
+    font-weight: 600;
+    text-shadow: 0 1px 3px rgba(0,0,0,0.3);
+    background: rgba(255, 255, 255, 0.1);
+    padding: 8px 20px;
+    border-radius: 25px;
+    display: inline-block;
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    backdrop-filter: blur(10px);
+  }
+  .game-content {
+    padding: 32px 24px;
+  }
+  .question-section {
+    margin-bottom: 40px;
+    text-align: center;
+  }
+  .question-category {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 8px;
+    font-size: 1.0em;
+    font-weight: 600;
+    margin-bottom: 16px;
+    color: var(--secondary-text-color, #64748b);
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+  }
+  .question-category ha-icon {
+    --mdc-icon-size: 20px;
+    color: var(--primary-color, #2563eb);
+  }
+  .question-text {
+    font-size: 1.4em;
+    margin-bottom: 32px;
+    color: var(--primary-text-color);
+    line-height: 1.5;
+    font-weight: 700;
+    background: var(--card-background-color, #ffffff);
+    padding: 24px;
+    border-radius: 16px;
+    border: 3px solid var(--primary-color, #2563eb);
+    box-shadow: 0 4px 16px rgba(37, 99, 235, 0.1);
+  }
+  .question-ready-title {
+    font-size: 1.3em;
+    font-weight: 600;
+    margin-bottom: 16px;
+    color: var(--secondary-text-color, #64748b);
+  }
+  .question-ready-text {
+    font-size: 1.1em;
+    color: var(--secondary-text-color, #64748b);
+    font-weight: 400;
+    line-height: 1.4;
+  }
+  .answers-grid {
+    display: grid;
+    grid-template-columns: 1fr;
+    gap: 16px;
+    margin-bottom: 24px;
+  }
+  .answer-button {
+    padding: 20px 24px;
+    border: 2px solid #e2e8f0;
+    border-radius: 12px;
+    background: white;
+    cursor: pointer;
+    font-size: 1.1em;
+    font-weight: 600;
+    transition: all 0.15s ease-out;
+    text-align: left;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
+    color: #1e293b;
+  }
+  .answer-button:hover {
+    background: #2563eb;
+    color: white;
+    border-color: #2563eb;
+    transform: translateY(-2px);
+    box-shadow: 0 8px 24px rgba(37, 99, 235, 0.2);
+  }
+  .answer-button.selected {
+    background: #10b981;
+    color: white;
+    border-color: #10b981;
+    box-shadow: 0 4px 16px rgba(16, 185, 129, 0.3);
+  }
+  .answer-button.selected:hover {
+    background: #059669;
+    border-color: #059669;
+    box-shadow: 0 8px 24px rgba(5, 150, 105, 0.3);
+  }
+  }
+  .countdown-timer {
+    text-align: center;
+    font-size: 2em;
+    font-weight: bold;
+    color: #2563eb;
+    margin-bottom: 20px;
+    padding: 10px;
+    border-radius: 8px;
+    transition: all 0.3s ease;
+  }
+  .countdown-timer.time-up {
+    color: #dc2626;
+    background-color: rgba(220, 38, 38, 0.1);
+    animation: pulse-red 1s infinite;
+  }
+  .countdown-timer.warning {
+    color: #f59e0b;
+    background-color: rgba(245, 158, 11, 0.1);
+  }
+  @keyframes pulse-red {
+    0% { transform: scale(1); opacity: 1; }
+    50% { transform: scale(1.05); opacity: 0.8; }
+    100% { transform: scale(1); opacity: 1; }
+  }
+  @keyframes pulse-orange-shadow {
+    0% { box-shadow: 0 8px 32px rgba(245, 158, 11, 0.4), 0 2px 16px rgba(245, 158, 11, 0.2); }
+    50% { box-shadow: 0 12px 40px rgba(245, 158, 11, 0.6), 0 4px 20px rgba(245, 158, 11, 0.4); }
+    100% { box-shadow: 0 8px 32px rgba(245, 158, 11, 0.4), 0 2px 16px rgba(245, 158, 11, 0.2); }
+  }
+  @keyframes pulse-red-shadow {
+    0% { box-shadow: 0 8px 32px rgba(220, 38, 38, 0.4), 0 2px 16px rgba(220, 38, 38, 0.2); }
+    50% { box-shadow: 0 12px 40px rgba(220, 38, 38, 0.6), 0 4px 20px rgba(220, 38, 38, 0.4); }
+    100% { box-shadow: 0 8px 32px rgba(220, 38, 38, 0.4), 0 2px 16px rgba(220, 38, 38, 0.2); }
+  }
+  .warning-pulse {
+    /* animation: pulse-orange-shadow 1.2s infinite; */
+  }
+  .time-up-pulse {
+    /* animation: pulse-red-shadow 1.2s infinite; */
+  }
+  .countdown-progress-container {
+    margin: 10px auto 20px auto;
+    max-width: 300px;
+  }
+  .countdown-progress-bar {
+    width: 100%;
+    height: 8px;
+    background-color: #e2e8f0;
+    border-radius: 4px;
+    overflow: hidden;
+    box-shadow: inset 0 1px 3px rgba(0, 0, 0, 0.2);
+  }
+  .countdown-progress-fill {
+    height: 100%;
+    background: linear-gradient(90deg, #059669, #2563eb);
+    border-radius: 4px;
+    transition: width 0.8s ease-out;
+    box-shadow: 0 1px 3px rgba(0, 0, 0, 0.3);
+  }
+  .countdown-timer.warning + .countdown-progress-container .countdown-progress-fill {
+    background: linear-gradient(90deg, #f59e0b, #dc2626);
+  }
+  .countdown-timer.time-up + .countdown-progress-container .countdown-progress-fill {
+    background: #dc2626;
+    animation: progress-pulse 1s infinite;
+  }
+  @keyframes progress-pulse {
+    0% { opacity: 1; }
+    50% { opacity: 0.5; }
+    100% { opacity: 1; }
+  }
+  @keyframes pulse-orange-shadow {
+    0% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(245, 158, 11, 0.8); }
+    50% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 20px rgba(245, 158, 11, 0.8); }
+    100% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(245, 158, 11, 0.8); }
+  }
+  @keyframes pulse-red-shadow {
+    0% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(220, 38, 38, 0.8); }
+    50% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 25px rgba(220, 38, 38, 0.8); }
+    100% { box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08), 0 2px 16px rgba(0, 0, 0, 0.04), 0 0 0 rgba(220, 38, 38, 0.8); }
+  }
+  .warning-pulse {
+    /* animation: pulse-orange-shadow 1.2s ease-in-out infinite; */
+  }
+  .time-up-pulse {
+    /* animation: pulse-red-shadow 1.2s ease-in-out infinite; */
+  }
+  @keyframes score-update-flash {
+    0% { background-color: #dbeafe; }
+    100% { background-color: transparent; }
+  }
+  .score-updated {
+    animation: score-update-flash 1s ease-out;
+  }
+  @keyframes count-up {
+    from { transform: translateY(5px); opacity: 0.5; }
+    to { transform: translateY(0); opacity: 1; }
+  }
+  .team-points {
+    animation: count-up 0.3s ease-in-out;
+  }
+  .teams-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+    gap: 12px;
+    margin-bottom: 32px;
+    overflow-x: auto;
+    padding-bottom: 8px;
+  }
+  .leaderboard-container {
+    padding: 16px 0;
+  }
+  .live-mvp {
+    display: flex;
+    justify-content: center;
+    gap: 6px;
+    margin-bottom: 16px;
+    font-size: 0.95em;
+    color: var(--secondary-text-color);
+  }
+  .live-mvp strong {
+    color: var(--primary-text-color);
+  }
+  .leader-card {
+    border: 2px solid #ffd700 !important; /* Gold border */
+    background: linear-gradient(145deg, #fffbeb, #fdf2d1) !important;
+    transform: scale(1.05);
+    margin-bottom: 24px;
+    box-shadow: 0 8px 30px rgba(255, 215, 0, 0.3) !important;
+    position: relative;
+  }
+  .leader-crown {
+    position: absolute;
+    top: -15px;
+    left: 50%;
+    transform: translateX(-50%);
+    font-size: 2em;
+    color: #ffd700;
+    filter: drop-shadow(0 2px 3px rgba(0,0,0,0.3));
+  }
+  .other-teams-grid {
+    display: grid;
+    gap: 12px;
+  }
+  .team-info {
+    display: flex;
+    align-items: center;
+    gap: 12px;
+  }
+  .team-score-section {
+    flex: 1;
+    padding-top: 8px;
+  }
+  .score-progress-bar {
+    width: 100%;
+    height: 8px;
+    background-color: #e2e8f0;
+    border-radius: 4px;
+    overflow: hidden;
+    margin-top: 4px;
+  }
+  .score-progress-fill {
+    height: 100%;
+    background: linear-gradient(90deg, #60a5fa, #2563eb);
+    border-radius: 4px;
+    transition: width 0.5s ease-in-out;
+  }
+  .rank-1 .score-progress-fill { 
+    background: linear-gradient(90deg, #fde047, #f59e0b); 
+  }
+  .rank-2 .score-progress-fill { 
+    background: linear-gradient(90deg, #d1d5db, #9ca3af); 
+  }
+  .rank-3 .score-progress-fill { 
+    background: linear-gradient(90deg, #fcd34d, #d97706); 
+  }
+  .team-card {
+    display: grid;
+    grid-template-columns: auto auto 1fr auto auto;
+    gap: 12px;
+    align-items: center;
+    background: white;
+    padding: 12px 16px;
+    border-radius: 8px;
+    border: 1px solid #f1f5f9;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
+    transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
+    position: relative;
+    overflow: hidden;
+  }
+  .other-teams-grid .team-card {
+    display: grid;
+    grid-template-columns: auto 1fr auto;
+    gap: 12px;
+    align-items: start;
+  }
+  .team-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    bottom: 0;
+    width: 4px;
+    background: #2563eb;
+  }
+  .team-card:hover {
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
+    border-color: #e2e8f0;
+    background: rgba(248, 250, 252, 1.0);
+  }
+  .team-name {
+    font-weight: 700;
+    color: var(--primary-text-color, #1e293b);
+    font-size: 1.1em;
+  }
+  .team-points {
+    font-size: 1.1em;
+    color: #2563eb;
+    font-weight: 800;
+  }
+  /* Rank display */
+  .team-rank {
+    font-size: 1.1em;
+    font-weight: 700;
+    color: #64748b;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    min-width: 40px;
+    text-align: center;
+  }
+  /* Medal icon */
+  .team-medal {
+    font-size: 1.3em;
+  }
+  /* Rank-specific styling */
+  .rank-1::before {
+    background: #ffd700 !important; /* Gold */
+  }
+  .rank-1 .team-medal {
+    color: #ffd700;
+  }
+  .rank-2::before {
+    background: #c0c0c0 !important; /* Silver */
+  }
+  .rank-2 .team-medal {
+    color: #c0c0c0;
+  }
+  .rank-3::before {
+    background: #cd7f32 !important; /* Bronze */
+  }
+  .rank-3 .team-medal {
+    color: #cd7f32;
+  }
+  .team-answer {
+    padding: 8px 16px;
+    border-radius: 20px;
+    font-size: 0.9em;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+  }
+  .team-answered {
+    background: #059669;
+    color: white;
+  }
+  .team-not-answered {
+    background: #f59e0b;
+    color: white;
+  }
+  .team-last-round {
+    padding: 3px 8px;
+    border-radius: 10px;
+    font-size: 0.8em;
+    margin-top: 5px;
+    font-style: italic;
+  }
+  .team-correct {
+    background: #059669;
+    color: white;
+  }
+  .team-incorrect {
+    background: #dc2626;
+    color: white;
+  }
+  /* New team card states */
+  .team-card-neutral {
+    background: #f8fafc;
+    border-color: #e2e8f0;
+  }
+  .team-card-neutral::before {
+    background: #94a3b8;
+  }
+  .team-card-answered-during-timer {
+    background: #f0fdf4;
+    border-color: #bbf7d0;
+  }
+  .team-card-answered-during-timer::before {
+    background: #22c55e;
+  }
+  .team-card-results {
+    background: white;
+    border-color: #f1f5f9;
+  }
+  .team-card-results::before {
+    background: #2563eb;
+  }
+
+  /* Streak indicator */
+  .streak-indicator {
+    display: flex;
+    align-items: center;
+    gap: 4px;
+    background: #fb923c;
+    color: white;
+    padding: 2px 8px;
+    border-radius: 12px;
+    font-size: 0.9em;
+    font-weight: 700;
+    margin-left: 8px;
+    animation: streak-pop-in 0.3s ease-out;
+  }
+
+  .streak-indicator ha-icon {
+    --mdc-icon-size: 16px;
+    animation: fire-flicker 1.5s infinite;
+  }
+
+  @keyframes streak-pop-in {
+    from { transform: scale(0.5); opacity: 0; }
+    to { transform: scale(1); opacity: 1; }
+  }
+
+  @keyframes fire-flicker {
+    0%, 100% { color: #f97316; }
+    50% { color: #fef3c7; }
+  }
+
+  /* Team answer status during timer */
+  .team-answer-status {
+    padding: 4px 8px;
+    border-radius: 12px;
+    font-size: 0.8em;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    background: #e2e8f0;
+    color: #475569;
+  }
+  /* Current answer display */
+  .team-current-answer {
+    padding: 4px 8px;
+    border-radius: 12px;
+    font-size: 0.8em;
+    font-weight: 600;
+    background: #dbeafe;
+    color: #1d4ed8;
+  }
+  /* Team status area for compact layout */
+  .team-status-area {
+    display: flex;
+    flex-direction: column;
+    gap: 4px;
+    align-items: flex-end;
+    min-width: 140px;
+  }
+  /* Badge container */
+  .team-badges {
+    display: flex;
+    gap: 6px;
+    justify-content: flex-end;
+  }
+  /* Individual badges */
+  .team-answer-badge, .team-points-badge {
+    padding: 4px 8px;
+    border-radius: 12px;
+    font-size: 0.8em;
+    font-weight: 700;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+  }
+  .badge-correct {
+    background: #059669;
+    color: white;
+  }
+  .badge-incorrect {
+    background: #dc2626;
+    color: white;
+  }
+  .game-controls {
+    display: flex;
+    gap: 16px;
+    justify-content: center;
+    flex-wrap: wrap;
+    margin-top: 32px;
+  }
+  .control-button {
+    padding: 16px 32px;
+    border: none;
+    border-radius: 12px;
+    cursor: pointer;
+    font-weight: 700;
+    font-size: 1.1em;
+    transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
+    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    position: relative;
+    overflow: hidden;
+  }
+  .control-button::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
+    transition: left 0.5s;
+  }
+  .control-button:hover::before {
+    left: 100%;
+  }
+  .primary-button {
+    background: #2563eb;
+    color: white;
+  }
+  .secondary-button {
+    background: #dc2626;
+    color: white;
+  }
+  .control-button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.2);
+  }
+  .control-button:active {
+    transform: translateY(0);
+    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
+  }
+  .answer-final {
+    margin-top: 12px;
+    text-align: center;
+    font-weight: 600;
+    color: var(--warning-color, #d97706);
+  }
+  .fun-fact {
+    background: rgba(37, 99, 235, 0.05);
+    padding: 20px;
+    border-radius: 12px;
+    margin-top: 24px;
+    border-left: 4px solid #2563eb;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
+  }
+  .fun-fact-title {
+    font-weight: 700;
+    margin-bottom: 12px;
+    color: var(--primary-text-color);
+    font-size: 1.1em;
+  }
+  .team-management-section {
+    border: 1px solid #f1f5f9;
+    border-radius: 12px;
+    margin-bottom: 24px;
+    overflow: hidden;
+    background: white;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
+  }
+  .section-header {
+    background: #f8fafc;
+    padding: 20px 24px;
+    cursor: pointer;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
+    border-bottom: 1px solid #e2e8f0;
+  }
+  .section-header:hover {
+    background: #f1f5f9;
+    transform: translateY(-1px);
+  }
+  .section-header h3 {
+    margin: 0;
+    color: var(--primary-text-color);
+    font-size: 1.2em;
+    font-weight: 700;
+  }
+  .expand-icon {
+    font-size: 1.3em;
+    color: #2563eb;
+    transition: all 0.3s cubic-bezier(0.4, 0.0, 0.2, 1);
+    font-weight: bold;
+  }
+  .team-management-content {
+    padding: 24px;
+    background: white;
+  }
+  .team-count-section, .team-setup-section {
+    margin-bottom: 20px;
+  }
+  .management-input-header {
+    display: flex;
+    align-items: center;
+    margin-bottom: 12px;
+  }
+  .management-input-header h4 {
+    margin: 0 0 0 12px;
+    font-size: 1.1em;
+    font-weight: 700;
+    color: var(--primary-text-color);
+  }
+  .management-input-header .input-icon {
+    --mdc-icon-size: 20px;
+    color: #2563eb;
+  }
+  .input-description {
+    margin: 0 0 12px 0;
+    opacity: 0.7;
+    font-size: 0.9em;
+    color: var(--secondary-text-color, #64748b);
+  }
+  .form-select, .main-team-input, .main-team-select {
+    width: 100%;
+    padding: 10px;
+    border: 1px solid var(--divider-color);
+    border-radius: 6px;
+    background: var(--card-background-color, white);
+    color: var(--primary-text-color, #1e293b);
+    font-size: 14px;
+    box-sizing: border-box;
+    transition: all 0.2s ease;
+  }
+  .form-select:focus, .main-team-input:focus, .main-team-select:focus {
+    outline: none;
+    border-color: #2563eb;
+    box-shadow: 0 0 0 2px rgba(37, 99, 235, 0.1);
+  }
+  .main-teams-container {
+    display: grid;
+    gap: 12px;
+  }
+  .main-team-item {
+    display: grid;
+    grid-template-columns: auto 1fr 1fr;
+    gap: 12px;
+    align-items: center;
+    background: var(--secondary-background-color, #f5f5f5);
+    padding: 12px;
+    border-radius: 6px;
+    border: 1px solid var(--divider-color);
+  }
+  .main-team-item:hover {
+    background: var(--divider-color, #e0e0e0);
+  }
+  .main-team-item .team-label {
+    font-weight: 600;
+    white-space: nowrap;
+    color: var(--primary-text-color, #1e293b);
+  }
+
+  /* Points Animation Styles */
+  .points-animator {
+    position: absolute;
+    z-index: 9999;
+    background: linear-gradient(135deg, #059669, #047857);
+    color: white;
+    padding: 8px 12px;
+    border-radius: 20px;
+    font-weight: 800;
+    font-size: 1.1em;
+    text-align: center;
+    box-shadow: 0 4px 20px rgba(5, 150, 105, 0.4);
+    border: 2px solid rgba(255, 255, 255, 0.3);
+    pointer-events: none;
+    opacity: 0;
+    transform: scale(0);
+    transition: all 0.8s cubic-bezier(0.4, 0.0, 0.2, 1);
+    white-space: nowrap;
+    letter-spacing: 0.5px;
+    text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
+  }
+
+  @media (max-width: 768px) {
+    .main-team-item {
+      grid-template-columns: 1fr;
+      text-align: center;
+      gap: 8px;
+    }
+    .main-team-item .team-label {
+      text-align: center;
+    }
+  }
+
+  /* Enhanced Mobile Responsiveness */
+  @media (max-width: 480px) {
+    .game-header {
+      padding: 32px 16px;
+    }
+    .game-title {
+      font-size: 2.2em;
+    }
+    .game-content {
+      padding: 24px 16px;
+    }
+    .question-category {
+      font-size: 0.9em;
+    }
+    .question-text {
+      font-size: 1.2em;
+      padding: 20px;
+    }
+    .answer-button {
+      padding: 16px 20px;
+      font-size: 1em;
+    }
+    .teams-grid {
+      grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+      gap: 8px;
+    }
+    .team-card {
+      padding: 10px 12px;
+      grid-template-columns: auto auto 1fr auto;
+      gap: 8px;
+    }
+    .other-teams-grid .team-card {
+      grid-template-columns: auto 1fr auto;
+      gap: 8px;
+    }
+    .leader-card {
+      transform: scale(1.02);
+      margin-bottom: 16px;
+    }
+    .leader-crown {
+      font-size: 1.5em;
+      top: -12px;
+    }
+    .team-status-area {
+      min-width: 100px;
+    }
+    .control-button {
+      padding: 14px 24px;
+      font-size: 1em;
+    }
+    .game-controls {
+      flex-direction: column;
+      gap: 12px;
+    }
+    .game-controls .control-button {
+      width: 100%;
+    }
+    .section-header {
+      padding: 16px 20px;
+    }
+    .team-management-content {
+      padding: 20px 16px;
+    }
+  }
+
+  /* Extra small screens - horizontal scroll for teams */
+  @media (max-width: 320px) {
+    .other-teams-grid {
+      gap: 8px;
+    }
+    .team-card {
+      scroll-snap-align: start;
+      min-width: 240px;
+    }
+    .other-teams-grid .team-card {
+      min-width: 240px;
+    }
+    .leader-card {
+      transform: scale(1.0);
+      margin-bottom: 12px;
+    }
+  }
+`;
+
+const SUMMARY_STYLES = `
+  .summary-container {
+    text-align: center;
+    padding: 32px;
+    background: linear-gradient(135deg, #059669 0%, #047857 100%);
+    border-radius: var(--ha-card-border-radius, 12px);
+    color: white;
+    min-height: 500px;
+    box-shadow: 0 10px 25px rgba(5, 150, 105, 0.15);
+  }
+
+  .summary-header {
+    margin-bottom: 24px;
+  }
+
+  .summary-header h1 {
+    font-size: 2.8rem;
+    margin: 0;
+    text-shadow: 
+      2px 2px 4px rgba(0,0,0,0.4),
+      0 4px 8px rgba(0,0,0,0.3),
+      0 0 30px rgba(255,255,255,0.1);
+    font-weight: 900;
+    background: linear-gradient(45deg, #ffffff 30%, #f0f9ff 50%, #ffffff 70%);
+    background-size: 200% 200%;
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+    animation: summaryTitleGlow 3s ease-in-out infinite;
+  }
+  @keyframes summaryTitleGlow {
+    0%, 100% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+  }
+
+  .summary-header p {
+    font-size: 1.3rem;
+    margin: 8px 0;
+    opacity: 0.95;
+    font-weight: 600;
+    text-shadow: 0 1px 3px rgba(0,0,0,0.2);
+  }
+
+  .winner-section {
+    background: rgba(255,255,255,0.1);
+    border-radius: 16px;
+    padding: 24px;
+    margin: 20px 0;
+    backdrop-filter: blur(10px);
+  }
+
+  .winner-trophy {
+    font-size: 4rem;
+    color: #fbbf24;
+    margin-bottom: 16px;
+    filter: drop-shadow(2px 2px 4px rgba(0,0,0,0.3));
+    animation: bounce 2s infinite;
+  }
+
+  @keyframes bounce {
+    0%, 20%, 50%, 80%, 100% { transform: translateY(0); }
+    40% { transform: translateY(-10px); }
+    60% { transform: translateY(-5px); }
+  }
+
+  .winner-section h2 {
+    font-size: 1.8rem;
+    margin: 0 0 8px 0;
+    color: #fbbf24;
+  }
+
+  .winner-name {
+    font-size: 2.2rem;
+    font-weight: bold;
+    margin: 8px 0;
+  }
+
+  .winner-points {
+    font-size: 1.5rem;
+    color: #fbbf24;
+    font-weight: bold;
+  }
+
+  .mvp-section {
+    background: rgba(255,255,255,0.08);
+    border-radius: 12px;
+    padding: 20px;
+    margin: 20px 0;
+  }
+
+  .mvp-section h3 {
+    font-size: 1.4rem;
+    margin: 0 0 12px 0;
+    color: #fbbf24;
+  }
+
+  .mvp-name {
+    font-size: 1.3rem;
+    font-weight: bold;
+    margin: 8px 0;
+  }
+
+  .mvp-stat {
+    font-size: 1rem;
+    opacity: 0.9;
+  }
+
+  .final-rankings {
+    background: rgba(255,255,255,0.05);
+    border-radius: 12px;
+    padding: 20px;
+    margin: 20px 0;
+    text-align: left;
+  }
+
+  .final-rankings h3 {
+    text-align: center;
+    font-size: 1.4rem;
+    margin: 0 0 16px 0;
+    color: #fbbf24;
+  }
+
+  .ranking-item {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    padding: 12px 16px;
+    margin: 8px 0;
+    background: rgba(255,255,255,0.1);
+    border-radius: 8px;
+    backdrop-filter: blur(5px);
+  }
+
+  .ranking-item .rank {
+    font-size: 1.2rem;
+    font-weight: bold;
+    width: 40px;
+    color: #fbbf24;
+  }
+
+  .ranking-item .name {
+    font-size: 1.1rem;
+    font-weight: bold;
+    flex-grow: 1;
+    margin-left: 12px;
+  }
+
+  .ranking-item .stat {
+    font-size: 0.9rem;
+    opacity: 0.8;
+    margin: 0 12px;
+  }
+
+  .ranking-item .points {
+    font-size: 1rem;
+    font-weight: bold;
+    color: #fbbf24;
+    min-width: 60px;
+    text-align: right;
+  }
+
+  .control-button {
+    background: #2563eb;
+    color: white;
+    border: none;
+    padding: 16px 32px;
+    border-radius: 12px;
+    font-size: 1.1rem;
+    font-weight: bold;
+    cursor: pointer;
+    margin-top: 24px;
+    transition: all 0.3s ease;
+    box-shadow: 0 4px 12px rgba(37, 99, 235, 0.3);
+  }
+
+  .control-button:hover {
+    background: #1d4ed8;
+    transform: translateY(-2px);
+    box-shadow: 0 6px 16px rgba(37, 99, 235, 0.4);
+  }
+
+  .control-button:active {
+    transform: translateY(0);
+  }
+`;
+
+const TABLET_STYLES = `
+  .tablet-container {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
+    background: var(--ha-card-background, var(--card-background-color, white));
+    border-radius: var(--ha-card-border-radius, 16px);
+    border: none;
+    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08);
+    overflow: hidden;
+    display: flex;
+    height: 100vh;
+    max-height: 800px;
+  }
+
+  .tablet-left {
+    flex: 1;
+    padding: 32px;
+    background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
+    color: white;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+    text-align: center;
+  }
+
+  .tablet-right {
+    flex: 1;
+    padding: 32px;
+    background: var(--ha-card-background, white);
+    display: flex;
+    flex-direction: column;
+  }
+
+  .tablet-timer {
+    font-size: 8rem;
+    font-weight: 800;
+    margin-bottom: 24px;
+    text-shadow: 0 4px 8px rgba(0,0,0,0.3);
+    line-height: 1;
+  }
+
+  .tablet-timer.warning {
+    color: #fbbf24;
+    animation: warning-pulse 1s infinite;
+  }
+
+  .tablet-timer.time-up {
+    color: #dc2626;
+    animation: danger-pulse 0.5s infinite;
+  }
+
+  @keyframes warning-pulse {
+    0%, 100% { opacity: 1; }
+    50% { opacity: 0.7; }
+  }
+
+  @keyframes danger-pulse {
+    0%, 100% { opacity: 1; transform: scale(1); }
+    50% { opacity: 0.8; transform: scale(1.05); }
+  }
+
+  .tablet-progress {
+    width: 100%;
+    height: 20px;
+    background: rgba(255,255,255,0.2);
+    border-radius: 10px;
+    overflow: hidden;
+    margin-bottom: 24px;
+  }
+
+  .tablet-progress-fill {
+    height: 100%;
+    background: linear-gradient(90deg, #10b981, #059669);
+    border-radius: 10px;
+    transition: width 0.3s ease;
+  }
+
+  .tablet-progress-fill.warning {
+    background: linear-gradient(90deg, #f59e0b, #d97706);
+  }
+
+  .tablet-progress-fill.danger {
+    background: linear-gradient(90deg, #ef4444, #dc2626);
+  }
+
+  .tablet-question-info {
+    opacity: 0.9;
+  }
+
+  .tablet-question-category {
+    font-size: 1.2rem;
+    margin-bottom: 8px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 8px;
+  }
+
+  .tablet-round-info {
+    font-size: 1.5rem;
+    font-weight: 600;
+    margin-bottom: 16px;
+  }
+
+  .tablet-ranking-header {
+    font-size: 2.2rem;
+    font-weight: 900;
+    margin-bottom: 24px;
+    text-align: center;
+    color: var(--primary-text-color);
+    text-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    background: linear-gradient(45deg, #1e293b 20%, #475569 50%, #1e293b 80%);
+    background-size: 200% 200%;
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+    animation: tabletHeaderGlow 4s ease-in-out infinite;
+  }
+  @keyframes tabletHeaderGlow {
+    0%, 100% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+  }
+
+  .tablet-ranking-content {
+    flex: 1;
+    overflow-y: auto;
+  }
+
+  /* Bar chart styles */
+  .bar-chart {
+    display: flex;
+    flex-direction: column;
+    gap: 16px;
+    padding: 20px 0;
+  }
+
+  .bar-item {
+    display: flex;
+    align-items: center;
+    gap: 16px;
+  }
+
+  .bar-label {
+    min-width: 120px;
+    font-weight: 600;
+    font-size: 1.1rem;
+  }
+
+  .bar-container {
+    flex: 1;
+    height: 40px;
+    background: #f1f5f9;
+    border-radius: 20px;
+    overflow: hidden;
+    position: relative;
+  }
+
+  .bar-fill {
+    height: 100%;
+    border-radius: 20px;
+    transition: width 2s ease;
+    position: relative;
+    display: flex;
+    align-items: center;
+    justify-content: flex-end;
+    padding-right: 12px;
+    color: white;
+    font-weight: bold;
+  }
+
+  .bar-fill.team-1 { background: linear-gradient(90deg, #3b82f6, #2563eb); }
+  .bar-fill.team-2 { background: linear-gradient(90deg, #10b981, #059669); }
+  .bar-fill.team-3 { background: linear-gradient(90deg, #f59e0b, #d97706); }
+  .bar-fill.team-4 { background: linear-gradient(90deg, #ef4444, #dc2626); }
+  .bar-fill.team-5 { background: linear-gradient(90deg, #8b5cf6, #7c3aed); }
+
+  .bar-points {
+    font-size: 0.9rem;
+    white-space: nowrap;
+  }
+
+  /* Summary styles (reuse from main summary screen) */
+  .summary-rankings {
+    background: rgba(0,0,0,0.02);
+    border-radius: 12px;
+    padding: 20px;
+    margin: 20px 0;
+  }
+
+  .summary-ranking-item {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    padding: 12px 16px;
+    margin: 8px 0;
+    background: white;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+  }
+
+  .summary-rank {
+    font-size: 1.2rem;
+    font-weight: bold;
+    width: 40px;
+    color: #2563eb;
+  }
+
+  .summary-name {
+    font-size: 1.1rem;
+    font-weight: 600;
+    flex-grow: 1;
+    margin-left: 12px;
+  }
+
+  .summary-points {
+    font-size: 1.1rem;
+    font-weight: bold;
+    color: #059669;
+  }
+`;
+
+// Register the card. The integration adds the card to the frontend itself, so a dashboard
+// that still lists it as a resource loads it twice; the second copy must not define it again.
+if (!customElements.get('home-trivia-card')) {
+  customElements.define('home-trivia-card', HomeTriviaCard);
+
+  // Register with Home Assistant
+  window.customCards = window.customCards || [];
+  window.customCards.push({
+    type: 'home-trivia-card',
+    name: 'Home Trivia Card',
+    description: 'A card for the Home Trivia game'
+  });
+}
 
 console.info(
   '%c  HOME-TRIVIA-CARD  %c  Version 1.0.0  ',
@@ -0,0 +1,35 @@
+"""Helpers for the Home Trivia tests."""
+from __future__ import annotations
+
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.home_trivia.const import DOMAIN
+
+
+async def async_setup_game(
+    hass: HomeAssistant, options: dict[str, Any] | None = None, data: dict[str, Any] | None = None
+) -> MockConfigEntry:
+    """Set up a game, the default one unless data names another."""
+    await async_setup_component(hass, "http", {})
+    entry = MockConfigEntry(domain=DOMAIN, data=data or {}, options=options or {})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def async_call(hass: HomeAssistant, service: str, **data: Any) -> None:
+    """Call a game service and wait for everything it started."""
+    await hass.services.async_call(DOMAIN, service, data, blocking=True)
+    await hass.async_block_till_done()
+
+
+async def async_next_question(hass: HomeAssistant) -> dict[str, Any]:
+    """Move to the next question and return the current question's attributes."""
+    await async_call(hass, "next_question")
+    return dict(hass.states.get("sensor.home_trivia_current_question").attributes)
@@ -0,0 +1,17 @@
+"""Fixtures for the Home Trivia tests."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load Home Trivia from custom_components."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def config_dir(hass, tmp_path):
+    """Give every test its own config directory for the databases, journal and packs."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
@@ -0,0 +1,37 @@
+"""Tests for the Home Trivia options."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.home_trivia.const import CONF_PACK_DIRECTORY, CONF_USE_QUESTION_DATABASE
+
+from .common import async_setup_game
+
+
+async def _async_submit_options(hass: HomeAssistant, entry_id: str, pack_directory: str) -> dict:
+    """Open the options flow and submit a pack directory with the other defaults."""
+    result = await hass.config_entries.options.async_init(entry_id)
+    assert result["type"] is FlowResultType.FORM
+    return await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_PACK_DIRECTORY: pack_directory, CONF_USE_QUESTION_DATABASE: True}
+    )
+
+
+async def test_options_saved_without_pack_directory(hass: HomeAssistant, tmp_path) -> None:
+    """Options can be saved before the pack folder exists, e.g. on a fresh install."""
+    entry = await async_setup_game(hass)
+    assert not (tmp_path / "home_trivia_packs").exists()
+
+    result = await _async_submit_options(hass, entry.entry_id, "home_trivia_packs")
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_PACK_DIRECTORY] == "home_trivia_packs"
+    assert entry.options[CONF_USE_QUESTION_DATABASE] is True
+
+    (tmp_path / "packs.json").write_text("[]")
+    result = await _async_submit_options(hass, entry.entry_id, "packs.json")
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_PACK_DIRECTORY: "pack_directory_is_file"}
+
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,22 @@
+"""Tests for the Home Trivia diagnostics."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import GAME_MODE_BUZZER
+from custom_components.home_trivia.diagnostics import async_get_config_entry_diagnostics
+
+from .common import async_call, async_setup_game
+
+
+async def test_diagnostics_report_the_game(hass: HomeAssistant) -> None:
+    """The diagnostics show the game's state and mode."""
+    entry = await async_setup_game(hass)
+    await async_call(hass, "update_game_mode", game_mode=GAME_MODE_BUZZER)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["game"]["game_mode"] == GAME_MODE_BUZZER
+    assert diagnostics["game"]["state"] == hass.states.get("sensor.home_trivia_game_status").state
+    assert diagnostics["game"]["question_count"] > 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,50 @@
+"""Tests for the game journal."""
+from __future__ import annotations
+
+import random
+
+from pytest_homeassistant_custom_component.common import MockUser
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import DOMAIN
+from custom_components.home_trivia.journal import read_events, replay
+
+from .common import async_call, async_next_question, async_setup_game
+
+
+async def test_journal_replays_the_game(hass: HomeAssistant) -> None:
+    """The journal identifies every question and replays to the published summary."""
+    entry = await async_setup_game(hass)
+    user = MockUser(name="Alice").add_to_hass(hass)
+    await async_call(hass, "update_team_count", team_count=4)
+    await async_call(hass, "start_game")
+    await async_call(hass, "update_team_user_id", team_id="team_2", user_id=user.id)
+
+    random.seed(1)
+    asked = []
+    for _ in range(10):
+        question = await async_next_question(hass)
+        asked.append(question["question_id"])
+        for team_number in range(1, 5):
+            answer = random.choice([question["correct_answer"], "X"])
+            await async_call(hass, "update_team_answer", team_id=f"team_{team_number}", answer=answer)
+    await async_next_question(hass)
+    await async_call(hass, "stop_game")
+
+    journal = hass.data[DOMAIN][entry.entry_id]["journal"]
+    await journal.async_flush()
+    events = await hass.async_add_executor_job(lambda: list(read_events(journal.path)))
+
+    assert None not in asked
+    drawn = [event["question_id"] for event in events if event["event"] == "question_drawn"]
+    scored = [event["question_id"] for event in events if event["event"] == "round_scored"]
+    assert drawn[: len(asked)] == asked
+    assert scored == asked
+
+    result = replay(events, {user.id: "Alice"})
+    assert result["summary"] == hass.states.get("sensor.home_trivia_game_status").attributes["game_summary"]
+    for row in result["scoreboard"]:
+        assert hass.states.get(f"sensor.{row['team']}").attributes["points"] == row["points"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
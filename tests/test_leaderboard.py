@@ -0,0 +1,81 @@
+"""Tests for the all-time leaderboards."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import DOMAIN
+from custom_components.home_trivia.leaderboard import Leaderboard, Leaderboards
+
+
+def _entry(name: str, average_points: float, points: int, seq: int) -> dict[str, Any]:
+    """Return a leaderboard entry."""
+    return {"team_name": name, "average_points": average_points, "points": points, "seq": seq}
+
+
+def _result(name: str, points: int, rounds: int = 10) -> dict[str, Any]:
+    """Return the result of a team as the GameManager submits it."""
+    return {"team_name": name, "points": points, "rounds": rounds, "game": "game"}
+
+
+def test_leaderboard_keeps_the_best_results() -> None:
+    """A full leaderboard evicts its weakest entry, and turns away weaker results."""
+    board = Leaderboard(3, [_entry("A", 10, 100, 1), _entry("B", 30, 300, 2), _entry("C", 20, 200, 3)])
+
+    assert board.submit(_entry("D", 25, 250, 4))
+    assert not board.submit(_entry("E", 5, 50, 5))
+    assert len(board) == 3
+    assert [entry["team_name"] for entry in board.entries()] == ["B", "D", "C"]
+    assert [entry["team_name"] for entry in board.entries(1)] == ["B"]
+
+    # Saved entries beyond the size are dropped when loading
+    assert len(Leaderboard(2, board.entries())) == 2
+
+
+def test_leaderboard_tie_order() -> None:
+    """Ties on average points go to more points, then to the earlier result."""
+    board = Leaderboard(3)
+    board.submit(_entry("later", 20, 200, 3))
+    board.submit(_entry("fewer rounds", 20, 100, 1))
+    board.submit(_entry("earlier", 20, 200, 2))
+
+    assert [entry["team_name"] for entry in board.entries()] == ["earlier", "later", "fewer rounds"]
+    # A result equal to the weakest entry is later, so it does not make it
+    assert not board.submit(_entry("tie", 20, 100, 4))
+
+
+async def test_leaderboards_filters_and_saves(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Results go to the board of their difficulty and team count; only placed results are saved."""
+    leaderboards = Leaderboards(hass, size=2)
+    await leaderboards.async_load()
+
+    assert leaderboards.async_submit("Easy", 2, [_result("A", 100), _result("B", 200), _result("idle", 0, 0)]) == 2
+    assert leaderboards.async_submit("Easy", 3, [_result("C", 150)]) == 1
+    assert leaderboards.async_submit("Hard", 2, [_result("D", 50)]) == 1
+    assert leaderboards.saves_scheduled == 3
+
+    # Too weak for the full board: nothing changed, so nothing is saved
+    assert leaderboards.async_submit("Easy", 2, [_result("E", 10)]) == 0
+    assert leaderboards.saves_scheduled == 3
+
+    easy_two = leaderboards.async_get("Easy", 2)
+    assert [entry["team_name"] for entry in easy_two[0]["entries"]] == ["B", "A"]
+    assert easy_two[0]["entries"][0]["average_points"] == 20
+    assert [(board["difficulty_level"], board["team_count"]) for board in leaderboards.async_get("Easy")] == [
+        ("Easy", 2),
+        ("Easy", 3),
+    ]
+    assert [board["difficulty_level"] for board in leaderboards.async_get(team_count=2)] == ["Easy", "Hard"]
+    assert leaderboards.async_get("Medium", 2) == []
+
+    # The delayed save is written at the latest when Home Assistant stops
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    saved = hass_storage[f"{DOMAIN}.leaderboards"]["data"]
+    assert saved["seq"] == 5
+
+    reloaded = Leaderboards(hass, size=2)
+    await reloaded.async_load()
+    assert reloaded.async_get() == leaderboards.async_get()
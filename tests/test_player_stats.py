@@ -0,0 +1,93 @@
+"""Tests for the long-term player statistics."""
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockUser
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import DOMAIN
+from custom_components.home_trivia.player_stats import BEST_CATEGORY_MIN_ROUNDS, PlayerStatsStore
+
+from .common import async_call, async_next_question, async_setup_game
+
+
+def test_write_adds_up_rounds_and_games(tmp_path) -> None:
+    """Rounds add to the totals, and a player's first round in a game counts the game."""
+    store = PlayerStatsStore(str(tmp_path / "player_stats.db"))
+    store.write([
+        ("round", "game_1", "entry", "Science", [("alice", True, 20, 1), ("bob", False, 0, 0)]),
+        ("round", "game_1", "entry", None, [("alice", True, 15, 2)]),
+    ])
+    store.write([("round", "game_2", "entry", "Science", [("alice", False, 0, 0)])])
+
+    alice = store.player("alice")
+    assert {key: alice[key] for key in ("games", "rounds", "correct", "points", "best_streak")} == {
+        "games": 2, "rounds": 3, "correct": 2, "points": 35, "best_streak": 2,
+    }
+    # Rounds without a category only count towards the totals
+    assert alice["categories"] == [{"category": "Science", "rounds": 2, "correct": 1, "accuracy": 0.5}]
+    assert store.player("bob")["games"] == 1
+    assert store.player("carol") is None
+    store.close()
+
+
+def test_best_category_needs_enough_rounds(tmp_path) -> None:
+    """A category only becomes the best one with enough rounds, unless none has them yet."""
+    store = PlayerStatsStore(str(tmp_path / "player_stats.db"))
+    assert store.best_category("alice") is None
+
+    store.write([("round", "game", None, "Music", [("alice", True, 10, 1)])])
+    store.write([("round", "game", None, "History", [("alice", False, 0, 0)])])
+    assert store.best_category("alice")["category"] == "Music"
+
+    for round_number in range(BEST_CATEGORY_MIN_ROUNDS):
+        store.write([("round", "game", None, "History", [("alice", round_number > 0, 10, 1)])])
+    # History is answered worse, but Music has too few rounds to count
+    best = store.best_category("alice")
+    assert best["category"] == "History"
+    assert best["rounds"] == BEST_CATEGORY_MIN_ROUNDS + 1
+    store.close()
+
+
+def test_mvps_ranks_by_games_as_mvp(tmp_path) -> None:
+    """Only the MVP of a game counts it, and only if they played in it."""
+    store = PlayerStatsStore(str(tmp_path / "player_stats.db"))
+    store.write([
+        ("round", "game_1", None, None, [("alice", False, 0, 0), ("bob", True, 10, 1), ("carol", False, 0, 0)]),
+        ("end", "game_1", "bob"),
+        ("round", "game_2", None, None, [("bob", True, 10, 1), ("carol", True, 10, 1)]),
+        ("end", "game_2", "bob"),
+        ("end", "game_2", "alice"),
+    ])
+
+    mvps = store.mvps()
+    assert [(player["user_id"], player["mvp_games"]) for player in mvps] == [
+        ("bob", 2), ("carol", 0), ("alice", 0),
+    ]
+    assert [player["user_id"] for player in store.mvps(1)] == ["bob"]
+    store.close()
+
+
+async def test_tied_mvp_is_the_first_to_get_there(hass: HomeAssistant) -> None:
+    """On a tie, the player who reached the score first is MVP, live and in the statistics."""
+    await async_setup_game(hass)
+    alice = MockUser(name="Alice").add_to_hass(hass)
+    bob = MockUser(name="Bob").add_to_hass(hass)
+    await async_call(hass, "update_team_count", team_count=2)
+    await async_call(hass, "start_game")
+    await async_call(hass, "update_team_user_id", team_id="team_1", user_id=alice.id)
+    await async_call(hass, "update_team_user_id", team_id="team_2", user_id=bob.id)
+
+    # Bob is right first, then Alice catches up
+    for correct_team in (2, 1):
+        question = await async_next_question(hass)
+        for team_number in (1, 2):
+            answer = question["correct_answer"] if team_number == correct_team else "X"
+            await async_call(hass, "update_team_answer", team_id=f"team_{team_number}", answer=answer)
+    await async_next_question(hass)
+    await async_call(hass, "stop_game")
+
+    summary = hass.states.get("sensor.home_trivia_game_status").attributes["game_summary"]
+    assert summary["mvp"]["name"] == "Bob"
+    mvps = await hass.data[DOMAIN]["player_stats"].async_get_mvps()
+    assert {player["user_id"]: player["mvp_games"] for player in mvps} == {bob.id: 1, alice.id: 0}
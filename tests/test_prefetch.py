@@ -0,0 +1,70 @@
+"""Tests for drawing the next question ahead of time."""
+from __future__ import annotations
+
+import json
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import CONF_PACK_DIRECTORY, CONF_USE_QUESTION_DATABASE, DOMAIN
+
+from .common import async_call, async_next_question, async_setup_game
+
+
+async def test_store_prefetch_released_after_database_switched_off(hass: HomeAssistant) -> None:
+    """A question prefetched from the database is put back there once the database is off."""
+    entry = await async_setup_game(hass, {CONF_USE_QUESTION_DATABASE: True})
+    game_manager = hass.data[DOMAIN][entry.entry_id]["game_manager"]
+    await async_call(hass, "import_question_database")
+    question_store = game_manager.question_store
+    assert question_store is not None
+
+    await async_call(hass, "start_game")
+    await async_next_question(hass)
+    prepared = await game_manager._prefetch
+    assert prepared.store is question_store and prepared.question_id is not None
+
+    hass.config_entries.async_update_entry(entry, options={CONF_USE_QUESTION_DATABASE: False})
+    await hass.async_block_till_done()
+    assert game_manager.question_store is None
+
+    # The prefetched question is discarded, and the next one comes from the packs
+    question = await async_next_question(hass)
+    assert question["question_id"] is not None
+    played = question_store._connect().execute(
+        "SELECT question_id FROM played_questions WHERE game_id = ?", (game_manager.game_id,)
+    ).fetchall()
+    assert prepared.question_id not in [question_id for (question_id,) in played]
+
+    await async_call(hass, "stop_game")
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_decks_rebuilt_when_pack_directory_changes(hass: HomeAssistant, tmp_path) -> None:
+    """Switching to another pack directory draws from its bank, although both start at generation 1."""
+    entry = await async_setup_game(hass)
+    game_manager = hass.data[DOMAIN][entry.entry_id]["game_manager"]
+    await async_call(hass, "start_game")
+    question = await async_next_question(hass)
+    old_bank = game_manager.question_bank
+    level = question["difficulty_level"]
+
+    packs = tmp_path / "other_packs"
+    packs.mkdir()
+    pack_question = dict(old_bank.get_question(question["question_id"]), id=900_001)
+    (packs / "extra.json").write_text(json.dumps([pack_question]))
+    hass.config_entries.async_update_entry(entry, options={CONF_PACK_DIRECTORY: "other_packs"})
+    await hass.async_block_till_done()
+    question_bank = game_manager.question_bank
+    assert question_bank is not old_bank
+    assert question_bank.generation == old_bank.generation
+
+    question = await async_next_question(hass)
+    assert question["question_id"] is not None
+    deck = game_manager._decks[level]
+    assert deck.bank is question_bank
+    assert 900_001 in deck._order
+    prepared = await game_manager._prefetch
+    assert prepared.bank is question_bank
+
+    await async_call(hass, "stop_game")
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,129 @@
+"""Tests for the question packs."""
+from __future__ import annotations
+
+import gzip
+import json
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import CONF_GAME_NAME, CONF_PACK_DIRECTORY, DOMAIN
+from custom_components.home_trivia.question_bank import PlayedQuestions, QuestionBank
+from custom_components.home_trivia.question_store import QuestionStore
+
+from .common import async_setup_game
+
+
+def _question(question_id, difficulty_level: str = "Easy") -> dict:
+    """Return a question in the questions.json schema."""
+    return {
+        "id": question_id,
+        "category": "Geography",
+        "question": f"Question {question_id}?",
+        "answer_a": "A",
+        "answer_b": "B",
+        "answer_c": "C",
+        "correct_answer": "A",
+        "fun_fact": "",
+        "difficulty_level": difficulty_level,
+    }
+
+
+async def test_questions_without_integer_ids_are_skipped(hass: HomeAssistant, tmp_path) -> None:
+    """Questions whose ids cannot be played are skipped when the packs are read and imported."""
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    ids = [1001, "geo-1", -5, True, 1002.5, None, "1003", 1004]
+    (packs / "mixed.json").write_text(json.dumps([_question(question_id) for question_id in ids]))
+    (tmp_path / "builtin.json").write_text("[]")
+
+    bank = QuestionBank(hass, str(packs), str(tmp_path / "builtin.json"))
+    await bank.async_load()
+
+    assert bank.question_count == 2
+    assert bank.get_question(1001) is not None and bank.get_question(1004) is not None
+    assert bank.pack_stats["mixed.json"]["questions"] == 2
+    assert bank.pack_stats["mixed.json"]["skipped"] == 6
+
+    store = QuestionStore(str(tmp_path / "questions.db"))
+    imported = await hass.async_add_executor_job(
+        store.import_questions, [_question(question_id) for question_id in ids]
+    )
+    assert imported == 2
+    assert await hass.async_add_executor_job(store.question_count) == 2
+    await hass.async_add_executor_job(store.close)
+
+
+def test_played_questions_with_sparse_ids() -> None:
+    """A few very large ids do not grow a bitmap up to the largest id."""
+    played = PlayedQuestions()
+    for question_id in range(1, 51):
+        assert played.add(question_id)
+    assert not played.sparse
+
+    assert played.add(100_000_000)
+    assert played.add(7_000_000_000)
+    assert not played.add(100_000_000)
+    assert played.sparse
+    assert len(played) == 52
+    assert 100_000_000 in played and 25 in played and 99 not in played
+    assert list(played) == [*range(1, 51), 100_000_000, 7_000_000_000]
+
+    encoded = played.encode()
+    assert len(encoded) < 200
+    restored = PlayedQuestions.decode(encoded)
+    assert restored.sparse and list(restored) == list(played) and len(restored) == 52
+
+    played.clear()
+    assert not played.sparse and len(played) == 0 and played.encode() == ""
+
+
+def test_played_questions_with_dense_ids() -> None:
+    """Dense ids stay in a bitmap, which decodes as before."""
+    played = PlayedQuestions()
+    for question_id in range(0, 20_000, 3):
+        played.add(question_id)
+    assert not played.sparse
+    restored = PlayedQuestions.decode(played.encode())
+    assert not restored.sparse and list(restored) == list(range(0, 20_000, 3))
+
+
+async def test_broken_packs_are_reported(hass: HomeAssistant, tmp_path) -> None:
+    """A corrupt gzip pack gets an error in its stats, and a pack named questions.json keeps its own stats."""
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    data = bytearray(gzip.compress(
+        "\n".join(json.dumps(_question(question_id)) for question_id in range(2000, 2200)).encode()
+    ))
+    data[len(data) // 2] ^= 0xFF
+    (packs / "broken.jsonl.gz").write_bytes(bytes(data))
+    (packs / "questions.json").write_text(json.dumps([_question(3001)]))
+    (tmp_path / "builtin.json").write_text(json.dumps([_question(1), _question(2)]))
+
+    bank = QuestionBank(hass, str(packs), str(tmp_path / "builtin.json"))
+    await bank.async_load()
+
+    assert "error" in bank.pack_stats["broken.jsonl.gz"]
+    assert bank.pack_stats["builtin:questions.json"]["questions"] == 2
+    assert bank.pack_stats["questions.json"]["questions"] == 1
+    assert bank.get_question(3001) is not None
+    # The question database import skips the broken pack too
+    assert {question["id"] for question in bank.iter_questions()} >= {1, 2, 3001}
+
+
+async def test_unused_question_banks_are_released(hass: HomeAssistant, tmp_path) -> None:
+    """Games share the bank of a pack directory until no loaded game uses it."""
+    (tmp_path / "packs").mkdir()
+    kitchen = await async_setup_game(hass)
+    garden = await async_setup_game(hass, data={CONF_GAME_NAME: "Garden"})
+    question_banks = hass.data[DOMAIN]["question_banks"]
+    assert len(question_banks) == 1
+
+    hass.config_entries.async_update_entry(garden, options={CONF_PACK_DIRECTORY: "packs"})
+    await hass.async_block_till_done()
+    assert len(question_banks) == 2
+
+    assert await hass.config_entries.async_unload(garden.entry_id)
+    assert list(question_banks.values()) == [hass.data[DOMAIN][kitchen.entry_id]["game_manager"].question_bank]
+
+    assert await hass.config_entries.async_unload(kitchen.entry_id)
+    assert question_banks == {}
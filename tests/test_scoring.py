@@ -0,0 +1,105 @@
+"""Tests for the scoring engine."""
+from __future__ import annotations
+
+from custom_components.home_trivia.const import (
+    CONF_BASE_POINTS,
+    CONF_SPEED_BONUS_PER_SECOND,
+    CONF_STREAK_BONUS,
+    CONF_STREAK_LENGTH,
+)
+from custom_components.home_trivia.scoring import (
+    DEFAULT_SCORING_RULES,
+    RoundAnswers,
+    ScoringRules,
+    buzzer_speed_bonuses,
+    score_round,
+    score_rounds,
+)
+
+TEAMS = ["home_trivia_team_1", "home_trivia_team_2", "home_trivia_team_3"]
+
+
+def test_classic_round() -> None:
+    """A correct answer earns the base points plus a point per second left."""
+    round_answers = RoundAnswers(TEAMS, "b", ["B", "A", None], [12, 20, 0])
+    scores = score_round(DEFAULT_SCORING_RULES, round_answers, [0, 4, 2])
+
+    assert scores.points == [22, 0, 0]
+    assert scores.correct == [True, False, False]
+    # Wrong and missing answers both break the streak
+    assert scores.streaks == [1, 0, 0]
+    assert scores.streak_bonuses == [0, 0, 0]
+
+
+def test_streak_bonus() -> None:
+    """Every streak_length correct answers in a row earn the streak bonus."""
+    round_answers = RoundAnswers(TEAMS, "A", ["A", "A", "A"], [0, 0, 0])
+    scores = score_round(DEFAULT_SCORING_RULES, round_answers, [1, 2, 5])
+
+    assert scores.streaks == [2, 3, 6]
+    assert scores.streak_bonuses == [0, 25, 25]
+    assert scores.points == [10, 35, 35]
+
+
+def test_buzzer_round() -> None:
+    """In buzzer mode only correct teams are ranked, and unanswered teams earn nothing."""
+    round_answers = RoundAnswers(TEAMS, "C", ["C", "A", "C"], [9, 10, 9], ranks=[2, 1, 3])
+    scores = score_round(DEFAULT_SCORING_RULES, round_answers, [0, 0, 0])
+
+    # Team 1 buzzed in before team 3 within the same second; team 2 was first but wrong
+    assert scores.points == [10 + 9 + 1, 0, 10 + 9]
+    assert scores.correct == [True, False, True]
+
+
+def test_buzzer_bonuses_never_tie() -> None:
+    """40 correct buzzes within the same second all earn different points."""
+    teams = 40
+    bonuses = buzzer_speed_bonuses(1, [True] * teams, [20] * teams, list(range(1, teams + 1)))
+    assert bonuses == [20 + teams - rank for rank in range(1, teams + 1)]
+
+    round_answers = RoundAnswers(
+        [f"team_{number}" for number in range(1, teams + 1)], "A", ["A"] * teams, [20] * teams, list(range(1, teams + 1))
+    )
+    points = score_round(DEFAULT_SCORING_RULES, round_answers, [0] * teams).points
+    assert all(earlier > later for earlier, later in zip(points, points[1:]))
+
+
+def test_buzzer_bonuses_without_speed_bonus() -> None:
+    """Without a speed bonus, the order of the buzzes earns nothing either."""
+    assert buzzer_speed_bonuses(0, [True, True], [5, 3], [1, 2]) == [0, 0]
+
+
+def test_rules_from_options() -> None:
+    """The options of a game override the default rules, and 0 turns bonuses off."""
+    assert ScoringRules.from_options({}) == DEFAULT_SCORING_RULES
+    rules = ScoringRules.from_options(
+        {CONF_BASE_POINTS: "5", CONF_SPEED_BONUS_PER_SECOND: 0, CONF_STREAK_LENGTH: 2, CONF_STREAK_BONUS: 7}
+    )
+    assert rules == ScoringRules(base_points=5, speed_bonus_per_second=0, streak_length=2, streak_bonus=7)
+
+    round_answers = RoundAnswers(TEAMS, "A", ["A", "A", "B"], [30, 30, 30])
+    scores = score_round(rules, round_answers, [0, 1, 1])
+    assert scores.points == [5, 12, 0]
+
+    no_streaks = ScoringRules.from_options({CONF_STREAK_LENGTH: 0})
+    assert score_round(no_streaks, round_answers, [2, 2, 2]).streak_bonuses == [0, 0, 0]
+
+
+def test_score_rounds_carries_streaks_within_a_game() -> None:
+    """Streaks carry over from round to round, and a None starts a new game."""
+    rounds = [
+        RoundAnswers(TEAMS[:2], "A", ["A", "A"], [0, 0]),
+        RoundAnswers(TEAMS[:2], "A", ["A", None], [0, 0]),
+        None,
+        RoundAnswers(TEAMS, "A", ["A", "A", "A"], [0, 0, 0]),
+        RoundAnswers(TEAMS, "B", ["B", "B", "C"], [1, 0, 0]),
+    ]
+    result = score_rounds(DEFAULT_SCORING_RULES, rounds)
+
+    assert result["rounds"] == 4
+    # Team 1 answers 4 in a row, but the new game restarts its streak after 2
+    assert result["teams"] == {
+        "home_trivia_team_1": {"points": 41, "correct": 4, "longest_streak": 2},
+        "home_trivia_team_2": {"points": 30, "correct": 3, "longest_streak": 2},
+        "home_trivia_team_3": {"points": 10, "correct": 1, "longest_streak": 1},
+    }
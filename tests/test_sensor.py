@@ -0,0 +1,41 @@
+"""Tests for the Home Trivia sensors."""
+from __future__ import annotations
+
+import json
+
+from homeassistant.core import State
+
+from custom_components.home_trivia.sensor import HomeTriviaGameStatusSensor
+
+
+def _tied_game_status() -> HomeTriviaGameStatusSensor:
+    """Return a game status where bob ties with alice after getting to her score first."""
+    sensor = HomeTriviaGameStatusSensor(None)
+    for user_id in ("alice", "bob", "bob", "alice"):
+        sensor.update_user_correct_answer(user_id)
+    assert list(sensor._user_stats) == ["alice", "bob"]
+    assert sensor.mvp["user_id"] == "bob" and sensor.mvp["tied_user_ids"] == ["alice"]
+    return sensor
+
+
+def test_mvp_tie_order_restored_from_game_store() -> None:
+    """The user who got to a tied score first stays MVP after a restart."""
+    snapshot = json.loads(json.dumps(_tied_game_status().snapshot()))
+
+    sensor = HomeTriviaGameStatusSensor(None)
+    sensor.restore_snapshot(snapshot)
+    assert sensor.mvp == {"user_id": "bob", "name": "bob", "score": 2, "tied_user_ids": ["alice"]}
+
+    # A game saved before the tie order was kept falls back to the user stats
+    del snapshot["mvp_user_ids"]
+    sensor.restore_snapshot(snapshot)
+    assert sensor.mvp["user_id"] == "alice" and sensor.mvp["tied_user_ids"] == ["bob"]
+
+
+async def test_mvp_tie_order_restored_from_last_state() -> None:
+    """The tie order is also restored from the last state when there is no saved game."""
+    attributes = _tied_game_status().extra_state_attributes
+
+    sensor = HomeTriviaGameStatusSensor(None)
+    await sensor._restore_state(State("sensor.home_trivia_game_status", "playing", attributes))
+    assert sensor.mvp["user_id"] == "bob" and sensor.mvp["tied_user_ids"] == ["alice"]
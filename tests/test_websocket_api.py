@@ -0,0 +1,48 @@
+"""Tests for the Home Trivia websocket commands."""
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import CONF_GAME_NAME, DOMAIN
+from custom_components.home_trivia.websocket_api import GameStateSubscriptions, websocket_submit_answer
+
+from .common import async_call, async_next_question, async_setup_game
+
+
+async def test_subscribe_snapshot_has_entity_prefix(hass: HomeAssistant) -> None:
+    """The snapshot tells the card the entity prefix, slugified like the entity ids."""
+    entry = await async_setup_game(hass, data={CONF_GAME_NAME: "Küche"})
+    game = hass.data[DOMAIN][entry.entry_id]
+    assert game["entity_prefix"] == "home_trivia_kuche"
+    assert hass.states.get("sensor.home_trivia_kuche_game_status") is not None
+
+    connection = Mock()
+    remove = GameStateSubscriptions(hass, game["entity_prefix"]).async_add(connection, 1)
+    event = connection.send_message.call_args.args[0]["event"]
+    assert event["type"] == "snapshot"
+    assert event["entity_prefix"] == "home_trivia_kuche"
+    assert "game_status" in event["changed"]
+
+    remove()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_submit_answer_finds_the_team_by_number(hass: HomeAssistant) -> None:
+    """The team_id is parsed once, and only the teams of the current team count answer."""
+    await async_setup_game(hass)
+    await async_call(hass, "update_team_count", team_count=3)
+    await async_call(hass, "start_game")
+    await async_next_question(hass)
+
+    connection = Mock()
+    websocket_submit_answer(hass, connection, {"id": 1, "team_id": "team_3", "answer": "B"})
+    ack = connection.send_result.call_args.args[1]
+    assert ack["team_id"] == "team_3"
+    assert ack["accepted"]
+    assert hass.states.get("sensor.home_trivia_team_3").attributes["answer"] == "B"
+
+    await async_call(hass, "update_team_count", team_count=2)
+    websocket_submit_answer(hass, connection, {"id": 2, "team_id": "team_3", "answer": "C"})
+    assert connection.send_error.call_args.args[0] == 2
@@ -0,0 +1,44 @@
+"""Tests for batching the state writes of a game operation."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.home_trivia.const import DOMAIN
+
+from .common import async_call, async_next_question, async_setup_game
+
+
+async def test_waiting_operation_does_not_hold_back_answers(hass: HomeAssistant) -> None:
+    """An answer is published right away while another operation waits inside its batch."""
+    entry = await async_setup_game(hass)
+    game_manager = hass.data[DOMAIN][entry.entry_id]["game_manager"]
+    context = game_manager.context
+    await async_call(hass, "start_game")
+    await async_next_question(hass)
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_operation() -> None:
+        with context.write_batch:
+            context.main_sensor.set_timer_length(45)
+            started.set()
+            await release.wait()
+
+    task = hass.async_create_task(slow_operation())
+    await started.wait()
+
+    ack = game_manager.submit_answer(1, "A")
+    assert ack["accepted"]
+    assert hass.states.get("sensor.home_trivia_team_1").attributes["answer"] == "A"
+    # The waiting operation's own writes still wait for it to finish
+    assert hass.states.get("sensor.home_trivia_game_status").attributes["timer_length"] != 45
+
+    release.set()
+    await task
+    assert hass.states.get("sensor.home_trivia_game_status").attributes["timer_length"] == 45
+
+    await async_call(hass, "stop_game")
+    assert await hass.config_entries.async_unload(entry.entry_id)